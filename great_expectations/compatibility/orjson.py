@@ -0,0 +1,10 @@
+from great_expectations.compatibility.not_imported import NotImported
+
+ORJSON_NOT_IMPORTED = NotImported(
+    "orjson is not installed, please 'pip install orjson'"
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = ORJSON_NOT_IMPORTED
@@ -50,6 +50,16 @@ try:
 except (ImportError, AttributeError):
     sqlite = SQLALCHEMY_NOT_IMPORTED
 
+try:
+    from sqlalchemy.dialects import mysql
+except (ImportError, AttributeError):
+    mysql = SQLALCHEMY_NOT_IMPORTED
+
+try:
+    from sqlalchemy.dialects import postgresql
+except (ImportError, AttributeError):
+    postgresql = SQLALCHEMY_NOT_IMPORTED
+
 try:
     from sqlalchemy.dialects import registry
 except (ImportError, AttributeError):
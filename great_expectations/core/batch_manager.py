@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import contextlib
+import contextvars
 import logging
 from collections import OrderedDict
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
 
 from great_expectations.core.batch import (
     Batch,
@@ -19,6 +21,27 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 logging.captureWarnings(True)
 
+# "BatchManager" -> IDs of its active Batch and BatchData, as seen by the enclosing "thread_scoped_batch_activation()".
+_thread_scoped_active_batch_ids: contextvars.ContextVar[
+    Optional[Dict[BatchManager, Dict[str, Optional[str]]]]
+] = contextvars.ContextVar("thread_scoped_active_batch_ids", default=None)
+
+
+@contextlib.contextmanager
+def thread_scoped_batch_activation() -> Iterator[None]:
+    """Keeps Batches, activated (or loaded) within the "with" block, active only for the current thread.
+
+    Threads, which share "ExecutionEngine" (hence its "BatchManager"), resolve metrics without explicit "batch_id" on
+    the active Batch.  Within this block, each "BatchManager" starts from the Batch active upon its first use in this
+    block, and then follows only activations made by the current thread; activations still update the shared active
+    Batch (seen outside of any such block), and loaded Batches and their data remain shared.
+    """
+    token: contextvars.Token = _thread_scoped_active_batch_ids.set({})
+    try:
+        yield
+    finally:
+        _thread_scoped_active_batch_ids.reset(token)
+
 
 class BatchManager:
     def __init__(
@@ -33,8 +56,10 @@ class BatchManager:
         """
         self._execution_engine: ExecutionEngine = execution_engine
 
-        self._active_batch_id: Optional[str] = None
-        self._active_batch_data_id: Optional[str] = None
+        self._shared_active_batch_ids: Dict[str, Optional[str]] = {
+            "batch_id": None,
+            "batch_data_id": None,
+        }
 
         self._batch_cache: Dict[str, Batch] = OrderedDict()
         self._batch_data_cache: Dict[str, BatchDataType] = {}
@@ -42,6 +67,38 @@ class BatchManager:
         if batch_list:
             self.load_batch_list(batch_list=batch_list)
 
+    def _get_active_batch_ids(self) -> Dict[str, Optional[str]]:
+        thread_scoped_active_batch_ids: Optional[
+            Dict[BatchManager, Dict[str, Optional[str]]]
+        ] = _thread_scoped_active_batch_ids.get()
+        if thread_scoped_active_batch_ids is None:
+            return self._shared_active_batch_ids
+
+        if self not in thread_scoped_active_batch_ids:
+            thread_scoped_active_batch_ids[self] = dict(self._shared_active_batch_ids)
+
+        return thread_scoped_active_batch_ids[self]
+
+    def _set_active_batch_ids(self, **active_batch_ids: Optional[str]) -> None:
+        self._get_active_batch_ids().update(active_batch_ids)
+        self._shared_active_batch_ids.update(active_batch_ids)
+
+    @property
+    def _active_batch_id(self) -> Optional[str]:
+        return self._get_active_batch_ids()["batch_id"]
+
+    @_active_batch_id.setter
+    def _active_batch_id(self, value: Optional[str]) -> None:
+        self._set_active_batch_ids(batch_id=value)
+
+    @property
+    def _active_batch_data_id(self) -> Optional[str]:
+        return self._get_active_batch_ids()["batch_data_id"]
+
+    @_active_batch_data_id.setter
+    def _active_batch_data_id(self, value: Optional[str]) -> None:
+        self._set_active_batch_ids(batch_data_id=value)
+
     @property
     def batch_data_cache(self) -> Dict[str, BatchDataType]:
         """Dictionary of loaded BatchData objects."""
@@ -142,6 +199,15 @@ class BatchManager:
         self._batch_cache = OrderedDict()
         self._active_batch_id = None
 
+    def activate_batch(self, batch_id: str) -> None:
+        """Makes previously loaded Batch (and its BatchData) active, without loading its BatchData again."""
+        if batch_id not in self._batch_cache or batch_id not in self._batch_data_cache:
+            raise ValueError(
+                f'Batch with ID "{batch_id}" must be loaded before it can be activated.'
+            )
+
+        self._set_active_batch_ids(batch_id=batch_id, batch_data_id=batch_id)
+
     def load_batch_list(self, batch_list: List[Batch]) -> None:
         batch: Batch
         for batch in batch_list:
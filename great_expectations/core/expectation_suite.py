@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import bisect
 import datetime
 import json
 import logging
@@ -11,6 +12,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Hashable,
     List,
     Optional,
     Sequence,
@@ -62,6 +64,273 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_UNHASHABLE_VALUE: object = object()
+
+
+def _to_hashable(value: Any) -> Hashable:
+    """
+    Returns hashable stand-in for "value" (e.g., kwargs of "ExpectationConfiguration"), such that equal values always
+    have equal stand-ins; unequal values may share stand-in, since index lookups verify candidates with full comparison.
+    """
+    if isinstance(value, dict):
+        return frozenset((key, _to_hashable(element)) for key, element in value.items())
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_to_hashable(element) for element in value)
+
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+
+    try:
+        hash(value)
+    except TypeError:
+        return _UNHASHABLE_VALUE
+
+    return value
+
+
+_INDEX_KEY_BY_MATCH_TYPE: Dict[str, Callable[[ExpectationConfiguration], Hashable]] = {
+    "domain": lambda expectation_configuration: (
+        expectation_configuration.expectation_type,
+        _to_hashable(expectation_configuration.get_domain_kwargs()),
+    ),
+    "success": lambda expectation_configuration: (
+        expectation_configuration.expectation_type,
+        _to_hashable(expectation_configuration.get_success_kwargs()),
+    ),
+    "runtime": lambda expectation_configuration: (
+        expectation_configuration.expectation_type,
+        _to_hashable(expectation_configuration.kwargs),
+    ),
+}
+
+_GE_CLOUD_ID_INDEX_NAME: str = "ge_cloud_id"
+
+
+class _ExpectationConfigurationList(list):
+    """
+    List of "ExpectationConfiguration" objects of "ExpectationSuite", which maintains hash indexes of positions of its
+    elements, keyed by "expectation_type" together with domain kwargs ("domain" match type), success kwargs ("success"
+    match type), or all kwargs ("runtime" match type), and by "ge_cloud_id".  Index is built on first lookup, is updated
+    when an element is appended or replaced, and is rebuilt on next lookup after any other mutation of the list.
+
+    Since elements can be changed in place (e.g., "suite.expectations[0].kwargs["column"] = "c""), leaving their stored
+    index keys stale, snapshot of "expectation_type", kwargs, and "ge_cloud_id" of every indexed element is kept, and
+    elements, which no longer equal their snapshots, are re-keyed before every lookup; indexed candidates are verified
+    against current element (keys of unequal values may coincide).
+    """
+
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        # Index name ("match_type" or "ge_cloud_id") -> key -> ascending positions; per-position keys (for updates).
+        self._positions_by_key: Dict[str, Dict[Hashable, List[int]]] = {}
+        self._keys_by_position: Dict[str, List[Hashable]] = {}
+        # Per-position snapshots of indexed elements (for detecting elements, changed in place).
+        self._snapshots: List[Any] = []
+
+    def find_indexes(
+        self,
+        expectation_configuration: Optional[ExpectationConfiguration] = None,
+        match_type: str = "domain",
+        ge_cloud_id: Optional[str] = None,
+    ) -> List[int]:
+        """Same as "ExpectationSuite.find_expectation_indexes()", but using index instead of scanning the list."""
+        if not self:
+            return []
+
+        index_name: str
+        key: Hashable
+        if ge_cloud_id is not None:
+            index_name = _GE_CLOUD_ID_INDEX_NAME
+            key = ge_cloud_id
+        else:
+            index_name = match_type
+            key = _INDEX_KEY_BY_MATCH_TYPE[match_type](expectation_configuration)  # type: ignore[arg-type]
+
+        self._rekey_changed_positions()
+        positions: List[int] = self._get_index(index_name=index_name).get(key, [])
+
+        def _matches(candidate: ExpectationConfiguration) -> bool:
+            if ge_cloud_id is not None:
+                return candidate.ge_cloud_id == ge_cloud_id
+
+            return candidate.isEquivalentTo(
+                other=expectation_configuration, match_type=match_type  # type: ignore[arg-type]
+            )
+
+        position: int
+        return [
+            position for position in positions if _matches(candidate=self[position])
+        ]
+
+    @staticmethod
+    def _get_snapshot_values(
+        expectation_configuration: ExpectationConfiguration,
+    ) -> tuple:
+        return (
+            expectation_configuration.expectation_type,
+            expectation_configuration.kwargs,
+            expectation_configuration.ge_cloud_id,
+        )
+
+    @classmethod
+    def _take_snapshot(cls, expectation_configuration: ExpectationConfiguration) -> Any:
+        try:
+            return deepcopy(
+                cls._get_snapshot_values(
+                    expectation_configuration=expectation_configuration
+                )
+            )
+        except Exception:
+            # Never equal to current values, so that element is re-keyed before every lookup.
+            return _UNHASHABLE_VALUE
+
+    def _is_snapshot_current(self, position: int) -> bool:
+        try:
+            return bool(
+                self._snapshots[position]
+                == self._get_snapshot_values(expectation_configuration=self[position])
+            )
+        except Exception:
+            return False
+
+    def _rekey_changed_positions(self) -> None:
+        if not self._positions_by_key:
+            return
+
+        position: int
+        for position in range(len(self)):
+            if not self._is_snapshot_current(position=position):
+                self._index_position(position=position)
+
+    @staticmethod
+    def _get_key(
+        index_name: str, expectation_configuration: ExpectationConfiguration
+    ) -> Hashable:
+        if index_name == _GE_CLOUD_ID_INDEX_NAME:
+            return _to_hashable(expectation_configuration.ge_cloud_id)
+
+        return _INDEX_KEY_BY_MATCH_TYPE[index_name](expectation_configuration)
+
+    def _get_index(self, index_name: str) -> Dict[Hashable, List[int]]:
+        if index_name not in self._positions_by_key:
+            keys: List[Hashable] = []
+            positions_by_key: Dict[Hashable, List[int]] = {}
+            position: int
+            expectation_configuration: ExpectationConfiguration
+            for position, expectation_configuration in enumerate(self):
+                key: Hashable = self._get_key(
+                    index_name=index_name,
+                    expectation_configuration=expectation_configuration,
+                )
+                keys.append(key)
+                positions_by_key.setdefault(key, []).append(position)
+
+            if not self._positions_by_key:
+                self._snapshots = [
+                    self._take_snapshot(
+                        expectation_configuration=expectation_configuration
+                    )
+                    for expectation_configuration in self
+                ]
+
+            self._keys_by_position[index_name] = keys
+            self._positions_by_key[index_name] = positions_by_key
+
+        return self._positions_by_key[index_name]
+
+    def _invalidate_index(self) -> None:
+        self._positions_by_key = {}
+        self._keys_by_position = {}
+        self._snapshots = []
+
+    def _index_position(self, position: int) -> None:
+        if not self._positions_by_key:
+            return
+
+        snapshot: Any = self._take_snapshot(expectation_configuration=self[position])
+        if position == len(self._snapshots):
+            self._snapshots.append(snapshot)
+        else:
+            self._snapshots[position] = snapshot
+
+        index_name: str
+        for index_name, positions_by_key in self._positions_by_key.items():
+            keys: List[Hashable] = self._keys_by_position[index_name]
+            key: Hashable = self._get_key(
+                index_name=index_name, expectation_configuration=self[position]
+            )
+            if position == len(keys):
+                keys.append(key)
+                positions_by_key.setdefault(key, []).append(position)
+                continue
+
+            positions: List[int] = positions_by_key[keys[position]]
+            positions.remove(position)
+            if not positions:
+                del positions_by_key[keys[position]]
+
+            keys[position] = key
+            bisect.insort(positions_by_key.setdefault(key, []), position)
+
+    def append(self, expectation_configuration: ExpectationConfiguration) -> None:
+        super().append(expectation_configuration)
+        self._index_position(position=len(self) - 1)
+
+    def __setitem__(self, position, value) -> None:
+        super().__setitem__(position, value)
+        if isinstance(position, int):
+            self._index_position(position=position % len(self))
+        else:
+            self._invalidate_index()
+
+    def __delitem__(self, position) -> None:
+        super().__delitem__(position)
+        self._invalidate_index()
+
+    def __iadd__(self, other):
+        self._invalidate_index()
+        return super().__iadd__(other)
+
+    def __imul__(self, other):
+        self._invalidate_index()
+        return super().__imul__(other)
+
+    def extend(self, other) -> None:
+        super().extend(other)
+        self._invalidate_index()
+
+    def insert(self, position, expectation_configuration) -> None:
+        super().insert(position, expectation_configuration)
+        self._invalidate_index()
+
+    def pop(self, position=-1):
+        self._invalidate_index()
+        return super().pop(position)
+
+    def remove(self, expectation_configuration) -> None:
+        super().remove(expectation_configuration)
+        self._invalidate_index()
+
+    def clear(self) -> None:
+        super().clear()
+        self._invalidate_index()
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._invalidate_index()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._invalidate_index()
+
+    def __reduce__(self):
+        # Index is not serialized; it is rebuilt on first lookup.
+        return self.__class__, (list(self),)
+
+    def __deepcopy__(self, memo: dict):
+        return self.__class__(deepcopy(list(self), memo))
+
 
 @public_api
 @deprecated_argument(argument_name="data_asset_type", version="0.14.0")
@@ -106,12 +375,12 @@ class ExpectationSuite(SerializableDictDot):
 
         if expectations is None:
             expectations = []
-        self.expectations = [
+        self.expectations = _ExpectationConfigurationList(
             ExpectationConfiguration(**expectation)
             if isinstance(expectation, dict)
             else expectation
             for expectation in expectations
-        ]
+        )
         if evaluation_parameters is None:
             evaluation_parameters = {}
         self.evaluation_parameters = evaluation_parameters
@@ -402,11 +671,11 @@ class ExpectationSuite(SerializableDictDot):
             for expectation in self.expectations
             if expectation.expectation_type in expectation_types
         ]
-        self.expectations = [
+        self.expectations = _ExpectationConfigurationList(
             expectation
             for expectation in self.expectations
             if expectation.expectation_type not in expectation_types
-        ]
+        )
 
         return removed_expectations
 
@@ -448,6 +717,16 @@ class ExpectationSuite(SerializableDictDot):
                 "Ensure that expectation configuration is valid."
             )
 
+        # Suites, whose "expectations" were replaced with plain "list" (rather than "ExpectationSuite" methods), are scanned.
+        if isinstance(self.expectations, _ExpectationConfigurationList) and (
+            ge_cloud_id is not None or match_type in _INDEX_KEY_BY_MATCH_TYPE
+        ):
+            return self.expectations.find_indexes(
+                expectation_configuration=expectation_configuration,
+                match_type=match_type,
+                ge_cloud_id=ge_cloud_id,
+            )
+
         match_indexes = []
         for idx, expectation in enumerate(self.expectations):
             if ge_cloud_id is not None:
@@ -581,8 +860,12 @@ class ExpectationSuite(SerializableDictDot):
                 "criteria"
             )
 
-        self.expectations[found_expectation_indexes[0]].patch(op, path, value)
-        return self.expectations[found_expectation_indexes[0]]
+        patched_expectation: ExpectationConfiguration = self.expectations[
+            found_expectation_indexes[0]
+        ].patch(op, path, value)
+        # Re-assignment keeps index of "expectations" consistent with patched kwargs.
+        self.expectations[found_expectation_indexes[0]] = patched_expectation
+        return patched_expectation
 
     def _add_expectation(
         self,
@@ -1,11 +1,15 @@
+import copy
 import hashlib
 import json
-from typing import Any, Set, TypeVar, Union
+from typing import Any, NoReturn, Optional, Set, Tuple, TypeVar, Union
 
 from great_expectations.core.util import convert_to_json_serializable
 
 T = TypeVar("T")
 
+# Types, whose instances JSON encoder serializes exactly as they are returned by "convert_to_json_serializable()".
+_JSON_NATIVE_SCALAR_TYPES = (str, int, bool, type(None))
+
 
 class IDDict(dict):
     _id_ignore_keys: Set[str] = set()
@@ -22,9 +26,8 @@ class IDDict(dict):
             key = list(id_keys)[0]
             return f"{key}={str(self[key])}"
 
-        _id_dict = convert_to_json_serializable(data={k: self[k] for k in id_keys})
         return hashlib.md5(
-            json.dumps(_id_dict, sort_keys=True).encode("utf-8")
+            _to_canonical_json(data={k: self[k] for k in id_keys}).encode("utf-8")
         ).hexdigest()
 
     def __hash__(self) -> int:  # type: ignore[override]
@@ -33,6 +36,86 @@ class IDDict(dict):
         return _result_hash
 
 
+class FrozenIDDict(IDDict):
+    """Immutable IDDict, whose id (and hash) are computed only once.
+
+    Nested values must not be modified either.  Copies are (mutable) IDDict objects.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._id: Optional[Union[str, Tuple]] = None
+        self._hash: Optional[int] = None
+
+    def to_id(self, id_keys=None, id_ignore_keys=None):
+        if id_keys is not None or id_ignore_keys is not None:
+            return super().to_id(id_keys=id_keys, id_ignore_keys=id_ignore_keys)
+
+        if self._id is None:
+            self._id = super().to_id()
+
+        return self._id
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        if self._hash is None:
+            self._hash = hash(self.to_id())
+
+        return self._hash
+
+    def __copy__(self) -> IDDict:
+        return IDDict(self)
+
+    def __deepcopy__(self, memo: dict) -> IDDict:
+        return IDDict(copy.deepcopy(dict(self), memo))
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    def _raise_immutable(self, *args, **kwargs) -> NoReturn:
+        raise TypeError(f'"{type(self).__name__}" object is immutable.')
+
+    __setitem__ = _raise_immutable
+    __delitem__ = _raise_immutable
+    __ior__ = _raise_immutable  # type: ignore[assignment]
+    clear = _raise_immutable
+    pop = _raise_immutable
+    popitem = _raise_immutable
+    setdefault = _raise_immutable
+    update = _raise_immutable
+
+
+def _to_canonical_json(data: dict) -> str:
+    """Returns JSON string of data (with sorted keys), identical to that of "convert_to_json_serializable(data)".
+
+    Conversion is skipped for data made of JSON-native types only (usual for kwargs), which JSON encoder handles as is.
+    """
+    if not _is_json_native(data=data):
+        data = convert_to_json_serializable(data=data)
+
+    return json.dumps(data, sort_keys=True)
+
+
+def _is_json_native(data: Any) -> bool:
+    data_type: type = type(data)
+    if data_type in _JSON_NATIVE_SCALAR_TYPES:
+        return True
+
+    if data_type is float:
+        # NaN is converted to None.
+        return data == data  # noqa: PLR0124
+
+    if data_type is dict:
+        return all(
+            type(key) is str and _is_json_native(data=value)
+            for key, value in data.items()
+        )
+
+    if data_type in (list, tuple):
+        return all(_is_json_native(data=element) for element in data)
+
+    return False
+
+
 def deep_convert_properties_iterable_to_id_dict(
     source: Union[T, dict]
 ) -> Union[T, IDDict]:
@@ -0,0 +1,438 @@
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+# KLL compactors shrink geometrically with distance from top level (as in original paper of Karnin, Lang, and Liberty).
+_KLL_CAPACITY_DECAY = 2.0 / 3.0
+_KLL_MIN_K = 8
+# Normalized rank error of KLL sketch is approximately 1.65 / k (for two-sided queries, with high probability).
+_KLL_RANK_ERROR_FACTOR = 1.65
+
+_HYPER_LOG_LOG_MIN_PRECISION = 4
+_HYPER_LOG_LOG_MAX_PRECISION = 18
+# Standard error of HyperLogLog estimate is approximately 1.04 / sqrt(number of registers).
+_HYPER_LOG_LOG_STANDARD_ERROR_FACTOR = 1.04
+# Small cardinalities (raw estimate of at most 2.5 times number of registers) are estimated by linear counting instead.
+_SMALL_RANGE_CORRECTION_FACTOR = 2.5
+
+
+class Sketch(ABC):
+    """Sketch is compact, mergeable summary of values, from which their statistics are estimated with bounded error.
+
+    Sketches, updated with disjoint parts of data (e.g., chunks of Batch, or Batches), are merged into sketch of all of
+    data; "to_json_dict()" and "from_json_dict()" serialize them (e.g., for combining sketches computed elsewhere).
+    Null values are never accounted for.
+    """
+
+    @classmethod
+    @abstractmethod
+    def from_relative_error(cls, relative_error: float) -> Sketch:
+        """Returns empty sketch, sized so that its estimates have given relative error (fraction between 0 and 1)."""
+        pass
+
+    @abstractmethod
+    def update(self, values: Sequence[Any]) -> None:
+        """Accounts for values (array-like, e.g., list, NumPy array, or Pandas Series)."""
+        pass
+
+    @abstractmethod
+    def merge(self, other: Sketch) -> None:
+        """Accounts for values, which "other" sketch (of same type) has been updated with."""
+        pass
+
+    @abstractmethod
+    def to_json_dict(self) -> dict:
+        """Returns JSON-serializable dictionary, holding state of sketch."""
+        pass
+
+    @classmethod
+    @abstractmethod
+    def from_json_dict(cls, sketch_dict: dict) -> Sketch:
+        """Returns sketch, whose state is given by dictionary, obtained from "to_json_dict()"."""
+        pass
+
+    def _validate_merged_sketch_type(self, other: Sketch) -> None:
+        if not isinstance(other, type(self)):
+            raise TypeError(
+                f'Sketch of type "{type(other).__name__}" cannot be merged into "{type(self).__name__}".'
+            )
+
+
+class KLLSketch(Sketch):
+    """KLL (Karnin, Lang, and Liberty) quantiles sketch of numeric values.
+
+    Values are kept in hierarchy of compactors; compactor at level "h" holds values of weight 2^h, and, once full, sorts
+    them and promotes every other value to next level (alternating between even and odd positions, which makes sketch
+    deterministic).  Quantiles are estimated from weighted ranks of retained values.
+
+    Args:
+        k: capacity of top level compactor, controlling accuracy (normalized rank error is approximately 1.65 / k).
+    """
+
+    def __init__(self, k: int = 200) -> None:
+        if k < _KLL_MIN_K:
+            raise ValueError(f"KLL sketch requires k of at least {_KLL_MIN_K}.")
+
+        self._k = k
+        self._count = 0
+        self._compactors: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._offsets: List[int] = [0]
+
+    @classmethod
+    def from_relative_error(cls, relative_error: float) -> KLLSketch:
+        _validate_relative_error(relative_error=relative_error)
+        return cls(
+            k=max(_KLL_MIN_K, math.ceil(_KLL_RANK_ERROR_FACTOR / relative_error))
+        )
+
+    @property
+    def k(self) -> int:
+        return self._k
+
+    @property
+    def count(self) -> int:
+        """Number of (non-null) values accounted for."""
+        return self._count
+
+    def update(self, values: Sequence[Any]) -> None:
+        array: np.ndarray = np.asarray(values, dtype=np.float64)
+        array = array[~np.isnan(array)]
+        if len(array) == 0:
+            return
+
+        self._count += len(array)
+        self._compactors[0] = np.concatenate((self._compactors[0], array))
+        self._compress()
+
+    def merge(self, other: Sketch) -> None:
+        self._validate_merged_sketch_type(other=other)
+        assert isinstance(other, KLLSketch)
+
+        self._k = min(self._k, other._k)
+        while len(self._compactors) < len(other._compactors):
+            self._add_level()
+
+        level: int
+        compactor: np.ndarray
+        for level, compactor in enumerate(other._compactors):
+            self._compactors[level] = np.concatenate(
+                (self._compactors[level], compactor)
+            )
+
+        self._count += other._count
+        self._compress()
+
+    def quantiles(self, quantiles: Sequence[float]) -> List[float]:
+        """Returns estimates of quantiles (NaN, if no values have been accounted for)."""
+        if self._count == 0:
+            return [math.nan for _ in quantiles]
+
+        items: np.ndarray = np.concatenate(self._compactors)
+        weights: np.ndarray = np.concatenate(
+            [
+                np.full(len(compactor), 2**level, dtype=np.int64)
+                for level, compactor in enumerate(self._compactors)
+            ]
+        )
+        order: np.ndarray = np.argsort(items, kind="stable")
+        items = items[order]
+        cumulative_weights: np.ndarray = np.cumsum(weights[order])
+
+        targets: np.ndarray = (
+            np.asarray(quantiles, dtype=np.float64) * cumulative_weights[-1]
+        )
+        indices: np.ndarray = np.minimum(
+            np.searchsorted(cumulative_weights, targets, side="left"), len(items) - 1
+        )
+        return items[indices].tolist()
+
+    def to_json_dict(self) -> dict:
+        return {
+            "k": self._k,
+            "count": self._count,
+            "compactors": [compactor.tolist() for compactor in self._compactors],
+            "offsets": list(self._offsets),
+        }
+
+    @classmethod
+    def from_json_dict(cls, sketch_dict: dict) -> KLLSketch:
+        sketch = cls(k=sketch_dict["k"])
+        sketch._count = sketch_dict["count"]
+        sketch._compactors = [
+            np.asarray(compactor, dtype=np.float64)
+            for compactor in sketch_dict["compactors"]
+        ]
+        sketch._offsets = list(sketch_dict["offsets"])
+        return sketch
+
+    def _capacity(self, level: int) -> int:
+        depth: int = len(self._compactors) - level - 1
+        return max(2, math.ceil(self._k * _KLL_CAPACITY_DECAY**depth))
+
+    def _add_level(self) -> None:
+        self._compactors.append(np.empty(0, dtype=np.float64))
+        self._offsets.append(0)
+
+    def _compress(self) -> None:
+        # Compaction is lazy: lowest full compactor is compacted only while sketch exceeds its total capacity.
+        while sum(len(compactor) for compactor in self._compactors) >= sum(
+            self._capacity(level=level) for level in range(len(self._compactors))
+        ):
+            level: int = next(
+                level
+                for level, compactor in enumerate(self._compactors)
+                if len(compactor) >= self._capacity(level=level)
+            )
+            if level + 1 == len(self._compactors):
+                self._add_level()
+
+            self._compactors[level + 1] = np.concatenate(
+                (self._compactors[level + 1], self._compact(level=level))
+            )
+
+    def _compact(self, level: int) -> np.ndarray:
+        items: np.ndarray = np.sort(self._compactors[level])
+        kept: np.ndarray = items[:0]
+        if len(items) % 2 == 1:
+            kept, items = items[:1], items[1:]
+
+        offset: int = self._offsets[level]
+        self._offsets[level] = 1 - offset
+        self._compactors[level] = kept
+        return items[offset::2]
+
+
+class HyperLogLogSketch(Sketch):
+    """HyperLogLog sketch of number of distinct values.
+
+    Every value is hashed to 64 bits; first "precision" bits select register, which retains maximum (over values) of
+    position of leftmost 1-bit in remaining bits.  Harmonic mean of registers estimates number of distinct values (with
+    linear counting correction for small cardinalities).
+
+    Args:
+        precision: number of bits, selecting register (sketch holds 2^precision registers).
+    """
+
+    def __init__(self, precision: int = 12) -> None:
+        if not (
+            _HYPER_LOG_LOG_MIN_PRECISION <= precision <= _HYPER_LOG_LOG_MAX_PRECISION
+        ):
+            raise ValueError(
+                f"HyperLogLog sketch requires precision between {_HYPER_LOG_LOG_MIN_PRECISION} and \
+{_HYPER_LOG_LOG_MAX_PRECISION}."
+            )
+
+        self._precision = precision
+        self._registers: np.ndarray = np.zeros(2**precision, dtype=np.uint8)
+
+    @classmethod
+    def from_relative_error(cls, relative_error: float) -> HyperLogLogSketch:
+        _validate_relative_error(relative_error=relative_error)
+        precision: int = math.ceil(
+            math.log2((_HYPER_LOG_LOG_STANDARD_ERROR_FACTOR / relative_error) ** 2)
+        )
+        return cls(
+            precision=min(
+                max(precision, _HYPER_LOG_LOG_MIN_PRECISION),
+                _HYPER_LOG_LOG_MAX_PRECISION,
+            )
+        )
+
+    @property
+    def precision(self) -> int:
+        return self._precision
+
+    def update(self, values: Sequence[Any]) -> None:
+        hashes: np.ndarray = _hash_values(values=values)
+        if len(hashes) == 0:
+            return
+
+        suffix_bits: int = 64 - self._precision
+        indices: np.ndarray = (hashes >> np.uint64(suffix_bits)).astype(np.intp)
+        suffixes: np.ndarray = hashes & np.uint64((1 << suffix_bits) - 1)
+        # Position of leftmost 1-bit within suffix (suffix of zeros yields "suffix_bits + 1").
+        ranks: np.ndarray = suffix_bits - _bit_length(values=suffixes) + 1
+        np.maximum.at(self._registers, indices, ranks.astype(np.uint8))
+
+    def merge(self, other: Sketch) -> None:
+        self._validate_merged_sketch_type(other=other)
+        assert isinstance(other, HyperLogLogSketch)
+
+        if other._precision != self._precision:
+            raise ValueError(
+                f"HyperLogLog sketches of different precisions ({self._precision} and {other._precision}) cannot be \
+merged."
+            )
+
+        np.maximum(self._registers, other._registers, out=self._registers)
+
+    def estimate(self) -> int:
+        """Returns estimate of number of distinct values."""
+        registers_count: int = len(self._registers)
+        alpha: float = 0.7213 / (1.0 + 1.079 / registers_count)
+        raw_estimate: float = (
+            alpha
+            * registers_count**2
+            / float(np.sum(np.power(2.0, -self._registers.astype(np.float64))))
+        )
+        zero_registers_count: int = int(np.count_nonzero(self._registers == 0))
+        if (
+            raw_estimate <= _SMALL_RANGE_CORRECTION_FACTOR * registers_count
+            and zero_registers_count > 0
+        ):
+            return round(
+                registers_count * math.log(registers_count / zero_registers_count)
+            )
+
+        return round(raw_estimate)
+
+    def to_json_dict(self) -> dict:
+        return {
+            "precision": self._precision,
+            "registers": self._registers.tolist(),
+        }
+
+    @classmethod
+    def from_json_dict(cls, sketch_dict: dict) -> HyperLogLogSketch:
+        sketch = cls(precision=sketch_dict["precision"])
+        sketch._registers = np.asarray(sketch_dict["registers"], dtype=np.uint8)
+        return sketch
+
+
+class MisraGriesSketch(Sketch):
+    """Misra-Gries sketch of frequent values ("heavy hitters").
+
+    At most "capacity" counters are retained; whenever more are needed, all counts are decreased by smallest count,
+    which is not among "capacity" largest ones (making sketch mergeable, as shown by Agarwal et al.).  Counts of values
+    are underestimated by at most "maximum_error" (which never exceeds number of values divided by "capacity" + 1), so
+    every value, more frequent than that, is retained.
+
+    Args:
+        capacity: maximum number of retained counters.
+    """
+
+    def __init__(self, capacity: int = 100) -> None:
+        if capacity < 1:
+            raise ValueError("Misra-Gries sketch requires positive capacity.")
+
+        self._capacity = capacity
+        self._count = 0
+        self._counters: Dict[Any, int] = {}
+
+    @classmethod
+    def from_relative_error(cls, relative_error: float) -> MisraGriesSketch:
+        _validate_relative_error(relative_error=relative_error)
+        return cls(capacity=math.ceil(1.0 / relative_error))
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def count(self) -> int:
+        """Number of (non-null) values accounted for."""
+        return self._count
+
+    @property
+    def maximum_error(self) -> float:
+        """Upper bound of difference between actual and estimated count of any value."""
+        return (self._count - sum(self._counters.values())) / (self._capacity + 1)
+
+    def update(self, values: Sequence[Any]) -> None:
+        value_counts: pd.Series = pd.Series(values, dtype=object).value_counts(
+            dropna=True
+        )
+        self._add_counters(
+            counters=dict(zip(value_counts.index.tolist(), value_counts.tolist())),
+            count=int(value_counts.sum()),
+        )
+
+    def merge(self, other: Sketch) -> None:
+        self._validate_merged_sketch_type(other=other)
+        assert isinstance(other, MisraGriesSketch)
+
+        self._capacity = min(self._capacity, other._capacity)
+        self._add_counters(counters=other._counters, count=other._count)
+
+    def heavy_hitters(self) -> Dict[Any, int]:
+        """Returns retained values with (underestimated) counts, from most to least frequent."""
+        return dict(
+            sorted(self._counters.items(), key=lambda element: element[1], reverse=True)
+        )
+
+    def to_json_dict(self) -> dict:
+        return {
+            "capacity": self._capacity,
+            "count": self._count,
+            "counters": [[value, count] for value, count in self._counters.items()],
+        }
+
+    @classmethod
+    def from_json_dict(cls, sketch_dict: dict) -> MisraGriesSketch:
+        sketch = cls(capacity=sketch_dict["capacity"])
+        sketch._count = sketch_dict["count"]
+        sketch._counters = {value: count for value, count in sketch_dict["counters"]}
+        return sketch
+
+    def _add_counters(self, counters: Dict[Any, int], count: int) -> None:
+        value: Any
+        value_count: int
+        for value, value_count in counters.items():
+            self._counters[value] = self._counters.get(value, 0) + value_count
+
+        self._count += count
+
+        if len(self._counters) > self._capacity:
+            threshold: int = sorted(self._counters.values(), reverse=True)[
+                self._capacity
+            ]
+            self._counters = {
+                value: value_count - threshold
+                for value, value_count in self._counters.items()
+                if value_count > threshold
+            }
+
+
+def _validate_relative_error(relative_error: float) -> None:
+    if not 0.0 < relative_error < 1.0:
+        raise ValueError(
+            f"Relative error of sketch must be between 0 and 1 (exclusive), but {relative_error} was given."
+        )
+
+
+def _hash_values(values: Sequence[Any]) -> np.ndarray:
+    """Returns 64-bit hashes of non-null values, which are equal for equal values (regardless of their numeric type)."""
+    array: np.ndarray = np.asarray(values)
+    if array.dtype.kind in "USO":
+        array = array.astype(object)
+
+    array = array[~pd.isnull(array)]
+    if array.dtype.kind in "biuf":
+        # Integers and floats, which are equal, must hash equally (chunks of same column may differ in numeric type).
+        # Adding zero also normalizes negative zero.
+        array = array.astype(np.float64) + 0.0
+
+    try:
+        return pd.util.hash_array(array)
+    except (TypeError, ValueError):
+        # Objects, other than strings, are hashed by their string representations (as Pandas does for mixed types).
+        return pd.util.hash_array(
+            np.array([str(value) for value in array], dtype=object)
+        )
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Returns numbers of significant bits of unsigned 64-bit integers (with exact floating point arithmetic)."""
+    high: np.ndarray = (values >> np.uint64(32)).astype(np.float64)
+    low: np.ndarray = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    with np.errstate(divide="ignore"):
+        return np.where(
+            high > 0,
+            np.floor(np.log2(high)) + 33,
+            np.where(low > 0, np.floor(np.log2(low)) + 1, 0),
+        ).astype(np.int64)
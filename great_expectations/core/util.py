@@ -271,6 +271,13 @@ def convert_to_json_serializable(  # noqa: C901 - complexity 32
     Raises:
         TypeError: A non-JSON-serializable field was found.
     """
+    # Values of most common exact types (builtins, numeric arrays) are converted without walking "isinstance" chain.
+    converter: Optional[
+        Callable[[Any], JSONValues]
+    ] = _JSON_CONVERTER_BY_EXACT_TYPE.get(type(data))
+    if converter is not None:
+        return converter(data)
+
     if isinstance(data, pydantic.BaseModel):
         return json.loads(data.json())
 
@@ -304,10 +311,7 @@ def convert_to_json_serializable(  # noqa: C901 - complexity 32
         return new_list
 
     if isinstance(data, (np.ndarray, pd.Index)):
-        # test_obj[key] = test_obj[key].tolist()
-        # If we have an array or index, convert it first to a list--causing coercion to float--and then round
-        # to the number of digits for which the string representation will equal the float representation
-        return [convert_to_json_serializable(x) for x in data.tolist()]
+        return _convert_array_to_json_serializable(data=data)
 
     if isinstance(data, np.int64):
         return int(data)
@@ -366,17 +370,7 @@ def convert_to_json_serializable(  # noqa: C901 - complexity 32
         pass
 
     if isinstance(data, pd.Series):
-        # Converting a series is tricky since the index may not be a string, but all json
-        # keys must be strings. So, we use a very ugly serialization strategy
-        index_name = data.index.name or "index"
-        value_name = data.name or "value"
-        return [
-            {
-                index_name: convert_to_json_serializable(idx),
-                value_name: convert_to_json_serializable(val),
-            }
-            for idx, val in data.items()
-        ]
+        return _convert_series_to_json_serializable(data=data)
 
     if isinstance(data, pd.DataFrame):
         return convert_to_json_serializable(data.to_dict(orient="records"))
@@ -415,6 +409,97 @@ def convert_to_json_serializable(  # noqa: C901 - complexity 32
     )
 
 
+def _convert_float_to_json_serializable(data: float) -> Optional[float]:
+    # Handling "float(nan)" separately is required by Python-3.6 and Pandas-0.23 versions.
+    if np.isnan(data):
+        return None
+
+    return data
+
+
+def _convert_dict_to_json_serializable(data: dict) -> dict:
+    # A pandas index can be numeric, and a dict key can be numeric, but a json key must be a string
+    return {str(key): convert_to_json_serializable(data[key]) for key in data}
+
+
+def _convert_collection_to_json_serializable(
+    data: Union[list, tuple, set]
+) -> List[JSONValues]:
+    return [convert_to_json_serializable(val) for val in data]
+
+
+def _convert_numeric_array_to_list(array: Any) -> Optional[list]:
+    """
+    Converts "numpy" array of boolean, integer, or floating dtype to (nested) list of Python scalars in bulk, replacing
+    "NaN" with None; returns None for arrays of other dtypes (and for 0-dimensional arrays), which are converted per value.
+    """
+    if not (
+        isinstance(array, np.ndarray) and array.ndim > 0 and array.dtype.kind in "biuf"
+    ):
+        return None
+
+    if array.dtype.kind == "f":
+        is_nan: npt.NDArray = np.isnan(array)
+        if is_nan.any():
+            array = array.astype(object)
+            array[is_nan] = None
+
+    return array.tolist()
+
+
+def _convert_array_to_json_serializable(data: Union[npt.NDArray, pd.Index]) -> list:
+    values: Optional[list] = _convert_numeric_array_to_list(array=np.asarray(data))
+    if values is not None:
+        return values
+
+    # test_obj[key] = test_obj[key].tolist()
+    # If we have an array or index, convert it first to a list--causing coercion to float--and then round
+    # to the number of digits for which the string representation will equal the float representation
+    return [convert_to_json_serializable(x) for x in data.tolist()]
+
+
+def _convert_series_to_json_serializable(data: pd.Series) -> List[dict]:
+    # Converting a series is tricky since the index may not be a string, but all json
+    # keys must be strings. So, we use a very ugly serialization strategy
+    index_name = data.index.name or "index"
+    value_name = data.name or "value"
+
+    index_values: Optional[list] = _convert_numeric_array_to_list(
+        array=data.index.to_numpy()
+    )
+    if index_values is None:
+        index_values = [convert_to_json_serializable(idx) for idx in data.index]
+
+    values: Optional[list] = _convert_numeric_array_to_list(array=data.to_numpy())
+    if values is None:
+        values = [convert_to_json_serializable(val) for val in data]
+
+    return [
+        {
+            index_name: idx,
+            value_name: val,
+        }
+        for idx, val in zip(index_values, values)
+    ]
+
+
+# Converters for values, whose type is exactly (not subclass of) given type; subclasses (e.g., "SerializableDotDict",
+# which is "dict", or "numpy.float64", which is "float") take full "isinstance" path of "convert_to_json_serializable()".
+_JSON_CONVERTER_BY_EXACT_TYPE: Dict[type, Callable[[Any], JSONValues]] = {
+    str: lambda data: data,
+    int: lambda data: data,
+    bool: lambda data: data,
+    type(None): lambda data: data,
+    float: _convert_float_to_json_serializable,
+    dict: _convert_dict_to_json_serializable,
+    list: _convert_collection_to_json_serializable,
+    tuple: _convert_collection_to_json_serializable,
+    set: _convert_collection_to_json_serializable,
+    np.ndarray: _convert_array_to_json_serializable,
+    pd.Series: _convert_series_to_json_serializable,
+}
+
+
 def ensure_json_serializable(data):  # noqa: C901 - complexity 21
     """
     Helper function to convert an object to one that is json serializable
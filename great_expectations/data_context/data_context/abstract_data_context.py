@@ -12,6 +12,7 @@ import warnings
 import webbrowser
 from abc import ABC, abstractmethod
 from collections import OrderedDict
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -105,6 +106,7 @@ from great_expectations.data_context.util import (
 )
 from great_expectations.dataset.dataset import Dataset
 from great_expectations.datasource import LegacyDatasource
+from great_expectations.datasource.datasource_dict import LazyDatasourceDict
 from great_expectations.datasource.datasource_serializer import (
     NamedDatasourceSerializer,
 )
@@ -304,7 +306,7 @@ class AbstractDataContext(ConfigPeer, ABC):
         )
 
         # Store cached datasources but don't init them
-        self._cached_datasources: dict = {}
+        self._cached_datasources: LazyDatasourceDict = LazyDatasourceDict()
 
         # Build the datasources we know about and have access to
         self._init_datasources()
@@ -1689,14 +1691,28 @@ class AbstractDataContext(ConfigPeer, ABC):
         if not datasource_name:
             raise ValueError("Datasource names must be a datasource name")
 
-        datasource = self.get_datasource(datasource_name=datasource_name)
-
-        if isinstance(datasource, FluentDatasource):
-            # Note: this results in some unnecessary dict lookups
-            self._delete_fluent_datasource(datasource_name)
-        elif save_changes:
-            datasource_config = datasourceConfigSchema.load(datasource.config)
-            self._datasource_store.delete(datasource_config)
+        if self._cached_datasources.is_pending(datasource_name):
+            # Pending Datasources are configured by "datasources" (never "fluent_datasources"); they are deleted by
+            # their configuration, without instantiating (e.g., connecting to) them.
+            if save_changes:
+                datasource_config = datasourceConfigSchema.load(
+                    dict(
+                        datasourceConfigSchema.dump(
+                            self.config.datasources[datasource_name]  # type: ignore[index]
+                        )
+                    )
+                )
+                datasource_config.name = datasource_name
+                self._datasource_store.delete(datasource_config)
+        else:
+            datasource = self.get_datasource(datasource_name=datasource_name)
+
+            if isinstance(datasource, FluentDatasource):
+                # Note: this results in some unnecessary dict lookups
+                self._delete_fluent_datasource(datasource_name)
+            elif save_changes:
+                datasource_config = datasourceConfigSchema.load(datasource.config)
+                self._datasource_store.delete(datasource_config)
         self._cached_datasources.pop(datasource_name, None)
         self.config.datasources.pop(datasource_name, None)  # type: ignore[union-attr]
 
@@ -4578,14 +4594,15 @@ Generated, evaluated, and stored {total_expectations} Expectations during profil
     def datasources(
         self,
     ) -> Dict[str, Union[LegacyDatasource, BaseDatasource, FluentDatasource]]:
-        """A single holder for all Datasources in this context"""
-        return self._cached_datasources
+        """A single holder for all Datasources in this context (instantiated on first access)"""
+        return self._cached_datasources  # type: ignore[return-value] # "LazyDatasourceDict" is "MutableMapping"
 
     @property
     def fluent_datasources(self) -> Dict[str, FluentDatasource]:
+        # Pending (not yet instantiated) Datasources are always configured by "datasources" (not "fluent_datasources").
         return {
             name: ds
-            for (name, ds) in self.datasources.items()
+            for (name, ds) in self._cached_datasources.instantiated.items()
             if isinstance(ds, FluentDatasource)
         }
 
@@ -4650,32 +4667,38 @@ Generated, evaluated, and stored {total_expectations} Expectations during profil
             Dict[str, DatasourceConfig], config.datasources
         )
 
+        # Datasources are instantiated on first access (e.g., by "get_datasource()"), so that creating DataContext does
+        # not pay for instantiating (e.g., connecting to) Datasources, which are never used.
         for datasource_name, datasource_config in datasources.items():
-            try:
-                config = copy.deepcopy(datasource_config)  # type: ignore[assignment]
+            self._cached_datasources.add_pending(
+                name=datasource_name,
+                instantiate_fn=partial(
+                    self._instantiate_datasource_from_project_config,
+                    datasource_name=datasource_name,
+                    datasource_config=datasource_config,
+                ),
+            )
 
-                raw_config_dict = dict(datasourceConfigSchema.dump(config))
-                substituted_config_dict: dict = self.config_provider.substitute_config(
-                    raw_config_dict
-                )
+    def _instantiate_datasource_from_project_config(
+        self, datasource_name: str, datasource_config: DatasourceConfig
+    ) -> Datasource:
+        config = copy.deepcopy(datasource_config)
 
-                raw_datasource_config = datasourceConfigSchema.load(raw_config_dict)
-                substituted_datasource_config = datasourceConfigSchema.load(
-                    substituted_config_dict
-                )
-                substituted_datasource_config.name = datasource_name
+        raw_config_dict = dict(datasourceConfigSchema.dump(config))
+        substituted_config_dict: dict = self.config_provider.substitute_config(
+            raw_config_dict
+        )
 
-                datasource = self._instantiate_datasource_from_config(
-                    raw_config=raw_datasource_config,
-                    substituted_config=substituted_datasource_config,
-                )
-                self._cached_datasources[datasource_name] = datasource
-            except gx_exceptions.DatasourceInitializationError as e:
-                logger.warning(f"Cannot initialize datasource {datasource_name}: {e}")
-                # this error will happen if our configuration contains datasources that GX can no longer connect to.
-                # this is ok, as long as we don't use it to retrieve a batch. If we try to do that, the error will be
-                # caught at the context.get_batch() step. So we just pass here.
-                pass
+        raw_datasource_config = datasourceConfigSchema.load(raw_config_dict)
+        substituted_datasource_config = datasourceConfigSchema.load(
+            substituted_config_dict
+        )
+        substituted_datasource_config.name = datasource_name
+
+        return self._instantiate_datasource_from_config(
+            raw_config=raw_datasource_config,
+            substituted_config=substituted_datasource_config,
+        )
 
     def _instantiate_datasource_from_config(
         self,
@@ -4971,6 +4994,7 @@ Generated, evaluated, and stored {total_expectations} Expectations during profil
             "active_batch_definition", {}
         ).get("data_asset_name")
 
+        metric_kv_pairs: List[Tuple[ValidationMetricIdentifier, Any]] = []
         for expectation_suite_dependency, metrics_list in requested_metrics.items():
             if (expectation_suite_dependency != "*") and (
                 expectation_suite_dependency != expectation_suite_name
@@ -4994,19 +5018,21 @@ Generated, evaluated, and stored {total_expectations} Expectations during profil
                         metric_value = validation_results.get_metric(
                             metric_name, **metric_kwargs
                         )
-                        self.stores[target_store_name].set(
-                            ValidationMetricIdentifier(
-                                run_id=run_id,
-                                data_asset_name=data_asset_name,
-                                expectation_suite_identifier=ExpectationSuiteIdentifier(
-                                    expectation_suite_name
+                        metric_kv_pairs.append(
+                            (
+                                ValidationMetricIdentifier(
+                                    run_id=run_id,
+                                    data_asset_name=data_asset_name,
+                                    expectation_suite_identifier=ExpectationSuiteIdentifier(
+                                        expectation_suite_name
+                                    ),
+                                    metric_name=metric_name,
+                                    metric_kwargs_id=get_metric_kwargs_id(
+                                        metric_kwargs=metric_kwargs
+                                    ),
                                 ),
-                                metric_name=metric_name,
-                                metric_kwargs_id=get_metric_kwargs_id(
-                                    metric_kwargs=metric_kwargs
-                                ),
-                            ),
-                            metric_value,
+                                metric_value,
+                            )
                         )
                     except gx_exceptions.UnavailableMetricError:
                         # This will happen frequently in larger pipelines
@@ -5015,6 +5041,9 @@ Generated, evaluated, and stored {total_expectations} Expectations during profil
                             "this validation result.".format(metric_name)
                         )
 
+        if metric_kv_pairs:
+            self.stores[target_store_name].set_many(metric_kv_pairs)
+
     def send_usage_message(
         self, event: str, event_payload: Optional[dict], success: Optional[bool] = None
     ) -> None:
@@ -2,7 +2,7 @@ import logging
 import urllib
 import uuid
 from abc import ABCMeta, abstractmethod
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional, Sequence, Tuple, Union
 
 import pyparsing as pp
 
@@ -20,6 +20,8 @@ class StoreBackend(metaclass=ABCMeta):
       - _set
       - list_keys
       - _has_key
+
+    Backends, which can read or write many keys in a single round trip, should also override _get_many and _set_many.
     """
 
     IGNORED_FILES = [".ipynb_checkpoints"]
@@ -131,6 +133,29 @@ class StoreBackend(metaclass=ABCMeta):
             logger.debug(str(e))
             raise StoreBackendError("ValueError while calling _set on store backend.")
 
+    def get_many(self, keys: Sequence[tuple], **kwargs) -> List[Any]:
+        """
+        Retrieves values of all given keys, in the order of "keys", using as few round trips to the backend as it allows.
+        """
+        for key in keys:
+            self._validate_key(key)
+        return self._get_many(keys, **kwargs)
+
+    def set_many(self, kv_pairs: Sequence[Tuple[tuple, Any]], **kwargs) -> None:
+        """
+        Essentially `set` for each given key-value pair, using as few round trips to the backend as it allows.
+        """
+        for key, value in kv_pairs:
+            self._validate_key(key)
+            self._validate_value(value)
+        try:
+            self._set_many(kv_pairs, **kwargs)
+        except ValueError as e:
+            logger.debug(str(e))
+            raise StoreBackendError(
+                "ValueError while calling _set_many on store backend."
+            )
+
     def add(self, key, value, **kwargs):
         """
         Essentially `set` but validates that a given key-value pair does not already exist.
@@ -211,6 +236,13 @@ class StoreBackend(metaclass=ABCMeta):
     def _set(self, key, value, **kwargs) -> None:
         raise NotImplementedError
 
+    def _get_many(self, keys: Sequence[tuple], **kwargs) -> List[Any]:
+        return [self._get(key, **kwargs) for key in keys]
+
+    def _set_many(self, kv_pairs: Sequence[Tuple[tuple, Any]], **kwargs) -> None:
+        for key, value in kv_pairs:
+            self._set(key, value, **kwargs)
+
     @abstractmethod
     def _move(self, source_key, dest_key, **kwargs) -> None:
         raise NotImplementedError
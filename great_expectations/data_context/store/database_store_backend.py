@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import uuid
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility import sqlalchemy
@@ -26,6 +26,8 @@ logger = logging.getLogger(__name__)
 
 
 class DatabaseStoreBackend(StoreBackend):
+    MAX_BOUND_PARAMETERS_PER_STATEMENT = 900
+
     def __init__(  # noqa: C901 - 16
         self,
         table_name,
@@ -101,8 +103,13 @@ class DatabaseStoreBackend(StoreBackend):
                 raise gx_exceptions.StoreBackendError(
                     f"Unable to use table {table_name}: it exists, but does not have the expected schema."
                 )
+            # Pre-existing tables may lack a primary key (or unique constraint) on the key columns.
+            self._key_columns_are_unique = self._has_unique_key_columns(
+                table=table, key_columns=key_columns
+            )
         except sqlalchemy.NoSuchTableError:
             table = sa.Table(table_name, meta, *cols)
+            self._key_columns_are_unique = True
             try:
                 if self._schema_name:
                     with self.engine.begin() as connection:
@@ -232,18 +239,40 @@ class DatabaseStoreBackend(StoreBackend):
             create_engine_kwargs,
         )
 
+    @staticmethod
+    def _has_unique_key_columns(table: sa.Table, key_columns) -> bool:
+        """Whether primary key, unique constraint, or unique index of "table" spans exactly "key_columns"."""
+        unique_column_sets: List[set] = [
+            {str(col.name).lower() for col in table.primary_key.columns}
+        ]
+        constraint: sa.Constraint
+        for constraint in table.constraints:
+            if isinstance(constraint, sa.UniqueConstraint):
+                unique_column_sets.append(
+                    {str(col.name).lower() for col in constraint.columns}
+                )
+        index: sa.Index
+        for index in table.indexes:
+            if index.unique:
+                unique_column_sets.append(
+                    {str(col.name).lower() for col in index.columns}
+                )
+
+        return set(key_columns) in unique_column_sets
+
+    def _build_key_condition(self, key: tuple) -> sqlalchemy.ColumnElement:
+        return sa.and_(
+            *(
+                getattr(self._table.columns, key_col) == val
+                for key_col, val in zip(self.key_columns, key)
+            )
+        )
+
     def _get(self, key):
         sel = (
             sa.select(sa.column("value"))
             .select_from(self._table)
-            .where(
-                sa.and_(
-                    *(
-                        getattr(self._table.columns, key_col) == val
-                        for key_col, val in zip(self.key_columns, key)
-                    )
-                )
-            )
+            .where(self._build_key_condition(key))
         )
         try:
             with self.engine.begin() as connection:
@@ -253,21 +282,55 @@ class DatabaseStoreBackend(StoreBackend):
             logger.debug(f"Error fetching value: {str(e)}")
             raise gx_exceptions.StoreError(f"Unable to fetch value for key: {str(key)}")
 
+    def _get_many(self, keys: Sequence[tuple], **kwargs) -> List[Any]:
+        columns = [sa.column(col) for col in self.key_columns]
+        # Bound parameters per statement are limited by some dialects (e.g., 999 in older SQLite versions).
+        keys_per_statement: int = max(
+            1, self.MAX_BOUND_PARAMETERS_PER_STATEMENT // len(self.key_columns)
+        )
+        values_by_key: Dict[tuple, Any] = {}
+        try:
+            with self.engine.begin() as connection:
+                idx: int
+                for idx in range(0, len(keys), keys_per_statement):
+                    sel = (
+                        sa.select(*columns, sa.column("value"))
+                        .select_from(self._table)
+                        .where(
+                            sa.or_(
+                                *(
+                                    self._build_key_condition(key)
+                                    for key in keys[idx : idx + keys_per_statement]
+                                )
+                            )
+                        )
+                    )
+                    row: sqlalchemy.Row
+                    for row in connection.execute(sel).fetchall():
+                        values_by_key[tuple(row[:-1])] = row[-1]
+        except SQLAlchemyError as e:
+            logger.debug(f"Error fetching values: {str(e)}")
+            raise gx_exceptions.StoreError(
+                f"Unable to fetch values for keys: {str(list(keys))}"
+            )
+
+        key: tuple
+        for key in keys:
+            if tuple(key) not in values_by_key:
+                raise gx_exceptions.StoreError(
+                    f"Unable to fetch value for key: {str(key)}"
+                )
+
+        return [values_by_key[tuple(key)] for key in keys]
+
     def _set(self, key, value, allow_update=True, **kwargs) -> None:
+        if allow_update:
+            self._upsert(kv_pairs=[(key, value)])
+            return
+
         cols = {k: v for (k, v) in zip(self.key_columns, key)}
         cols["value"] = value
-
-        if allow_update:
-            if self.has_key(key):  # noqa: W601
-                ins = (
-                    self._table.update()
-                    .where(getattr(self._table.columns, self.key_columns[0]) == key[0])
-                    .values(**cols)
-                )
-            else:
-                ins = self._table.insert().values(**cols)
-        else:
-            ins = self._table.insert().values(**cols)
+        ins = self._table.insert().values(**cols)
 
         try:
             with self.engine.begin() as connection:
@@ -280,6 +343,77 @@ class DatabaseStoreBackend(StoreBackend):
                     f"Integrity error {str(e)} while trying to store key"
                 )
 
+    def _set_many(self, kv_pairs, allow_update=True, **kwargs) -> None:
+        if allow_update:
+            self._upsert(kv_pairs=kv_pairs)
+            return
+
+        for key, value in kv_pairs:
+            self._set(key, value, allow_update=False, **kwargs)
+
+    def _upsert(self, kv_pairs: Sequence[Tuple[tuple, Any]]) -> None:
+        """
+        Inserts or updates all given key-value pairs in a single transaction: as one "INSERT ... ON CONFLICT" (or "ON
+        DUPLICATE KEY") statement, executed for all rows at once, where the dialect supports it, and otherwise as an
+        "UPDATE", followed by an "INSERT" only when no row was updated, per key-value pair.
+        """
+        # The last value of a repeated key wins, as it would with consecutive "set()" calls.
+        rows_by_key: Dict[tuple, dict] = {}
+        for key, value in kv_pairs:
+            row = {k: v for (k, v) in zip(self.key_columns, key)}
+            row["value"] = value
+            rows_by_key[tuple(key)] = row
+
+        if not rows_by_key:
+            return
+
+        upsert_statement = self._build_upsert_statement()
+        try:
+            with self.engine.begin() as connection:
+                if upsert_statement is not None:
+                    connection.execute(upsert_statement, list(rows_by_key.values()))
+                    return
+
+                for key, row in rows_by_key.items():
+                    result = connection.execute(
+                        self._table.update()
+                        .where(self._build_key_condition(key))
+                        .values(value=row["value"])
+                    )
+                    if result.rowcount == 0:
+                        connection.execute(self._table.insert().values(**row))
+        except sqlalchemy.IntegrityError as e:
+            raise gx_exceptions.StoreBackendError(
+                f"Integrity error {str(e)} while trying to store keys"
+            )
+
+    def _build_upsert_statement(self) -> Optional[sqlalchemy.Insert]:
+        # Conflict handling of these statements relies on uniqueness of key columns, enforced by the database itself.
+        if not self._key_columns_are_unique:
+            return None
+
+        dialect_name: str = self.engine.dialect.name
+        if dialect_name in ("postgresql", "sqlite"):
+            dialect_module = (
+                sqlalchemy.postgresql
+                if dialect_name == "postgresql"
+                else sqlalchemy.sqlite
+            )
+            insert = dialect_module.insert(self._table)
+            return insert.on_conflict_do_update(
+                index_elements=[
+                    getattr(self._table.columns, key_col)
+                    for key_col in self.key_columns
+                ],
+                set_={"value": insert.excluded.value},
+            )
+
+        if dialect_name == "mysql":
+            insert = sqlalchemy.mysql.insert(self._table)
+            return insert.on_duplicate_key_update(value=insert.inserted.value)
+
+        return None
+
     def _move(self) -> None:  # type: ignore[override]
         raise NotImplementedError
 
@@ -305,14 +439,7 @@ class DatabaseStoreBackend(StoreBackend):
         sel = (
             sa.select(sa.func.count(sa.column("value")))
             .select_from(self._table)
-            .where(
-                sa.and_(
-                    *(
-                        getattr(self._table.columns, key_col) == val
-                        for key_col, val in zip(self.key_columns, key)
-                    )
-                )
-            )
+            .where(self._build_key_condition(key))
         )
         try:
             with self.engine.begin() as connection:
@@ -341,14 +468,7 @@ class DatabaseStoreBackend(StoreBackend):
         return [tuple(row) for row in row_list]
 
     def remove_key(self, key):
-        delete_statement = self._table.delete().where(
-            sa.and_(
-                *(
-                    getattr(self._table.columns, key_col) == val
-                    for key_col, val in zip(self.key_columns, key)
-                )
-            )
-        )
+        delete_statement = self._table.delete().where(self._build_key_condition(key))
         try:
             with self.engine.begin() as connection:
                 return connection.execute(delete_statement)
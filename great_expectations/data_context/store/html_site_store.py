@@ -1,8 +1,10 @@
+import json
 import logging
 import os
 import re
 import tempfile
 from mimetypes import guess_type
+from typing import Optional
 from zipfile import ZipFile, is_zipfile
 
 from great_expectations.core.data_context_key import DataContextKey
@@ -23,7 +25,11 @@ from great_expectations.data_context.util import (
     instantiate_class_from_config,
     load_class,
 )
-from great_expectations.exceptions import ClassInstantiationError, DataContextError
+from great_expectations.exceptions import (
+    ClassInstantiationError,
+    DataContextError,
+    InvalidKeyError,
+)
 from great_expectations.util import (
     filter_properties_dict,
     verify_dynamic_loading_support,
@@ -103,6 +109,9 @@ class HtmlSiteStore:
 
     _key_class = SiteSectionIdentifier
 
+    # Key (in the "static_assets" store backend) of the JSON document recording what has been rendered into the site.
+    RENDER_MANIFEST_KEY = ("render_manifest.json",)
+
     def __init__(self, store_backend=None, runtime_environment=None) -> None:
         store_backend_module_name = store_backend.get(
             "module_name", "great_expectations.data_context.store"
@@ -372,6 +381,47 @@ class HtmlSiteStore:
             content_type="text/html; " "charset=utf-8",
         )
 
+    def get_render_manifest(self) -> Optional[dict]:
+        """
+        Returns the render manifest of the site (an empty one if nothing has been recorded yet), or None if the site
+        cannot hold a render manifest (e.g., in GX Cloud), in which case every build must render every resource.
+
+        The render manifest records, for each site section, which resources have been rendered from which content, so
+        that subsequent builds can skip resources that have not changed since.
+        """
+        store_backend = self.store_backends["static_assets"]
+        if isinstance(store_backend, GXCloudStoreBackend):
+            return None
+
+        try:
+            render_manifest = json.loads(store_backend.get(self.RENDER_MANIFEST_KEY))
+        except InvalidKeyError:
+            return {"sections": {}}
+        except ValueError:
+            logger.warning(
+                "Data Docs render manifest could not be read; all resources will be rendered again."
+            )
+            return {"sections": {}}
+
+        if not isinstance(render_manifest, dict) or not isinstance(
+            render_manifest.get("sections"), dict
+        ):
+            return {"sections": {}}
+
+        return render_manifest
+
+    def set_render_manifest(self, render_manifest: dict) -> None:
+        store_backend = self.store_backends["static_assets"]
+        if isinstance(store_backend, GXCloudStoreBackend):
+            return
+
+        store_backend.set(
+            self.RENDER_MANIFEST_KEY,
+            json.dumps(render_manifest, indent=2, sort_keys=True),
+            content_encoding="utf-8",
+            content_type="application/json",
+        )
+
     def clean_site(self) -> None:
         for _, target_store_backend in self.store_backends.items():
             keys = target_store_backend.list_keys()
@@ -55,6 +55,15 @@ class InMemoryStoreBackend(StoreBackend):
     def _set(self, key, value, **kwargs) -> None:
         self._store[key] = value
 
+    def _get_many(self, keys, **kwargs):
+        try:
+            return [self._store[key] for key in keys]
+        except KeyError as e:
+            raise InvalidKeyError(f"{str(e)}")
+
+    def _set_many(self, kv_pairs, **kwargs) -> None:
+        self._store.update(kv_pairs)
+
     def _move(self, source_key, dest_key, **kwargs) -> None:
         self._store[dest_key] = self._store[source_key]
         self._store.pop(source_key)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Type
 
 from typing_extensions import TypedDict
 
@@ -190,6 +190,19 @@ class Store:
 
         return None
 
+    def get_many(self, keys: Sequence[DataContextKey]) -> List[Optional[Any]]:
+        """
+        Essentially `get` for each given key, retrieving all values from the store backend at once.
+        """
+        if self.cloud_mode:
+            return [self.get(key) for key in keys]
+
+        for key in keys:
+            self._validate_key(key)
+
+        values = self._store_backend.get_many([self.key_to_tuple(key) for key in keys])
+        return [self.deserialize(value) if value else None for value in values]
+
     def set(self, key: DataContextKey, value: Any, **kwargs) -> None:
         if key == StoreBackend.STORE_BACKEND_ID_KEY:
             return self._store_backend.set(key, value, **kwargs)
@@ -199,6 +212,23 @@ class Store:
             self.key_to_tuple(key), self.serialize(value), **kwargs
         )
 
+    def set_many(
+        self, kv_pairs: Sequence[Tuple[DataContextKey, Any]], **kwargs
+    ) -> None:
+        """
+        Essentially `set` for each given key-value pair, writing all values to the store backend at once.
+        """
+        for key, _ in kv_pairs:
+            self._validate_key(key)
+
+        return self._store_backend.set_many(
+            [
+                (self.key_to_tuple(key), self.serialize(value))
+                for key, value in kv_pairs
+            ],
+            **kwargs,
+        )
+
     def add(self, key: DataContextKey, value: Any, **kwargs) -> None:
         """
         Essentially `set` but validates that a given key-value pair does not already exist.
@@ -6,7 +6,7 @@ import random
 import re
 import shutil
 from abc import ABCMeta
-from typing import Any, List, Tuple
+from typing import Any, Iterator, List, Pattern, Set, Tuple
 
 from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.exceptions import InvalidKeyError, StoreBackendError
@@ -15,6 +15,33 @@ from great_expectations.util import filter_properties_dict
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_filepath_template_regex(
+    filepath_template: str,
+) -> Tuple[Pattern, List[int]]:
+    """
+    Converts filepath_template to regex, matching filepath of a key, and to indexes of key elements, captured by groups
+    "tuple_index_<i>" of this regex; compiled once per filepath_template (rather than once per converted filepath).
+    """
+    indexed_string_substitutions = re.findall(r"{\d+}", filepath_template)
+    tuple_index_list = [
+        f"(?P<tuple_index_{i}>.*)" for i in range(len(indexed_string_substitutions))
+    ]
+    intermediate_filepath_regex = re.sub(
+        r"{\d+}",
+        lambda m, r=iter(  # noqa: B008 # function-call-in-default-argument
+            tuple_index_list
+        ): next(r),
+        filepath_template,
+    )
+    filepath_regex = intermediate_filepath_regex.format(*tuple_index_list)
+    tuple_indexes = [
+        int(re.search(r"\d+", indexed_string_substitution).group(0))  # type: ignore[union-attr]
+        for indexed_string_substitution in indexed_string_substitutions
+    ]
+    return re.compile(filepath_regex), tuple_indexes
+
+
 class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
     r"""
     If filepath_template is provided, the key to this StoreBackend abstract class must be a tuple with
@@ -165,32 +192,18 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
             else:
                 filepath_template = self.filepath_template
 
-            # Convert the template to a regex
-            indexed_string_substitutions = re.findall(r"{\d+}", filepath_template)
-            tuple_index_list = [
-                f"(?P<tuple_index_{i}>.*)"
-                for i in range(len(indexed_string_substitutions))
-            ]
-            intermediate_filepath_regex = re.sub(
-                r"{\d+}",
-                lambda m, r=iter(  # noqa: B008 # function-call-in-default-argument
-                    tuple_index_list
-                ): next(r),
-                filepath_template,
+            filepath_regex, tuple_indexes = _compile_filepath_template_regex(
+                filepath_template=filepath_template
             )
-            filepath_regex = intermediate_filepath_regex.format(*tuple_index_list)
 
             # Apply the regex to the filepath
-            matches = re.compile(filepath_regex).match(filepath)
+            matches = filepath_regex.match(filepath)
             if matches is None:
                 return None
 
             # Map key elements into the appropriate parts of the tuple
             new_key = [None] * self.key_length
-            for i in range(len(tuple_index_list)):
-                tuple_index = int(
-                    re.search(r"\d+", indexed_string_substitutions[i]).group(0)
-                )
+            for i, tuple_index in enumerate(tuple_indexes):
                 key_element = matches.group(f"tuple_index_{str(i)}")
                 new_key[tuple_index] = key_element
 
@@ -200,6 +213,39 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
             new_key = tuple(filepath.split(os.sep))
         return new_key
 
+    def _convert_key_prefix_to_filepath_prefix(self, prefix: Tuple) -> str:
+        """
+        Returns the longest string, with which filepath of every key starting with "prefix" starts, so that object stores
+        can list only objects under it (listed keys still need to be filtered by "prefix", since, for example, filepath
+        prefix "a/b" of key prefix ("a", "b") is also the start of filepath of key ("a", "bc")).
+        """
+        if not prefix:
+            return ""
+        if prefix == self.STORE_BACKEND_ID_KEY:
+            return self._convert_key_to_filepath(prefix)
+
+        if self.filepath_template:
+            filepath_prefix = ""
+            position = 0
+            for match in re.finditer(r"{(\d+)}", self.filepath_template):
+                filepath_prefix += self.filepath_template[position : match.start()]
+                tuple_index = int(match.group(1))
+                if tuple_index >= len(prefix):
+                    break
+                filepath_prefix += prefix[tuple_index]
+                position = match.end()
+            else:
+                filepath_prefix += self.filepath_template[position:]
+        else:
+            filepath_prefix = "/".join(prefix)
+
+        if self.filepath_prefix:
+            filepath_prefix = f"{self.filepath_prefix}/{filepath_prefix}"
+        if self.platform_specific_separator:
+            filepath_prefix = filepath_prefix.replace("/", os.sep)
+
+        return filepath_prefix
+
     def verify_that_key_to_filepath_operation_is_reversible(self):
         def get_random_hex(size=4):
             return "".join(
@@ -328,12 +374,31 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         path, filename = os.path.split(filepath)
 
         os.makedirs(str(path), exist_ok=True)  # noqa: PTH103
+        self._write_file(filepath=filepath, value=value)
+        return filepath
+
+    def _set_many(self, kv_pairs, **kwargs) -> None:
+        # Keys of one batch typically share few directories (e.g., metrics of one run), so each is created only once.
+        created_paths: Set[str] = set()
+        for key, value in kv_pairs:
+            if not isinstance(key, tuple):
+                key = key.to_tuple()
+            filepath = os.path.join(  # noqa: PTH118
+                self.full_base_directory, self._convert_key_to_filepath(key)
+            )
+            path = os.path.dirname(filepath)  # noqa: PTH120
+            if path not in created_paths:
+                os.makedirs(str(path), exist_ok=True)  # noqa: PTH103
+                created_paths.add(path)
+            self._write_file(filepath=filepath, value=value)
+
+    @staticmethod
+    def _write_file(filepath: str, value) -> None:
         with open(filepath, "wb") as outfile:
             if isinstance(value, str):
                 outfile.write(value.encode("utf-8"))
             else:
                 outfile.write(value)
-        return filepath
 
     def _move(self, source_key, dest_key, **kwargs):
         source_path = os.path.join(  # noqa: PTH118
@@ -612,39 +677,48 @@ class TupleS3StoreBackend(TupleStoreBackend):
 
         s3.Object(self.bucket, source_filepath).delete()
 
-    def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
-        # Note that the prefix arg is only included to maintain consistency with the parent class signature
-        s3r = self._create_resource()
-        bucket = s3r.Bucket(self.bucket)
-        key_list = []
-        if self.prefix:
-            objects_list = bucket.objects.filter(Prefix=self.prefix)
+    def _build_s3_object_key_prefix(self, prefix: Tuple) -> str:
+        filepath_prefix = self._convert_key_prefix_to_filepath_prefix(prefix)
+        if not self.prefix:
+            return filepath_prefix
+        if not filepath_prefix:
+            return self.prefix
+        if self.platform_specific_separator:
+            return os.path.join(self.prefix, filepath_prefix)  # noqa: PTH118
+        return "/".join((self.prefix, filepath_prefix))
+
+    def _convert_s3_object_key_to_key(self, s3_object_key: str):
+        if self.platform_specific_separator:
+            s3_object_key = os.path.relpath(s3_object_key, self.prefix)
         else:
-            objects_list = bucket.objects.all()
-        for s3_object_info in objects_list:
-            s3_object_key = s3_object_info.key
-            if self.platform_specific_separator:
-                s3_object_key = os.path.relpath(s3_object_key, self.prefix)
+            if self.prefix is None:
+                if s3_object_key.startswith("/"):
+                    s3_object_key = s3_object_key[1:]
             else:
-                if self.prefix is None:
-                    if s3_object_key.startswith("/"):
-                        s3_object_key = s3_object_key[1:]
-                else:
-                    if s3_object_key.startswith(f"{self.prefix}/"):
-                        s3_object_key = s3_object_key[len(self.prefix) + 1 :]
-            if self.filepath_prefix and not s3_object_key.startswith(
-                self.filepath_prefix
-            ):
-                continue
-            elif self.filepath_suffix and not s3_object_key.endswith(
-                self.filepath_suffix
-            ):
-                continue
-            key = self._convert_filepath_to_key(s3_object_key)
-            if key:
-                key_list.append(key)
+                if s3_object_key.startswith(f"{self.prefix}/"):
+                    s3_object_key = s3_object_key[len(self.prefix) + 1 :]
+        if self.filepath_prefix and not s3_object_key.startswith(self.filepath_prefix):
+            return None
+        elif self.filepath_suffix and not s3_object_key.endswith(self.filepath_suffix):
+            return None
+        return self._convert_filepath_to_key(s3_object_key)
+
+    def iter_keys(self, prefix: Tuple = ()) -> Iterator[Tuple]:
+        """
+        Yields keys, which start with "prefix", while paging through objects under the S3 prefix built from "prefix".
+        """
+        s3 = self._create_client()
+        paginator = s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=self.bucket, Prefix=self._build_s3_object_key_prefix(prefix)
+        ):
+            for s3_object_info in page.get("Contents", []):
+                key = self._convert_s3_object_key_to_key(s3_object_info["Key"])
+                if key and key[: len(prefix)] == prefix:
+                    yield key
 
-        return key_list
+    def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
+        return list(self.iter_keys(prefix=prefix))
 
     def get_url_for_key(self, key, protocol=None):
         location = None
@@ -700,8 +774,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
             return False
 
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        return key in self.iter_keys(prefix=key)
 
     def _assume_role_and_get_secret_credentials(self):
         import boto3
@@ -896,15 +969,27 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         blob = bucket.blob(source_filepath)
         _ = bucket.rename_blob(blob, dest_filepath)
 
-    def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
-        # Note that the prefix arg is only included to maintain consistency with the parent class signature
-        key_list = []
+    def _build_gcs_object_key_prefix(self, prefix: Tuple) -> str:
+        filepath_prefix = self._convert_key_prefix_to_filepath_prefix(prefix)
+        if not self.prefix:
+            return filepath_prefix
+        if not filepath_prefix:
+            return self.prefix
+        if self.platform_specific_separator:
+            return os.path.join(self.prefix, filepath_prefix)  # noqa: PTH118
+        return "/".join((self.prefix, filepath_prefix))
 
+    def iter_keys(self, prefix: Tuple = ()) -> Iterator[Tuple]:
+        """
+        Yields keys, which start with "prefix", while paging through blobs under the GCS prefix built from "prefix".
+        """
         from great_expectations.compatibility import google
 
         gcs = google.storage.Client(self.project)
 
-        for blob in gcs.list_blobs(self.bucket, prefix=self.prefix):
+        for blob in gcs.list_blobs(
+            self.bucket, prefix=self._build_gcs_object_key_prefix(prefix)
+        ):
             gcs_object_name = blob.name
             gcs_object_key = os.path.relpath(
                 gcs_object_name,
@@ -919,9 +1004,11 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             ):
                 continue
             key = self._convert_filepath_to_key(gcs_object_key)
-            if key:
-                key_list.append(key)
-        return key_list
+            if key and key[: len(prefix)] == prefix:
+                yield key
+
+    def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
+        return list(self.iter_keys(prefix=prefix))
 
     def get_url_for_key(self, key, protocol=None):
         path = self._convert_key_to_filepath(key)
@@ -972,8 +1059,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         return True
 
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        return key in self.iter_keys(prefix=key)
 
 
 class TupleAzureBlobStoreBackend(TupleStoreBackend):
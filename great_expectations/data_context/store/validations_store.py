@@ -2,6 +2,8 @@ import random
 import uuid
 from typing import Dict
 
+from great_expectations import exceptions as gx_exceptions
+from great_expectations.compatibility.orjson import orjson
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
     ExpectationSuiteValidationResultSchema,
@@ -28,6 +30,9 @@ class ValidationsStore(Store):
     """
     A ValidationsStore manages Validation Results to ensure they are accessible via a Data Context for review and rendering into Data Docs.
 
+    If "use_orjson" is set (requires "orjson" package), Validation Results are encoded with "orjson" (much faster for
+    large results, e.g., of "COMPLETE" result format); note that "orjson" encodes non-finite floats as null.
+
     --ge-feature-maturity-info--
 
         id: validations_store_filesystem
@@ -96,12 +101,23 @@ class ValidationsStore(Store):
     _key_class: type = ValidationResultIdentifier
 
     def __init__(
-        self, store_backend=None, runtime_environment=None, store_name=None
+        self,
+        store_backend=None,
+        runtime_environment=None,
+        store_name=None,
+        use_orjson: bool = False,
     ) -> None:
         self._expectationSuiteValidationResultSchema = (
             ExpectationSuiteValidationResultSchema()
         )
 
+        if use_orjson and not orjson:
+            raise gx_exceptions.StoreConfigurationError(
+                f'"use_orjson" is set for ValidationsStore, but {orjson}.'
+            )
+
+        self._use_orjson = use_orjson
+
         if store_backend is not None:
             store_backend_module_name = store_backend.get(
                 "module_name", "great_expectations.data_context.store"
@@ -149,6 +165,9 @@ class ValidationsStore(Store):
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
+        if use_orjson:
+            self._config["use_orjson"] = use_orjson
+
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
 
     def ge_cloud_response_json_to_object_dict(self, response_json: Dict) -> Dict:
@@ -167,6 +186,19 @@ class ValidationsStore(Store):
     def serialize(self, value):
         if self.cloud_mode:
             return value.to_json_dict()
+
+        if self._use_orjson:
+            try:
+                return orjson.dumps(
+                    self._expectationSuiteValidationResultSchema.dump(
+                        value.to_json_dict()
+                    ),
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS,
+                ).decode("utf-8")
+            except orjson.JSONEncodeError:
+                # Values not supported by "orjson" (e.g., integers exceeding 64 bits) are encoded by standard library.
+                pass
+
         return self._expectationSuiteValidationResultSchema.dumps(
             value.to_json_dict(), indent=2, sort_keys=True
         )
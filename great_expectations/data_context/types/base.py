@@ -35,7 +35,7 @@ from marshmallow import (
     pre_dump,
     validates_schema,
 )
-from marshmallow.validate import OneOf
+from marshmallow.validate import OneOf, Range
 from marshmallow.warnings import RemovedInMarshmallow4Warning
 from ruamel.yaml import YAML
 from ruamel.yaml.comments import CommentedMap
@@ -1040,6 +1040,7 @@ class ExecutionEngineConfigSchema(Schema):
         keys=fields.Str(), values=fields.Str(), required=False, allow_none=True
     )
     caching = fields.Boolean(required=False, allow_none=True)
+    metric_cache_max_bytes = fields.Integer(required=False, allow_none=True)
     batch_spec_defaults = fields.Dict(required=False, allow_none=True)
     force_reuse_spark_context = fields.Boolean(required=False, allow_none=True)
     # BigQuery Service Account Credentials
@@ -1047,6 +1048,9 @@ class ExecutionEngineConfigSchema(Schema):
     credentials_info = fields.Dict(required=False, allow_none=True)
 
     create_temp_table = fields.Boolean(required=False, allow_none=True)
+    fuse_metric_bundle_queries = fields.Boolean(required=False, allow_none=True)
+    persistent_metric_cache = fields.Dict(required=False, allow_none=True)
+    concurrency = fields.Dict(required=False, allow_none=True)
 
     # noinspection PyUnusedLocal
     @validates_schema
@@ -1545,19 +1549,31 @@ class IncludeRenderedContentConfigSchema(Schema):
 class ConcurrencyConfig(DictDot):
     """WARNING: This class is experimental."""
 
-    def __init__(self, enabled: bool = False) -> None:
+    def __init__(
+        self,
+        enabled: bool = False,
+        max_metric_resolution_concurrency: Optional[int] = None,
+    ) -> None:
         """Initialize a concurrency configuration to control multithreaded execution.
 
         Args:
             enabled: Whether or not multithreading is enabled.
+            max_metric_resolution_concurrency: Max number of metrics that an ExecutionEngine resolves at the same time
+                (defaults to the number of CPUs).
         """
         self._enabled = enabled
+        self._max_metric_resolution_concurrency = max_metric_resolution_concurrency
 
     @property
     def enabled(self):
         """Whether or not multithreading is enabled."""
         return self._enabled
 
+    @property
+    def max_metric_resolution_concurrency(self) -> Optional[int]:
+        """Max number of metrics to resolve concurrently with multithreading (None means the number of CPUs)."""
+        return self._max_metric_resolution_concurrency
+
     @property
     def max_database_query_concurrency(self) -> int:
         """Max number of concurrent database queries to execute with mulithreading."""
@@ -1591,6 +1607,18 @@ class ConcurrencyConfigSchema(Schema):
     """WARNING: This class is experimental."""
 
     enabled = fields.Boolean(default=False)
+    max_metric_resolution_concurrency = fields.Integer(
+        required=False, allow_none=True, validate=Range(min=1)
+    )
+
+    # noinspection PyUnusedLocal
+    @post_dump
+    def remove_max_metric_resolution_concurrency_if_none(
+        self, data: dict, **kwargs
+    ) -> dict:
+        if data.get("max_metric_resolution_concurrency") is None:
+            data.pop("max_metric_resolution_concurrency", None)
+        return data
 
 
 class GXCloudConfig(DictDot):
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import UserDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Union
+
+import great_expectations.exceptions as gx_exceptions
+
+if TYPE_CHECKING:
+    from great_expectations.datasource import BaseDatasource, LegacyDatasource
+    from great_expectations.datasource.fluent import Datasource as FluentDatasource
+
+logger = logging.getLogger(__name__)
+
+DatasourceType = Union["LegacyDatasource", "BaseDatasource", "FluentDatasource"]
+
+
+class LazyDatasourceDict(UserDict):
+    """
+    Datasources of DataContext by name, some of which are pending: registered by name together with function, which
+    instantiates Datasource from its configuration.  Pending Datasource is instantiated on first access to it by name
+    ("[]", "get()", and "in"), while bulk access ("keys()", "values()", "items()", "len()", and iteration) instantiates
+    all pending Datasources.
+
+    Datasource, whose instantiation fails with "DatasourceInitializationError", is logged and dropped, as if it were not
+    configured; such error is raised again when Datasource is retrieved from its store (e.g., by "get_datasource()").
+    Removing ("del" and "pop()") pending Datasource drops it without instantiating it.  Each pending Datasource is
+    instantiated at most once, even when accessed from several threads at once.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._pending: Dict[str, Callable[[], DatasourceType]] = {}
+        # Reentrant, since instantiating Datasource may access other Datasources of its DataContext.
+        self._lock = threading.RLock()
+
+    @property
+    def instantiated(self) -> Dict[str, DatasourceType]:
+        """Datasources, which have already been instantiated (pending Datasources are not instantiated)."""
+        return self.data
+
+    def add_pending(
+        self, name: str, instantiate_fn: Callable[[], DatasourceType]
+    ) -> None:
+        """Registers Datasource by name, deferring its instantiation (by calling "instantiate_fn") until accessed."""
+        with self._lock:
+            self.data.pop(name, None)
+            self._pending[name] = instantiate_fn
+
+    def is_pending(self, name: str) -> bool:
+        """Whether Datasource is registered by name, but has not been instantiated yet."""
+        return name in self._pending
+
+    def _instantiate(self, name: str) -> bool:
+        with self._lock:
+            instantiate_fn = self._pending.get(name)
+            if instantiate_fn is None:
+                return name in self.data
+
+            try:
+                datasource: DatasourceType = instantiate_fn()
+            except gx_exceptions.DatasourceInitializationError as e:
+                self._pending.pop(name, None)
+                logger.warning(f"Cannot initialize datasource {name}: {e}")
+                # this error will happen if our configuration contains datasources that GX can no longer connect to.
+                # this is ok, as long as we don't use it to retrieve a batch. If we try to do that, the error will be
+                # caught at the context.get_batch() step. So we just pass here.
+                return False
+
+            # Datasource may have been replaced or removed while it was being instantiated.
+            if self._pending.get(name) is instantiate_fn:
+                del self._pending[name]
+                self.data[name] = datasource
+
+            return name in self.data
+
+    def _instantiate_all(self) -> None:
+        name: str
+        for name in list(self._pending.keys()):
+            self._instantiate(name=name)
+
+    def __getitem__(self, key: str) -> DatasourceType:
+        self._instantiate(name=key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._instantiate(name=key)
+
+    def __setitem__(self, key: str, item: DatasourceType) -> None:
+        with self._lock:
+            self._pending.pop(key, None)
+            self.data[key] = item
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            if key in self._pending:
+                del self._pending[key]
+            else:
+                del self.data[key]
+
+    def pop(self, key: str, *args: Any) -> Any:
+        """Removes Datasource by name; pending Datasource is dropped without being instantiated (returning None)."""
+        with self._lock:
+            if self._pending.pop(key, None) is not None:
+                return None
+
+            return self.data.pop(key, *args)
+
+    def __iter__(self) -> Iterator[str]:
+        self._instantiate_all()
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        self._instantiate_all()
+        return len(self.data)
+
+    def __repr__(self) -> str:
+        self._instantiate_all()
+        return repr(self.data)
+
+    def __getstate__(self) -> dict:
+        # Lock is neither copied nor pickled (e.g., by "copy.deepcopy()" of DataContext); each copy has its own lock.
+        state: dict = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def copy(self) -> LazyDatasourceDict:
+        datasources = LazyDatasourceDict()
+        with self._lock:
+            datasources.data.update(self.data)
+            datasources._pending.update(self._pending)
+        return datasources
@@ -61,6 +61,7 @@ if TYPE_CHECKING:
     )
     from great_expectations.core.config_provider import _ConfigurationProvider
     from great_expectations.data_context import AbstractDataContext as GXDataContext
+    from great_expectations.data_context.types.base import ConcurrencyConfig
     from great_expectations.datasource.data_connector.batch_filter import BatchSlice
     from great_expectations.datasource.fluent import BatchRequest, BatchRequestOptions
     from great_expectations.datasource.fluent.data_asset.data_connector import (
@@ -446,8 +447,11 @@ class Datasource(
             current_execution_engine_kwargs != self._cached_execution_engine_kwargs
             or not self._execution_engine
         ):
+            concurrency: Optional[ConcurrencyConfig] = (
+                self._data_context.concurrency if self._data_context else None
+            )
             self._execution_engine = self._execution_engine_type()(
-                **current_execution_engine_kwargs
+                concurrency=concurrency, **current_execution_engine_kwargs
             )
             self._cached_execution_engine_kwargs = current_execution_engine_kwargs
         return self._execution_engine
@@ -64,9 +64,14 @@ class BaseDatasource:
                 message="No ExecutionEngine configuration provided."
             )
 
+        # Every ExecutionEngine accepts "concurrency" keyword argument, even if it is not named in its constructor.
+        execution_engine_config: dict = execution_engine
+        if concurrency is not None and "concurrency" not in execution_engine:
+            execution_engine_config = {**execution_engine, "concurrency": concurrency}
+
         try:
             self._execution_engine = instantiate_class_from_config(
-                config=execution_engine,
+                config=execution_engine_config,
                 runtime_environment={"concurrency": concurrency},
                 config_defaults={"module_name": "great_expectations.execution_engine"},
             )
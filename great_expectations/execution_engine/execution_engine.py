@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import copy
+import hashlib
+import json
 import logging
+import os
+import pathlib
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from typing import (
     TYPE_CHECKING,
@@ -10,6 +15,7 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -21,7 +27,16 @@ import great_expectations.exceptions as gx_exceptions
 from great_expectations.core._docs_decorators import public_api
 from great_expectations.core.batch_manager import BatchManager
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.metric_function_types import (
+    MetricPartialFunctionTypeSuffixes,
+)
 from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.data_context.types.base import (
+    ConcurrencyConfig,
+    concurrencyConfigSchema,
+)
+from great_expectations.data_context.util import instantiate_class_from_config
+from great_expectations.execution_engine.metric_cache import MetricCache
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.expectations.row_conditions import (
     RowCondition,
@@ -43,6 +58,9 @@ if TYPE_CHECKING:
         BatchMarkers,
         BatchSpec,
     )
+    from great_expectations.execution_engine.persistent_metric_cache import (
+        PersistentMetricCache,
+    )
     from great_expectations.expectations.metrics.metric_provider import MetricProvider
     from great_expectations.validator.validator import Validator
 
@@ -56,11 +74,31 @@ class NoOpDict:
     def __setitem__(self, key, value):
         return None
 
+    # noinspection PyMethodMayBeStatic,PyUnusedLocal
+    def get(self, key, default=None):
+        return default
+
     # noinspection PyMethodMayBeStatic,PyUnusedLocal
     def update(self, value):
         return None
 
 
+# Sentinel, distinguishing absent cache entries from cached "None" metric values.
+_MISSING_METRIC_VALUE = object()
+
+# Domain kwargs, which only filter rows of base data of Domain (see "get_domain_records()" of ExecutionEngine subclasses).
+ROW_FILTERING_DOMAIN_KWARGS_KEYS: Tuple[str, ...] = (
+    "row_condition",
+    "condition_parser",
+    "filter_conditions",
+    "ignore_row_if",
+    "column",
+    "column_A",
+    "column_B",
+    "column_list",
+)
+
+
 @dataclass(frozen=True)
 class MetricComputationConfiguration(DictDot):
     """
@@ -120,8 +158,9 @@ class ExecutionEngine(ABC):
 
     Crucially, ExecutionEngine serves as focal point for resolving (i.e., computing) metrics.  Wherever opportunities
     arize to bundle multiple metric computations (e.g., SQLAlchemy, Spark), ExecutionEngine utilizes subclasses in order
-    to provide specific functionality (bundling of computation is available only for "deferred execution" computational
-    systems, such as SQLAlchemy and Spark; it is not available for Pandas, because Pandas computations are immediate).
+    to provide specific functionality (bundling of computation is primarily meant for "deferred execution" computational
+    systems, such as SQLAlchemy and Spark; Pandas, whose computations are immediate, bundles column aggregates in order
+    to share records of their compute Domain).
 
     Finally, ExecutionEngine defines interfaces for Batch data sampling and splitting Batch of data along defined axes.
 
@@ -130,9 +169,16 @@ class ExecutionEngine(ABC):
     Args:
         name: (str) name of this ExecutionEngine
         caching: (Boolean) if True (default), then resolved (computed) metrics are added to local in-memory cache.
+        metric_cache_max_bytes: budget (in bytes) for estimated size of local in-memory metric cache, above which least
+            recently used metrics, not needed by metrics being resolved, are evicted (default is unbounded).
         batch_spec_defaults: dictionary of BatchSpec overrides (useful for amending configuration at runtime).
         batch_data_dict: dictionary of Batch objects with corresponding IDs as keys supplied at initialization time
         validator: Validator object (optional) -- not utilized in V3 and later versions
+        concurrency: ConcurrencyConfig (or its dictionary form); if enabled, independent metrics of a ValidationGraph
+            are resolved concurrently, up to "max_metric_resolution_concurrency" at a time (experimental).
+        persistent_metric_cache: PersistentMetricCache (or its configuration dictionary); if provided, resolved metrics
+            are stored across ExecutionEngine lifetimes, keyed by metric and Batch fingerprint, and are not computed
+            again for unchanged Batch of data (experimental).
     """
 
     recognized_batch_spec_defaults: Set[str] = set()
@@ -141,22 +187,50 @@ class ExecutionEngine(ABC):
         self,
         name: Optional[str] = None,
         caching: bool = True,
+        metric_cache_max_bytes: Optional[int] = None,
         batch_spec_defaults: Optional[dict] = None,
         batch_data_dict: Optional[dict] = None,
         validator: Optional[Validator] = None,
+        concurrency: Optional[Union[ConcurrencyConfig, dict]] = None,
+        persistent_metric_cache: Optional[Union[PersistentMetricCache, dict]] = None,
     ) -> None:
         self.name = name
         self._validator = validator
 
+        if concurrency is None:
+            concurrency = ConcurrencyConfig()
+        elif isinstance(concurrency, dict):
+            concurrency = ConcurrencyConfig(**concurrency)
+
+        self._concurrency = concurrency
+
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
         # (e.g. self.spark_df) over the lifetime of the dataset instance
         self._caching = caching
-        # NOTE: 20200918 - this is a naive cache; update.
         if self._caching:
-            self._metric_cache: Union[Dict, NoOpDict] = {}
+            self._metric_cache: Union[MetricCache, NoOpDict] = MetricCache(
+                max_bytes=metric_cache_max_bytes
+            )
         else:
             self._metric_cache = NoOpDict()
 
+        persistent_metric_cache_config: Optional[dict] = None
+        if isinstance(persistent_metric_cache, dict):
+            persistent_metric_cache_config = persistent_metric_cache
+            persistent_metric_cache = instantiate_class_from_config(
+                config=persistent_metric_cache,
+                runtime_environment={},
+                config_defaults={
+                    "module_name": "great_expectations.execution_engine.persistent_metric_cache",
+                },
+            )
+
+        self._persistent_metric_cache: Optional[
+            PersistentMetricCache
+        ] = persistent_metric_cache
+        self._batch_fingerprints: Dict[str, Optional[str]] = {}
+        self._persisted_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
 
@@ -186,9 +260,14 @@ class ExecutionEngine(ABC):
         self._config = {
             "name": name,
             "caching": caching,
+            "metric_cache_max_bytes": metric_cache_max_bytes,
             "batch_spec_defaults": batch_spec_defaults,
             "batch_data_dict": batch_data_dict,
             "validator": validator,
+            "persistent_metric_cache": persistent_metric_cache_config,
+            "concurrency": concurrencyConfigSchema.dump(concurrency)
+            if concurrency.enabled
+            else None,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -208,11 +287,55 @@ class ExecutionEngine(ABC):
     def dialect(self):
         return None
 
+    @property
+    def concurrency(self) -> ConcurrencyConfig:
+        """Concurrency configuration governing how many metric computations may be in flight at once."""
+        return self._concurrency
+
+    @property
+    def max_metric_resolution_concurrency(self) -> int:
+        """Maximum number of "resolve_metrics()" calls that this ExecutionEngine can service at the same time.
+
+        Unless concurrency is enabled, this is 1 (i.e., metrics are resolved one graph level at a time on the calling
+        thread); otherwise, it is "ConcurrencyConfig.max_metric_resolution_concurrency" (the number of CPUs, if unset).
+        Subclasses, whose backends cannot safely share state among threads, override this limit.
+        """
+        if not self._concurrency.enabled:
+            return 1
+
+        return (
+            self._concurrency.max_metric_resolution_concurrency or os.cpu_count() or 1
+        )
+
+    @property
+    def metric_cache(self) -> Optional[MetricCache]:
+        """Local in-memory cache of resolved metrics (None, if caching is disabled)."""
+        if isinstance(self._metric_cache, MetricCache):
+            return self._metric_cache
+
+        return None
+
+    @property
+    def persistent_metric_cache(self) -> Optional[PersistentMetricCache]:
+        """Cache of resolved metrics, which outlives this ExecutionEngine (None, if not configured)."""
+        return self._persistent_metric_cache
+
     @property
     def batch_manager(self) -> BatchManager:
         """Getter for batch_manager"""
         return self._batch_manager
 
+    @contextmanager
+    def retain_shared_domain_records(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> Iterator[None]:
+        """Context manager, within which this ExecutionEngine may keep records of Domains, shared by several of given
+        metrics (e.g., those of one "ValidationGraph"), materialized for reuse, and releases them on exit.
+
+        By default, records are not retained; subclasses, whose Domain records are costly to recompute, override this.
+        """
+        yield
+
     def _load_batch_data_from_dict(
         self, batch_data_dict: Dict[str, BatchDataType]
     ) -> None:
@@ -226,6 +349,7 @@ class ExecutionEngine(ABC):
 
     def load_batch_data(self, batch_id: str, batch_data: BatchDataType) -> None:
         self._batch_manager.save_batch_data(batch_id=batch_id, batch_data=batch_data)
+        self._batch_fingerprints.pop(batch_id, None)
 
     def get_batch_data(
         self,
@@ -267,6 +391,28 @@ class ExecutionEngine(ABC):
         if not metrics_to_resolve:
             return metrics or {}
 
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        if self._persistent_metric_cache is not None:
+            metrics_to_compute: List[MetricConfiguration] = []
+
+            metric_to_resolve: MetricConfiguration
+            for metric_to_resolve in metrics_to_resolve:
+                if self.load_persisted_metric(metric_configuration=metric_to_resolve):
+                    resolved_metrics[
+                        metric_to_resolve.id
+                    ] = self._persisted_metrics.pop(metric_to_resolve.id)
+                else:
+                    metrics_to_compute.append(metric_to_resolve)
+
+            if self._caching:
+                self._metric_cache.update(resolved_metrics)
+
+            if not metrics_to_compute:
+                return resolved_metrics
+
+            metrics_to_resolve = metrics_to_compute
+
         metric_fn_direct_configurations: List[MetricComputationConfiguration]
         metric_fn_bundle_configurations: List[MetricComputationConfiguration]
         (
@@ -277,11 +423,132 @@ class ExecutionEngine(ABC):
             metrics=metrics,
             runtime_configuration=runtime_configuration,
         )
-        return self._process_direct_and_bundled_metric_computation_configurations(
+        computed_metrics: Dict[
+            Tuple[str, str, str], MetricValue
+        ] = self._process_direct_and_bundled_metric_computation_configurations(
             metric_fn_direct_configurations=metric_fn_direct_configurations,
             metric_fn_bundle_configurations=metric_fn_bundle_configurations,
         )
 
+        if self._persistent_metric_cache is not None:
+            self._persist_metrics(
+                metric_configurations=metrics_to_resolve,
+                resolved_metrics=computed_metrics,
+            )
+
+        resolved_metrics.update(computed_metrics)
+        return resolved_metrics
+
+    def load_persisted_metric(self, metric_configuration: MetricConfiguration) -> bool:
+        """Looks up value of given metric in "PersistentMetricCache" and, if found, retains it for "resolve_metrics()".
+
+        Args:
+            metric_configuration: "MetricConfiguration" object, whose value is sought (its default kwargs must be set).
+
+        Returns:
+            Boolean, indicating whether or not metric does not need to be computed (in which case neither do its
+            dependencies).
+        """
+        if self._persistent_metric_cache is None or not self._is_persistable_metric(
+            metric_configuration=metric_configuration
+        ):
+            return False
+
+        if metric_configuration.id in self._persisted_metrics:
+            return True
+
+        batch_fingerprint: Optional[str] = self._get_batch_fingerprint(
+            batch_id=metric_configuration.metric_domain_kwargs.get("batch_id")
+        )
+        if batch_fingerprint is None:
+            return False
+
+        found: bool
+        value: Optional[MetricValue]
+        found, value = self._persistent_metric_cache.get(
+            metric_id=metric_configuration.id, batch_fingerprint=batch_fingerprint
+        )
+        if found:
+            self._persisted_metrics[metric_configuration.id] = value
+
+        return found
+
+    def _persist_metrics(
+        self,
+        metric_configurations: Iterable[MetricConfiguration],
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue],
+    ) -> None:
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metric_configurations:
+            if metric_configuration.id not in resolved_metrics or not (
+                self._is_persistable_metric(metric_configuration=metric_configuration)
+            ):
+                continue
+
+            batch_fingerprint: Optional[str] = self._get_batch_fingerprint(
+                batch_id=metric_configuration.metric_domain_kwargs.get("batch_id")
+            )
+            if batch_fingerprint is not None:
+                self._persistent_metric_cache.set(  # type: ignore[union-attr] # checked by caller
+                    metric_id=metric_configuration.id,
+                    batch_fingerprint=batch_fingerprint,
+                    value=resolved_metrics[metric_configuration.id],
+                )
+
+    @staticmethod
+    def _is_persistable_metric(metric_configuration: MetricConfiguration) -> bool:
+        # Partial functions (e.g., SQLAlchemy expressions, Spark columns, Pandas series) are bound to backend and Batch.
+        return metric_configuration.metric_name.split(".")[-1] not in {
+            suffix.value for suffix in MetricPartialFunctionTypeSuffixes
+        }
+
+    def _get_batch_fingerprint(self, batch_id: Optional[str]) -> Optional[str]:
+        """Returns fingerprint of data of given Batch (or active Batch), memoized until its "BatchData" is reloaded."""
+        if batch_id is None:
+            batch_id = self._batch_manager.active_batch_data_id
+
+        if batch_id is None:
+            return None
+
+        if batch_id not in self._batch_fingerprints:
+            self._batch_fingerprints[batch_id] = self._compute_batch_fingerprint(
+                batch_id=batch_id
+            )
+
+        return self._batch_fingerprints[batch_id]
+
+    def _compute_batch_fingerprint(self, batch_id: str) -> Optional[str]:
+        """Computes fingerprint, which changes whenever data of given Batch may have changed (None, if unknown).
+
+        Generally, "pandas_data_fingerprint" of BatchMarkers is used, if available; otherwise, local files are identified
+        by their "BatchSpec" together with their modification time and size.  Subclasses can provide stronger methods.
+        """
+        batch = self._batch_manager.batch_cache.get(batch_id)
+        if batch is None:
+            return None
+
+        batch_markers: Optional[BatchMarkers] = getattr(batch, "batch_markers", None)
+        if batch_markers and batch_markers.get("pandas_data_fingerprint"):
+            return batch_markers["pandas_data_fingerprint"]
+
+        batch_spec: Optional[BatchSpec] = getattr(batch, "batch_spec", None)
+        path: Optional[str] = batch_spec.get("path") if batch_spec else None
+        if not (isinstance(path, str) and pathlib.Path(path).is_file()):
+            return None
+
+        try:
+            serialized_batch_spec: str = json.dumps(
+                convert_to_json_serializable(data=dict(batch_spec)),  # type: ignore[arg-type] # checked above
+                sort_keys=True,
+            )
+        except TypeError:
+            return None
+
+        stat_result: os.stat_result = pathlib.Path(path).stat()
+        return hashlib.md5(
+            f"{serialized_batch_spec}:{stat_result.st_mtime_ns}:{stat_result.st_size}".encode()
+        ).hexdigest()
+
     def resolve_metric_bundle(
         self, metric_fn_bundle
     ) -> Dict[Tuple[str, str, str], MetricValue]:
@@ -455,6 +722,32 @@ class ExecutionEngine(ABC):
                         message=f'Missing metric dependency: {str(e)} for metric "{metric_to_resolve.metric_name}".'
                     )
 
+                metric_fn_bundle_configurations.append(
+                    MetricComputationConfiguration(
+                        metric_configuration=metric_to_resolve,
+                        metric_fn=metric_aggregate_fn,
+                        metric_provider_kwargs=metric_provider_kwargs,
+                        compute_domain_kwargs=compute_domain_kwargs,
+                        accessor_domain_kwargs=accessor_domain_kwargs,
+                    )
+                )
+            elif getattr(metric_fn, "bundled_metric_fn", None) is not None:
+                # Metric function, which can also be computed in bundle with other metrics (e.g., Pandas column
+                # aggregates), provides partial metric function the same way that "metric_partial_fn" dependency does.
+                try:
+                    (
+                        metric_aggregate_fn,
+                        compute_domain_kwargs,
+                        accessor_domain_kwargs,
+                    ) = metric_fn.bundled_metric_fn(  # type: ignore[attr-defined]
+                        **metric_provider_kwargs
+                    )
+                except Exception as e:
+                    raise gx_exceptions.MetricResolutionError(
+                        message=str(e),
+                        failed_metrics=(metric_to_resolve,),
+                    ) from e
+
                 metric_fn_bundle_configurations.append(
                     MetricComputationConfiguration(
                         metric_configuration=metric_to_resolve,
@@ -508,10 +801,15 @@ class ExecutionEngine(ABC):
                 metric_dependencies_by_metric_name[metric_name] = metrics[
                     metric_configuration.id
                 ]
-            elif self._caching and metric_configuration.id in self._metric_cache:  # type: ignore[operator] # TODO: update NoOpDict
-                metric_dependencies_by_metric_name[metric_name] = self._metric_cache[
-                    metric_configuration.id
-                ]
+                continue
+
+            cached_value: Any = (
+                self._metric_cache.get(metric_configuration.id, _MISSING_METRIC_VALUE)
+                if self._caching
+                else _MISSING_METRIC_VALUE
+            )
+            if cached_value is not _MISSING_METRIC_VALUE:
+                metric_dependencies_by_metric_name[metric_name] = cached_value
             else:
                 raise gx_exceptions.MetricError(
                     message=f'Missing metric dependency: "{metric_name}" for metric "{metric_to_resolve.metric_name}".'
@@ -561,6 +859,9 @@ class ExecutionEngine(ABC):
                 metric_fn_bundle=metric_fn_bundle_configurations
             )
             resolved_metrics.update(resolved_metric_bundle)
+        except gx_exceptions.MetricResolutionError:
+            # Engine already determined which metrics of the bundle failed.
+            raise
         except Exception as e:
             raise gx_exceptions.MetricResolutionError(
                 message=str(e),
@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.validator.computed_metric import MetricValue  # noqa: TCH001
+
+logger = logging.getLogger(__name__)
+
+
+class MetricCache:
+    """MetricCache holds resolved metrics of ExecutionEngine in memory, optionally bounded by (estimated) size in bytes.
+
+    When "max_bytes" is exceeded, least recently used entries are evicted, except for pinned entries (i.e., metrics that
+    dependent metrics, which are yet to be resolved, still need).  Sizes of entries are estimated inexpensively (e.g.,
+    "nbytes" of NumPy arrays and "memory_usage()" of Pandas objects, without introspection of Python objects they hold).
+
+    Args:
+        max_bytes: budget (in bytes) for total estimated size of entries (default is unbounded).
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None) -> None:
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError(
+                f'"max_bytes" must be non-negative integer (received "{max_bytes}").'
+            )
+
+        self._max_bytes = max_bytes
+
+        self._entries: OrderedDict[Tuple[str, str, str], MetricValue] = OrderedDict()
+        self._entry_sizes: Dict[Tuple[str, str, str], int] = {}
+        self._size_bytes: int = 0
+        self._pin_counts: Counter = Counter()
+
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+        # Metrics may be resolved concurrently (see "ConcurrentMetricResolutionScheduler").
+        self._lock = threading.RLock()
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        return self._max_bytes
+
+    @property
+    def size_bytes(self) -> int:
+        """Total estimated size of entries (in bytes)."""
+        return self._size_bytes
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    @property
+    def statistics(self) -> Dict[str, Optional[int]]:
+        """Snapshot of counters and size accounting of this MetricCache."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self._size_bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Tuple[str, str, str]) -> bool:
+        return key in self._entries
+
+    def __getitem__(self, key: Tuple[str, str, str]) -> MetricValue:
+        with self._lock:
+            value: MetricValue = self._entries[key]
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def get(self, key: Tuple[str, str, str], default: Any = None) -> MetricValue:
+        """Returns cached value (marking it as most recently used) or "default", counting hit or miss, respectively."""
+        with self._lock:
+            if key not in self._entries:
+                self._misses += 1
+                return default
+
+            return self[key]
+
+    def __setitem__(self, key: Tuple[str, str, str], value: MetricValue) -> None:
+        with self._lock:
+            self._set(key=key, value=value)
+            self._evict()
+
+    def update(self, metrics: Dict[Tuple[str, str, str], MetricValue]) -> None:
+        with self._lock:
+            key: Tuple[str, str, str]
+            value: MetricValue
+            for key, value in metrics.items():
+                self._set(key=key, value=value)
+
+            self._evict()
+
+    def pop(self, key: Tuple[str, str, str], default: Any = None) -> MetricValue:
+        """Removes entry (if present), returning its value (or "default", if absent)."""
+        with self._lock:
+            if key not in self._entries:
+                return default
+
+            self._size_bytes -= self._entry_sizes.pop(key)
+            return self._entries.pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._entry_sizes.clear()
+            self._size_bytes = 0
+
+    def pin(self, keys: Iterable[Tuple[str, str, str]]) -> None:
+        """Protects given metrics (whether already cached or not) from eviction until they are unpinned."""
+        with self._lock:
+            self._pin_counts.update(keys)
+
+    def unpin(self, keys: Iterable[Tuple[str, str, str]]) -> None:
+        """Reverses "pin()"; metrics are evictable once they have been unpinned as many times as they have been pinned."""
+        with self._lock:
+            self._pin_counts.subtract(keys)
+            self._pin_counts = +self._pin_counts
+            self._evict()
+
+    def _set(self, key: Tuple[str, str, str], value: MetricValue) -> None:
+        if key in self._entries:
+            self._size_bytes -= self._entry_sizes[key]
+
+        size: int = estimate_size_bytes(value=value)
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        self._entry_sizes[key] = size
+        self._size_bytes += size
+
+    def _evict(self) -> None:
+        if self._max_bytes is None or self._size_bytes <= self._max_bytes:
+            return
+
+        key: Tuple[str, str, str]
+        for key in list(self._entries.keys()):
+            if self._size_bytes <= self._max_bytes:
+                break
+
+            if self._pin_counts[key] > 0:
+                continue
+
+            del self._entries[key]
+            self._size_bytes -= self._entry_sizes.pop(key)
+            self._evictions += 1
+
+        if self._size_bytes > self._max_bytes:
+            logger.debug(
+                f"""MetricCache holds {self._size_bytes} bytes of pinned metrics, exceeding its budget of \
+{self._max_bytes} bytes.
+"""
+            )
+
+
+class ConditionValueCache:
+    """ConditionValueCache holds results of row-wise conditions per distinct column value, bounded by number of entries.
+
+    Conditions, evaluated once per distinct value (see "evaluate_on_distinct_values"), look up values, for which they
+    were evaluated by earlier expectations (on the same or other columns), so that only new values are evaluated.
+    Entries are keyed by condition (i.e., metric name and value kwargs), type of value, and value; when "max_entries"
+    is exceeded, least recently used entries are evicted.
+
+    Args:
+        max_entries: maximum number of (condition, value) results held.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        if max_entries < 1:
+            raise ValueError(
+                f'"max_entries" must be positive integer (received "{max_entries}").'
+            )
+
+        self._max_entries = max_entries
+
+        self._entries: OrderedDict[Tuple[str, type, Hashable], Any] = OrderedDict()
+
+        self._hits: int = 0
+        self._misses: int = 0
+
+        # Metrics may be resolved concurrently (see "ConcurrentMetricResolutionScheduler").
+        self._lock = threading.Lock()
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    @property
+    def statistics(self) -> Dict[str, int]:
+        """Snapshot of counters of this ConditionValueCache."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_many(
+        self, condition_id: str, values: Sequence[Hashable]
+    ) -> Tuple[List[Any], List[bool]]:
+        """Returns results, held for "values" under "condition_id" (None, if absent), and flags of their presence."""
+        results: List[Any] = []
+        found: List[bool] = []
+        with self._lock:
+            value: Hashable
+            for value in values:
+                key: Tuple[str, type, Hashable] = (condition_id, type(value), value)
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    results.append(self._entries[key])
+                    found.append(True)
+                else:
+                    results.append(None)
+                    found.append(False)
+
+            self._hits += sum(found)
+            self._misses += len(found) - sum(found)
+
+        return results, found
+
+    def set_many(
+        self, condition_id: str, values: Sequence[Hashable], results: Sequence[Any]
+    ) -> None:
+        with self._lock:
+            value: Hashable
+            result: Any
+            for value, result in zip(values, results):
+                key: Tuple[str, type, Hashable] = (condition_id, type(value), value)
+                self._entries[key] = result
+                self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def estimate_size_bytes(value: Any) -> int:
+    """Estimates memory footprint of metric value (in bytes), without traversing individual elements of arrays."""
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=False).sum())
+
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=False))
+
+    if isinstance(value, pd.Index):
+        return int(value.memory_usage(deep=False))
+
+    if isinstance(value, (tuple, list, set, frozenset)):
+        return sys.getsizeof(value) + sum(
+            estimate_size_bytes(value=element) for element in value
+        )
+
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size_bytes(value=key) + estimate_size_bytes(value=element)
+            for key, element in value.items()
+        )
+
+    try:
+        return sys.getsizeof(value)
+    except TypeError:
+        return 0
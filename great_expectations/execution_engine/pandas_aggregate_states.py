@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import math
+import operator
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Callable
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from great_expectations.core.sketches import Sketch
+
+# Sentinel, distinguishing absence of aggregated records from aggregate values, which happen to be "None".
+_NO_VALUE = object()
+
+
+class AggregateState(ABC):
+    """AggregateState is mergeable partial state of column aggregate, which is updated with consecutive chunks of column.
+
+    States make column aggregates computable in one pass over Batch of data, which is read in chunks (without holding all
+    of its records in memory); states, computed over disjoint chunks, can also be merged.
+
+    Args:
+        aggregate_fn: metric function, which computes aggregate of entire column (given in "column" keyword argument).
+    """
+
+    def __init__(self, aggregate_fn: Callable[..., Any]) -> None:
+        self._aggregate_fn = aggregate_fn
+
+    @abstractmethod
+    def update(self, column: pd.Series) -> None:
+        """Accounts for records of next chunk of column."""
+        pass
+
+    @abstractmethod
+    def merge(self, other: AggregateState) -> None:
+        """Accounts for records, which "other" state (of same type) has been updated with."""
+        pass
+
+    @abstractmethod
+    def result(self) -> Any:
+        """Returns aggregate of all records accounted for."""
+        pass
+
+
+class ReducedAggregateState(AggregateState):
+    """AggregateState of aggregates, whose value for all records is reduction of their values for chunks (e.g., "max").
+
+    Chunks without records, and null values of aggregate (e.g., "max" of chunk holding only nulls), are skipped.
+    """
+
+    def __init__(self, aggregate_fn: Callable[..., Any]) -> None:
+        super().__init__(aggregate_fn=aggregate_fn)
+        self._value: Any = _NO_VALUE
+        self._empty_value: Any = _NO_VALUE
+
+    @staticmethod
+    @abstractmethod
+    def reduce(value: Any, other_value: Any) -> Any:
+        pass
+
+    def update(self, column: pd.Series) -> None:
+        if len(column) == 0:
+            if self._empty_value is _NO_VALUE:
+                self._empty_value = self._aggregate_fn(column=column)
+
+            return
+
+        self._accumulate(value=self._aggregate_fn(column=column))
+
+    def merge(self, other: AggregateState) -> None:
+        assert isinstance(other, ReducedAggregateState)
+        if other._value is not _NO_VALUE:
+            self._accumulate(value=other._value)
+
+        if self._empty_value is _NO_VALUE:
+            self._empty_value = other._empty_value
+
+    def result(self) -> Any:
+        if self._value is not _NO_VALUE:
+            return self._value
+
+        if self._empty_value is not _NO_VALUE:
+            return self._empty_value
+
+        return self._aggregate_fn(column=pd.Series(dtype=object))
+
+    def _accumulate(self, value: Any) -> None:
+        if self._value is _NO_VALUE or _is_null(value=self._value):
+            self._value = value
+        elif not _is_null(value=value):
+            self._value = self.reduce(self._value, value)
+
+
+class MinAggregateState(ReducedAggregateState):
+    reduce = staticmethod(min)
+
+
+class MaxAggregateState(ReducedAggregateState):
+    reduce = staticmethod(max)
+
+
+class SumAggregateState(ReducedAggregateState):
+    reduce = staticmethod(operator.add)
+
+
+class SketchAggregateState(ReducedAggregateState):
+    """AggregateState of aggregates, whose values are mergeable sketches (e.g., "column.quantile_values.sketch")."""
+
+    @staticmethod
+    def reduce(value: Sketch, other_value: Sketch) -> Sketch:
+        value.merge(other=other_value)
+        return value
+
+
+class MomentsAggregateState(AggregateState):
+    """AggregateState, holding count, mean, and sum of squared deviations from mean of non-null values of column.
+
+    Chunks are combined using pairwise update formulas of Chan, Golub, and LeVeque (generalization of Welford's online
+    algorithm), which avoid catastrophic cancellation of accumulating sums of squares.
+    """
+
+    def __init__(self, aggregate_fn: Callable[..., Any]) -> None:
+        super().__init__(aggregate_fn=aggregate_fn)
+        self._count: int = 0
+        self._mean: float = 0.0
+        self._m2: float = 0.0
+
+    def update(self, column: pd.Series) -> None:
+        if not pd.api.types.is_numeric_dtype(column):
+            raise TypeError(
+                f'Moments of column "{column.name}" can only be computed for numeric values (not "{column.dtype}").'
+            )
+
+        values: pd.Series = column.dropna()
+        count: int = len(values)
+        if count == 0:
+            return
+
+        mean: float = float(values.mean())
+        m2: float = float(((values - mean) ** 2).sum())
+        self._combine(count=count, mean=mean, m2=m2)
+
+    def merge(self, other: AggregateState) -> None:
+        assert isinstance(other, MomentsAggregateState)
+        if other._count > 0:
+            self._combine(count=other._count, mean=other._mean, m2=other._m2)
+
+    def _combine(self, count: int, mean: float, m2: float) -> None:
+        total_count: int = self._count + count
+        delta: float = mean - self._mean
+        self._mean += delta * count / total_count
+        self._m2 += m2 + delta * delta * self._count * count / total_count
+        self._count = total_count
+
+
+class MeanAggregateState(MomentsAggregateState):
+    def result(self) -> float:
+        if self._count == 0:
+            return math.nan
+
+        return self._mean
+
+
+class StandardDeviationAggregateState(MomentsAggregateState):
+    """Sample standard deviation (with one degree of freedom, as in "pandas.Series.std()")."""
+
+    def result(self) -> float:
+        if self._count < 2:  # noqa: PLR2004
+            return math.nan
+
+        return math.sqrt(self._m2 / (self._count - 1))
+
+
+def _is_null(value: Any) -> bool:
+    try:
+        return bool(pd.isnull(value))
+    except (TypeError, ValueError):
+        # Non-scalar values (e.g., arrays) are never considered null.
+        return False
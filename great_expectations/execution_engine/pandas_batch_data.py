@@ -1,6 +1,14 @@
+from __future__ import annotations
+
+import logging
+from typing import Callable, Iterable, Iterator, Optional
+
 import pandas as pd
 
 from great_expectations.core.batch import BatchData
+from great_expectations.exceptions import ExecutionEngineError
+
+logger = logging.getLogger(__name__)
 
 
 class PandasBatchData(BatchData):
@@ -11,3 +19,81 @@ class PandasBatchData(BatchData):
     @property
     def dataframe(self):
         return self._dataframe
+
+
+class PandasChunkedBatchData(PandasBatchData):
+    """PandasBatchData, whose records are read in chunks on every pass over them, instead of being held in memory.
+
+    Metrics, which support chunked computation (e.g., column aggregates with mergeable partial states), iterate over
+    "iter_chunks()"; all other metrics (e.g., column map metrics) access "dataframe", which fails, unless reading all
+    chunks into single DataFrame (only once) is explicitly allowed.
+
+    Args:
+        execution_engine: ExecutionEngine, which loaded this Batch of data.
+        chunks_fn: function, which returns new iterable of consecutive chunks (DataFrame objects) of records.
+        allow_materialization: if True, metrics not supporting chunked computation read all records into memory;
+            otherwise (default), they raise ExecutionEngineError.
+    """
+
+    def __init__(
+        self,
+        execution_engine,
+        chunks_fn: Callable[[], Iterable[pd.DataFrame]],
+        allow_materialization: bool = False,
+    ) -> None:
+        super().__init__(execution_engine=execution_engine, dataframe=None)  # type: ignore[arg-type]
+        self._chunks_fn = chunks_fn
+        self._allow_materialization = allow_materialization
+
+    @property
+    def allow_materialization(self) -> bool:
+        return self._allow_materialization
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether or not all records have been read into memory (after which chunks are no longer read)."""
+        return self._dataframe is not None
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """Yields consecutive chunks of records (at least one chunk, which is empty, if there are no records)."""
+        if self._dataframe is not None:
+            yield self._dataframe
+            return
+
+        # Empty chunk (e.g., of file with header only) is yielded only in absence of records, in order to convey columns.
+        empty_chunk: Optional[pd.DataFrame] = None
+        has_records: bool = False
+
+        chunk: pd.DataFrame
+        for chunk in self._chunks_fn():
+            if len(chunk) == 0:
+                if empty_chunk is None:
+                    empty_chunk = chunk
+
+                continue
+
+            has_records = True
+            yield chunk
+
+        if not has_records:
+            yield pd.DataFrame() if empty_chunk is None else empty_chunk
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        if self._dataframe is None:
+            if not self._allow_materialization:
+                raise ExecutionEngineError(
+                    """Requested metric does not support chunked computation and needs all records of Batch, which is \
+read in chunks ("chunksize" reader option), in memory.  Either remove "chunksize" reader option, or construct \
+PandasExecutionEngine with "materialize_chunked_batch_data=True" in order to read all chunks into memory (once) for such \
+metrics.
+"""
+                )
+
+            logger.warning(
+                "Reading all chunks of Batch into memory, because requested metric does not support chunked computation."
+            )
+            chunks = list(self._chunks_fn())
+            self._dataframe = pd.concat(chunks) if chunks else pd.DataFrame()
+
+        return self._dataframe
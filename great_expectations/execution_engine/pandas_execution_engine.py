@@ -4,15 +4,31 @@ import datetime
 import hashlib
 import logging
 import pickle
+from dataclasses import dataclass
 from functools import partial
 from io import BytesIO
-from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union, cast, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+    overload,
+)
 
 import pandas as pd
 from typing_extensions import TypeAlias
 
 import great_expectations.exceptions as gx_exceptions
-from great_expectations.compatibility import aws, azure, google
+from great_expectations.compatibility import aws, azure, google, pyarrow
 from great_expectations.compatibility.sqlalchemy_and_pandas import (
     execute_pandas_reader_fn,
 )
@@ -27,15 +43,21 @@ from great_expectations.core.batch_spec import (
     RuntimeDataBatchSpec,
     S3BatchSpec,
 )
+from great_expectations.core.id_dict import IDDict
 from great_expectations.core.metric_domain_types import (
     MetricDomainTypes,  # noqa: TCH001
 )
 from great_expectations.core.util import AzureUrl, GCSUrl, S3Url, sniff_s3_compression
 from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.execution_engine.execution_engine import (
+    MetricComputationConfiguration,  # noqa: TCH001
     SplitDomainKwargs,  # noqa: TCH001
 )
-from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.execution_engine.metric_cache import ConditionValueCache
+from great_expectations.execution_engine.pandas_batch_data import (
+    PandasBatchData,
+    PandasChunkedBatchData,
+)
 from great_expectations.execution_engine.split_and_sample.pandas_data_sampler import (
     PandasDataSampler,
 )
@@ -43,14 +65,53 @@ from great_expectations.execution_engine.split_and_sample.pandas_data_splitter i
     PandasDataSplitter,
 )
 
+if TYPE_CHECKING:
+    from great_expectations.execution_engine.pandas_aggregate_states import (
+        AggregateState,
+    )
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
 logger = logging.getLogger(__name__)
 
 
 HASH_THRESHOLD = 1e9
 
+# Leading element of metric cache keys of filtered Domain records (distinct from names of metrics).
+DOMAIN_RECORDS_CACHE_KEY_PREFIX = "__domain_records__"
+
 DataFrameFactoryFn: TypeAlias = Callable[..., pd.DataFrame]
 
 
+@dataclass(frozen=True)
+class PandasColumnAggregate:
+    """Aggregate of single column, which "PandasExecutionEngine.resolve_metric_bundle()" computes (on demand) together
+    with other aggregates of same compute Domain.
+
+    Args:
+        column_name: name of column being aggregated.
+        aggregate_fn: function, which computes metric value, given column (as Pandas Series) in "column" keyword argument.
+        filter_column_isnull: if True, null values are removed from column before computing aggregate.
+        aggregate_state_type: mergeable partial state of aggregate (if any), used for Batch of data read in chunks.
+        requires_records: if False, "aggregate_fn" returns value, derived from resolved metric dependencies only (e.g.,
+            from sketch), and is called with "column=None" (without obtaining records of compute Domain).
+    """
+
+    column_name: str
+    aggregate_fn: Callable[..., Any]
+    filter_column_isnull: bool = False
+    aggregate_state_type: Optional[Type[AggregateState]] = None
+    requires_records: bool = True
+
+    def get_column(self, df: pd.DataFrame) -> pd.Series:
+        """Returns (null-filtered, if so requested) column of "df", on which aggregate is computed."""
+        column: pd.Series = df[self.column_name]
+        if self.filter_column_isnull:
+            column = column[column.notnull()]
+
+        return column
+
+
 @public_api
 class PandasExecutionEngine(ExecutionEngine):
     """PandasExecutionEngine instantiates the ExecutionEngine API to support computations using Pandas.
@@ -59,7 +120,11 @@ class PandasExecutionEngine(ExecutionEngine):
 
     Args:
         *args: Positional arguments for configuring PandasExecutionEngine
-        **kwargs: Keyword arguments for configuring PandasExecutionEngine
+        **kwargs: Keyword arguments for configuring PandasExecutionEngine (e.g., "materialize_chunked_batch_data", which
+            allows metrics, that do not support chunked computation, to read all chunks of Batch of data, which is read
+            in chunks, into memory; by default, such metrics fail; or "condition_value_cache_max_entries", which keeps
+            results of conditions, evaluated once per distinct column value, for as many most recently used values, so
+            that later expectations evaluate such conditions only for values not seen before)
 
     For example:
     ```python
@@ -96,6 +161,17 @@ class PandasExecutionEngine(ExecutionEngine):
         self.discard_subset_failing_expectations = kwargs.pop(
             "discard_subset_failing_expectations", False
         )
+        self._materialize_chunked_batch_data: bool = kwargs.pop(
+            "materialize_chunked_batch_data", False
+        )
+        condition_value_cache_max_entries: Optional[int] = kwargs.pop(
+            "condition_value_cache_max_entries", None
+        )
+        self._condition_value_cache: Optional[ConditionValueCache] = (
+            ConditionValueCache(max_entries=condition_value_cache_max_entries)
+            if condition_value_cache_max_entries
+            else None
+        )
         boto3_options: Dict[str, dict] = kwargs.pop("boto3_options", {})
         azure_options: Dict[str, dict] = kwargs.pop("azure_options", {})
         gcs_options: Dict[str, dict] = kwargs.pop("gcs_options", {})
@@ -106,6 +182,11 @@ class PandasExecutionEngine(ExecutionEngine):
         self._azure = None
         self._gcs = None
 
+        # Filtered records of Domains with row conditions or "ignore_row_if" directives are held in metric cache (where
+        # they count against "metric_cache_max_bytes" budget), keyed by Batch ID and filtering Domain kwargs; keys are
+        # tracked per Batch, in order to discard records filtered from previously loaded data of reloaded Batch.
+        self._domain_records_cache_keys: Dict[str, Set[Tuple[str, str, str]]] = {}
+
         super().__init__(*args, **kwargs)
 
         self._config.update(
@@ -117,9 +198,22 @@ class PandasExecutionEngine(ExecutionEngine):
             }
         )
 
+        if self._materialize_chunked_batch_data:
+            self._config["materialize_chunked_batch_data"] = True
+
+        if condition_value_cache_max_entries:
+            self._config[
+                "condition_value_cache_max_entries"
+            ] = condition_value_cache_max_entries
+
         self._data_splitter = PandasDataSplitter()
         self._data_sampler = PandasDataSampler()
 
+    @property
+    def condition_value_cache(self) -> Optional[ConditionValueCache]:
+        """Results of conditions per distinct column value (see "condition_value_cache_max_entries"), if enabled."""
+        return self._condition_value_cache
+
     def _instantiate_azure_client(self) -> None:
         self._azure = None
         if azure.BlobServiceClient:
@@ -188,6 +282,32 @@ class PandasExecutionEngine(ExecutionEngine):
 
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+        # Records, filtered from previously loaded data of this Batch, are not needed any longer.
+        key: Tuple[str, str, str]
+        for key in self._domain_records_cache_keys.pop(batch_id, set()):
+            self._metric_cache.pop(key, None)
+
+    def _compute_batch_fingerprint(self, batch_id: str) -> Optional[str]:
+        """In absence of fingerprint in BatchMarkers (e.g., for large or in-memory DataFrames), hashes DataFrame."""
+        batch_fingerprint: Optional[str] = super()._compute_batch_fingerprint(
+            batch_id=batch_id
+        )
+        if batch_fingerprint is not None:
+            return batch_fingerprint
+
+        batch_data = self.batch_manager.batch_data_cache.get(batch_id)
+        if not isinstance(batch_data, PandasBatchData):
+            return None
+
+        # Hashing Batch of data, which is read in chunks, would require all of its records in memory.
+        if (
+            isinstance(batch_data, PandasChunkedBatchData)
+            and not batch_data.is_materialized
+        ):
+            return None
+
+        return hash_pandas_dataframe(batch_data.dataframe)
+
     def get_batch_data_and_markers(  # noqa: C901 - 22
         self, batch_spec: BatchSpec
     ) -> Tuple[Any, BatchMarkers]:  # batch_data
@@ -315,6 +435,11 @@ Bucket: {error}"""
             reader_method = batch_spec.reader_method
             reader_options = batch_spec.reader_options
             path = batch_spec.path
+            if reader_options and reader_options.get("chunksize"):
+                return self._get_chunked_batch_data_and_markers(
+                    batch_spec=batch_spec, batch_markers=batch_markers
+                )
+
             reader_fn = self._get_reader_fn(reader_method, path)
             df = reader_fn(path, **reader_options)
 
@@ -350,6 +475,89 @@ not {batch_spec.__class__.__name__}"""
 
         return typed_batch_data, batch_markers
 
+    def _get_chunked_batch_data_and_markers(
+        self, batch_spec: PathBatchSpec, batch_markers: BatchMarkers
+    ) -> Tuple[PandasChunkedBatchData, BatchMarkers]:
+        """Builds Batch of data, which is read in chunks of "chunksize" reader option rows on every pass over it.
+
+        Readers, which support "chunksize" option (e.g., "read_csv"), return iterators over chunks; Parquet files are read
+        in batches of records using "pyarrow".  Splitting and sampling of chunked Batch of data are not supported.
+        """
+        if batch_spec.get("splitter_method") or batch_spec.get("sampling_method"):
+            raise gx_exceptions.ExecutionEngineError(
+                'Splitting and sampling are not supported for Batch of data, which is read in chunks ("chunksize" \
+reader option).'
+            )
+
+        path: str = batch_spec.path
+        reader_method: str = (
+            batch_spec.reader_method
+            or self.guess_reader_method_from_path(path=path)["reader_method"]
+        )
+        reader_options: dict = dict(batch_spec.reader_options)
+
+        chunks_fn: Callable[[], Iterator[pd.DataFrame]]
+        if reader_method == "read_parquet":
+            chunks_fn = partial(
+                self._read_parquet_chunks, path=path, reader_options=reader_options
+            )
+        else:
+            chunks_fn = partial(
+                self._read_chunks,
+                reader_fn=self._get_reader_fn(batch_spec.reader_method, path),
+                path=path,
+                reader_options=reader_options,
+            )
+
+        typed_batch_data = PandasChunkedBatchData(
+            execution_engine=self,
+            chunks_fn=chunks_fn,
+            allow_materialization=self._materialize_chunked_batch_data,
+        )
+
+        return typed_batch_data, batch_markers
+
+    @staticmethod
+    def _read_chunks(
+        reader_fn: DataFrameFactoryFn, path: str, reader_options: dict
+    ) -> Iterator[pd.DataFrame]:
+        reader = reader_fn(path, **reader_options)
+        if isinstance(reader, pd.DataFrame):
+            raise gx_exceptions.ExecutionEngineError(
+                f'Pandas reader method for "{path}" does not support reading in chunks ("chunksize" reader option).'
+            )
+
+        try:
+            yield from reader
+        finally:
+            reader.close()
+
+    @staticmethod
+    def _read_parquet_chunks(path: str, reader_options: dict) -> Iterator[pd.DataFrame]:
+        unsupported_options: set = set(reader_options.keys()) - {
+            "chunksize",
+            "columns",
+            "engine",
+        }
+        if unsupported_options:
+            raise gx_exceptions.ExecutionEngineError(
+                f"""Reader options {sorted(unsupported_options)} are not supported for reading Parquet files in chunks.
+"""
+            )
+
+        parquet_file = pyarrow.parquet.ParquetFile(path)
+
+        # Records keep their position in file as index (as if all of them were read at once).
+        offset: int = 0
+        for record_batch in parquet_file.iter_batches(
+            batch_size=reader_options["chunksize"],
+            columns=reader_options.get("columns"),
+        ):
+            chunk: pd.DataFrame = record_batch.to_pandas()
+            chunk.index = pd.RangeIndex(start=offset, stop=offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
+
     def _apply_splitting_and_sampling_methods(self, batch_spec, batch_data):
         splitter_method_name: Optional[str] = batch_spec.get("splitter_method")
         if splitter_method_name:
@@ -471,26 +679,280 @@ not {batch_spec.__class__.__name__}"""
             )
 
     def resolve_metric_bundle(
-        self, metric_fn_bundle
-    ) -> Dict[Tuple[str, str, str], Any]:
-        """Resolve a bundle of metrics with the same compute Domain as part of a single trip to the compute engine."""
-        return (
-            {}
-        )  # This is NO-OP for "PandasExecutionEngine" (no bundling for direct execution computational backend).
+        self,
+        metric_fn_bundle: Iterable[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """For every metric in a set of column aggregate Metrics ("PandasColumnAggregate" objects) to resolve, obtains
+        records of their compute Domain and (null-filtered, if so requested) column only once, in order to compute all
+        aggregates, sharing them, in a single pass.  If Batch of data is read in chunks, aggregates with mergeable partial
+        states are computed in single pass over chunks of records of their compute Domain.
+
+            Args:
+                metric_fn_bundle (Iterable[MetricComputationConfiguration]): \
+                    "MetricComputationConfiguration" contains MetricProvider's MetricConfiguration (its unique identifier),
+                    its metric provider function (the function that actually executes the metric), and arguments to pass
+                    to metric provider function (dictionary of metrics defined in registry and corresponding arguments).
+
+            Returns:
+                A dictionary of "MetricConfiguration" IDs and their corresponding fully resolved values for domains.
+
+            Raises:
+                MetricResolutionError: listing only those metrics, whose computation failed.
+        """
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        aggregates: Dict[Tuple[str, str, str], dict] = {}
+
+        aggregate: dict
+
+        domain_id: Tuple[str, str, str]
+
+        bundled_metric_configuration: MetricComputationConfiguration
+        for bundled_metric_configuration in metric_fn_bundle:
+            compute_domain_kwargs: dict = (
+                bundled_metric_configuration.compute_domain_kwargs or {}
+            )
+            if not isinstance(compute_domain_kwargs, IDDict):
+                compute_domain_kwargs = IDDict(compute_domain_kwargs)
+
+            domain_id = compute_domain_kwargs.to_id()
+            if domain_id not in aggregates:
+                aggregates[domain_id] = {
+                    "column_aggregates": [],
+                    "metric_configurations": [],
+                    "domain_kwargs": compute_domain_kwargs,
+                }
+
+            aggregates[domain_id]["column_aggregates"].append(
+                bundled_metric_configuration.metric_fn
+            )
+            aggregates[domain_id]["metric_configurations"].append(
+                bundled_metric_configuration.metric_configuration
+            )
+
+        failed_metrics: List[Tuple[MetricConfiguration, Exception]] = []
+
+        for aggregate in aggregates.values():
+            domain_kwargs: dict = aggregate["domain_kwargs"]
+
+            column_aggregates: List[
+                Tuple[PandasColumnAggregate, MetricConfiguration]
+            ] = list(
+                zip(aggregate["column_aggregates"], aggregate["metric_configurations"])
+            )
+
+            column_aggregate: PandasColumnAggregate
+            metric_configuration: MetricConfiguration
+            for column_aggregate, metric_configuration in column_aggregates:
+                if not column_aggregate.requires_records:
+                    try:
+                        resolved_metrics[
+                            metric_configuration.id
+                        ] = column_aggregate.aggregate_fn(column=None)
+                    except Exception as e:
+                        failed_metrics.append((metric_configuration, e))
+
+            column_aggregates = [
+                element for element in column_aggregates if element[0].requires_records
+            ]
+
+            if self._is_read_in_chunks(domain_kwargs=domain_kwargs):
+                # Aggregates with mergeable partial states do not need all records of Batch of data in memory.
+                self._resolve_column_aggregates_over_chunks(
+                    domain_kwargs=domain_kwargs,
+                    column_aggregates=[
+                        element
+                        for element in column_aggregates
+                        if element[0].aggregate_state_type is not None
+                    ],
+                    resolved_metrics=resolved_metrics,
+                    failed_metrics=failed_metrics,
+                )
+                column_aggregates = [
+                    element
+                    for element in column_aggregates
+                    if element[0].aggregate_state_type is None
+                ]
+
+            if not column_aggregates:
+                continue
+
+            df: pd.DataFrame = self.get_domain_records(domain_kwargs=domain_kwargs)
+
+            columns: Dict[Tuple[str, bool], pd.Series] = {}
+
+            for column_aggregate, metric_configuration in column_aggregates:
+                try:
+                    column: pd.Series = self._get_bundled_column(
+                        df=df, column_aggregate=column_aggregate, columns=columns
+                    )
+                    resolved_metrics[
+                        metric_configuration.id
+                    ] = column_aggregate.aggregate_fn(column=column)
+                except Exception as e:
+                    # Like directly computed metrics, failing aggregate does not fail other metrics of the bundle.
+                    failed_metrics.append((metric_configuration, e))
+
+            logger.debug(
+                f"PandasExecutionEngine computed {len(column_aggregates)} metrics on domain_id \
+{IDDict(domain_kwargs).to_id()}"
+            )
+
+        if failed_metrics:
+            # Chaining keeps traceback of (first) failure in exception info, reported for failed metrics.
+            raise gx_exceptions.MetricResolutionError(
+                message="; ".join(str(e) for _, e in failed_metrics),
+                failed_metrics=[
+                    metric_configuration for metric_configuration, _ in failed_metrics
+                ],
+            ) from failed_metrics[0][1]
+
+        return resolved_metrics
+
+    def _resolve_column_aggregates_over_chunks(
+        self,
+        domain_kwargs: dict,
+        column_aggregates: List[Tuple[PandasColumnAggregate, MetricConfiguration]],
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue],
+        failed_metrics: List[Tuple[MetricConfiguration, Exception]],
+    ) -> None:
+        """Updates mergeable partial states of column aggregates with every chunk of records of Domain (in single pass)."""
+        if not column_aggregates:
+            return
+
+        states: Dict[Tuple[str, str, str], AggregateState] = {
+            metric_configuration.id: column_aggregate.aggregate_state_type(  # type: ignore[misc]
+                aggregate_fn=column_aggregate.aggregate_fn
+            )
+            for column_aggregate, metric_configuration in column_aggregates
+        }
+        failed_metric_ids: Set[Tuple[str, str, str]] = set()
+
+        column_aggregate: PandasColumnAggregate
+        metric_configuration: MetricConfiguration
+        chunk: pd.DataFrame
+        for chunk in self.iter_domain_record_chunks(domain_kwargs=domain_kwargs):
+            columns: Dict[Tuple[str, bool], pd.Series] = {}
+            for column_aggregate, metric_configuration in column_aggregates:
+                if metric_configuration.id in failed_metric_ids:
+                    continue
+
+                try:
+                    states[metric_configuration.id].update(
+                        column=self._get_bundled_column(
+                            df=chunk, column_aggregate=column_aggregate, columns=columns
+                        )
+                    )
+                except Exception as e:
+                    failed_metric_ids.add(metric_configuration.id)
+                    failed_metrics.append((metric_configuration, e))
+
+        for column_aggregate, metric_configuration in column_aggregates:
+            if metric_configuration.id in failed_metric_ids:
+                continue
+
+            try:
+                resolved_metrics[metric_configuration.id] = states[
+                    metric_configuration.id
+                ].result()
+            except Exception as e:
+                failed_metrics.append((metric_configuration, e))
+
+        logger.debug(
+            f"PandasExecutionEngine computed {len(column_aggregates)} metrics over chunks of records on domain_id \
+{IDDict(domain_kwargs).to_id()}"
+        )
+
+    @staticmethod
+    def _get_bundled_column(
+        df: pd.DataFrame,
+        column_aggregate: PandasColumnAggregate,
+        columns: Dict[Tuple[str, bool], pd.Series],
+    ) -> pd.Series:
+        """Returns (null-filtered, if so requested) column of "df", reusing it among aggregates through "columns"."""
+        key: Tuple[str, bool] = (
+            column_aggregate.column_name,
+            column_aggregate.filter_column_isnull,
+        )
+        if key not in columns:
+            columns[key] = column_aggregate.get_column(df=df)
+
+        return columns[key]
 
     @public_api
-    def get_domain_records(  # noqa: C901 - 17
+    def get_domain_records(
         self,
         domain_kwargs: dict,
     ) -> pd.DataFrame:
         """Uses the given Domain kwargs (which include row_condition, condition_parser, and ignore_row_if directives) to obtain and/or query a Batch of data.
 
+        Records, filtered by row condition and/or "ignore_row_if" directive, are memoized per Batch in metric cache
+        (unless caching is disabled), so that metrics sharing the same filtering Domain kwargs do not query and copy the
+        Batch repeatedly.  Hence, like the DataFrame of the Batch itself, returned DataFrame is shared among metrics and
+        must not be modified in place.
+
         Args:
             domain_kwargs (dict) - A dictionary consisting of the Domain kwargs specifying which data to obtain
 
         Returns:
             A DataFrame (the data on which to compute returned in the format of a Pandas DataFrame)
         """
+        batch_id: str
+        batch_data: PandasBatchData
+        batch_id, batch_data = self._get_domain_batch_data(domain_kwargs=domain_kwargs)
+        data: pd.DataFrame = batch_data.dataframe
+
+        filtering_domain_kwargs: IDDict = self._get_filtering_domain_kwargs(
+            domain_kwargs=domain_kwargs
+        )
+        if not filtering_domain_kwargs:
+            return data
+
+        if not self._caching:
+            return self._filter_domain_records(data=data, domain_kwargs=domain_kwargs)
+
+        key: Tuple[str, str, str] = (
+            DOMAIN_RECORDS_CACHE_KEY_PREFIX,
+            batch_id,
+            filtering_domain_kwargs.to_id(),
+        )
+        filtered_data: Optional[pd.DataFrame] = self._metric_cache.get(key)
+        if filtered_data is not None:
+            return filtered_data
+
+        filtered_data = self._filter_domain_records(
+            data=data, domain_kwargs=domain_kwargs
+        )
+        self._metric_cache[key] = filtered_data
+        self._domain_records_cache_keys.setdefault(batch_id, set()).add(key)
+        return filtered_data
+
+    def iter_domain_record_chunks(self, domain_kwargs: dict) -> Iterator[pd.DataFrame]:
+        """Yields records of Domain in consecutive chunks, if Batch of data is read in chunks (and has not been read into
+        memory in its entirety); otherwise, yields all records of Domain (as returned by "get_domain_records()") at once.
+
+        Args:
+            domain_kwargs (dict) - A dictionary consisting of the Domain kwargs specifying which data to obtain
+
+        Returns:
+            Iterator over DataFrame objects (at least one, which is empty, if Domain has no records)
+        """
+        batch_data: PandasBatchData
+        _, batch_data = self._get_domain_batch_data(domain_kwargs=domain_kwargs)
+        if (
+            not isinstance(batch_data, PandasChunkedBatchData)
+            or batch_data.is_materialized
+        ):
+            yield self.get_domain_records(domain_kwargs=domain_kwargs)
+            return
+
+        chunk: pd.DataFrame
+        for chunk in batch_data.iter_chunks():
+            yield self._filter_domain_records(data=chunk, domain_kwargs=domain_kwargs)
+
+    def _get_domain_batch_data(
+        self, domain_kwargs: dict
+    ) -> Tuple[str, PandasBatchData]:
         table = domain_kwargs.get("table", None)
         if table:
             raise ValueError(
@@ -501,23 +963,72 @@ not {batch_spec.__class__.__name__}"""
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.batch_manager.active_batch_data_id is not None:
-                data = cast(
-                    PandasBatchData, self.batch_manager.active_batch_data
-                ).dataframe
+                batch_id = self.batch_manager.active_batch_data_id
+                batch_data = cast(PandasBatchData, self.batch_manager.active_batch_data)
             else:
                 raise gx_exceptions.ValidationError(
                     "No batch is specified, but could not identify a loaded batch."
                 )
         else:
             if batch_id in self.batch_manager.batch_data_cache:
-                data = cast(
+                batch_data = cast(
                     PandasBatchData, self.batch_manager.batch_data_cache[batch_id]
-                ).dataframe
+                )
             else:
                 raise gx_exceptions.ValidationError(
                     f"Unable to find batch with batch_id {batch_id}"
                 )
 
+        return batch_id, batch_data
+
+    def _is_read_in_chunks(self, domain_kwargs: dict) -> bool:
+        batch_data: PandasBatchData
+        _, batch_data = self._get_domain_batch_data(domain_kwargs=domain_kwargs)
+        return (
+            isinstance(batch_data, PandasChunkedBatchData)
+            and not batch_data.is_materialized
+        )
+
+    @staticmethod
+    def _get_filtering_domain_kwargs(domain_kwargs: dict) -> IDDict:
+        """Returns those Domain kwargs, which determine records of Domain (empty, if all records of Batch are used)."""
+        filtering_keys: Tuple[str, ...]
+        if "column" in domain_kwargs:
+            filtering_keys = ("row_condition", "condition_parser")
+        elif "column_A" in domain_kwargs and "column_B" in domain_kwargs:
+            filtering_keys = (
+                "row_condition",
+                "condition_parser",
+                "column_A",
+                "column_B",
+                "ignore_row_if",
+            )
+        elif "column_list" in domain_kwargs:
+            filtering_keys = (
+                "row_condition",
+                "condition_parser",
+                "column_list",
+                "ignore_row_if",
+            )
+        else:
+            filtering_keys = ("row_condition", "condition_parser")
+
+        if not domain_kwargs.get("row_condition") and not (
+            "ignore_row_if" in filtering_keys and "ignore_row_if" in domain_kwargs
+        ):
+            return IDDict()
+
+        return IDDict(
+            {
+                key: value
+                for key, value in domain_kwargs.items()
+                if key in filtering_keys
+            }
+        )
+
+    @staticmethod
+    def _filter_domain_records(data: pd.DataFrame, domain_kwargs: dict) -> pd.DataFrame:
+        """Applies row condition and "ignore_row_if" directive of Domain kwargs to records of Batch."""
         # Filtering by row condition.
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
@@ -635,6 +1146,30 @@ not {batch_spec.__class__.__name__}"""
 
         return data, split_domain_kwargs.compute, split_domain_kwargs.accessor
 
+    def get_compute_domain_kwargs(
+        self,
+        domain_kwargs: dict,
+        domain_type: Union[str, MetricDomainTypes],
+        accessor_keys: Optional[Iterable[str]] = None,
+    ) -> Tuple[dict, dict]:
+        """Splits Domain kwargs into compute and accessor Domain kwargs, as "get_compute_domain()" does, without
+        obtaining records of compute Domain (which "resolve_metric_bundle()" obtains once for all bundled metrics).
+
+        Returns:
+            A tuple of compute_domain_kwargs and accessor_domain_kwargs
+        """
+        table: str = domain_kwargs.get("table", None)
+        if table:
+            raise ValueError(
+                "PandasExecutionEngine does not currently support multiple named tables."
+            )
+
+        split_domain_kwargs: SplitDomainKwargs = self._split_domain_kwargs(
+            domain_kwargs, domain_type, accessor_keys
+        )
+
+        return split_domain_kwargs.compute, split_domain_kwargs.accessor
+
 
 def hash_pandas_dataframe(df):
     try:
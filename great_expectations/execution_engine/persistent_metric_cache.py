@@ -0,0 +1,438 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.validator.computed_metric import MetricValue  # noqa: TCH001
+
+logger = logging.getLogger(__name__)
+
+
+class PersistentMetricCache(ABC):
+    """PersistentMetricCache stores resolved metric values beyond lifetime of ExecutionEngine, which computed them.
+
+    Entries are keyed by "MetricConfiguration" ID together with fingerprint of Batch, on which metric was computed (e.g.,
+    hash of Pandas DataFrame or modification time and size of file), so that validating unchanged Batch of data again
+    (e.g., re-running Checkpoint after adding Expectations to ExpectationSuite) only computes metrics not seen before.
+
+    Subclasses implement storage of serialized entries; this base class implements keying, serialization, and eviction
+    policy (least recently used entries are evicted above "max_entries"; entries older than "ttl_seconds" expire).
+
+    Args:
+        max_entries: maximum number of entries retained (default is unlimited).
+        ttl_seconds: time (in seconds) after being stored, when entries expire (default is never).
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(
+                f'"max_entries" must be positive integer (received "{max_entries}").'
+            )
+
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError(
+                f'"ttl_seconds" must be positive number (received "{ttl_seconds}").'
+            )
+
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+
+    @property
+    def max_entries(self) -> Optional[int]:
+        return self._max_entries
+
+    @property
+    def ttl_seconds(self) -> Optional[float]:
+        return self._ttl_seconds
+
+    def get(
+        self, metric_id: Tuple[str, str, str], batch_fingerprint: str
+    ) -> Tuple[bool, Optional[MetricValue]]:
+        """Retrieves metric value, stored for given metric and Batch.
+
+        Returns:
+            Tuple, whose first element indicates whether or not (unexpired) entry was found, and whose second element is
+            metric value (None, if entry was not found).
+        """
+        key: str = self.build_key(
+            metric_id=metric_id, batch_fingerprint=batch_fingerprint
+        )
+        with self._lock:
+            entry: Optional[Tuple[bytes, float]] = self._get(key=key)
+            if entry is None:
+                return False, None
+
+            payload: bytes
+            stored_at: float
+            payload, stored_at = entry
+            if self._is_expired(stored_at=stored_at):
+                self._remove(key=key)
+                return False, None
+
+        try:
+            return True, pickle.loads(payload)
+        except Exception as e:
+            logger.warning(
+                f"""Unable to deserialize cached value of metric {str(metric_id)} ({type(e).__name__}: "{str(e)}"); \
+discarding it.
+"""
+            )
+            with self._lock:
+                self._remove(key=key)
+
+            return False, None
+
+    def set(
+        self,
+        metric_id: Tuple[str, str, str],
+        batch_fingerprint: str,
+        value: MetricValue,
+    ) -> bool:
+        """Stores metric value for given metric and Batch (values, which cannot be serialized, are not stored).
+
+        Returns:
+            Boolean, indicating whether or not value was stored.
+        """
+        try:
+            payload: bytes = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug(
+                f"""Value of metric {str(metric_id)} cannot be serialized ({type(e).__name__}: "{str(e)}"); not \
+caching it.
+"""
+            )
+            return False
+
+        key: str = self.build_key(
+            metric_id=metric_id, batch_fingerprint=batch_fingerprint
+        )
+        now: float = time.time()
+        with self._lock:
+            self._set(key=key, payload=payload, stored_at=now)
+            if self._should_evict(now=now):
+                self._evict(
+                    max_entries=self._max_entries,
+                    stored_before=None
+                    if self._ttl_seconds is None
+                    else now - self._ttl_seconds,
+                )
+
+        return True
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        with self._lock:
+            self._clear()
+
+    @staticmethod
+    def build_key(metric_id: Tuple[str, str, str], batch_fingerprint: str) -> str:
+        serialized_id: str = json.dumps(
+            convert_to_json_serializable(data=[batch_fingerprint, list(metric_id)]),
+            sort_keys=True,
+        )
+        return hashlib.md5(serialized_id.encode("utf-8")).hexdigest()
+
+    def _should_evict(self, now: float) -> bool:
+        """Whether or not to evict entries after storing one at time "now" (never, unless cache is bounded)."""
+        return self._max_entries is not None or self._ttl_seconds is not None
+
+    def _is_expired(self, stored_at: float) -> bool:
+        return (
+            self._ttl_seconds is not None
+            and stored_at < time.time() - self._ttl_seconds
+        )
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[Tuple[bytes, float]]:
+        """Returns serialized value and time it was stored (None, if key is absent); marks entry as recently used."""
+        pass
+
+    @abstractmethod
+    def _set(self, key: str, payload: bytes, stored_at: float) -> None:
+        pass
+
+    @abstractmethod
+    def _remove(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def _evict(
+        self, max_entries: Optional[int], stored_before: Optional[float]
+    ) -> None:
+        """Removes entries stored before "stored_before", followed by least recently used entries above "max_entries"."""
+        pass
+
+    @abstractmethod
+    def _clear(self) -> None:
+        pass
+
+
+class SqlitePersistentMetricCache(PersistentMetricCache):
+    """PersistentMetricCache, whose entries are stored in table of local SQLite database file.
+
+    Args:
+        database_path: path to SQLite database file (created, if it does not exist).
+        max_entries: maximum number of entries retained (default is unlimited).
+        ttl_seconds: time (in seconds) after being stored, when entries expire (default is never).
+    """
+
+    TABLE_NAME: str = "ge_metric_cache"
+
+    def __init__(
+        self,
+        database_path: str,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        super().__init__(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+        self._database_path = database_path
+
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: Optional[int] = None
+
+        Path(database_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, self._connect() as connection:
+            connection.execute(
+                f"""CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (
+    key TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)"""
+            )
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.TABLE_NAME}_accessed_at ON {self.TABLE_NAME} (accessed_at)"
+            )
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.TABLE_NAME}_stored_at ON {self.TABLE_NAME} (stored_at)"
+            )
+
+    @property
+    def database_path(self) -> str:
+        return self._database_path
+
+    def close(self) -> None:
+        """Closes connection to SQLite database (it is opened again, if cache is used afterwards)."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __del__(self) -> None:
+        if getattr(self, "_connection", None) is not None:
+            self._connection.close()  # type: ignore[union-attr]
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Cache holds one connection, which "self._lock" guards among threads; SQLite connection must not be used across
+        # "fork()", and so child process opens its own (database file locking arbitrates among processes).
+        if self._connection is None or self._connection_pid != os.getpid():
+            self._connection = sqlite3.connect(
+                self._database_path, timeout=30, check_same_thread=False
+            )
+            self._connection_pid = os.getpid()
+
+        with self._connection:
+            yield self._connection
+
+    def __len__(self) -> int:
+        with self._lock, self._connect() as connection:
+            return connection.execute(
+                f"SELECT COUNT(*) FROM {self.TABLE_NAME}"
+            ).fetchone()[0]
+
+    def _get(self, key: str) -> Optional[Tuple[bytes, float]]:
+        with self._connect() as connection:
+            row = connection.execute(
+                f"SELECT payload, stored_at FROM {self.TABLE_NAME} WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            connection.execute(
+                f"UPDATE {self.TABLE_NAME} SET accessed_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+
+        return row[0], row[1]
+
+    def _set(self, key: str, payload: bytes, stored_at: float) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                f"INSERT OR REPLACE INTO {self.TABLE_NAME} (key, payload, stored_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, payload, stored_at, stored_at),
+            )
+
+    def _remove(self, key: str) -> None:
+        with self._connect() as connection:
+            connection.execute(f"DELETE FROM {self.TABLE_NAME} WHERE key = ?", (key,))
+
+    def _evict(
+        self, max_entries: Optional[int], stored_before: Optional[float]
+    ) -> None:
+        with self._connect() as connection:
+            if stored_before is not None:
+                connection.execute(
+                    f"DELETE FROM {self.TABLE_NAME} WHERE stored_at < ?",
+                    (stored_before,),
+                )
+
+            if max_entries is not None:
+                num_entries: int = connection.execute(
+                    f"SELECT COUNT(*) FROM {self.TABLE_NAME}"
+                ).fetchone()[0]
+                if num_entries > max_entries:
+                    connection.execute(
+                        f"""DELETE FROM {self.TABLE_NAME} WHERE key IN (
+    SELECT key FROM {self.TABLE_NAME} ORDER BY accessed_at ASC LIMIT ?
+)""",
+                        (num_entries - max_entries,),
+                    )
+
+    def _clear(self) -> None:
+        with self._connect() as connection:
+            connection.execute(f"DELETE FROM {self.TABLE_NAME}")
+
+
+class FilesystemPersistentMetricCache(PersistentMetricCache):
+    """PersistentMetricCache, whose entries are stored as files in local directory (one file per entry).
+
+    Time of last use of entry is tracked by access time of its file, and time of storing entry by its modification time.
+    Since eviction scans whole directory, it is amortized: directory is scanned after every "max_entries / 10" entries
+    stored (so that number of entries may exceed "max_entries" by 10% in between), or "ttl_seconds" after last scan.
+
+    Args:
+        base_directory: directory, in which entries are stored (created, if it does not exist).
+        max_entries: maximum number of entries retained (default is unlimited).
+        ttl_seconds: time (in seconds) after being stored, when entries expire (default is never).
+    """
+
+    FILE_EXTENSION: str = ".pickle"
+
+    def __init__(
+        self,
+        base_directory: str,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        super().__init__(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+        self._base_directory = Path(base_directory)
+        self._base_directory.mkdir(parents=True, exist_ok=True)
+
+        self._num_entries_stored_since_eviction = 0
+        self._last_evicted_at: float = time.time()
+
+    @property
+    def base_directory(self) -> str:
+        return str(self._base_directory)
+
+    def _path(self, key: str) -> Path:
+        return self._base_directory / f"{key}{self.FILE_EXTENSION}"
+
+    def _entry_paths(self):
+        return self._base_directory.glob(f"*{self.FILE_EXTENSION}")
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._entry_paths())
+
+    def _should_evict(self, now: float) -> bool:
+        self._num_entries_stored_since_eviction += 1
+        if not (
+            (
+                self._max_entries is not None
+                and self._num_entries_stored_since_eviction
+                >= max(1, self._max_entries // 10)
+            )
+            or (
+                self._ttl_seconds is not None
+                and now - self._last_evicted_at >= self._ttl_seconds
+            )
+        ):
+            return False
+
+        self._num_entries_stored_since_eviction = 0
+        self._last_evicted_at = now
+        return True
+
+    def _get(self, key: str) -> Optional[Tuple[bytes, float]]:
+        path: Path = self._path(key=key)
+        try:
+            payload: bytes = path.read_bytes()
+            stored_at: float = path.stat().st_mtime
+            os.utime(path, times=(time.time(), stored_at))
+        except FileNotFoundError:
+            return None
+
+        return payload, stored_at
+
+    def _set(self, key: str, payload: bytes, stored_at: float) -> None:
+        path: Path = self._path(key=key)
+        # Entry is written to temporary file first, so that concurrent readers never observe partially written entry.
+        temporary_path: Path = path.with_suffix(
+            f".{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        temporary_path.write_bytes(payload)
+        os.utime(temporary_path, times=(stored_at, stored_at))
+        temporary_path.replace(path)
+
+    def _remove(self, key: str) -> None:
+        self._unlink(path=self._path(key=key))
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        # Entry may have been removed concurrently ("missing_ok" argument of "Path.unlink()" requires Python 3.8).
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _evict(
+        self, max_entries: Optional[int], stored_before: Optional[float]
+    ) -> None:
+        entries: list = []
+
+        path: Path
+        for path in self._entry_paths():
+            try:
+                stat_result: os.stat_result = path.stat()
+            except FileNotFoundError:
+                continue
+
+            if stored_before is not None and stat_result.st_mtime < stored_before:
+                self._unlink(path=path)
+            else:
+                entries.append((stat_result.st_atime, path))
+
+        if max_entries is not None and len(entries) > max_entries:
+            entries.sort(key=lambda entry: entry[0], reverse=True)
+            for _, path in entries[max_entries:]:
+                self._unlink(path=path)
+
+    def _clear(self) -> None:
+        path: Path
+        for path in self._entry_paths():
+            self._unlink(path=path)
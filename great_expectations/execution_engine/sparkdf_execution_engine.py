@@ -3,12 +3,16 @@ from __future__ import annotations
 import copy
 import datetime
 import logging
+import threading
+from collections import Counter, defaultdict
+from contextlib import contextmanager
 from functools import reduce
 from typing import (
     Any,
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -17,9 +21,11 @@ from typing import (
     overload,
 )
 
+import pandas as pd
 from dateutil.parser import parse
 
 from great_expectations.compatibility import pyspark
+from great_expectations.compatibility.not_imported import is_version_less_than
 from great_expectations.compatibility.pyspark import (
     functions as F,
 )
@@ -50,6 +56,7 @@ from great_expectations.exceptions import (
 from great_expectations.exceptions import exceptions as gx_exceptions
 from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.execution_engine.execution_engine import (
+    ROW_FILTERING_DOMAIN_KWARGS_KEYS,
     MetricComputationConfiguration,  # noqa: TCH001
     SplitDomainKwargs,  # noqa: TCH001
 )
@@ -72,12 +79,84 @@ from great_expectations.validator.metric_configuration import (
 
 logger = logging.getLogger(__name__)
 
+# Column, holding index of Domain of each row, when metric bundles of several Domains are computed in single Spark job.
+_DOMAIN_INDEX_COLUMN_NAME: str = "__gx_metric_bundle_domain_index"
+
+
+def build_vectorized_spark_udf(
+    value_fn_factory: Callable[[], Callable[[Any], Any]],
+    return_type: pyspark.types.DataType,
+) -> Callable:
+    """Builds Spark UDF, applying function returned by "value_fn_factory" to every value of column.
+
+    Where possible, Arrow-backed "pandas_udf" over iterator of batches is returned, so that values cross JVM/Python
+    boundary in Arrow batches, and "value_fn_factory" is called once per partition (any state it prepares, such as
+    compiled validator, is reused for all rows of partition).  If Arrow (or Spark 3 "pandas_udf" iterator support) is
+    unavailable, row-at-a-time "udf" is returned instead, calling "value_fn_factory" once per deserialized UDF instance.
+
+    Args:
+        value_fn_factory: Zero-argument callable, returning function that maps single column value to result value.
+        return_type: Spark "DataType" of result values.
+
+    Returns:
+        Spark UDF, accepting single column.
+    """
+    if not is_version_less_than(pyspark.__version__, "3.0.0"):
+
+        def _apply_to_batches(batches):
+            value_fn: Callable[[Any], Any] = value_fn_factory()
+            batch: pd.Series
+            for batch in batches:
+                yield pd.Series(
+                    [value_fn(value) for value in batch],
+                    index=batch.index,
+                    dtype=object,
+                )
+
+        # Spark infers "pandas_udf" flavor from type hints, which must be actual types (not postponed strings).
+        _apply_to_batches.__annotations__ = {
+            "batches": Iterator[pd.Series],
+            "return": Iterator[pd.Series],
+        }
+
+        try:
+            return F.pandas_udf(_apply_to_batches, return_type)
+        except ImportError as e:
+            logger.debug(
+                f'Arrow is unavailable ({e}); falling back to row-at-a-time Spark "udf".'
+            )
+
+    state: Dict[str, Callable[[Any], Any]] = {}
+
+    def _apply_to_value(value: Any) -> Any:
+        if "value_fn" not in state:
+            state["value_fn"] = value_fn_factory()
+
+        return state["value_fn"](value)
+
+    return F.udf(_apply_to_value, return_type)
+
+
+def _dateutil_parse_to_timestamp(value: Any) -> Optional[datetime.datetime]:
+    if value is None:
+        return None
+
+    parsed: datetime.datetime = parse(value)
+    # Naive result is local time (as with row-at-a-time "udf"); making it timezone-aware keeps Arrow from reading it as UTC.
+    if parsed.tzinfo is None:
+        parsed = parsed.astimezone()
+
+    return parsed
+
 
 # noinspection SpellCheckingInspection
 def apply_dateutil_parse(column):
     assert len(column.columns) == 1, "Expected DataFrame with 1 column"
     col_name = column.columns[0]
-    _udf = F.udf(parse, pyspark.types.TimestampType())
+    _udf = build_vectorized_spark_udf(
+        value_fn_factory=lambda: _dateutil_parse_to_timestamp,
+        return_type=pyspark.types.TimestampType(),
+    )
     return column.withColumn(col_name, _udf(col_name))
 
 
@@ -91,9 +170,14 @@ class SparkDFExecutionEngine(ExecutionEngine):
 
     Args:
         *args: Positional arguments for configuring SparkDFExecutionEngine
-        persist: If True (default), then creation of the Spark DataFrame is done outside this class
+        persist: If True (default), then creation of the Spark DataFrame is done outside this class; moreover, \
+            DataFrames of Domains, filtered by "row_condition" and shared by several metrics of "ValidationGraph", are \
+            persisted while "ValidationGraph" is resolved, and are unpersisted afterwards
         spark_config: Dictionary of Spark configuration options
         force_reuse_spark_context: If True then utilize existing SparkSession if it exists and is active
+        fuse_metric_bundle_queries: If True, metric bundles of Domains, which differ from one another only in their row \
+            filtering directives (e.g., "row_condition" or "ignore_row_if"), are computed in single Spark job over \
+            DataFrame of their Batch, grouped by Domain (rows retained by several Domains are replicated for each)
         **kwargs: Keyword arguments for configuring SparkDFExecutionEngine
 
     For example:
@@ -190,9 +274,19 @@ class SparkDFExecutionEngine(ExecutionEngine):
         persist=True,
         spark_config=None,
         force_reuse_spark_context=True,
+        fuse_metric_bundle_queries: bool = False,
         **kwargs,
     ) -> None:
         self._persist = persist
+        self._fuse_metric_bundle_queries = fuse_metric_bundle_queries
+
+        # Numbers of metrics of ValidationGraphs being resolved, referencing each (batch_id, row_condition, parser) key,
+        # and persisted DataFrames, filtered by "row_condition", of keys referenced by several metrics.
+        self._domain_records_reference_counts: Counter = Counter()
+        self._persisted_domain_records: Dict[
+            Tuple[Optional[str], str, Optional[str]], pyspark.DataFrame
+        ] = {}
+        self._persisted_domain_records_lock = threading.Lock()
 
         if spark_config is None:
             spark_config = {}
@@ -218,6 +312,8 @@ class SparkDFExecutionEngine(ExecutionEngine):
                 "azure_options": azure_options,
             }
         )
+        if fuse_metric_bundle_queries:
+            self._config["fuse_metric_bundle_queries"] = fuse_metric_bundle_queries
 
         self._data_splitter = SparkDataSplitter()
         self._data_sampler = SparkDataSampler()
@@ -245,8 +341,65 @@ class SparkDFExecutionEngine(ExecutionEngine):
         if self._persist:
             batch_data.dataframe.persist()
 
+        # DataFrames, derived from previously loaded data of this Batch, are stale.
+        with self._persisted_domain_records_lock:
+            key: Tuple[Optional[str], str, Optional[str]]
+            for key in list(self._persisted_domain_records.keys()):
+                if key[0] == batch_id:
+                    self._persisted_domain_records.pop(key).unpersist()
+
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    @contextmanager
+    def retain_shared_domain_records(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> Iterator[None]:
+        """Within this context, DataFrame of Domain, filtered by "row_condition", is persisted on first use, provided
+        that several of given metrics reference it (and "persist" is enabled); it is unpersisted on exit (once no other
+        active context references it).
+        """
+        if not self._persist:
+            yield
+            return
+
+        reference_counts: Counter = Counter()
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metric_configurations:
+            key: Optional[
+                Tuple[Optional[str], str, Optional[str]]
+            ] = self._get_row_condition_domain_key(
+                domain_kwargs=metric_configuration.metric_domain_kwargs
+            )
+            if key is not None:
+                reference_counts[key] += 1
+
+        with self._persisted_domain_records_lock:
+            self._domain_records_reference_counts.update(reference_counts)
+
+        try:
+            yield
+        finally:
+            with self._persisted_domain_records_lock:
+                self._domain_records_reference_counts.subtract(reference_counts)
+                for key in reference_counts:
+                    if self._domain_records_reference_counts[key] <= 0:
+                        del self._domain_records_reference_counts[key]
+                        if key in self._persisted_domain_records:
+                            self._persisted_domain_records.pop(key).unpersist()
+
+    def _get_row_condition_domain_key(
+        self, domain_kwargs: dict
+    ) -> Optional[Tuple[Optional[str], str, Optional[str]]]:
+        row_condition: Optional[str] = domain_kwargs.get("row_condition")
+        if not row_condition:
+            return None
+
+        return (
+            domain_kwargs.get("batch_id") or self.batch_manager.active_batch_data_id,
+            row_condition,
+            domain_kwargs.get("condition_parser"),
+        )
+
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
     ) -> Tuple[Any, BatchMarkers]:  # batch_data
@@ -468,7 +621,7 @@ illegal.  Please check your config."""
             )
 
     @public_api
-    def get_domain_records(  # noqa: C901 - 18
+    def get_domain_records(
         self,
         domain_kwargs: dict,
     ) -> "pyspark.DataFrame":  # noqa F821
@@ -511,31 +664,104 @@ illegal.  Please check your config."""
                 raise ValidationError(f"Unable to find batch with batch_id {batch_id}")
 
         # Filtering by row condition.
-        row_condition = domain_kwargs.get("row_condition", None)
-        if row_condition:
-            condition_parser = domain_kwargs.get("condition_parser", None)
-            if condition_parser == "spark":
-                data = data.filter(row_condition)
-            elif condition_parser == "great_expectations__experimental__":
-                parsed_condition = parse_condition_to_spark(row_condition)
-                data = data.filter(parsed_condition)
-            else:
-                raise GreatExpectationsError(
-                    f"unrecognized condition_parser {str(condition_parser)} for Spark execution engine"
-                )
+        data = self._get_row_condition_domain_records(
+            data=data, domain_kwargs=domain_kwargs
+        )
 
         # Filtering by filter_conditions
+        filter_condition: Optional[pyspark.Column] = self._get_filter_condition(
+            domain_kwargs=domain_kwargs
+        )
+        if filter_condition is not None:
+            data = data.filter(filter_condition)
+
+        if "column" in domain_kwargs:
+            return data
+
+        # Filtering by ignore_row_if directive
+        ignore_row_if_condition: Optional[
+            pyspark.Column
+        ] = self._get_ignore_row_if_condition(domain_kwargs=domain_kwargs)
+        if ignore_row_if_condition is not None:
+            data = data.filter(ignore_row_if_condition)
+
+        return data
+
+    def _get_row_condition_domain_records(
+        self, data: pyspark.DataFrame, domain_kwargs: dict
+    ) -> pyspark.DataFrame:
+        row_condition: Optional[pyspark.Column] = self._get_row_condition(
+            domain_kwargs=domain_kwargs
+        )
+        if row_condition is None:
+            return data
+
+        key: Optional[
+            Tuple[Optional[str], str, Optional[str]]
+        ] = self._get_row_condition_domain_key(domain_kwargs=domain_kwargs)
+        with self._persisted_domain_records_lock:
+            if key in self._persisted_domain_records:
+                return self._persisted_domain_records[key]
+
+            data = data.filter(row_condition)
+            if self._domain_records_reference_counts[key] > 1:
+                # Persisting is lazy: records are cached by first Spark job, which computes them.
+                self._persisted_domain_records[key] = data.persist()
+
+            return data
+
+    def _get_domain_filter_condition(
+        self, domain_kwargs: dict
+    ) -> Optional[pyspark.Column]:
+        """Combines all row filtering directives of Domain kwargs ("row_condition", "filter_conditions", and
+        "ignore_row_if") into single Spark condition, satisfied by exactly those rows, which "get_domain_records()"
+        retains from DataFrame of Batch (None, if all rows are retained).
+        """
+        conditions: List[pyspark.Column] = [
+            condition
+            for condition in (
+                self._get_row_condition(domain_kwargs=domain_kwargs),
+                self._get_filter_condition(domain_kwargs=domain_kwargs),
+                None
+                if "column" in domain_kwargs
+                else self._get_ignore_row_if_condition(domain_kwargs=domain_kwargs),
+            )
+            if condition is not None
+        ]
+        if not conditions:
+            return None
+
+        return reduce(lambda a, b: a & b, conditions)
+
+    @staticmethod
+    def _get_row_condition(domain_kwargs: dict) -> Optional[pyspark.Column]:
+        row_condition = domain_kwargs.get("row_condition", None)
+        if not row_condition:
+            return None
+
+        condition_parser = domain_kwargs.get("condition_parser", None)
+        if condition_parser == "spark":
+            return F.expr(row_condition)
+
+        if condition_parser == "great_expectations__experimental__":
+            return parse_condition_to_spark(row_condition)
+
+        raise GreatExpectationsError(
+            f"unrecognized condition_parser {str(condition_parser)} for Spark execution engine"
+        )
+
+    def _get_filter_condition(self, domain_kwargs: dict) -> Optional[pyspark.Column]:
         filter_conditions: List[RowCondition] = domain_kwargs.get(
             "filter_conditions", []
         )
         if len(filter_conditions) > 0:
             filter_condition = self._combine_row_conditions(filter_conditions)
-            data = data.filter(filter_condition.condition)
+            return F.expr(filter_condition.condition)
 
-        if "column" in domain_kwargs:
-            return data
+        return None
 
-        # Filtering by ignore_row_if directive
+    @staticmethod
+    def _get_ignore_row_if_condition(domain_kwargs: dict) -> Optional[pyspark.Column]:
         if (
             "column_A" in domain_kwargs
             and "column_B" in domain_kwargs
@@ -551,19 +777,19 @@ illegal.  Please check your config."""
                 ignore_condition = (
                     F.col(column_A_name).isNull() & F.col(column_B_name).isNull()
                 )
-                data = data.filter(~ignore_condition)
+                return ~ignore_condition
             elif ignore_row_if == "either_value_is_missing":
                 ignore_condition = (
                     F.col(column_A_name).isNull() | F.col(column_B_name).isNull()
                 )
-                data = data.filter(~ignore_condition)
+                return ~ignore_condition
             else:
                 if ignore_row_if != "neither":
                     raise ValueError(
                         f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
                     )
 
-            return data
+            return None
 
         if "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
             column_list = domain_kwargs["column_list"]
@@ -573,22 +799,20 @@ illegal.  Please check your config."""
                     F.col(column_name).isNull() for column_name in column_list
                 ]
                 ignore_condition = reduce(lambda a, b: a & b, conditions)
-                data = data.filter(~ignore_condition)
+                return ~ignore_condition
             elif ignore_row_if == "any_value_is_missing":
                 conditions = [
                     F.col(column_name).isNull() for column_name in column_list
                 ]
                 ignore_condition = reduce(lambda a, b: a | b, conditions)
-                data = data.filter(~ignore_condition)
+                return ~ignore_condition
             else:
                 if ignore_row_if != "never":
                     raise ValueError(
                         f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
                     )
 
-            return data
-
-        return data
+        return None
 
     @staticmethod
     def _combine_row_conditions(row_conditions: List[RowCondition]) -> RowCondition:
@@ -750,6 +974,11 @@ illegal.  Please check your config."""
             aggregates[domain_id]["column_aggregates"].append(metric_fn)
             aggregates[domain_id]["metric_ids"].append(metric_to_resolve.id)
 
+        if self._fuse_metric_bundle_queries:
+            aggregates = self._resolve_metric_bundles_sharing_base_domain(
+                aggregates=aggregates, resolved_metrics=resolved_metrics
+            )
+
         for aggregate in aggregates.values():
             domain_kwargs: dict = aggregate["domain_kwargs"]
             df: pyspark.DataFrame = self.get_domain_records(domain_kwargs=domain_kwargs)
@@ -780,6 +1009,105 @@ illegal.  Please check your config."""
 
         return resolved_metrics
 
+    def _resolve_metric_bundles_sharing_base_domain(
+        self,
+        aggregates: Dict[Tuple[str, str, str], dict],
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue],
+    ) -> Dict[Tuple[str, str, str], dict]:
+        """Computes metric bundles of Domains, which share same DataFrame of Batch (i.e., differ only in their row
+        filtering directives), in single Spark job per Batch: every row is tagged with indexes of all Domains, which
+        retain it (see "_get_domain_filter_condition()"), and all aggregates are computed for each Domain index.
+
+        Resolved metric values are added to "resolved_metrics"; returned are metric bundles, which remain to be computed
+        one Domain at a time (those not sharing Batch with other Domains, those of Domains having no rows, since value of
+        aggregate over empty DataFrame is not known without computing it, and those, whose fused job failed analysis).
+        """
+        aggregates_by_base_domain_id: Dict[
+            Tuple[str, str, str], List[Tuple[Tuple[str, str, str], dict]]
+        ] = defaultdict(list)
+        base_domain_kwargs_by_base_domain_id: Dict[Tuple[str, str, str], IDDict] = {}
+
+        domain_id: Tuple[str, str, str]
+        aggregate: dict
+        for domain_id, aggregate in aggregates.items():
+            base_domain_kwargs = IDDict(
+                {
+                    key: value
+                    for key, value in aggregate["domain_kwargs"].items()
+                    if key not in ROW_FILTERING_DOMAIN_KWARGS_KEYS
+                }
+            )
+            base_domain_id: Tuple[str, str, str] = base_domain_kwargs.to_id()
+            base_domain_kwargs_by_base_domain_id[base_domain_id] = base_domain_kwargs
+            aggregates_by_base_domain_id[base_domain_id].append((domain_id, aggregate))
+
+        unresolved_aggregates: Dict[Tuple[str, str, str], dict] = {}
+
+        domain_index: int
+        condition: Optional[pyspark.Column]
+        for base_domain_id, domain_aggregates in aggregates_by_base_domain_id.items():
+            if len(domain_aggregates) < 2:
+                unresolved_aggregates.update(dict(domain_aggregates))
+                continue
+
+            df: pyspark.DataFrame = self.get_domain_records(
+                domain_kwargs=base_domain_kwargs_by_base_domain_id[base_domain_id]
+            )
+            domain_indexes: List[pyspark.Column] = []
+            for domain_index, (domain_id, aggregate) in enumerate(domain_aggregates):
+                condition = self._get_domain_filter_condition(
+                    domain_kwargs=aggregate["domain_kwargs"]
+                )
+                domain_indexes.append(
+                    F.lit(domain_index)
+                    if condition is None
+                    else F.when(condition, F.lit(domain_index))
+                )
+
+            df = df.withColumn(
+                _DOMAIN_INDEX_COLUMN_NAME, F.explode(F.array(*domain_indexes))
+            ).filter(F.col(_DOMAIN_INDEX_COLUMN_NAME).isNotNull())
+            column_aggregates: List[pyspark.Column] = [
+                column_aggregate
+                for _, aggregate in domain_aggregates
+                for column_aggregate in aggregate["column_aggregates"]
+            ]
+            try:
+                res: List[pyspark.Row] = (
+                    df.groupBy(_DOMAIN_INDEX_COLUMN_NAME)
+                    .agg(*column_aggregates)
+                    .collect()
+                )
+            except pyspark.AnalysisException as e:
+                # Aggregates may reference columns, derived from records of their Domain, and absent from Batch.
+                logger.debug(
+                    f"SparkDFExecutionEngine could not fuse metric bundles of {len(domain_aggregates)} Domains: {e}"
+                )
+                unresolved_aggregates.update(dict(domain_aggregates))
+                continue
+
+            logger.debug(
+                f"SparkDFExecutionEngine computed {len(column_aggregates)} metrics on {len(domain_aggregates)} Domains of base domain_id {base_domain_id}"
+            )
+
+            row_by_domain_index: Dict[int, pyspark.Row] = {row[0]: row for row in res}
+            # Values of aggregates of each Domain follow Domain index and values of aggregates of preceding Domains.
+            offset: int = 1
+            for domain_index, (domain_id, aggregate) in enumerate(domain_aggregates):
+                if domain_index not in row_by_domain_index:
+                    unresolved_aggregates[domain_id] = aggregate
+                else:
+                    idx: int
+                    metric_id: Tuple[str, str, str]
+                    for idx, metric_id in enumerate(aggregate["metric_ids"]):
+                        resolved_metrics[metric_id] = convert_to_json_serializable(
+                            data=row_by_domain_index[domain_index][offset + idx]
+                        )
+
+                offset += len(aggregate["metric_ids"])
+
+        return unresolved_aggregates
+
     def head(self, n=5):
         """Returns dataframe head. Default is 5"""
         return self.dataframe.limit(n).toPandas()
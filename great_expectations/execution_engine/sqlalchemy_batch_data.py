@@ -111,6 +111,20 @@ class SqlAlchemyBatchData(BatchData):
 
         self._dialect = dialect
 
+        # Temporary tables (as opposed to tables, views, and "temporary" tables that these backends create permanently)
+        # are only visible to the database session that created them.
+        self._is_session_scoped = bool(
+            not table_name
+            and create_temp_table
+            and dialect
+            not in [
+                GXSqlDialect.BIGQUERY,
+                GXSqlDialect.DREMIO,
+                GXSqlDialect.TRINO,
+                GXSqlDialect.AWSATHENA,
+            ]
+        )
+
         if table_name:
             # Suggestion: pull this block out as its own _function
             if use_quoted_name:
@@ -196,6 +210,11 @@ class SqlAlchemyBatchData(BatchData):
     def use_quoted_name(self):
         return self._use_quoted_name
 
+    @property
+    def is_session_scoped(self) -> bool:
+        """Whether or not selectable is a temporary table, accessible only through the connection that created it."""
+        return self._is_session_scoped
+
     def _create_temporary_table(  # noqa: C901 - 18
         self, temp_table_name, query, temp_table_schema_name=None
     ) -> str:
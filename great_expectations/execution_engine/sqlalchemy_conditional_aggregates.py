@@ -0,0 +1,127 @@
+"""
+Rewriting of SQL aggregate expressions so that they only consider rows satisfying a given condition.
+
+Metric bundles computed over differently filtered versions of the same base selectable (e.g., distinct "row_condition"
+or "ignore_row_if" directives) can thereby be folded into a single query: "MAX(a)" over "SELECT * FROM t WHERE cond"
+is equivalent to "MAX(CASE WHEN cond THEN a END)" over "t", because aggregate functions ignore NULL values.
+"""
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Optional, Set
+
+from great_expectations.compatibility.sqlalchemy import (
+    sqlalchemy as sa,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.compatibility import sqlalchemy
+
+logger = logging.getLogger(__name__)
+
+# Aggregate functions, which ignore NULL arguments (i.e., rows excluded by "CASE WHEN" do not affect their values).
+NULL_IGNORING_AGGREGATE_FUNCTION_NAMES: Set[str] = {
+    "avg",
+    "count",
+    "max",
+    "min",
+    "stddev",
+    "stddev_pop",
+    "stddev_samp",
+    "sum",
+    "var_pop",
+    "var_samp",
+    "variance",
+}
+
+
+def restrict_aggregates_to_condition(
+    metric_fn: sqlalchemy.ColumnElement,
+    condition: sqlalchemy.ColumnElement,
+) -> Optional[sqlalchemy.ColumnElement]:
+    """Rewrites every aggregate function "agg(x)" in "metric_fn" as "agg(CASE WHEN condition THEN x END)".
+
+    Args:
+        metric_fn: SQL expression (optionally labeled), whose aggregates are computed over single selectable.
+        condition: SQL boolean expression, referencing columns of the same selectable.
+
+    Returns:
+        Rewritten SQL expression or None, if equivalence cannot be guaranteed (e.g., "metric_fn" contains unknown or
+        windowed aggregate functions, subqueries, or references columns outside of aggregate functions).
+    """
+    restricted_case_expressions: Set[int] = set()
+
+    def _restrict(
+        element: sqlalchemy.ClauseElement,
+    ) -> Optional[sqlalchemy.ClauseElement]:
+        if not (
+            isinstance(element, sa.sql.functions.FunctionElement)
+            and element.name.lower() in NULL_IGNORING_AGGREGATE_FUNCTION_NAMES
+        ):
+            return None
+
+        arguments = []
+        for argument in element.clauses.clauses:
+            if (
+                isinstance(argument, sa.sql.elements.UnaryExpression)
+                and argument.operator is sa.sql.operators.distinct_op
+            ):
+                restricted = sa.case((condition, argument.element))
+                arguments.append(sa.distinct(restricted))
+            elif (
+                isinstance(argument, sa.sql.elements.ColumnClause)
+                and argument.name == "*"
+            ):
+                restricted = sa.case((condition, 1))
+                arguments.append(restricted)
+            else:
+                restricted = sa.case((condition, argument))
+                arguments.append(restricted)
+
+            restricted_case_expressions.add(id(restricted))
+
+        return getattr(sa.func, element.name)(*arguments)
+
+    restricted_metric_fn: sqlalchemy.ColumnElement = (
+        sa.sql.visitors.replacement_traverse(metric_fn, {}, _restrict)
+    )
+
+    if _references_rows_outside_of(
+        element=restricted_metric_fn,
+        restricted_case_expressions=restricted_case_expressions,
+    ):
+        logger.debug(
+            f"Unable to restrict aggregates of {str(metric_fn)} to condition {str(condition)}."
+        )
+        return None
+
+    return restricted_metric_fn
+
+
+def _references_rows_outside_of(
+    element: sqlalchemy.ClauseElement, restricted_case_expressions: Set[int]
+) -> bool:
+    if id(element) in restricted_case_expressions:
+        return False
+
+    if isinstance(
+        element,
+        (
+            sa.sql.elements.ColumnClause,
+            sa.sql.elements.TextClause,
+            sa.sql.elements.Over,
+            sa.sql.elements.FunctionFilter,
+            sa.sql.elements.WithinGroup,
+            sa.sql.selectable.ScalarSelect,
+            sa.sql.selectable.SelectBase,
+        ),
+    ):
+        return True
+
+    child: sqlalchemy.ClauseElement
+    return any(
+        _references_rows_outside_of(
+            element=child, restricted_case_expressions=restricted_case_expressions
+        )
+        for child in element.get_children()
+    )
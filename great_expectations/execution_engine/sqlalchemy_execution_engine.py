@@ -11,6 +11,7 @@ import re
 import string
 import traceback
 import warnings
+from collections import defaultdict
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -38,10 +39,12 @@ from great_expectations.compatibility.sqlalchemy import (
     sqlalchemy_version_check,
 )
 from great_expectations.core._docs_decorators import public_api
+from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.usage_statistics.events import UsageStatsEvents
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.execution_engine.execution_engine import (
+    ROW_FILTERING_DOMAIN_KWARGS_KEYS,
     MetricComputationConfiguration,
     SplitDomainKwargs,
 )
@@ -75,6 +78,9 @@ from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
+from great_expectations.execution_engine.sqlalchemy_conditional_aggregates import (
+    restrict_aggregates_to_condition,
+)
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
 from great_expectations.expectations.row_conditions import (
     RowCondition,
@@ -192,6 +198,10 @@ except ImportError:
 if TYPE_CHECKING:
     from sqlalchemy.engine import Engine as SaEngine  # noqa: TID251
 
+    from great_expectations.execution_engine.persistent_metric_cache import (
+        PersistentMetricCache,
+    )
+
 
 def _get_dialect_type_module(dialect):
     """Given a dialect, returns the dialect type, which is defines the engine/system that is used to communicates
@@ -276,6 +286,14 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             URL can be used to access the data. This will be overridden by all other configuration options if \
             any are provided.
         concurrency (ConcurrencyConfig): Concurrency config used to configure the sqlalchemy engine.
+        fuse_metric_bundle_queries (bool): If True, metric bundles of Domains, which differ from one another only in \
+            their row filtering directives (e.g., "row_condition" or "ignore_row_if"), are computed in single scan \
+            of their common base selectable, using conditional aggregates (e.g., "MAX(CASE WHEN ... THEN x END)").
+        persistent_metric_cache (PersistentMetricCache or dict): Cache of resolved metrics, which outlives \
+            ExecutionEngine (see "ExecutionEngine"); since fingerprints of database tables are not available, it only \
+            applies to Batches, whose BatchMarkers carry fingerprint.
+        metric_cache_max_bytes (int): Budget (in bytes) for estimated size of local in-memory metric cache (see \
+            "ExecutionEngine").
 
     For example:
     ```python
@@ -295,15 +313,31 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         batch_data_dict: Optional[dict] = None,
         create_temp_table: bool = True,
         concurrency: Optional[ConcurrencyConfig] = None,
+        fuse_metric_bundle_queries: bool = False,
+        persistent_metric_cache: Optional[Union[PersistentMetricCache, dict]] = None,
+        metric_cache_max_bytes: Optional[int] = None,
         **kwargs,  # These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
     ) -> None:
-        super().__init__(name=name, batch_data_dict=batch_data_dict)
+        if concurrency is None:
+            if data_context is None or data_context.concurrency is None:
+                concurrency = ConcurrencyConfig()
+            else:
+                concurrency = data_context.concurrency
+
+        super().__init__(
+            name=name,
+            batch_data_dict=batch_data_dict,
+            concurrency=concurrency,
+            persistent_metric_cache=persistent_metric_cache,
+            metric_cache_max_bytes=metric_cache_max_bytes,
+        )
         self._name = name
 
         self._credentials = credentials
         self._connection_string = connection_string
         self._url = url
         self._create_temp_table = create_temp_table
+        self._fuse_metric_bundle_queries = fuse_metric_bundle_queries
         os.environ["SF_PARTNER"] = "great_expectations_oss"
 
         if engine is not None:
@@ -314,12 +348,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 )
             self.engine = engine
         else:
-            if data_context is None or data_context.concurrency is None:
-                concurrency = ConcurrencyConfig()
-            else:
-                concurrency = data_context.concurrency
-
-            concurrency.add_sqlalchemy_create_engine_parameters(kwargs)  # type: ignore[union-attr]
+            concurrency.add_sqlalchemy_create_engine_parameters(kwargs)
 
             if credentials is not None:
                 self.engine = self._build_engine(credentials=credentials, **kwargs)
@@ -451,6 +480,11 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "fuse_metric_bundle_queries": fuse_metric_bundle_queries,
+            "metric_cache_max_bytes": metric_cache_max_bytes,
+            "persistent_metric_cache": persistent_metric_cache
+            if isinstance(persistent_metric_cache, dict)
+            else None,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -485,6 +519,28 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         """
         return self.engine.dialect.name.lower()
 
+    @property
+    def max_metric_resolution_concurrency(self) -> int:
+        """Metric functions run their queries on "self.engine", which multiple threads may only share as pooled "Engine"
+        (every query checking out its own connection), but neither as single "Connection" nor if some loaded Batch is
+        temporary table, visible only to the database session that created it.
+        """
+        if not (
+            self._engine_backup is None
+            and sqlalchemy.Engine
+            and isinstance(self.engine, sqlalchemy.Engine)
+        ):
+            return 1
+
+        batch_data: Any
+        if any(
+            isinstance(batch_data, SqlAlchemyBatchData) and batch_data.is_session_scoped
+            for batch_data in self.batch_manager.batch_data_cache.values()
+        ):
+            return 1
+
+        return super().max_metric_resolution_concurrency
+
     def _build_engine(self, credentials: dict, **kwargs) -> sa.engine.Engine:
         """
         Using a set of given credentials, constructs an Execution Engine , connecting to a database using a URL or a
@@ -567,8 +623,27 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             create_engine_kwargs,
         )
 
+    def _get_domain_batch_data(self, domain_kwargs: dict) -> SqlAlchemyBatchData:
+        """Returns "SqlAlchemyBatchData" object referenced by "batch_id" of given Domain kwargs (or active Batch)."""
+        batch_id: Optional[str] = domain_kwargs.get("batch_id")
+        if batch_id is None:
+            # We allow no batch id specified if there is only one batch
+            if self.batch_manager.active_batch_data:
+                return cast(SqlAlchemyBatchData, self.batch_manager.active_batch_data)
+
+            raise GreatExpectationsError(
+                "No batch is specified, but could not identify a loaded batch."
+            )
+
+        if batch_id in self.batch_manager.batch_data_cache:
+            return cast(
+                SqlAlchemyBatchData, self.batch_manager.batch_data_cache[batch_id]
+            )
+
+        raise GreatExpectationsError(f"Unable to find batch with batch_id {batch_id}")
+
     @public_api
-    def get_domain_records(  # noqa: C901 - 24
+    def get_domain_records(
         self,
         domain_kwargs: dict,
     ) -> sqlalchemy.Selectable:
@@ -580,28 +655,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         Returns:
             An SqlAlchemy table/column(s) (the selectable object for obtaining data on which to compute returned in the format of an SqlAlchemy table/column(s) object)
         """
-        data_object: SqlAlchemyBatchData
-
-        batch_id: Optional[str] = domain_kwargs.get("batch_id")
-        if batch_id is None:
-            # We allow no batch id specified if there is only one batch
-            if self.batch_manager.active_batch_data:
-                data_object = cast(
-                    SqlAlchemyBatchData, self.batch_manager.active_batch_data
-                )
-            else:
-                raise GreatExpectationsError(
-                    "No batch is specified, but could not identify a loaded batch."
-                )
-        else:
-            if batch_id in self.batch_manager.batch_data_cache:
-                data_object = cast(
-                    SqlAlchemyBatchData, self.batch_manager.batch_data_cache[batch_id]
-                )
-            else:
-                raise GreatExpectationsError(
-                    f"Unable to find batch with batch_id {batch_id}"
-                )
+        data_object: SqlAlchemyBatchData = self._get_domain_batch_data(
+            domain_kwargs=domain_kwargs
+        )
 
         selectable: sqlalchemy.Selectable
         if "table" in domain_kwargs and domain_kwargs["table"] is not None:
@@ -632,26 +688,82 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             selectable = selectable.columns().subquery()
 
         # Filtering by row condition.
+        row_condition: Optional[sqlalchemy.ColumnElement] = self._get_row_condition(
+            domain_kwargs=domain_kwargs
+        )
+        if row_condition is not None:
+            selectable = (
+                sa.select(sa.text("*")).select_from(selectable).where(row_condition)
+            )
+
+        # Filtering by filter_conditions
+        filter_condition: Optional[
+            sqlalchemy.ColumnElement
+        ] = self._get_filter_condition(domain_kwargs=domain_kwargs)
+        if filter_condition is not None:
+            selectable = (
+                sa.select(sa.text("*")).select_from(selectable).where(filter_condition)
+            )
+
+        if "column" in domain_kwargs:
+            return selectable
+
+        # Filtering by ignore_row_if directive
+        ignore_row_if_condition: Optional[
+            sqlalchemy.ColumnElement
+        ] = self._get_ignore_row_if_condition(domain_kwargs=domain_kwargs)
+        if ignore_row_if_condition is not None:
+            selectable = get_sqlalchemy_selectable(
+                sa.select(sa.text("*"))
+                .select_from(get_sqlalchemy_selectable(selectable))
+                .where(ignore_row_if_condition)
+            )
+
+        return selectable
+
+    def _get_domain_filter_condition(
+        self, domain_kwargs: dict
+    ) -> Optional[sqlalchemy.ColumnElement]:
+        """Combines all row filtering directives of Domain kwargs ("row_condition", "filter_conditions", and
+        "ignore_row_if") into single SQL condition, satisfied by exactly those rows, which "get_domain_records()"
+        retains from base selectable of Domain (None, if all rows are retained).
+        """
+        conditions: List[sqlalchemy.ColumnElement] = [
+            condition
+            for condition in (
+                self._get_row_condition(domain_kwargs=domain_kwargs),
+                self._get_filter_condition(domain_kwargs=domain_kwargs),
+                None
+                if "column" in domain_kwargs
+                else self._get_ignore_row_if_condition(domain_kwargs=domain_kwargs),
+            )
+            if condition is not None
+        ]
+        if not conditions:
+            return None
+
+        return sa.and_(*conditions)
+
+    @staticmethod
+    def _get_row_condition(domain_kwargs: dict) -> Optional[sqlalchemy.ColumnElement]:
         if (
-            "row_condition" in domain_kwargs
-            and domain_kwargs["row_condition"] is not None
+            "row_condition" not in domain_kwargs
+            or domain_kwargs["row_condition"] is None
         ):
-            condition_parser = domain_kwargs["condition_parser"]
-            if condition_parser == "great_expectations__experimental__":
-                parsed_condition = parse_condition_to_sqlalchemy(
-                    domain_kwargs["row_condition"]
-                )
-                selectable = (
-                    sa.select(sa.text("*"))
-                    .select_from(selectable)
-                    .where(parsed_condition)
-                )
-            else:
-                raise GreatExpectationsError(
-                    "SqlAlchemyExecutionEngine only supports the great_expectations condition_parser."
-                )
+            return None
 
-        # Filtering by filter_conditions
+        condition_parser = domain_kwargs["condition_parser"]
+        if condition_parser == "great_expectations__experimental__":
+            return parse_condition_to_sqlalchemy(domain_kwargs["row_condition"])
+
+        raise GreatExpectationsError(
+            "SqlAlchemyExecutionEngine only supports the great_expectations condition_parser."
+        )
+
+    @staticmethod
+    def _get_filter_condition(
+        domain_kwargs: dict,
+    ) -> Optional[sqlalchemy.ColumnElement]:
         filter_conditions: List[RowCondition] = domain_kwargs.get(
             "filter_conditions", []
         )
@@ -662,20 +774,17 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 filter_condition.condition_type == RowConditionParserType.GE
             ), "filter_condition must be of type GX for SqlAlchemyExecutionEngine"
 
-            selectable = (
-                sa.select(sa.text("*"))
-                .select_from(selectable)
-                .where(parse_condition_to_sqlalchemy(filter_condition.condition))
-            )
+            return parse_condition_to_sqlalchemy(filter_condition.condition)
         elif len(filter_conditions) > 1:
             raise GreatExpectationsError(
                 "SqlAlchemyExecutionEngine currently only supports a single filter condition."
             )
 
-        if "column" in domain_kwargs:
-            return selectable
+        return None
 
-        # Filtering by ignore_row_if directive
+    def _get_ignore_row_if_condition(
+        self, domain_kwargs: dict
+    ) -> Optional[sqlalchemy.ColumnElement]:
         if (
             "column_A" in domain_kwargs
             and "column_B" in domain_kwargs
@@ -701,29 +810,17 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
             ignore_row_if = domain_kwargs["ignore_row_if"]
             if ignore_row_if == "both_values_are_missing":
-                selectable = get_sqlalchemy_selectable(
-                    sa.select(sa.text("*"))
-                    .select_from(get_sqlalchemy_selectable(selectable))
-                    .where(
-                        sa.not_(
-                            sa.and_(
-                                sa.column(column_A_name) == None,  # noqa: E711
-                                sa.column(column_B_name) == None,  # noqa: E711
-                            )
-                        )
+                return sa.not_(
+                    sa.and_(
+                        sa.column(column_A_name) == None,  # noqa: E711
+                        sa.column(column_B_name) == None,  # noqa: E711
                     )
                 )
             elif ignore_row_if == "either_value_is_missing":
-                selectable = get_sqlalchemy_selectable(
-                    sa.select(sa.text("*"))
-                    .select_from(get_sqlalchemy_selectable(selectable))
-                    .where(
-                        sa.not_(
-                            sa.or_(
-                                sa.column(column_A_name) == None,  # noqa: E711
-                                sa.column(column_B_name) == None,  # noqa: E711
-                            )
-                        )
+                return sa.not_(
+                    sa.or_(
+                        sa.column(column_A_name) == None,  # noqa: E711
+                        sa.column(column_B_name) == None,  # noqa: E711
                     )
                 )
             else:
@@ -732,7 +829,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                         f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
                     )
 
-            return selectable
+            return None
 
         if "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
             if cast(
@@ -748,32 +845,20 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
             ignore_row_if = domain_kwargs["ignore_row_if"]
             if ignore_row_if == "all_values_are_missing":
-                selectable = get_sqlalchemy_selectable(
-                    sa.select(sa.text("*"))
-                    .select_from(get_sqlalchemy_selectable(selectable))
-                    .where(
-                        sa.not_(
-                            sa.and_(
-                                *(
-                                    sa.column(column_name) == None  # noqa: E711
-                                    for column_name in column_list
-                                )
-                            )
+                return sa.not_(
+                    sa.and_(
+                        *(
+                            sa.column(column_name) == None  # noqa: E711
+                            for column_name in column_list
                         )
                     )
                 )
             elif ignore_row_if == "any_value_is_missing":
-                selectable = get_sqlalchemy_selectable(
-                    sa.select(sa.text("*"))
-                    .select_from(get_sqlalchemy_selectable(selectable))
-                    .where(
-                        sa.not_(
-                            sa.or_(
-                                *(
-                                    sa.column(column_name) == None  # noqa: E711
-                                    for column_name in column_list
-                                )
-                            )
+                return sa.not_(
+                    sa.or_(
+                        *(
+                            sa.column(column_name) == None  # noqa: E711
+                            for column_name in column_list
                         )
                     )
                 )
@@ -783,9 +868,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                         f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
                     )
 
-            return selectable
-
-        return selectable
+        return None
 
     @public_api
     def get_compute_domain(
@@ -948,7 +1031,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return SplitDomainKwargs(compute_domain_kwargs, accessor_domain_kwargs)
 
-    def resolve_metric_bundle(
+    def resolve_metric_bundle(  # noqa: C901 - 16
         self,
         metric_fn_bundle: Iterable[MetricComputationConfiguration],
     ) -> Dict[Tuple[str, str, str], MetricValue]:
@@ -1011,6 +1094,11 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
             queries[domain_id]["metric_ids"].append(metric_to_resolve.id)
 
+        if self._fuse_metric_bundle_queries:
+            queries = self._fuse_metric_bundle_queries_sharing_base_domain(
+                queries=queries
+            )
+
         for query in queries.values():
             domain_kwargs: dict = query["domain_kwargs"]
             selectable: sqlalchemy.Selectable = self.get_domain_records(
@@ -1019,49 +1107,70 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
             assert len(query["select"]) == len(query["metric_ids"])
 
-            try:
-                """
-                If a custom query is passed, selectable will be TextClause and not formatted
-                as a subquery wrapped in "(subquery) alias". TextClause must first be converted
-                to TextualSelect using sa.columns() before it can be converted to type Subquery
-                """
-                if sqlalchemy.TextClause and isinstance(
-                    selectable, sqlalchemy.TextClause
-                ):
-                    sa_query_object = sa.select(*query["select"]).select_from(
-                        selectable.columns().subquery()
-                    )
-                elif (
-                    sqlalchemy.Select and isinstance(selectable, sqlalchemy.Select)
-                ) or (
-                    sqlalchemy.TextualSelect
-                    and isinstance(selectable, sqlalchemy.TextualSelect)
-                ):
-                    sa_query_object = sa.select(*query["select"]).select_from(
-                        selectable.subquery()
-                    )
-                else:
-                    sa_query_object = sa.select(*query["select"]).select_from(
-                        selectable
-                    )
-
-                logger.debug(f"Attempting query {str(sa_query_object)}")
+            """
+            If a custom query is passed, selectable will be TextClause and not formatted
+            as a subquery wrapped in "(subquery) alias". TextClause must first be converted
+            to TextualSelect using sa.columns() before it can be converted to type Subquery
+            """
+            if sqlalchemy.TextClause and isinstance(selectable, sqlalchemy.TextClause):
+                query["sa_query_object"] = sa.select(*query["select"]).select_from(
+                    selectable.columns().subquery()
+                )
+            elif (sqlalchemy.Select and isinstance(selectable, sqlalchemy.Select)) or (
+                sqlalchemy.TextualSelect
+                and isinstance(selectable, sqlalchemy.TextualSelect)
+            ):
+                query["sa_query_object"] = sa.select(*query["select"]).select_from(
+                    selectable.subquery()
+                )
+            else:
+                query["sa_query_object"] = sa.select(*query["select"]).select_from(
+                    selectable
+                )
 
-                if sqlalchemy.Engine and isinstance(self.engine, sqlalchemy.Engine):
-                    self.engine = self.engine.connect()
+        if self._can_execute_metric_bundle_queries_concurrently(
+            queries=list(queries.values())
+        ):
+            # Every query checks out its own connection from the pool of the underlying Engine (bounded by the number
+            # of worker threads, which "AsyncExecutor" caps at "ConcurrencyConfig.max_database_query_concurrency").
+            engine: sqlalchemy.Engine = (
+                self.engine
+                if isinstance(self.engine, sqlalchemy.Engine)
+                else self.engine.engine
+            )
+            with AsyncExecutor(
+                concurrency_config=self.concurrency, max_workers=len(queries)
+            ) as async_executor:
+                async_results: Dict[Tuple[str, str, str], AsyncResult] = {
+                    domain_id: async_executor.submit(
+                        self._execute_metric_bundle_query,
+                        sa_query_object=query["sa_query_object"],
+                        domain_kwargs=query["domain_kwargs"],
+                        connectable=engine,
+                    )
+                    for domain_id, query in queries.items()
+                }
 
-                res = self.engine.execute(sa_query_object).fetchall()
+            for domain_id, query in queries.items():
+                query["result"] = async_results[domain_id].result()
+        elif queries:
+            # Metrics, resolved concurrently, keep pooled "Engine" (each query checks out its own connection).
+            if (
+                sqlalchemy.Engine
+                and isinstance(self.engine, sqlalchemy.Engine)
+                and self.max_metric_resolution_concurrency == 1
+            ):
+                self.engine = self.engine.connect()
 
-                logger.debug(
-                    f"""SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id \
-{IDDict(domain_kwargs).to_id()}"""
+            for query in queries.values():
+                query["result"] = self._execute_metric_bundle_query(
+                    sa_query_object=query["sa_query_object"],
+                    domain_kwargs=query["domain_kwargs"],
+                    connectable=self.engine,
                 )
-            except sqlalchemy.OperationalError as oe:
-                exception_message: str = "An SQL execution Exception occurred.  "
-                exception_traceback: str = traceback.format_exc()
-                exception_message += f'{type(oe).__name__}: "{str(oe)}".  Traceback: "{exception_traceback}".'
-                logger.error(exception_message)
-                raise ExecutionEngineError(message=exception_message)
+
+        for query in queries.values():
+            res = query["result"]
 
             assert (
                 len(res) == 1
@@ -1081,6 +1190,135 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return resolved_metrics
 
+    def _fuse_metric_bundle_queries_sharing_base_domain(
+        self, queries: Dict[Tuple[str, str, str], dict]
+    ) -> Dict[Tuple[str, str, str], dict]:
+        """Folds metric bundle queries of Domains, which share same base selectable (i.e., differ only in their row
+        filtering directives), into single query per base selectable, whose aggregates are restricted to rows of their
+        original Domains.  Metrics, for which such restriction is not possible (see "restrict_aggregates_to_condition()"
+        for details), remain in query of their original Domain.
+        """
+        queries_by_base_domain_id: Dict[
+            Tuple[str, str, str], List[Tuple[Tuple[str, str, str], dict]]
+        ] = defaultdict(list)
+
+        base_domain_kwargs: IDDict
+        base_domain_kwargs_by_base_domain_id: Dict[Tuple[str, str, str], IDDict] = {}
+
+        domain_id: Tuple[str, str, str]
+        query: dict
+        for domain_id, query in queries.items():
+            base_domain_kwargs = IDDict(
+                {
+                    key: value
+                    for key, value in query["domain_kwargs"].items()
+                    if key not in ROW_FILTERING_DOMAIN_KWARGS_KEYS
+                }
+            )
+            base_domain_id: Tuple[str, str, str] = base_domain_kwargs.to_id()
+            base_domain_kwargs_by_base_domain_id[base_domain_id] = base_domain_kwargs
+            queries_by_base_domain_id[base_domain_id].append((domain_id, query))
+
+        fused_queries: Dict[Tuple[str, str, str], dict] = {}
+
+        fused_query: dict
+        condition: Optional[sqlalchemy.ColumnElement]
+        select: sqlalchemy.ColumnElement
+        restricted_select: Optional[sqlalchemy.ColumnElement]
+        metric_id: Tuple[str, str, str]
+        for base_domain_id, domain_queries in queries_by_base_domain_id.items():
+            if len(domain_queries) < 2:
+                fused_queries.update(dict(domain_queries))
+                continue
+
+            fused_query = {
+                "select": [],
+                "metric_ids": [],
+                "domain_kwargs": base_domain_kwargs_by_base_domain_id[base_domain_id],
+            }
+            for domain_id, query in domain_queries:
+                condition = self._get_domain_filter_condition(
+                    domain_kwargs=query["domain_kwargs"]
+                )
+                unfused_query: dict = {
+                    "select": [],
+                    "metric_ids": [],
+                    "domain_kwargs": query["domain_kwargs"],
+                }
+                for select, metric_id in zip(query["select"], query["metric_ids"]):
+                    restricted_select = (
+                        select
+                        if condition is None
+                        else restrict_aggregates_to_condition(
+                            metric_fn=select, condition=condition
+                        )
+                    )
+                    if restricted_select is None:
+                        unfused_query["select"].append(select)
+                        unfused_query["metric_ids"].append(metric_id)
+                    else:
+                        fused_query["select"].append(restricted_select)
+                        fused_query["metric_ids"].append(metric_id)
+
+                if unfused_query["select"]:
+                    fused_queries[domain_id] = unfused_query
+
+            if fused_query["select"]:
+                fused_queries[base_domain_id] = fused_query
+
+        return fused_queries
+
+    def _can_execute_metric_bundle_queries_concurrently(
+        self, queries: List[dict]
+    ) -> bool:
+        """Metric bundle queries for distinct Domains are executed concurrently only if concurrency is enabled, and if
+        none of them depends on state, confined to a single connection (such as session-scoped temporary tables).
+        """
+        if not self.concurrency.enabled or len(queries) < 2:
+            return False
+
+        # These backends pin all work to one connection (see "_engine_backup" in constructor).
+        if self._engine_backup is not None:
+            return False
+
+        query: dict
+        return not any(
+            self._get_domain_batch_data(
+                domain_kwargs=query["domain_kwargs"]
+            ).is_session_scoped
+            for query in queries
+        )
+
+    @staticmethod
+    def _execute_metric_bundle_query(
+        sa_query_object: sqlalchemy.Select,
+        domain_kwargs: dict,
+        connectable: Union[sqlalchemy.Engine, sqlalchemy.Connection],
+    ) -> List[sqlalchemy.Row]:
+        """Executes single metric bundle query, using own pooled connection if "connectable" is "Engine" object."""
+        res: List[sqlalchemy.Row]
+        try:
+            logger.debug(f"Attempting query {str(sa_query_object)}")
+
+            if sqlalchemy.Engine and isinstance(connectable, sqlalchemy.Engine):
+                with connectable.connect() as connection:
+                    res = connection.execute(sa_query_object).fetchall()
+            else:
+                res = connectable.execute(sa_query_object).fetchall()
+
+            logger.debug(
+                f"""SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id \
+{IDDict(domain_kwargs).to_id()}"""
+            )
+        except sqlalchemy.OperationalError as oe:
+            exception_message: str = "An SQL execution Exception occurred.  "
+            exception_traceback: str = traceback.format_exc()
+            exception_message += f'{type(oe).__name__}: "{str(oe)}".  Traceback: "{exception_traceback}".'
+            logger.error(exception_message)
+            raise ExecutionEngineError(message=exception_message)
+
+        return res
+
     def close(self) -> None:
         """
         Note: Will 20210729
@@ -41,6 +41,9 @@ class ExpectColumnMostCommonValueToBeInSet(ColumnAggregateExpectation):
         ties_okay (boolean or None): \
             If True, then the expectation will still succeed if values outside the designated set are as common \
             (but not more common) than designated values
+        allow_relative_error (float or None): \
+            If a float between 0 and 1, the most common values may be estimated (from a mergeable sketch, or with an \
+            approximate function native to the backend) with this relative error, rather than computed exactly.
 
     Other Parameters:
         result_format (str or None): \
@@ -82,12 +85,14 @@ class ExpectColumnMostCommonValueToBeInSet(ColumnAggregateExpectation):
     success_keys = (
         "value_set",
         "ties_okay",
+        "allow_relative_error",
     )
 
     # Default values
     default_kwarg_values = {
         "value_set": None,
         "ties_okay": None,
+        "allow_relative_error": False,
         "result_format": "BASIC",
         "include_config": True,
         "catch_exceptions": False,
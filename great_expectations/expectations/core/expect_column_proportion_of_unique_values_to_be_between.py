@@ -62,6 +62,9 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnAggregateExpectation
             If True, the minimum proportion of unique values must be strictly larger than min_value, default=False
         strict_max (boolean): \
             If True, the maximum proportion of unique values must be strictly smaller than max_value, default=False
+        allow_relative_error (float or None): \
+            If a float between 0 and 1, the number of unique values may be estimated (from a mergeable sketch, or with an \
+            approximate function native to the backend) with this relative error, rather than computed exactly.
 
     Other Parameters:
         result_format (str or None): \
@@ -109,6 +112,7 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnAggregateExpectation
         "strict_min",
         "max_value",
         "strict_max",
+        "allow_relative_error",
         "auto",
         "profiler_config",
     )
@@ -187,6 +191,7 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnAggregateExpectation
         "max_value": None,
         "strict_min": None,
         "strict_max": None,
+        "allow_relative_error": False,
         "result_format": "BASIC",
         "include_config": True,
         "catch_exceptions": False,
@@ -49,6 +49,7 @@ from great_expectations.rule_based_profiler.parameter_container import (
     VARIABLES_KEY,
 )
 from great_expectations.util import isclose
+from great_expectations.validator.metric_configuration import MetricConfiguration
 from great_expectations.validator.validator import (
     ValidationDependencies,  # noqa: TCH001
 )
@@ -704,11 +705,22 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnAggregateExpectation):
             )
         )
         # column.quantile_values expects a "quantiles" key
-        validation_dependencies.get_metric_configuration(
-            metric_name="column.quantile_values"
-        ).metric_value_kwargs["quantiles"] = configuration.kwargs["quantile_ranges"][
-            "quantiles"
-        ]
+        metric_configuration: MetricConfiguration = (
+            validation_dependencies.get_metric_configuration(
+                metric_name="column.quantile_values"
+            )
+        )
+        validation_dependencies.set_metric_configuration(
+            metric_name="column.quantile_values",
+            metric_configuration=MetricConfiguration(
+                metric_name=metric_configuration.metric_name,
+                metric_domain_kwargs=metric_configuration.metric_domain_kwargs,
+                metric_value_kwargs={
+                    **metric_configuration.metric_value_kwargs,
+                    "quantiles": configuration.kwargs["quantile_ranges"]["quantiles"],
+                },
+            ),
+        )
         return validation_dependencies
 
     def _validate(
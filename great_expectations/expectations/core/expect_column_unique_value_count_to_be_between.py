@@ -10,6 +10,7 @@ from great_expectations.expectations.expectation import (
     ColumnAggregateExpectation,
     render_evaluation_parameter_string,
 )
+from great_expectations.expectations.metrics.util import get_allowed_relative_error
 from great_expectations.render import (
     LegacyDescriptiveRendererType,
     LegacyRendererType,
@@ -38,6 +39,8 @@ from great_expectations.rule_based_profiler.parameter_container import (
     PARAMETER_KEY,
     VARIABLES_KEY,
 )
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import ValidationDependencies
 
 if TYPE_CHECKING:
     from great_expectations.render.renderer_configuration import AddParamArgs
@@ -56,6 +59,9 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnAggregateExpectation):
             The minimum number of unique values allowed.
         max_value (int or None): \
             The maximum number of unique values allowed.
+        allow_relative_error (float or None): \
+            If a float between 0 and 1, the number of unique values may be estimated (from a mergeable sketch, or with an \
+            approximate function native to the backend) with this relative error, rather than computed exactly.
 
     Other Parameters:
         result_format (str or None): \
@@ -101,6 +107,7 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnAggregateExpectation):
     success_keys = (
         "min_value",
         "max_value",
+        "allow_relative_error",
         "auto",
         "profiler_config",
     )
@@ -179,6 +186,7 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnAggregateExpectation):
         "condition_parser": None,
         "min_value": None,
         "max_value": None,
+        "allow_relative_error": False,
         "result_format": "BASIC",
         "include_config": True,
         "catch_exceptions": False,
@@ -373,6 +381,42 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnAggregateExpectation):
         else:
             return [template_string_object, observed_value]
 
+    def get_validation_dependencies(
+        self,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> ValidationDependencies:
+        validation_dependencies: ValidationDependencies = (
+            super().get_validation_dependencies(
+                configuration, execution_engine, runtime_configuration
+            )
+        )
+        # Relative error, if allowed, makes number of unique values approximated (in place of its exact computation).
+        allowed_relative_error: Optional[float] = get_allowed_relative_error(
+            self.get_success_kwargs(configuration=configuration).get(
+                "allow_relative_error"
+            )
+        )
+        if allowed_relative_error is not None:
+            metric_configuration: MetricConfiguration = (
+                validation_dependencies.get_metric_configuration(
+                    metric_name="column.distinct_values.count"
+                )
+            )
+            validation_dependencies.set_metric_configuration(
+                metric_name="column.distinct_values.count",
+                metric_configuration=MetricConfiguration(
+                    metric_name="column.distinct_values.count.approximate",
+                    metric_domain_kwargs=metric_configuration.metric_domain_kwargs,
+                    metric_value_kwargs={
+                        "allow_relative_error": allowed_relative_error
+                    },
+                ),
+            )
+
+        return validation_dependencies
+
     def _validate(
         self,
         configuration: ExpectationConfiguration,
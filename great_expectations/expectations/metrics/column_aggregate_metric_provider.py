@@ -1,6 +1,6 @@
 import logging
-from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Type, Union
+from functools import partial, wraps
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Type, Union
 
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.core import ExpectationConfiguration  # noqa: TCH001
@@ -8,6 +8,9 @@ from great_expectations.core._docs_decorators import public_api
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.metric_function_types import MetricPartialFunctionTypes
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasColumnAggregate,
+)
 from great_expectations.execution_engine.sparkdf_execution_engine import (
     SparkDFExecutionEngine,
 )
@@ -30,6 +33,8 @@ from great_expectations.validator.metric_configuration import MetricConfiguratio
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from great_expectations.compatibility import sqlalchemy
 
 
@@ -46,9 +51,15 @@ def column_aggregate_value(
     A metric function that is decorated as a column_aggregate_partial will be called with a specified Pandas column
     and any value_kwargs associated with the Metric for which the provider function is being declared.
 
+    When resolved by the ExecutionEngine, the metric function is computed in a bundle with the other column aggregates
+    of the same compute Domain, which share records (and null-filtered columns) obtained only once.
+
     Args:
         engine: The `ExecutionEngine` used to to evaluate the condition
-        **kwargs: Arguments passed to specified function
+        **kwargs: Arguments passed to specified function (e.g., "aggregate_state_type", subclass of "AggregateState",
+            which makes aggregate computable over Batch of data read in chunks, or "value_from_metrics_fn", which is
+            called like metric function, but without "column", and returns metric value, derived from resolved metric
+            dependencies, e.g., from sketch, or NotImplemented, if metric function must compute aggregate of column)
 
     Returns:
         An annotated metric_function which will be called with a simplified signature.
@@ -57,21 +68,23 @@ def column_aggregate_value(
     if issubclass(engine, PandasExecutionEngine):
 
         def wrapper(metric_fn: Callable):
-            @metric_value(engine=PandasExecutionEngine)
-            @wraps(metric_fn)
-            def inner_func(
+            def bundled_metric_fn(
                 cls,
                 execution_engine: PandasExecutionEngine,
                 metric_domain_kwargs: dict,
                 metric_value_kwargs: dict,
                 metrics: Dict[str, Any],
                 runtime_configuration: dict,
-            ):
+            ) -> Tuple[PandasColumnAggregate, dict, dict]:
                 filter_column_isnull = kwargs.get(
                     "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
                 )
 
-                df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+                # Records are not obtained here; "resolve_metric_bundle()" obtains them once per compute Domain.
+                (
+                    compute_domain_kwargs,
+                    accessor_domain_kwargs,
+                ) = execution_engine.get_compute_domain_kwargs(
                     domain_kwargs=metric_domain_kwargs, domain_type=domain_type
                 )
 
@@ -84,16 +97,67 @@ def column_aggregate_value(
                     batch_columns_list=metrics["table.columns"],
                 )
 
-                if filter_column_isnull:
-                    df = df[df[column_name].notnull()]
+                value_from_metrics_fn: Optional[Callable] = kwargs.get(
+                    "value_from_metrics_fn"
+                )
+                if value_from_metrics_fn is not None:
+                    value: Any = value_from_metrics_fn(
+                        cls, **metric_value_kwargs, _metrics=metrics
+                    )
+                    if value is not NotImplemented:
+                        metric_aggregate = PandasColumnAggregate(
+                            column_name=column_name,
+                            aggregate_fn=partial(_get_resolved_value, value=value),
+                            requires_records=False,
+                        )
+                        return (
+                            metric_aggregate,
+                            compute_domain_kwargs,
+                            accessor_domain_kwargs,
+                        )
+
+                metric_aggregate = PandasColumnAggregate(
+                    column_name=column_name,
+                    aggregate_fn=partial(
+                        metric_fn, cls, **metric_value_kwargs, _metrics=metrics
+                    ),
+                    filter_column_isnull=filter_column_isnull,
+                    aggregate_state_type=kwargs.get("aggregate_state_type"),
+                )
+                return metric_aggregate, compute_domain_kwargs, accessor_domain_kwargs
 
-                return metric_fn(
+            @metric_value(engine=PandasExecutionEngine)
+            @wraps(metric_fn)
+            def inner_func(
+                cls,
+                execution_engine: PandasExecutionEngine,
+                metric_domain_kwargs: dict,
+                metric_value_kwargs: dict,
+                metrics: Dict[str, Any],
+                runtime_configuration: dict,
+            ):
+                # Computed directly (outside of bundle), aggregate is still defined by "bundled_metric_fn()".
+                metric_aggregate: PandasColumnAggregate
+                compute_domain_kwargs: dict
+                metric_aggregate, compute_domain_kwargs, _ = bundled_metric_fn(
                     cls,
-                    column=df[column_name],
-                    **metric_value_kwargs,
-                    _metrics=metrics,
+                    execution_engine=execution_engine,
+                    metric_domain_kwargs=metric_domain_kwargs,
+                    metric_value_kwargs=metric_value_kwargs,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+                if not metric_aggregate.requires_records:
+                    return metric_aggregate.aggregate_fn(column=None)
+
+                df: pd.DataFrame = execution_engine.get_domain_records(
+                    domain_kwargs=compute_domain_kwargs
+                )
+                return metric_aggregate.aggregate_fn(
+                    column=metric_aggregate.get_column(df=df)
                 )
 
+            inner_func.bundled_metric_fn = bundled_metric_fn  # type: ignore[attr-defined]
             return inner_func
 
         return wrapper
@@ -103,6 +167,11 @@ def column_aggregate_value(
         )
 
 
+def _get_resolved_value(value: Any, column: None = None) -> Any:
+    """Aggregate function of "PandasColumnAggregate", whose value does not require records (see "requires_records")."""
+    return value
+
+
 @public_api
 def column_aggregate_partial(engine: Type[ExecutionEngine], **kwargs):
     """Provides engine-specific support for authoring a metric_fn with a simplified signature.
@@ -1,6 +1,8 @@
 from .column_distinct_values import (
     ColumnDistinctValues,
     ColumnDistinctValuesCount,
+    ColumnDistinctValuesCountApproximate,
+    ColumnDistinctValuesCountSketch,
     ColumnDistinctValuesCountUnderThreshold,
 )
 from .column_histogram import ColumnHistogram
@@ -14,10 +16,10 @@ from .column_parameterized_distribution_ks_test_p_value import (
 )
 from .column_partition import ColumnPartition
 from .column_proportion_of_unique_values import ColumnUniqueProportion
-from .column_quantile_values import ColumnQuantileValues
+from .column_quantile_values import ColumnQuantileValues, ColumnQuantileValuesSketch
 from .column_standard_deviation import ColumnStandardDeviation
 from .column_sum import ColumnSum
-from .column_value_counts import ColumnValueCounts
+from .column_value_counts import ColumnValueCounts, ColumnValueCountsSketch
 from .column_values_between_count import ColumnValuesBetweenCount
 from .column_values_length_max import ColumnValuesLengthMax
 from .column_values_length_min import ColumnValuesLengthMin
@@ -9,18 +9,24 @@ from great_expectations.compatibility.pyspark import (
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.core import ExpectationConfiguration  # noqa: TCH001
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.sketches import HyperLogLogSketch
 from great_expectations.execution_engine import (
     ExecutionEngine,
     PandasExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.pandas_aggregate_states import (
+    SketchAggregateState,
+)
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
     column_aggregate_partial,
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.util import get_allowed_relative_error
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
@@ -132,6 +138,126 @@ class ColumnDistinctValuesCount(ColumnAggregateMetricProvider):
         return F.countDistinct(column)
 
 
+class ColumnDistinctValuesCountSketch(ColumnAggregateMetricProvider):
+    """HyperLogLog sketch of column, from which "column.distinct_values.count.approximate" is estimated."""
+
+    metric_name = "column.distinct_values.count.sketch"
+    value_keys = ("allow_relative_error",)
+
+    @column_aggregate_value(
+        engine=PandasExecutionEngine,
+        filter_column_isnull=True,
+        aggregate_state_type=SketchAggregateState,
+    )
+    def _pandas(
+        cls, column: pd.Series, allow_relative_error: float, **kwargs
+    ) -> HyperLogLogSketch:
+        sketch = HyperLogLogSketch.from_relative_error(
+            relative_error=allow_relative_error
+        )
+        sketch.update(values=column)
+        return sketch
+
+
+class ColumnDistinctValuesCountApproximate(ColumnAggregateMetricProvider):
+    """Number of distinct values, estimated with relative error, which "allow_relative_error" allows (if any).
+
+    Unless "allow_relative_error" is float between 0 and 1, number of distinct values is computed exactly.  Otherwise,
+    Pandas estimates it from mergeable HyperLogLog sketch, Spark uses "approx_count_distinct()", and SQL dialects with
+    native approximate distinct count (BigQuery, Snowflake, Trino, and Athena) use it.
+    """
+
+    metric_name = "column.distinct_values.count.approximate"
+    value_keys = ("allow_relative_error",)
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(
+        cls,
+        metric_value_kwargs: Dict[str, Any],
+        metrics: Dict[str, Any],
+        **kwargs,
+    ) -> int:
+        if (
+            get_allowed_relative_error(metric_value_kwargs.get("allow_relative_error"))
+            is None
+        ):
+            return metrics["column.distinct_values.count"]
+
+        sketch: HyperLogLogSketch = metrics["column.distinct_values.count.sketch"]
+        return sketch.estimate()
+
+    @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(
+        cls,
+        column: sqlalchemy.ColumnClause,
+        allow_relative_error: Any = None,
+        _dialect=None,
+        **kwargs,
+    ) -> sqlalchemy.Selectable:
+        if get_allowed_relative_error(allow_relative_error) is not None:
+            dialect_name: str = _dialect.name.lower()
+            if dialect_name in (GXSqlDialect.BIGQUERY, GXSqlDialect.SNOWFLAKE):
+                return sa.func.approx_count_distinct(column)
+
+            if dialect_name in (GXSqlDialect.TRINO, GXSqlDialect.AWSATHENA):
+                return sa.func.approx_distinct(column)
+
+        return sa.func.count(sa.distinct(column))
+
+    @column_aggregate_partial(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        column: pyspark.Column,
+        allow_relative_error: Any = None,
+        **kwargs,
+    ) -> pyspark.Column:
+        allowed_relative_error: Optional[float] = get_allowed_relative_error(
+            allow_relative_error
+        )
+        if allowed_relative_error is None:
+            return F.countDistinct(column)
+
+        return F.approx_count_distinct(column, rsd=allowed_relative_error)
+
+    @classmethod
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[Dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        if isinstance(execution_engine, PandasExecutionEngine):
+            allowed_relative_error: Optional[float] = get_allowed_relative_error(
+                metric.metric_value_kwargs.get("allow_relative_error")
+            )
+            if allowed_relative_error is None:
+                dependencies["column.distinct_values.count"] = MetricConfiguration(
+                    metric_name="column.distinct_values.count",
+                    metric_domain_kwargs=metric.metric_domain_kwargs,
+                    metric_value_kwargs=None,
+                )
+            else:
+                dependencies[
+                    "column.distinct_values.count.sketch"
+                ] = MetricConfiguration(
+                    metric_name="column.distinct_values.count.sketch",
+                    metric_domain_kwargs=metric.metric_domain_kwargs,
+                    metric_value_kwargs={
+                        "allow_relative_error": allowed_relative_error
+                    },
+                )
+
+        return dependencies
+
+
 class ColumnDistinctValuesCountUnderThreshold(ColumnAggregateMetricProvider):
     metric_name = "column.distinct_values.count.under_threshold"
     condition_keys = ("threshold",)
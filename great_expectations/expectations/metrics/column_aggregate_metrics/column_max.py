@@ -7,6 +7,9 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.pandas_aggregate_states import (
+    MaxAggregateState,
+)
 from great_expectations.execution_engine.sparkdf_execution_engine import (
     apply_dateutil_parse,
 )
@@ -22,7 +25,9 @@ class ColumnMax(ColumnAggregateMetricProvider):
     metric_name = "column.max"
     value_keys = ("parse_strings_as_datetimes",)
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(
+        engine=PandasExecutionEngine, aggregate_state_type=MaxAggregateState
+    )
     def _pandas(cls, column, **kwargs):
         parse_strings_as_datetimes: bool = (
             kwargs.get("parse_strings_as_datetimes") or False
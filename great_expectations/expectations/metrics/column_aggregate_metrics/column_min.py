@@ -7,6 +7,9 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.pandas_aggregate_states import (
+    MinAggregateState,
+)
 from great_expectations.execution_engine.sparkdf_execution_engine import (
     apply_dateutil_parse,
 )
@@ -22,7 +25,9 @@ class ColumnMin(ColumnAggregateMetricProvider):
     metric_name = "column.min"
     value_keys = ("parse_strings_as_datetimes",)
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(
+        engine=PandasExecutionEngine, aggregate_state_type=MinAggregateState
+    )
     def _pandas(cls, column, **kwargs):
         parse_strings_as_datetimes: bool = (
             kwargs.get("parse_strings_as_datetimes") or False
@@ -1,6 +1,7 @@
 from typing import Any, Dict, Optional
 
 from great_expectations.core import ExpectationConfiguration  # noqa: TCH001
+from great_expectations.core.sketches import MisraGriesSketch  # noqa: TCH001
 from great_expectations.execution_engine import (
     ExecutionEngine,
     PandasExecutionEngine,
@@ -12,13 +13,39 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.util import get_allowed_relative_error
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
+def _get_pandas_most_common_value_from_sketch(
+    cls, allow_relative_error=None, _metrics=None, **kwargs
+):
+    if get_allowed_relative_error(allow_relative_error) is None:
+        return NotImplemented
+
+    sketch: MisraGriesSketch = _metrics["column.value_counts.sketch"]
+    heavy_hitters: Dict[Any, int] = sketch.heavy_hitters()
+    return [
+        value
+        for value, count in heavy_hitters.items()
+        if count == max(heavy_hitters.values())
+    ]
+
+
 class ColumnMostCommonValue(ColumnAggregateMetricProvider):
+    """Most common value(s) of column.
+
+    If "allow_relative_error" is float between 0 and 1, Pandas estimates them from mergeable Misra-Gries sketch (as values
+    with largest estimated count, which is underestimated by at most given fraction of number of non-null values).
+    """
+
     metric_name = "column.most_common_value"
+    value_keys = ("allow_relative_error",)
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(
+        engine=PandasExecutionEngine,
+        value_from_metrics_fn=_get_pandas_most_common_value_from_sketch,
+    )
     def _pandas(cls, column, **kwargs):
         mode_list = list(column.mode().values)
         return mode_list
@@ -80,4 +107,17 @@ class ColumnMostCommonValue(ColumnAggregateMetricProvider):
                 },
             )
 
+        allowed_relative_error: Optional[float] = get_allowed_relative_error(
+            metric.metric_value_kwargs.get("allow_relative_error")
+        )
+        if (
+            isinstance(execution_engine, PandasExecutionEngine)
+            and allowed_relative_error is not None
+        ):
+            dependencies["column.value_counts.sketch"] = MetricConfiguration(
+                metric_name="column.value_counts.sketch",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+                metric_value_kwargs={"allow_relative_error": allowed_relative_error},
+            )
+
         return dependencies
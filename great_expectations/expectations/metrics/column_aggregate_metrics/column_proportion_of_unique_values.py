@@ -14,6 +14,7 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     ColumnAggregateMetricProvider,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.util import get_allowed_relative_error
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
@@ -34,6 +35,7 @@ def unique_proportion(_metrics):
 
 class ColumnUniqueProportion(ColumnAggregateMetricProvider):
     metric_name = "column.unique_proportion"
+    value_keys = ("allow_relative_error",)
 
     @metric_value(engine=PandasExecutionEngine)
     def _pandas(*args, metrics, **kwargs):
@@ -62,10 +64,20 @@ class ColumnUniqueProportion(ColumnAggregateMetricProvider):
             runtime_configuration=runtime_configuration,
         )
 
-        dependencies["column.distinct_values.count"] = MetricConfiguration(
-            metric_name="column.distinct_values.count",
-            metric_domain_kwargs=metric.metric_domain_kwargs,
+        allowed_relative_error: Optional[float] = get_allowed_relative_error(
+            metric.metric_value_kwargs.get("allow_relative_error")
         )
+        if allowed_relative_error is None:
+            dependencies["column.distinct_values.count"] = MetricConfiguration(
+                metric_name="column.distinct_values.count",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+            )
+        else:
+            dependencies["column.distinct_values.count"] = MetricConfiguration(
+                metric_name="column.distinct_values.count.approximate",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+                metric_value_kwargs={"allow_relative_error": allowed_relative_error},
+            )
 
         dependencies[
             f"column_values.nonnull.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}"
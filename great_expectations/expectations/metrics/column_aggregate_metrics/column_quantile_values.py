@@ -3,7 +3,7 @@ import itertools
 import logging
 import traceback
 from collections.abc import Iterable
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 
@@ -11,12 +11,18 @@ from great_expectations.compatibility import sqlalchemy
 from great_expectations.compatibility.sqlalchemy import (
     sqlalchemy as sa,
 )
+from great_expectations.core import ExpectationConfiguration  # noqa: TCH001
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.sketches import KLLSketch
 from great_expectations.execution_engine import (
+    ExecutionEngine,
     PandasExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.pandas_aggregate_states import (
+    SketchAggregateState,
+)
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
 from great_expectations.execution_engine.util import get_approximate_percentile_disc_sql
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
@@ -24,7 +30,11 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
-from great_expectations.expectations.metrics.util import attempt_allowing_relative_error
+from great_expectations.expectations.metrics.util import (
+    attempt_allowing_relative_error,
+    get_allowed_relative_error,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 logger = logging.getLogger(__name__)
 
@@ -40,11 +50,25 @@ else:
     Row = sqlalchemy.RowProxy
 
 
+def _get_pandas_quantile_values_from_sketch(
+    cls, quantiles, allow_relative_error=False, _metrics=None, **kwargs
+):
+    # Relative error (rather than name of interpolation method) makes quantiles estimated from mergeable sketch.
+    if get_allowed_relative_error(allow_relative_error) is None:
+        return NotImplemented
+
+    sketch: KLLSketch = _metrics["column.quantile_values.sketch"]
+    return sketch.quantiles(quantiles=quantiles)
+
+
 class ColumnQuantileValues(ColumnAggregateMetricProvider):
     metric_name = "column.quantile_values"
     value_keys = ("quantiles", "allow_relative_error")
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(
+        engine=PandasExecutionEngine,
+        value_from_metrics_fn=_get_pandas_quantile_values_from_sketch,
+    )
     def _pandas(cls, column, quantiles, allow_relative_error, **kwargs):
         """Quantile Function"""
         interpolation_options = ("linear", "lower", "higher", "midpoint", "nearest")
@@ -55,7 +79,8 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         if allow_relative_error not in interpolation_options:
             raise ValueError(
                 f"If specified for pandas, allow_relative_error must be one an allowed value for the 'interpolation'"
-                f"parameter of .quantile() (one of {interpolation_options})"
+                f"parameter of .quantile() (one of {interpolation_options}), or a float between 0 and 1 (relative "
+                f"error of quantiles estimated from a KLL sketch)"
             )
 
         return column.quantile(quantiles, interpolation=allow_relative_error).tolist()
@@ -187,6 +212,53 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
 
         return df.approxQuantile(column, list(quantiles), allow_relative_error)
 
+    @classmethod
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        allowed_relative_error: Optional[float] = get_allowed_relative_error(
+            metric.metric_value_kwargs.get("allow_relative_error")
+        )
+        if (
+            isinstance(execution_engine, PandasExecutionEngine)
+            and allowed_relative_error is not None
+        ):
+            dependencies["column.quantile_values.sketch"] = MetricConfiguration(
+                metric_name="column.quantile_values.sketch",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+                metric_value_kwargs={"allow_relative_error": allowed_relative_error},
+            )
+
+        return dependencies
+
+
+class ColumnQuantileValuesSketch(ColumnAggregateMetricProvider):
+    """KLL sketch of (numeric) column, from which "column.quantile_values" are estimated with relative error allowed."""
+
+    metric_name = "column.quantile_values.sketch"
+    value_keys = ("allow_relative_error",)
+
+    @column_aggregate_value(
+        engine=PandasExecutionEngine,
+        filter_column_isnull=True,
+        aggregate_state_type=SketchAggregateState,
+    )
+    def _pandas(cls, column, allow_relative_error, **kwargs) -> KLLSketch:
+        sketch = KLLSketch.from_relative_error(relative_error=allow_relative_error)
+        sketch.update(values=column)
+        return sketch
+
 
 def _get_column_quantiles_mssql(
     column, quantiles: Iterable, selectable, sqlalchemy_engine
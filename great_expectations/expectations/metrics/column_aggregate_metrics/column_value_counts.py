@@ -5,13 +5,18 @@ import pandas as pd
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.sketches import MisraGriesSketch
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.pandas_aggregate_states import (
+    SketchAggregateState,
+)
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
+    column_aggregate_value,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
 
@@ -182,3 +187,26 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
             name="count",
         )
         return series
+
+
+class ColumnValueCountsSketch(ColumnAggregateMetricProvider):
+    """Misra-Gries sketch of most frequent values of column (with counts, underestimated by at most given fraction of
+    number of non-null values), from which "column.most_common_value" is estimated with relative error allowed.
+    """
+
+    metric_name = "column.value_counts.sketch"
+    value_keys = ("allow_relative_error",)
+
+    @column_aggregate_value(
+        engine=PandasExecutionEngine,
+        filter_column_isnull=True,
+        aggregate_state_type=SketchAggregateState,
+    )
+    def _pandas(
+        cls, column: pd.Series, allow_relative_error: float, **kwargs
+    ) -> MisraGriesSketch:
+        sketch = MisraGriesSketch.from_relative_error(
+            relative_error=allow_relative_error
+        )
+        sketch.update(values=column)
+        return sketch
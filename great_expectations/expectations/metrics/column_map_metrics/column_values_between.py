@@ -15,6 +15,7 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import evaluate_on_distinct_values
 from great_expectations.warnings import warn_deprecated_parse_strings_as_datetimes
 
 
@@ -66,7 +67,9 @@ class ColumnValuesBetween(ColumnMapMetricProvider):
                     pass
 
             try:
-                temp_column = column.map(parse)
+                temp_column = evaluate_on_distinct_values(
+                    column=column, fn=lambda distinct_values: distinct_values.map(parse)
+                )
             except TypeError:
                 temp_column = column
 
@@ -17,6 +17,7 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     column_condition_partial,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_partial
+from great_expectations.expectations.metrics.util import evaluate_on_distinct_values
 from great_expectations.warnings import warn_deprecated_parse_strings_as_datetimes
 
 
@@ -44,7 +45,9 @@ class ColumnValuesDecreasing(ColumnMapMetricProvider):
             warn_deprecated_parse_strings_as_datetimes()
 
             try:
-                temp_column = column.map(parse)
+                temp_column = evaluate_on_distinct_values(
+                    column=column, fn=lambda distinct_values: distinct_values.map(parse)
+                )
             except TypeError:
                 temp_column = column
         else:
@@ -1,11 +1,13 @@
 import json
 
 from great_expectations.compatibility import pyspark
-from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
 )
+from great_expectations.execution_engine.sparkdf_execution_engine import (
+    build_vectorized_spark_udf,
+)
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
@@ -15,7 +17,9 @@ from great_expectations.expectations.metrics.map_metric_provider import (
 class ColumnValuesJsonParseable(ColumnMapMetricProvider):
     condition_metric_name = "column_values.json_parseable"
 
-    @column_condition_partial(engine=PandasExecutionEngine)
+    @column_condition_partial(
+        engine=PandasExecutionEngine, evaluate_distinct_values=True
+    )
     def _pandas(cls, column, **kwargs):
         def is_json(val):
             try:
@@ -35,6 +39,9 @@ class ColumnValuesJsonParseable(ColumnMapMetricProvider):
             except Exception:
                 return False
 
-        is_json_udf = F.udf(is_json, pyspark.types.BooleanType())
+        is_json_udf = build_vectorized_spark_udf(
+            value_fn_factory=lambda: is_json,
+            return_type=pyspark.types.BooleanType(),
+        )
 
         return is_json_udf(column)
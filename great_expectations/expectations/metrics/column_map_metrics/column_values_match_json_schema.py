@@ -3,12 +3,14 @@ import json
 import jsonschema
 
 from great_expectations.compatibility import pyspark
-from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
 )
+from great_expectations.execution_engine.sparkdf_execution_engine import (
+    build_vectorized_spark_udf,
+)
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
@@ -19,7 +21,9 @@ class ColumnValuesMatchJsonSchema(ColumnMapMetricProvider):
     condition_metric_name = "column_values.match_json_schema"
     condition_value_keys = ("json_schema",)
 
-    @column_condition_partial(engine=PandasExecutionEngine)
+    @column_condition_partial(
+        engine=PandasExecutionEngine, evaluate_distinct_values=True
+    )
     def _pandas(cls, column, json_schema, **kwargs):
         def matches_json_schema(val):
             try:
@@ -42,24 +46,33 @@ class ColumnValuesMatchJsonSchema(ColumnMapMetricProvider):
         # This step insures that Spark UDF defined can be pickled; otherwise, pickle serialization exceptions may occur.
         json_schema = convert_to_json_serializable(data=json_schema)
 
-        def matches_json_schema(val):
-            if val is None:
-                return False
-            try:
-                val_json = json.loads(val)
-                jsonschema.validate(instance=val_json, schema=json_schema)
-                # jsonschema.validate raises an error if validation fails.
-                # So if we make it this far, we know that the validation succeeded.
-                return True
-            except jsonschema.ValidationError:
-                return False
-            except jsonschema.SchemaError:
-                raise
-            except:
-                raise
+        def build_matches_json_schema():
+            # Validator is compiled (and schema checked) once per partition, rather than on every value.
+            validator_cls = jsonschema.validators.validator_for(json_schema)
+            validator_cls.check_schema(json_schema)
+            validator = validator_cls(json_schema)
+
+            def matches_json_schema(val):
+                if val is None:
+                    return False
+                try:
+                    val_json = json.loads(val)
+                    validator.validate(val_json)
+                    # validator.validate raises an error if validation fails.
+                    # So if we make it this far, we know that the validation succeeded.
+                    return True
+                except jsonschema.ValidationError:
+                    return False
+                except jsonschema.SchemaError:
+                    raise
+                except:
+                    raise
+
+            return matches_json_schema
 
-        matches_json_schema_udf = F.udf(
-            lambda val: matches_json_schema(val=val), pyspark.types.BooleanType()
+        matches_json_schema_udf = build_vectorized_spark_udf(
+            value_fn_factory=build_matches_json_schema,
+            return_type=pyspark.types.BooleanType(),
         )
 
         return matches_json_schema_udf(column)
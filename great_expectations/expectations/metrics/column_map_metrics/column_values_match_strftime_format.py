@@ -1,11 +1,13 @@
 from datetime import datetime
 
 from great_expectations.compatibility import pyspark
-from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
 )
+from great_expectations.execution_engine.sparkdf_execution_engine import (
+    build_vectorized_spark_udf,
+)
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
@@ -16,7 +18,9 @@ class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
     condition_metric_name = "column_values.match_strftime_format"
     condition_value_keys = ("strftime_format",)
 
-    @column_condition_partial(engine=PandasExecutionEngine)
+    @column_condition_partial(
+        engine=PandasExecutionEngine, evaluate_distinct_values=True
+    )
     def _pandas(cls, column, strftime_format, **kwargs):
         def is_parseable_by_format(val):
             try:
@@ -55,5 +59,8 @@ class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
             except ValueError:
                 return False
 
-        success_udf = F.udf(is_parseable_by_format, pyspark.types.BooleanType())
+        success_udf = build_vectorized_spark_udf(
+            value_fn_factory=lambda: is_parseable_by_format,
+            return_type=pyspark.types.BooleanType(),
+        )
         return success_udf(column)
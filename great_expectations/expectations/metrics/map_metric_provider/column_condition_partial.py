@@ -16,6 +16,7 @@ from great_expectations.compatibility.sqlalchemy import (
     sqlalchemy as sa,
 )
 from great_expectations.core._docs_decorators import public_api
+from great_expectations.core.id_dict import IDDict
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.metric_function_types import (
     MetricPartialFunctionTypes,
@@ -30,6 +31,7 @@ from great_expectations.expectations.metrics.metric_provider import (
     metric_partial,
 )
 from great_expectations.expectations.metrics.util import (
+    evaluate_on_distinct_values,
     get_dbms_compatible_column_names,
 )
 
@@ -37,6 +39,7 @@ logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from great_expectations.compatibility import sqlalchemy
+    from great_expectations.execution_engine.metric_cache import ConditionValueCache
 
 
 @public_api
@@ -56,13 +59,17 @@ def column_condition_partial(  # noqa: C901 - 23
     Args:
         engine: The `ExecutionEngine` used to to evaluate the condition
         partial_fn_type: The metric function
-        **kwargs: Arguments passed to specified function
+        **kwargs: Arguments passed to specified function (for PandasExecutionEngine, "evaluate_distinct_values=True"
+            calls row-wise metric function, whose result for each row depends only on the value in this row, once per
+            distinct column value, rather than for every row)
 
     Returns:
         An annotated metric_function which will be called with a simplified signature.
     """
     domain_type = MetricDomainTypes.COLUMN
     if issubclass(engine, PandasExecutionEngine):
+        evaluate_distinct_values: bool = kwargs.pop("evaluate_distinct_values", False)
+
         if partial_fn_type is None:
             partial_fn_type = MetricPartialFunctionTypes.MAP_CONDITION_SERIES
 
@@ -112,12 +119,33 @@ def column_condition_partial(  # noqa: C901 - 23
                 if filter_column_isnull:
                     df = df[df[column_name].notnull()]
 
-                meets_expectation_series = metric_fn(
-                    cls,
-                    df[column_name],
-                    **metric_value_kwargs,
-                    _metrics=metrics,
-                )
+                if evaluate_distinct_values:
+                    condition_value_cache: Optional[
+                        ConditionValueCache
+                    ] = execution_engine.condition_value_cache
+                    condition_id: Optional[str] = None
+                    if condition_value_cache is not None:
+                        condition_id = f"{cls.condition_metric_name}:{IDDict(metric_value_kwargs).to_id()}"
+
+                    meets_expectation_series = evaluate_on_distinct_values(
+                        column=df[column_name],
+                        fn=lambda column: metric_fn(
+                            cls,
+                            column,
+                            **metric_value_kwargs,
+                            _metrics=metrics,
+                        ),
+                        condition_value_cache=condition_value_cache,
+                        condition_id=condition_id,
+                    )
+                else:
+                    meets_expectation_series = metric_fn(
+                        cls,
+                        df[column_name],
+                        **metric_value_kwargs,
+                        _metrics=metrics,
+                    )
+
                 return (
                     ~meets_expectation_series,
                     compute_domain_kwargs,
@@ -1,4 +1,6 @@
-from typing import Any, Dict, Optional, cast
+from typing import Any, Dict, Iterator, Optional, cast
+
+import pandas as pd
 
 from great_expectations.compatibility import pyspark, sqlalchemy
 from great_expectations.core.metric_domain_types import MetricDomainTypes
@@ -32,9 +34,16 @@ class ColumnTypes(TableMetricProvider):
         metrics: Dict[str, Any],
         runtime_configuration: dict,
     ):
-        df, _, _ = execution_engine.get_compute_domain(
-            metric_domain_kwargs, domain_type=MetricDomainTypes.TABLE
+        execution_engine.get_compute_domain_kwargs(
+            domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.TABLE
+        )
+
+        # For Batch of data, read in chunks, column types are those of first chunk of records.
+        chunks: Iterator[pd.DataFrame] = execution_engine.iter_domain_record_chunks(
+            domain_kwargs=metric_domain_kwargs
         )
+        df: pd.DataFrame = next(chunks)
+        chunks.close()
         return [
             {"name": name, "type": dtype}
             for (name, dtype) in zip(df.columns, df.dtypes)
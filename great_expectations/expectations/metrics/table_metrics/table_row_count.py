@@ -30,10 +30,17 @@ class TableRowCount(TableMetricProvider):
         metrics: Dict[str, Any],
         runtime_configuration: dict,
     ):
-        df, _, _ = execution_engine.get_compute_domain(
+        execution_engine.get_compute_domain_kwargs(
             domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.TABLE
         )
-        return df.shape[0]
+
+        # Batch of data, read in chunks, is counted chunk by chunk (without holding all of its records in memory).
+        return sum(
+            df.shape[0]
+            for df in execution_engine.iter_domain_record_chunks(
+                domain_kwargs=metric_domain_kwargs
+            )
+        )
 
     @metric_partial(
         engine=SqlAlchemyExecutionEngine,
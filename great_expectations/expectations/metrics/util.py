@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import re
 import warnings
-from typing import Any, Dict, List, Optional, Tuple, overload
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, overload
 
 import numpy as np
 import pandas as pd
@@ -26,6 +26,9 @@ from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
 from great_expectations.execution_engine.util import check_sql_engine_dialect
 from great_expectations.util import get_sqlalchemy_inspector
 
+if TYPE_CHECKING:
+    from great_expectations.execution_engine.metric_cache import ConditionValueCache
+
 try:
     import psycopg2  # noqa: F401
     import sqlalchemy.dialects.postgresql.psycopg2 as sqlalchemy_psycopg2  # noqa: TID251
@@ -332,6 +335,17 @@ def attempt_allowing_relative_error(dialect):
     return detected_redshift or detected_psycopg2
 
 
+def get_allowed_relative_error(allow_relative_error: Any) -> Optional[float]:
+    """Returns relative error, which "allow_relative_error" metric value kwarg allows (if it is float between 0 and 1,
+    exclusive), or None (if value must be computed exactly, or its computation is otherwise specified, e.g., by name of
+    interpolation method for "column.quantile_values" in Pandas).
+    """
+    if isinstance(allow_relative_error, float) and 0.0 < allow_relative_error < 1.0:
+        return allow_relative_error
+
+    return None
+
+
 def is_column_present_in_table(
     engine: sqlalchemy.Engine,
     table_selectable: sqlalchemy.Select,
@@ -1294,3 +1308,72 @@ def compute_unexpected_pandas_indices(
         unexpected_index_list = list(domain_records_df.index)
 
     return unexpected_index_list
+
+
+def evaluate_on_distinct_values(
+    column: pd.Series,
+    fn: Callable[[pd.Series], Any],
+    condition_value_cache: Optional[ConditionValueCache] = None,
+    condition_id: Optional[str] = None,
+) -> pd.Series:
+    """
+    Evaluates row-wise "fn" (i.e., whose result for each row depends only on the value in this row) once per distinct
+    value of "column", and broadcasts its results back to all rows of "column".
+
+    Args:
+        column: Pandas Series, which "fn" would otherwise be called with.
+        fn: function, taking Pandas Series and returning array-like of results of the same length.
+        condition_value_cache: if provided, results held for values under "condition_id" are reused (and results for
+            other values are added), so that "fn" is evaluated only for values not seen before.
+        condition_id: identifier of condition (e.g., metric name and value kwargs), which "fn" evaluates.
+
+    Returns:
+        Pandas Series of results of "fn", having index of "column"; columns holding unhashable values (e.g.,
+        dictionaries) are passed to "fn" as they are.
+    """
+    if column.empty:
+        return fn(column)
+
+    try:
+        codes, uniques = pd.factorize(column)
+    except TypeError:
+        return fn(column)
+
+    distinct_values = pd.Series(uniques)
+    null_rows: np.ndarray = codes == -1
+    if null_rows.any():
+        # Null values are coded as -1, which (once first null value is appended) indexes last distinct value.
+        distinct_values = pd.concat(
+            [distinct_values, column[null_rows].iloc[:1]], ignore_index=True
+        )
+
+    results: np.ndarray
+    if condition_value_cache is None or condition_id is None:
+        results = np.asarray(fn(distinct_values))
+    else:
+        values: list = distinct_values.tolist()
+        cached_results: List[Any]
+        found: List[bool]
+        cached_results, found = condition_value_cache.get_many(
+            condition_id=condition_id, values=values
+        )
+        missing_idx: List[int] = [
+            idx for idx, is_found in enumerate(found) if not is_found
+        ]
+        if missing_idx:
+            missing_results: list = np.asarray(
+                fn(distinct_values.iloc[missing_idx].reset_index(drop=True))
+            ).tolist()
+            condition_value_cache.set_many(
+                condition_id=condition_id,
+                values=[values[idx] for idx in missing_idx],
+                results=missing_results,
+            )
+            idx: int
+            result: Any
+            for idx, result in zip(missing_idx, missing_results):
+                cached_results[idx] = result
+
+        results = np.asarray(cached_results)
+
+    return pd.Series(results[codes], index=column.index, name=column.name)
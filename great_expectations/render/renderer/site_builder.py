@@ -1,12 +1,18 @@
+import concurrent.futures
+import hashlib
+import json
 import logging
+import multiprocessing
 import os
 import traceback
-from collections import OrderedDict
-from typing import Any, List, Optional, Tuple
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
 
 import great_expectations.exceptions as exceptions
+from great_expectations import __version__ as ge_version
 from great_expectations.core import ExpectationSuite
-from great_expectations.core.util import nested_update
+from great_expectations.core.data_context_key import DataContextKey  # noqa: TCH001
+from great_expectations.core.util import convert_to_json_serializable, nested_update
 from great_expectations.data_context.cloud_constants import GXCloudRESTResource
 from great_expectations.data_context.store.html_site_store import (
     HtmlSiteStore,
@@ -54,6 +60,9 @@ class SiteBuilder:
         (filesystem or S3)
         * where the HTML files should be written (filesystem or S3)
         * which renderer and view class should be used to render each section
+        * how many pages may be rendered concurrently (by default, one at a
+        time); pages are rendered in worker processes where the platform
+        supports forking them (in threads otherwise), and written in threads
 
     Here is an example of a minimal configuration for a site::
 
@@ -76,6 +85,7 @@ class SiteBuilder:
                 prefix: /data_docs/
             site_index_builder:
                 class_name: DefaultSiteIndexBuilder
+            max_rendering_workers: 8
 
             # Verbose version:
             # site_index_builder:
@@ -122,12 +132,14 @@ class SiteBuilder:
         cloud_mode=False,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
+        max_rendering_workers=None,
         **kwargs,
     ) -> None:
         self.site_name = site_name
         self.data_context = data_context
         self.store_backend = store_backend
         self.show_how_to_buttons = show_how_to_buttons
+        self.max_rendering_workers = max_rendering_workers
         if ge_cloud_mode:
             cloud_mode = ge_cloud_mode
         self.cloud_mode = cloud_mode
@@ -241,6 +253,7 @@ class SiteBuilder:
                     "data_context_id": self.data_context_id,
                     "show_how_to_buttons": self.show_how_to_buttons,
                     "cloud_mode": self.cloud_mode,
+                    "max_rendering_workers": self.max_rendering_workers,
                 },
                 config_defaults={"name": site_section_name, "module_name": module_name},
             )
@@ -359,6 +372,7 @@ class DefaultSiteSectionBuilder:
         cloud_mode=False,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
+        max_rendering_workers=None,
         **kwargs,
     ) -> None:
         self.name = name
@@ -369,6 +383,9 @@ class DefaultSiteSectionBuilder:
         self.validation_results_limit = validation_results_limit
         self.data_context_id = data_context_id
         self.show_how_to_buttons = show_how_to_buttons
+        self.custom_styles_directory = custom_styles_directory
+        self.custom_views_directory = custom_views_directory
+        self.max_rendering_workers = max_rendering_workers
         if ge_cloud_mode:
             cloud_mode = ge_cloud_mode
         self.cloud_mode = cloud_mode
@@ -416,12 +433,14 @@ class DefaultSiteSectionBuilder:
             )
 
     def build(self, resource_identifiers=None) -> None:
-        source_store_keys = self.source_store.list_keys()
+        all_source_store_keys = self.source_store.list_keys()
+        source_store_keys = all_source_store_keys
         if self.name == "validations" and self.validation_results_limit:
             source_store_keys = sorted(
                 source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
             )[: self.validation_results_limit]
 
+        resource_keys: List[DataContextKey] = []
         for resource_key in source_store_keys:
             # if no resource_identifiers are passed, the section
             # builder will build
@@ -436,78 +455,588 @@ class DefaultSiteSectionBuilder:
                     resource_key, self.run_name_filter
                 ):
                     continue
-            try:
-                resource = self.source_store.get(resource_key)
-                if isinstance(resource_key, ExpectationSuiteIdentifier):
-                    resource = ExpectationSuite(
-                        **resource, data_context=self.data_context
-                    )
-            except exceptions.InvalidKeyError:
-                logger.warning(
-                    f"Object with Key: {str(resource_key)} could not be retrieved. Skipping..."
+
+            resource_keys.append(resource_key)
+
+        # Resources whose content has not changed since their pages were last rendered (by an equally configured
+        # builder) are neither deserialized nor rendered again.
+        render_manifest: Optional[
+            _SiteSectionRenderManifest
+        ] = self._get_site_section_render_manifest()
+
+        if (
+            not self.cloud_mode
+            and self.max_rendering_workers
+            and self.max_rendering_workers > 1
+            and len(resource_keys) > 1
+        ):
+            self._build_pages_concurrently(
+                resource_keys=resource_keys, render_manifest=render_manifest
+            )
+        else:
+            for resource_key in resource_keys:
+                self._build_page(
+                    resource_key=resource_key, render_manifest=render_manifest
                 )
-                continue
 
-            if isinstance(resource_key, ExpectationSuiteIdentifier):
-                expectation_suite_name = resource_key.expectation_suite_name
-                logger.debug(
-                    f"        Rendering expectation suite {expectation_suite_name}"
+        if render_manifest is not None:
+            render_manifest.save(source_store_keys=all_source_store_keys)
+
+    def _build_page(
+        self,
+        resource_key: DataContextKey,
+        render_manifest: Optional["_SiteSectionRenderManifest"],
+    ) -> None:
+        content_hash: Optional[str] = None
+        try:
+            if render_manifest is None:
+                resource = self._to_page_resource(
+                    resource_key=resource_key,
+                    resource=self.source_store.get(resource_key),
                 )
-            elif isinstance(resource_key, ValidationResultIdentifier):
-                run_id = resource_key.run_id
-                run_name = run_id.run_name
-                run_time = run_id.run_time
-                expectation_suite_name = (
-                    resource_key.expectation_suite_identifier.expectation_suite_name
+            else:
+                changed_serialized_resource: Optional[
+                    Tuple[Any, str]
+                ] = self._get_changed_serialized_resource(
+                    resource_key=resource_key, render_manifest=render_manifest
                 )
-                if self.name == "profiling":
+                if changed_serialized_resource is None:
                     logger.debug(
-                        f"        Rendering profiling for batch {resource_key.batch_identifier}"
+                        f"        Skipping unchanged resource {str(resource_key)}"
                     )
-                else:
+                    return
 
-                    logger.debug(
-                        f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"
-                    )
+                serialized_resource, content_hash = changed_serialized_resource
+                resource = self._deserialize_page_resource(
+                    resource_key=resource_key, serialized_resource=serialized_resource
+                )
+        except exceptions.InvalidKeyError:
+            logger.warning(
+                f"Object with Key: {str(resource_key)} could not be retrieved. Skipping..."
+            )
+            return
 
-            try:
-                rendered_content = self.renderer_class.render(resource)
+        self._log_rendering(resource_key=resource_key)
 
-                if self.cloud_mode:
-                    self.target_store.set(
-                        GXCloudIdentifier(
-                            resource_type=GXCloudRESTResource.RENDERED_DATA_DOC
+        try:
+            if self.cloud_mode:
+                rendered_content = self.renderer_class.render(resource)
+                self.target_store.set(
+                    GXCloudIdentifier(
+                        resource_type=GXCloudRESTResource.RENDERED_DATA_DOC
+                    ),
+                    rendered_content,
+                    source_type=resource_key.resource_type,
+                    source_id=resource_key.id,
+                )
+            else:
+                self._write_page(
+                    resource_key=resource_key,
+                    viewable_content=self._render_page(resource=resource),
+                )
+                if render_manifest is not None:
+                    render_manifest.add_rendered_resource(
+                        resource_key=resource_key,
+                        content_hash=content_hash,
+                        index_info=_get_index_info(
+                            resource_key=resource_key, resource=resource
                         ),
-                        rendered_content,
-                        source_type=resource_key.resource_type,
-                        source_id=resource_key.id,
                     )
-                else:
-                    viewable_content = self.view_class.render(
-                        rendered_content,
-                        data_context_id=self.data_context_id,
-                        show_how_to_buttons=self.show_how_to_buttons,
+        except Exception as e:
+            logger.error(_get_rendering_exception_message(e))
+
+            # The page may be stale or missing; make sure that the next build renders it again.
+            if render_manifest is not None:
+                render_manifest.remove_rendered_resource(resource_key=resource_key)
+
+    def _build_pages_concurrently(
+        self,
+        resource_keys: List[DataContextKey],
+        render_manifest: Optional["_SiteSectionRenderManifest"],
+    ) -> None:
+        """Renders pages in worker processes (threads, where processes cannot be forked), and writes them in threads.
+
+        Resources are read, and pages are written and recorded in the render manifest, in the same order as they are
+        when pages are built one at a time, so the site (and the log) does not depend on the number of workers.
+        """
+        max_workers: int = min(self.max_rendering_workers, len(resource_keys))
+        max_pending_pages: int = 2 * max_workers
+
+        render_executor: concurrent.futures.Executor
+        render: Callable[[DataContextKey, Any], Tuple[Optional[str], ...]]
+        fork_context: Optional[
+            multiprocessing.context.BaseContext
+        ] = _get_fork_context()
+        if fork_context is None:
+            render_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers
+            )
+            render = self._render_serialized_page
+        else:
+            # Forked processes inherit this builder (including its DataContext) instead of receiving it pickled.
+            render_executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=fork_context,
+                initializer=_set_forked_site_section_builder,
+                initargs=(self, fork_context.Barrier(max_workers)),
+            )
+            _start_rendering_processes(
+                render_executor=render_executor, max_workers=max_workers
+            )
+            render = _render_serialized_page_in_forked_process
+
+        pending_renders: Deque[
+            Tuple[DataContextKey, str, concurrent.futures.Future]
+        ] = deque()
+        pending_writes: Deque[
+            Tuple[DataContextKey, str, Optional[dict], concurrent.futures.Future]
+        ] = deque()
+        with render_executor, concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers
+        ) as write_executor:
+            for resource_key in resource_keys:
+                try:
+                    changed_serialized_resource: Optional[
+                        Tuple[Any, str]
+                    ] = self._get_changed_serialized_resource(
+                        resource_key=resource_key, render_manifest=render_manifest
+                    )
+                except exceptions.InvalidKeyError:
+                    logger.warning(
+                        f"Object with Key: {str(resource_key)} could not be retrieved. Skipping..."
+                    )
+                    continue
+
+                if changed_serialized_resource is None:
+                    logger.debug(
+                        f"        Skipping unchanged resource {str(resource_key)}"
                     )
-                    # Verify type
-                    self.target_store.set(
-                        SiteSectionIdentifier(
-                            site_section_name=self.name,
-                            resource_identifier=resource_key,
+                    continue
+
+                serialized_resource, content_hash = changed_serialized_resource
+                self._log_rendering(resource_key=resource_key)
+                pending_renders.append(
+                    (
+                        resource_key,
+                        content_hash,
+                        render_executor.submit(
+                            render, resource_key, serialized_resource
                         ),
-                        viewable_content,
                     )
-            except Exception as e:
-                exception_message = """\
+                )
+
+                # Bound the number of resources (and pages) held in memory at once.
+                while len(pending_renders) > max_pending_pages:
+                    self._write_rendered_page(
+                        pending_render=pending_renders.popleft(),
+                        write_executor=write_executor,
+                        pending_writes=pending_writes,
+                        render_manifest=render_manifest,
+                    )
+                while len(pending_writes) > max_pending_pages:
+                    _complete_page_write(
+                        pending_write=pending_writes.popleft(),
+                        render_manifest=render_manifest,
+                    )
+
+            while pending_renders:
+                self._write_rendered_page(
+                    pending_render=pending_renders.popleft(),
+                    write_executor=write_executor,
+                    pending_writes=pending_writes,
+                    render_manifest=render_manifest,
+                )
+            while pending_writes:
+                _complete_page_write(
+                    pending_write=pending_writes.popleft(),
+                    render_manifest=render_manifest,
+                )
+
+    def _write_rendered_page(
+        self,
+        pending_render: Tuple[DataContextKey, str, concurrent.futures.Future],
+        write_executor: concurrent.futures.Executor,
+        pending_writes: Deque[
+            Tuple[DataContextKey, str, Optional[dict], concurrent.futures.Future]
+        ],
+        render_manifest: Optional["_SiteSectionRenderManifest"],
+    ) -> None:
+        resource_key, content_hash, render_future = pending_render
+        viewable_content: Optional[str]
+        index_info: Optional[dict]
+        exception_message: Optional[str]
+        try:
+            viewable_content, index_info, exception_message = render_future.result()
+        except Exception as e:
+            # E.g., the rendering process was terminated abruptly.
+            exception_message = _get_rendering_exception_message(e)
+
+        if exception_message is not None:
+            logger.error(exception_message)
+            if render_manifest is not None:
+                render_manifest.remove_rendered_resource(resource_key=resource_key)
+            return
+
+        pending_writes.append(
+            (
+                resource_key,
+                content_hash,
+                index_info,
+                write_executor.submit(self._write_page, resource_key, viewable_content),
+            )
+        )
+
+    def _render_serialized_page(
+        self, resource_key: DataContextKey, serialized_resource: Any
+    ) -> Tuple[Optional[str], Optional[dict], Optional[str]]:
+        """Returns page of resource, and its index info (or message describing why it could not be rendered)."""
+        try:
+            resource: Any = self._deserialize_page_resource(
+                resource_key=resource_key, serialized_resource=serialized_resource
+            )
+            return (
+                self._render_page(resource=resource),
+                _get_index_info(resource_key=resource_key, resource=resource),
+                None,
+            )
+        except Exception as e:
+            return None, None, _get_rendering_exception_message(e)
+
+    def _render_page(self, resource: Any) -> str:
+        rendered_content = self.renderer_class.render(resource)
+        return self.view_class.render(
+            rendered_content,
+            data_context_id=self.data_context_id,
+            show_how_to_buttons=self.show_how_to_buttons,
+        )
+
+    def _write_page(self, resource_key: DataContextKey, viewable_content: str) -> None:
+        # Verify type
+        self.target_store.set(
+            SiteSectionIdentifier(
+                site_section_name=self.name,
+                resource_identifier=resource_key,
+            ),
+            viewable_content,
+        )
+
+    def _to_page_resource(self, resource_key: DataContextKey, resource: Any) -> Any:
+        if isinstance(resource_key, ExpectationSuiteIdentifier):
+            resource = ExpectationSuite(**resource, data_context=self.data_context)
+
+        return resource
+
+    def _deserialize_page_resource(
+        self, resource_key: DataContextKey, serialized_resource: Any
+    ) -> Any:
+        return self._to_page_resource(
+            resource_key=resource_key,
+            resource=self.source_store.deserialize(serialized_resource)
+            if serialized_resource
+            else None,
+        )
+
+    def _log_rendering(self, resource_key: DataContextKey) -> None:
+        if isinstance(resource_key, ExpectationSuiteIdentifier):
+            expectation_suite_name = resource_key.expectation_suite_name
+            logger.debug(
+                f"        Rendering expectation suite {expectation_suite_name}"
+            )
+        elif isinstance(resource_key, ValidationResultIdentifier):
+            run_id = resource_key.run_id
+            run_name = run_id.run_name
+            run_time = run_id.run_time
+            expectation_suite_name = (
+                resource_key.expectation_suite_identifier.expectation_suite_name
+            )
+            if self.name == "profiling":
+                logger.debug(
+                    f"        Rendering profiling for batch {resource_key.batch_identifier}"
+                )
+            else:
+
+                logger.debug(
+                    f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"
+                )
+
+    def _get_site_section_render_manifest(
+        self,
+    ) -> Optional["_SiteSectionRenderManifest"]:
+        if self.cloud_mode or not isinstance(self.target_store, HtmlSiteStore):
+            return None
+
+        render_manifest: Optional[dict] = self.target_store.get_render_manifest()
+        if render_manifest is None:
+            return None
+
+        # Pages rendered with a different renderer, view, or version of Great Expectations are not reused.
+        renderer_fingerprint: dict = {
+            "great_expectations_version": ge_version,
+            "renderer": _get_class_path(self.renderer_class),
+            "view": _get_class_path(self.view_class),
+            "custom_styles_directory": self.custom_styles_directory,
+            "custom_views_directory": self.custom_views_directory,
+            "data_context_id": str(self.data_context_id)
+            if self.data_context_id
+            else None,
+            "show_how_to_buttons": bool(self.show_how_to_buttons),
+        }
+        return _SiteSectionRenderManifest(
+            target_store=self.target_store,
+            render_manifest=render_manifest,
+            site_section_name=self.name,
+            renderer_fingerprint=renderer_fingerprint,
+        )
+
+    def _get_changed_serialized_resource(
+        self,
+        resource_key: DataContextKey,
+        render_manifest: Optional["_SiteSectionRenderManifest"],
+    ) -> Optional[Tuple[Any, str]]:
+        """Returns serialized resource (and hash of its content), or None if its page is up to date.
+
+        The serialized resource is hashed as stored, so that unchanged resources need not be deserialized.
+        """
+        serialized_resource: Any = self.source_store.store_backend.get(
+            self.source_store.key_to_tuple(resource_key)
+        )
+        content_hash: str = _get_content_hash(serialized_resource)
+        if render_manifest is not None and render_manifest.is_rendered(
+            resource_key=resource_key, content_hash=content_hash
+        ):
+            return None
+
+        return serialized_resource, content_hash
+
+
+class _SiteSectionRenderManifest:
+    """Records which resources of one site section have been rendered, and from which content.
+
+    The records of all sections are kept in the render manifest document of the "HtmlSiteStore" (which also holds the
+    properties of validation results that "DefaultSiteIndexBuilder" needs to link their pages).
+    """
+
+    def __init__(
+        self,
+        target_store: HtmlSiteStore,
+        render_manifest: dict,
+        site_section_name: str,
+        renderer_fingerprint: dict,
+    ) -> None:
+        self._target_store = target_store
+        self._render_manifest = render_manifest
+        self._changed = False
+        self._site_resource_keys: Dict[type, Set[Tuple[str, ...]]] = {}
+
+        site_section_manifest: Optional[dict] = render_manifest["sections"].get(
+            site_section_name
+        )
+        if not (
+            isinstance(site_section_manifest, dict)
+            and site_section_manifest.get("renderer_fingerprint")
+            == renderer_fingerprint
+            and isinstance(site_section_manifest.get("resources"), dict)
+        ):
+            site_section_manifest = {
+                "renderer_fingerprint": renderer_fingerprint,
+                "resources": {},
+            }
+            render_manifest["sections"][site_section_name] = site_section_manifest
+            self._changed = True
+
+        self._rendered_resources: Dict[str, dict] = site_section_manifest["resources"]
+
+    def is_rendered(self, resource_key: DataContextKey, content_hash: str) -> bool:
+        rendered_resource: Optional[dict] = self._rendered_resources.get(
+            _get_render_manifest_resource_key(resource_key)
+        )
+        if not rendered_resource or rendered_resource["content_hash"] != content_hash:
+            return False
+
+        # Pages may have been removed from the site independently of the render manifest.
+        resource_key_type: type = type(resource_key)
+        if resource_key_type not in self._site_resource_keys:
+            self._site_resource_keys[resource_key_type] = set(
+                self._target_store.store_backends[resource_key_type].list_keys()
+            )
+
+        return resource_key.to_tuple() in self._site_resource_keys[resource_key_type]
+
+    def add_rendered_resource(
+        self,
+        resource_key: DataContextKey,
+        content_hash: Optional[str],
+        index_info: Optional[dict],
+    ) -> None:
+        rendered_resource: dict = {"content_hash": content_hash}
+        if index_info is not None:
+            rendered_resource["index_info"] = index_info
+
+        self._rendered_resources[
+            _get_render_manifest_resource_key(resource_key)
+        ] = rendered_resource
+        self._changed = True
+
+    def remove_rendered_resource(self, resource_key: DataContextKey) -> None:
+        if (
+            self._rendered_resources.pop(
+                _get_render_manifest_resource_key(resource_key), None
+            )
+            is not None
+        ):
+            self._changed = True
+
+    def save(self, source_store_keys: List[DataContextKey]) -> None:
+        """Forgets resources no longer in source store, and writes render manifest (if it has changed)."""
+        resource_key: DataContextKey
+        source_resource_keys: Set[str] = {
+            _get_render_manifest_resource_key(resource_key)
+            for resource_key in source_store_keys
+        }
+        removed_resource_key: str
+        for removed_resource_key in (
+            set(self._rendered_resources.keys()) - source_resource_keys
+        ):
+            del self._rendered_resources[removed_resource_key]
+            self._changed = True
+
+        if self._changed:
+            self._target_store.set_render_manifest(self._render_manifest)
+            self._changed = False
+
+
+def _get_index_info(resource_key: DataContextKey, resource: Any) -> Optional[dict]:
+    """Returns everything "DefaultSiteIndexBuilder" needs to link page of validation result (None for other resources).
+
+    It is recorded in the render manifest, so that the index can be built without fetching the result again.
+    """
+    if not isinstance(resource_key, ValidationResultIdentifier):
+        return None
+
+    return convert_to_json_serializable(
+        data={
+            "success": resource.success,
+            "batch_kwargs": resource.meta.get("batch_kwargs", {}),
+            "batch_spec": resource.meta.get("batch_spec", {}),
+        }
+    )
+
+
+def _get_rendering_exception_message(e: Exception) -> str:
+    exception_message = """\
 An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
 not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
 diagnose and repair the underlying issue.  Detailed information follows:
                 """
-                exception_traceback = traceback.format_exc()
-                exception_message += (
-                    f'{type(e).__name__}: "{str(e)}".  '
-                    f'Traceback: "{exception_traceback}".'
-                )
-                logger.error(exception_message)
+    exception_traceback = traceback.format_exc()
+    exception_message += (
+        f'{type(e).__name__}: "{str(e)}".  ' f'Traceback: "{exception_traceback}".'
+    )
+    return exception_message
+
+
+def _complete_page_write(
+    pending_write: Tuple[
+        DataContextKey, str, Optional[dict], concurrent.futures.Future
+    ],
+    render_manifest: Optional[_SiteSectionRenderManifest],
+) -> None:
+    resource_key, content_hash, index_info, write_future = pending_write
+    try:
+        write_future.result()
+    except Exception as e:
+        logger.error(_get_rendering_exception_message(e))
+        if render_manifest is not None:
+            render_manifest.remove_rendered_resource(resource_key=resource_key)
+        return
+
+    if render_manifest is not None:
+        render_manifest.add_rendered_resource(
+            resource_key=resource_key, content_hash=content_hash, index_info=index_info
+        )
+
+
+def _get_fork_context() -> Optional[multiprocessing.context.BaseContext]:
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return None
+
+    return multiprocessing.get_context("fork")
+
+
+# "DefaultSiteSectionBuilder" whose pages are rendered by the current (forked) rendering process.
+_forked_site_section_builder: Optional[DefaultSiteSectionBuilder] = None
+# Barrier, at which all rendering processes of the current (forked) rendering process' pool wait once started.
+_forked_rendering_processes_barrier: Optional[
+    "multiprocessing.synchronize.Barrier"
+] = None
+
+_RENDERING_PROCESSES_START_TIMEOUT_SECONDS: float = 60.0
+
+
+def _set_forked_site_section_builder(
+    site_section_builder: DefaultSiteSectionBuilder,
+    rendering_processes_barrier: "multiprocessing.synchronize.Barrier",
+) -> None:
+    global _forked_site_section_builder, _forked_rendering_processes_barrier
+    _forked_site_section_builder = site_section_builder
+    _forked_rendering_processes_barrier = rendering_processes_barrier
+
+
+def _start_rendering_processes(
+    render_executor: concurrent.futures.ProcessPoolExecutor, max_workers: int
+) -> None:
+    """Forks all rendering processes before any page is written.
+
+    Forking while other threads (e.g., page writers) hold locks (of logging, of store backend clients, etc.) can
+    deadlock the forked process, and "ProcessPoolExecutor" may fork its processes lazily, as tasks are submitted.  Each
+    of the "max_workers" tasks submitted here waits until all of them run, so that no process becomes idle (and every
+    submission forks a new process) until the pool is full.
+    """
+    futures: List[concurrent.futures.Future] = [
+        render_executor.submit(_wait_for_rendering_processes)
+        for _ in range(max_workers)
+    ]
+    future: concurrent.futures.Future
+    for future in concurrent.futures.as_completed(futures):
+        try:
+            future.result()
+        except Exception as e:
+            # Pages are still rendered by the processes that were started.
+            logger.debug(f"Not all rendering processes could be started: {e}")
+
+
+def _wait_for_rendering_processes() -> None:
+    _forked_rendering_processes_barrier.wait(  # type: ignore[union-attr]
+        timeout=_RENDERING_PROCESSES_START_TIMEOUT_SECONDS
+    )
+
+
+def _render_serialized_page_in_forked_process(
+    resource_key: DataContextKey, serialized_resource: Any
+) -> Tuple[Optional[str], Optional[dict], Optional[str]]:
+    return _forked_site_section_builder._render_serialized_page(  # type: ignore[union-attr]
+        resource_key=resource_key, serialized_resource=serialized_resource
+    )
+
+
+def _get_class_path(obj: Any) -> str:
+    return f"{type(obj).__module__}.{type(obj).__name__}"
+
+
+def _get_content_hash(serialized_resource: Any) -> str:
+    if isinstance(serialized_resource, str):
+        serialized_resource = serialized_resource.encode("utf-8")
+    elif not isinstance(serialized_resource, bytes):
+        serialized_resource = json.dumps(
+            convert_to_json_serializable(data=serialized_resource), sort_keys=True
+        ).encode("utf-8")
+
+    return hashlib.md5(serialized_resource).hexdigest()
+
+
+def _get_render_manifest_resource_key(resource_key: DataContextKey) -> str:
+    # Identical to the relative path of the rendered page (without suffix), which is unique within a site section.
+    return "/".join(resource_key.to_tuple())
 
 
 class DefaultSiteIndexBuilder:
@@ -754,11 +1283,16 @@ class DefaultSiteIndexBuilder:
                 skip_and_clean_missing
             )
         )
+        render_manifest: Optional[dict] = (
+            self.target_store.get_render_manifest()
+            if isinstance(self.target_store, HtmlSiteStore)
+            else None
+        )
         self._add_profiling_to_index_links(
-            index_links_dict, validation_and_profiling_result_site_keys
+            index_links_dict, validation_and_profiling_result_site_keys, render_manifest
         )
         self._add_validations_to_index_links(
-            index_links_dict, validation_and_profiling_result_site_keys
+            index_links_dict, validation_and_profiling_result_site_keys, render_manifest
         )
 
         viewable_content = ""
@@ -866,6 +1400,7 @@ diagnose and repair the underlying issue.  Detailed information follows:
         self,
         index_links_dict: OrderedDict,
         validation_and_profiling_result_site_keys: List[ValidationResultIdentifier],
+        render_manifest: Optional[dict] = None,
     ) -> None:
         profiling = self.site_section_builders_config.get("profiling", "None")
         if profiling and profiling not in FALSEY_YAML_STRINGS:
@@ -881,15 +1416,14 @@ diagnose and repair the underlying issue.  Detailed information follows:
             ]
             for profiling_result_key in profiling_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=profiling_result_key.batch_identifier,
-                        expectation_suite_name=profiling_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=profiling_result_key.run_id,
-                        validations_store_name=self.source_stores.get("profiling"),
+                    index_info: dict = self._get_validation_result_index_info(
+                        section_name="profiling",
+                        validation_result_key=profiling_result_key,
+                        render_manifest=render_manifest,
                     )
 
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
+                    batch_kwargs = index_info["batch_kwargs"]
+                    batch_spec = index_info["batch_spec"]
 
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
@@ -912,6 +1446,7 @@ diagnose and repair the underlying issue.  Detailed information follows:
         self,
         index_links_dict: OrderedDict,
         validation_and_profiling_result_site_keys: List[ValidationResultIdentifier],
+        render_manifest: Optional[dict] = None,
     ) -> None:
         validations = self.site_section_builders_config.get("validations", "None")
         if validations and validations not in FALSEY_YAML_STRINGS:
@@ -936,16 +1471,15 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 ]
             for validation_result_key in validation_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=validation_result_key.batch_identifier,
-                        expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=validation_result_key.run_id,
-                        validations_store_name=self.source_stores.get("validations"),
+                    index_info: dict = self._get_validation_result_index_info(
+                        section_name="validations",
+                        validation_result_key=validation_result_key,
+                        render_manifest=render_manifest,
                     )
 
-                    validation_success = validation.success
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
+                    validation_success = index_info["success"]
+                    batch_kwargs = index_info["batch_kwargs"]
+                    batch_spec = index_info["batch_spec"]
 
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
@@ -965,6 +1499,35 @@ diagnose and repair the underlying issue.  Detailed information follows:
                     error_msg = f"Validation result not found: {str(validation_result_key.to_tuple()):s} - skipping"
                     logger.warning(error_msg)
 
+    def _get_validation_result_index_info(
+        self,
+        section_name: str,
+        validation_result_key: ValidationResultIdentifier,
+        render_manifest: Optional[dict],
+    ) -> dict:
+        """Returns properties of validation result needed for index, preferably as recorded when its page was rendered."""
+        if render_manifest is not None:
+            rendered_resource: dict = (
+                render_manifest["sections"]
+                .get(section_name, {})
+                .get("resources", {})
+                .get(_get_render_manifest_resource_key(validation_result_key), {})
+            )
+            if "index_info" in rendered_resource:
+                return rendered_resource["index_info"]
+
+        validation = self.data_context.get_validation_result(
+            batch_identifier=validation_result_key.batch_identifier,
+            expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
+            run_id=validation_result_key.run_id,
+            validations_store_name=self.source_stores.get(section_name),
+        )
+        return {
+            "success": validation.success,
+            "batch_kwargs": validation.meta.get("batch_kwargs", {}),
+            "batch_spec": validation.meta.get("batch_spec", {}),
+        }
+
 
 class CallToActionButton:
     def __init__(self, title, link) -> None:
@@ -46,6 +46,9 @@ from great_expectations.rule_based_profiler.estimators.numeric_range_estimation_
     NUM_HISTOGRAM_BINS,
     NumericRangeEstimationResult,
 )
+from great_expectations.rule_based_profiler.helpers.validator_pool import (
+    get_active_validator_pool,
+)
 from great_expectations.rule_based_profiler.parameter_container import (
     FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER,
     VARIABLES_PREFIX,
@@ -70,6 +73,9 @@ if TYPE_CHECKING:
     from great_expectations.data_context.data_context.abstract_data_context import (
         AbstractDataContext,
     )
+    from great_expectations.rule_based_profiler.helpers.validator_pool import (
+        ValidatorPool,
+    )
     from great_expectations.validator.validator import Validator
 
 logger = logging.getLogger(__name__)
@@ -131,7 +137,38 @@ def get_validator(
 """
             )
 
-    validator = get_validator_with_expectation_suite(
+    validator_pool: Optional[ValidatorPool] = get_active_validator_pool()
+    if validator_pool is None or data_context is None:
+        return _build_validator(
+            data_context=data_context,
+            batch_list=batch_list,
+            batch_request=batch_request,
+            expectation_suite_name=expectation_suite_name,
+        )
+
+    if batch_list is None or all(batch is None for batch in batch_list):
+        batch_list = validator_pool.get_batch_list(
+            data_context=data_context, batch_request=batch_request
+        )
+
+    return validator_pool.get_validator(
+        batch_list=batch_list,
+        build_validator=lambda pooled_batch_list: _build_validator(
+            data_context=data_context,
+            batch_list=pooled_batch_list,
+            batch_request=None,
+            expectation_suite_name=expectation_suite_name,
+        ),
+    )
+
+
+def _build_validator(
+    data_context: Optional[AbstractDataContext],
+    batch_list: Optional[List[Batch]],
+    batch_request: Optional[Union[BatchRequestBase, dict]],
+    expectation_suite_name: str,
+) -> Validator:
+    validator: Validator = get_validator_with_expectation_suite(
         data_context=data_context,
         batch_list=batch_list,
         batch_request=batch_request,
@@ -168,7 +205,13 @@ def get_batch_ids(
             parameters=parameters,
         )
 
-        batch_list = data_context.get_batch_list(batch_request=batch_request)
+        validator_pool: Optional[ValidatorPool] = get_active_validator_pool()
+        if validator_pool is None:
+            batch_list = data_context.get_batch_list(batch_request=batch_request)
+        else:
+            batch_list = validator_pool.get_batch_list(
+                data_context=data_context, batch_request=batch_request
+            )
 
     batch_ids: List[str] = [batch.id for batch in batch_list]
 
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import logging
+import threading
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from great_expectations.core.batch import (
+    batch_request_contains_batch_data,
+    get_batch_request_as_dict,
+)
+from great_expectations.core.id_dict import IDDict
+from great_expectations.core.util import convert_to_json_serializable
+
+if TYPE_CHECKING:
+    from great_expectations.core.batch import Batch, BatchRequestBase
+    from great_expectations.data_context.data_context.abstract_data_context import (
+        AbstractDataContext,
+    )
+    from great_expectations.validator.validator import Validator
+
+logger = logging.getLogger(__name__)
+
+
+class ValidatorPool:
+    """Cache of loaded "Batch" lists and of "Validator" objects built on them, scoped to one Rule-Based Profiler run.
+
+    Every "DomainBuilder" and "ParameterBuilder" of every "Rule" obtains its own "Validator" for (usually) the same few
+    BatchRequests.  Without pooling, each of them re-executes the BatchRequest (loading the data again) and re-registers
+    the resulting batches with the "ExecutionEngine".  The pool executes each BatchRequest once, and hands out the same
+    "Validator" (hence the same loaded batches and "ExecutionEngine" metric cache) for the same list of batch IDs.
+    """
+
+    def __init__(self) -> None:
+        self._batch_lists: Dict[str, List[Batch]] = {}
+        self._validators: Dict[Tuple[str, ...], Validator] = {}
+        self._lock = threading.RLock()
+
+    def get_batch_list(
+        self,
+        data_context: AbstractDataContext,
+        batch_request: Union[BatchRequestBase, dict],
+    ) -> List[Batch]:
+        """Returns "Batch" list for "batch_request", executing it only if this has not been done in the current run."""
+        batch_request_key: Optional[str] = _get_batch_request_key(
+            batch_request=batch_request
+        )
+        if batch_request_key is None:
+            return data_context.get_batch_list(batch_request=batch_request)
+
+        batch_list: Optional[List[Batch]]
+        with self._lock:
+            batch_list = self._batch_lists.get(batch_request_key)
+            if batch_list is None:
+                batch_list = data_context.get_batch_list(batch_request=batch_request)
+                self._batch_lists[batch_request_key] = batch_list
+
+        return list(batch_list)
+
+    def get_validator(
+        self,
+        batch_list: List[Batch],
+        build_validator: Callable[[List[Batch]], Validator],
+    ) -> Validator:
+        """Returns pooled "Validator" for "batch_list" (built using "build_validator" on first request).
+
+        A pooled "Validator" is returned with the last "Batch" of "batch_list" made active, exactly as it would be for
+        a newly built one, but without loading any of the batches again.  Threads sharing pooled "Validator" objects
+        must run within "thread_scoped_batch_activation()", so that each of them keeps its own active "Batch".
+        """
+        batch: Batch
+        batch_ids: Tuple[str, ...] = tuple(batch.id for batch in batch_list)
+
+        validator: Optional[Validator]
+        with self._lock:
+            validator = self._validators.get(batch_ids)
+            if validator is None:
+                validator = build_validator(batch_list)
+                self._validators[batch_ids] = validator
+            elif batch_ids:
+                _activate_batch_list(validator=validator, batch_list=batch_list)
+
+        return validator
+
+
+def _activate_batch_list(validator: Validator, batch_list: List[Batch]) -> None:
+    batch_manager = validator.execution_engine.batch_manager
+    last_batch_id: str = batch_list[-1].id
+    if batch_manager.active_batch_data_id == last_batch_id:
+        return
+
+    batch: Batch
+    if all(
+        batch.id in batch_manager.batch_cache
+        and batch.id in batch_manager.batch_data_cache
+        for batch in batch_list
+    ):
+        batch_manager.activate_batch(batch_id=last_batch_id)
+    else:
+        # Batch data was evicted from "ExecutionEngine" (e.g., by another consumer); it must be loaded again.
+        validator.load_batch_list(batch_list=batch_list)
+
+
+def _get_batch_request_key(
+    batch_request: Union[BatchRequestBase, dict]
+) -> Optional[str]:
+    """Returns key identifying "batch_request" within one run, or None if "batch_request" cannot be keyed reliably.
+
+    In-memory "batch_data" is represented by its object identity, since its contents are not part of the serialized
+    BatchRequest (and serializing them would defeat the purpose of the pool).
+    """
+    batch_request_as_dict: Optional[dict] = get_batch_request_as_dict(
+        batch_request=batch_request
+    )
+    if not batch_request_as_dict:
+        return None
+
+    batch_request_as_dict = dict(batch_request_as_dict)
+    if batch_request_contains_batch_data(batch_request=batch_request_as_dict):
+        runtime_parameters: dict = dict(batch_request_as_dict["runtime_parameters"])
+        runtime_parameters["batch_data"] = id(runtime_parameters["batch_data"])
+        batch_request_as_dict["runtime_parameters"] = runtime_parameters
+
+    try:
+        return IDDict(convert_to_json_serializable(data=batch_request_as_dict)).to_id()
+    except (TypeError, ValueError):
+        # E.g., "custom_filter_function" callables, which cannot be compared safely.
+        logger.debug("BatchRequest cannot be keyed; it will not be pooled.")
+        return None
+
+
+_active_validator_pool: contextvars.ContextVar[
+    Optional[ValidatorPool]
+] = contextvars.ContextVar("active_validator_pool", default=None)
+
+
+def get_active_validator_pool() -> Optional[ValidatorPool]:
+    """Returns "ValidatorPool" of the enclosing "validator_pool_scope()" (or None outside of any such scope)."""
+    return _active_validator_pool.get()
+
+
+@contextlib.contextmanager
+def validator_pool_scope() -> Iterator[ValidatorPool]:
+    """Makes one "ValidatorPool" active for the duration of the "with" block (nested scopes share the outer pool)."""
+    validator_pool: Optional[ValidatorPool] = _active_validator_pool.get()
+    if validator_pool is not None:
+        yield validator_pool
+        return
+
+    validator_pool = ValidatorPool()
+    token: contextvars.Token = _active_validator_pool.set(validator_pool)
+    try:
+        yield validator_pool
+    finally:
+        _active_validator_pool.reset(token)
@@ -28,6 +28,7 @@ if TYPE_CHECKING:
     from great_expectations.data_context.data_context.abstract_data_context import (
         AbstractDataContext,
     )
+    from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
 class MetricMultiBatchParameterBuilder(ParameterBuilder):
@@ -122,6 +123,46 @@ class MetricMultiBatchParameterBuilder(ParameterBuilder):
     def reduce_scalar_metric(self) -> Union[str, bool]:
         return self._reduce_scalar_metric
 
+    def _get_metric_configurations(
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricConfiguration]:
+        """
+        Returns "MetricConfiguration" objects, which "_build_parameters()" needs, unless its configuration depends on
+        parameters that are computed during execution.
+        """
+        if not self.metric_name or self._references_parameters(
+            value=[
+                self.metric_domain_kwargs,
+                self.metric_value_kwargs,
+                self.single_batch_mode,
+            ]
+        ):
+            return []
+
+        # Obtain single_batch_mode from "rule state" (i.e., variables and parameters); from instance variable otherwise.
+        single_batch_mode: bool = get_parameter_value_and_validate_return_type(
+            domain=domain,
+            parameter_reference=self.single_batch_mode,
+            expected_return_type=bool,
+            variables=variables,
+            parameters=parameters,
+        )
+
+        metric_configurations: List[MetricConfiguration]
+        _, _, _, metric_configurations = self._build_metric_configurations(
+            metric_name=self.metric_name,
+            metric_domain_kwargs=self.metric_domain_kwargs,
+            metric_value_kwargs=self.metric_value_kwargs,
+            limit=1 if single_batch_mode else None,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+        return metric_configurations
+
     def _build_parameters(
         self,
         domain: Domain,
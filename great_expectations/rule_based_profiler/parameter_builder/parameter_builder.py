@@ -51,6 +51,7 @@ from great_expectations.rule_based_profiler.metric_computation_result import (
 )
 from great_expectations.rule_based_profiler.parameter_container import (
     PARAMETER_KEY,
+    PARAMETER_PREFIX,
     RAW_PARAMETER_KEY,
     ParameterContainer,
     build_parameter_container,
@@ -260,6 +261,87 @@ class ParameterBuilder(ABC, Builder):
                     runtime_configuration=runtime_configuration,
                 )
 
+    def get_metric_configurations(
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+    ) -> List[MetricConfiguration]:
+        """
+        Returns "MetricConfiguration" objects, which "build_parameters()" (including its evaluation dependencies) is
+        known to need for given "Domain" before any parameters are computed; this enables "Rule" to resolve metrics of
+        all of its "Domain" objects together (metrics, depending on computed parameters, are not included).
+
+        Args:
+            domain: "Domain" object that is context for execution of this "ParameterBuilder" object.
+            variables: attribute name/value pairs
+            parameters: Dictionary of "ParameterContainer" objects corresponding to all "Domain" objects in memory.
+            batch_list: Explicit list of "Batch" objects to supply data at runtime.
+            batch_request: Explicit batch_request used to supply data at runtime.
+        """
+        self.set_batch_list_if_null_batch_request(
+            batch_list=batch_list,
+            batch_request=batch_request,
+        )
+
+        metric_configurations: List[MetricConfiguration] = []
+
+        evaluation_parameter_builder: ParameterBuilder
+        for evaluation_parameter_builder in self.evaluation_parameter_builders or []:
+            metric_configurations.extend(
+                evaluation_parameter_builder.get_metric_configurations(
+                    domain=domain,
+                    variables=variables,
+                    parameters=parameters,
+                    batch_list=self.batch_list,
+                    batch_request=self.batch_request,
+                )
+            )
+
+        metric_configurations.extend(
+            self._get_metric_configurations(
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+            )
+        )
+
+        return metric_configurations
+
+    def _get_metric_configurations(
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricConfiguration]:
+        """
+        Returns "MetricConfiguration" objects, which "_build_parameters()" of this "ParameterBuilder" is known to need
+        (none, unless implemented by "ParameterBuilder" subclass).
+        """
+        return []
+
+    @staticmethod
+    def _references_parameters(value: Any) -> bool:
+        """Determines whether or not value contains "$parameter"-style references (resolvable only during execution)."""
+        if isinstance(value, str):
+            return value.startswith(PARAMETER_PREFIX)
+
+        if isinstance(value, dict):
+            return any(
+                ParameterBuilder._references_parameters(value=element)
+                for element in value.values()
+            )
+
+        if isinstance(value, (list, tuple, set)):
+            return any(
+                ParameterBuilder._references_parameters(value=element)
+                for element in value
+            )
+
+        return False
+
     @abstractmethod
     def _build_parameters(
         self,
@@ -381,121 +463,69 @@ class ParameterBuilder(ABC, Builder):
 specified (empty "metric_name" value detected)."""
             )
 
-        batch_ids: Optional[List[str]] = self.get_batch_ids(
+        batch_ids: List[str]
+        domain_kwargs: dict
+        metrics_to_resolve: List[MetricConfiguration]
+        (
+            batch_ids,
+            domain_kwargs,
+            metric_value_kwargs,
+            metrics_to_resolve,
+        ) = self._build_metric_configurations(
+            metric_name=metric_name,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=metric_value_kwargs,
             limit=limit,
             domain=domain,
             variables=variables,
             parameters=parameters,
         )
-        if not batch_ids:
-            raise gx_exceptions.ProfilerExecutionError(
-                message=f"Utilizing a {self.__class__.__name__} requires a non-empty list of Batch identifiers."
-            )
-
-        """
-        Compute metrics, corresponding to multiple "MetricConfiguration" directives, together, rather than individually.
-
-        As a strategy, since "metric_domain_kwargs" changes depending on "batch_id", "metric_value_kwargs" serves as
-        identifying entity (through "AttributedResolvedMetrics") for accessing resolved metrics (computation results).
 
-        All "MetricConfiguration" directives are generated by combining each metric_value_kwargs" with
-        "metric_domain_kwargs" for all "batch_ids" (where every "metric_domain_kwargs" represents separate "batch_id").
-        Then, all "MetricConfiguration" objects, collected into list as container, are resolved simultaneously.
-        """
-
-        # Step-1: Gather "metric_domain_kwargs" (corresponding to "batch_ids").
+        # Step-4: Resolve all metrics in one operation simultaneously.
 
-        domain_kwargs: dict = build_metric_domain_kwargs(
-            batch_id=None,
-            metric_domain_kwargs=metric_domain_kwargs,
+        # The Validator object used for metric calculation purposes.
+        validator: Validator = self.get_validator(
             domain=domain,
             variables=variables,
             parameters=parameters,
         )
 
-        batch_id: str
-
-        metric_domain_kwargs = [
-            copy.deepcopy(
-                build_metric_domain_kwargs(
-                    batch_id=batch_id,
-                    metric_domain_kwargs=copy.deepcopy(domain_kwargs),
-                    domain=domain,
-                    variables=variables,
-                    parameters=parameters,
-                )
-            )
-            for batch_id in batch_ids
-        ]
-
-        # Step-2: Gather "metric_value_kwargs" (caller may require same metric computed for multiple arguments).
-
-        if not isinstance(metric_value_kwargs, list):
-            metric_value_kwargs = [metric_value_kwargs]
-
-        value_kwargs_cursor: dict
-        metric_value_kwargs = [
-            # Obtain value kwargs from "rule state" (i.e., variables and parameters); from instance variable otherwise.
-            get_parameter_value_and_validate_return_type(
-                domain=domain,
-                parameter_reference=value_kwargs_cursor,
-                expected_return_type=None,
-                variables=variables,
-                parameters=parameters,
+        # Metrics, resolved ahead of time for all "Domain" objects of "Rule" (see "Rule.run()"), are not recomputed.
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        if runtime_configuration and runtime_configuration.get(
+            "plan_metrics_across_domains", False
+        ):
+            resolved_metrics = validator.metrics_calculator.get_cached_metrics(
+                metric_configurations=metrics_to_resolve
             )
-            for value_kwargs_cursor in metric_value_kwargs
-        ]
-
-        # Step-3: Generate "MetricConfiguration" directives for all "metric_domain_kwargs"/"metric_value_kwargs" pairs.
 
-        domain_kwargs_cursor: dict
-        kwargs_combinations: List[List[dict]] = [
-            [domain_kwargs_cursor, value_kwargs_cursor]
-            for value_kwargs_cursor in metric_value_kwargs
-            for domain_kwargs_cursor in metric_domain_kwargs
+        metrics_to_compute: List[MetricConfiguration] = [
+            metric_configuration
+            for metric_configuration in metrics_to_resolve
+            if metric_configuration.id not in resolved_metrics
         ]
-
-        metrics_to_resolve: List[MetricConfiguration]
-
-        kwargs_pair_cursor: List[dict, dict]
-        metrics_to_resolve = [
-            MetricConfiguration(
-                metric_name=metric_name,
-                metric_domain_kwargs=kwargs_pair_cursor[0],
-                metric_value_kwargs=kwargs_pair_cursor[1],
+        if metrics_to_compute:
+            graph: ValidationGraph = (
+                validator.metrics_calculator.build_metric_dependency_graph(
+                    metric_configurations=metrics_to_compute,
+                    runtime_configuration=runtime_configuration,
+                )
             )
-            for kwargs_pair_cursor in kwargs_combinations
-        ]
-
-        # Step-4: Resolve all metrics in one operation simultaneously.
-
-        # The Validator object used for metric calculation purposes.
-        validator: Validator = self.get_validator(
-            domain=domain,
-            variables=variables,
-            parameters=parameters,
-        )
 
-        graph: ValidationGraph = (
-            validator.metrics_calculator.build_metric_dependency_graph(
-                metric_configurations=metrics_to_resolve,
+            computed_metrics: Dict[Tuple[str, str, str], MetricValue]
+            aborted_metrics_info: Dict[
+                Tuple[str, str, str],
+                Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
+            ]
+            (
+                computed_metrics,
+                aborted_metrics_info,
+            ) = validator.metrics_calculator.resolve_validation_graph_and_handle_aborted_metrics_info(
+                graph=graph,
                 runtime_configuration=runtime_configuration,
+                min_graph_edges_pbar_enable=0,
             )
-        )
-
-        resolved_metrics: Dict[Tuple[str, str, str], MetricValue]
-        aborted_metrics_info: Dict[
-            Tuple[str, str, str],
-            Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
-        ]
-        (
-            resolved_metrics,
-            aborted_metrics_info,
-        ) = validator.metrics_calculator.resolve_validation_graph_and_handle_aborted_metrics_info(
-            graph=graph,
-            runtime_configuration=runtime_configuration,
-            min_graph_edges_pbar_enable=0,
-        )
+            resolved_metrics.update(computed_metrics)
 
         # Step-5: Map resolved metrics to their attributes for identification and recovery by receiver.
 
@@ -588,6 +618,115 @@ specified (empty "metric_name" value detected)."""
             details=details,
         )
 
+    def _build_metric_configurations(
+        self,
+        metric_name: str,
+        metric_domain_kwargs: Optional[
+            Union[Union[str, dict], List[Union[str, dict]]]
+        ] = None,
+        metric_value_kwargs: Optional[
+            Union[Union[str, dict], List[Union[str, dict]]]
+        ] = None,
+        limit: Optional[int] = None,
+        domain: Optional[Domain] = None,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> Tuple[List[str], dict, List[dict], List[MetricConfiguration]]:
+        """
+        Generates "MetricConfiguration" directives of specified metric for all "Batch" objects (see "get_metrics()").
+
+        Returns:
+            Batch identifiers, "metric_domain_kwargs" (without "batch_id"), list of "metric_value_kwargs", and
+            "MetricConfiguration" objects for all "batch_id" and "metric_value_kwargs" combinations.
+        """
+        batch_ids: Optional[List[str]] = self.get_batch_ids(
+            limit=limit,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+        if not batch_ids:
+            raise gx_exceptions.ProfilerExecutionError(
+                message=f"Utilizing a {self.__class__.__name__} requires a non-empty list of Batch identifiers."
+            )
+
+        """
+        Compute metrics, corresponding to multiple "MetricConfiguration" directives, together, rather than individually.
+
+        As a strategy, since "metric_domain_kwargs" changes depending on "batch_id", "metric_value_kwargs" serves as
+        identifying entity (through "AttributedResolvedMetrics") for accessing resolved metrics (computation results).
+
+        All "MetricConfiguration" directives are generated by combining each metric_value_kwargs" with
+        "metric_domain_kwargs" for all "batch_ids" (where every "metric_domain_kwargs" represents separate "batch_id").
+        Then, all "MetricConfiguration" objects, collected into list as container, are resolved simultaneously.
+        """
+
+        # Step-1: Gather "metric_domain_kwargs" (corresponding to "batch_ids").
+
+        domain_kwargs: dict = build_metric_domain_kwargs(
+            batch_id=None,
+            metric_domain_kwargs=metric_domain_kwargs,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+
+        batch_id: str
+
+        metric_domain_kwargs = [
+            copy.deepcopy(
+                build_metric_domain_kwargs(
+                    batch_id=batch_id,
+                    metric_domain_kwargs=copy.deepcopy(domain_kwargs),
+                    domain=domain,
+                    variables=variables,
+                    parameters=parameters,
+                )
+            )
+            for batch_id in batch_ids
+        ]
+
+        # Step-2: Gather "metric_value_kwargs" (caller may require same metric computed for multiple arguments).
+
+        if not isinstance(metric_value_kwargs, list):
+            metric_value_kwargs = [metric_value_kwargs]
+
+        value_kwargs_cursor: dict
+        metric_value_kwargs = [
+            # Obtain value kwargs from "rule state" (i.e., variables and parameters); from instance variable otherwise.
+            get_parameter_value_and_validate_return_type(
+                domain=domain,
+                parameter_reference=value_kwargs_cursor,
+                expected_return_type=None,
+                variables=variables,
+                parameters=parameters,
+            )
+            for value_kwargs_cursor in metric_value_kwargs
+        ]
+
+        # Step-3: Generate "MetricConfiguration" directives for all "metric_domain_kwargs"/"metric_value_kwargs" pairs.
+
+        domain_kwargs_cursor: dict
+        kwargs_combinations: List[List[dict]] = [
+            [domain_kwargs_cursor, value_kwargs_cursor]
+            for value_kwargs_cursor in metric_value_kwargs
+            for domain_kwargs_cursor in metric_domain_kwargs
+        ]
+
+        metrics_to_resolve: List[MetricConfiguration]
+
+        kwargs_pair_cursor: List[dict, dict]
+        metrics_to_resolve = [
+            MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs=kwargs_pair_cursor[0],
+                metric_value_kwargs=kwargs_pair_cursor[1],
+            )
+            for kwargs_pair_cursor in kwargs_combinations
+        ]
+
+        return batch_ids, domain_kwargs, metric_value_kwargs, metrics_to_resolve
+
     @staticmethod
     def _sanitize_metric_computation(
         parameter_builder: ParameterBuilder,
@@ -1,8 +1,13 @@
+from __future__ import annotations
+
+import contextvars
 import copy
 import json
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
+from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
 from great_expectations.core.batch import Batch, BatchRequestBase  # noqa: TCH001
+from great_expectations.core.batch_manager import thread_scoped_batch_activation
 from great_expectations.core.domain import Domain  # noqa: TCH001
 from great_expectations.core.util import (
     convert_to_json_serializable,
@@ -18,6 +23,7 @@ from great_expectations.rule_based_profiler.domain_builder import (
 )
 from great_expectations.rule_based_profiler.expectation_configuration_builder import (
     ExpectationConfigurationBuilder,  # noqa: TCH001
+    init_rule_expectation_configuration_builders,
 )
 from great_expectations.rule_based_profiler.helpers.configuration_reconciliation import (
     DEFAULT_RECONCILATION_DIRECTIVES,
@@ -29,6 +35,7 @@ from great_expectations.rule_based_profiler.helpers.util import (
 )
 from great_expectations.rule_based_profiler.parameter_builder import (
     ParameterBuilder,  # noqa: TCH001
+    init_rule_parameter_builders,
 )
 from great_expectations.rule_based_profiler.parameter_container import (
     ParameterContainer,
@@ -41,6 +48,14 @@ from great_expectations.util import (
     measure_execution_time,
 )
 
+if TYPE_CHECKING:
+    from great_expectations.data_context.data_context.abstract_data_context import (
+        AbstractDataContext,
+    )
+    from great_expectations.rule_based_profiler.builder import Builder
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+    from great_expectations.validator.validator import Validator
+
 
 class Rule(SerializableDictDot):
     def __init__(
@@ -140,6 +155,41 @@ class Rule(SerializableDictDot):
 
         rule_state.reset_parameter_containers()
 
+        if runtime_configuration and runtime_configuration.get(
+            "plan_metrics_across_domains", False
+        ):
+            self._resolve_metrics_for_all_domains(
+                domains=domains,
+                variables=variables,
+                batch_list=batch_list,
+                batch_request=batch_request,
+                runtime_configuration=runtime_configuration,
+            )
+
+        data_context: Optional[AbstractDataContext] = (
+            self.domain_builder.data_context if self.domain_builder else None
+        )
+        max_domain_concurrency: int = (runtime_configuration or {}).get(
+            "max_domain_concurrency", len(domains)
+        )
+
+        # Domains are profiled concurrently only if concurrency is enabled in "DataContext" configuration.
+        with AsyncExecutor(
+            concurrency_config=data_context.concurrency if data_context else None,
+            max_workers=min(max_domain_concurrency, len(domains)),
+        ) as async_executor:
+            if async_executor.execute_concurrently:
+                self._build_parameters_for_domains_concurrently(
+                    async_executor=async_executor,
+                    domains=domains,
+                    variables=variables,
+                    rule_state=rule_state,
+                    batch_list=batch_list,
+                    batch_request=batch_request,
+                    runtime_configuration=runtime_configuration,
+                )
+                return rule_state
+
         pbar_method: Callable = determine_progress_bar_method_by_environment()
 
         domain: Domain
@@ -151,35 +201,17 @@ class Rule(SerializableDictDot):
             bar_format="{desc:25}{percentage:3.0f}%|{bar}{r_bar}",
         ):
             rule_state.initialize_parameter_container_for_domain(domain=domain)
-
-            parameter_builders: List[ParameterBuilder] = self.parameter_builders or []
-            parameter_builder: ParameterBuilder
-            for parameter_builder in parameter_builders:
-                parameter_builder.build_parameters(
-                    domain=domain,
-                    variables=variables,
-                    parameters=rule_state.parameters,
-                    parameter_computation_impl=None,
-                    batch_list=batch_list,
-                    batch_request=batch_request,
-                    runtime_configuration=runtime_configuration,
-                )
-
-            expectation_configuration_builders: List[
-                ExpectationConfigurationBuilder
-            ] = (self.expectation_configuration_builders or [])
-
-            expectation_configuration_builder: ExpectationConfigurationBuilder
-
-            for expectation_configuration_builder in expectation_configuration_builders:
-                expectation_configuration_builder.resolve_validation_dependencies(
-                    domain=domain,
-                    variables=variables,
-                    parameters=rule_state.parameters,
-                    batch_list=batch_list,
-                    batch_request=batch_request,
-                    runtime_configuration=runtime_configuration,
-                )
+            self._build_parameters_for_domain(
+                domain=domain,
+                variables=variables,
+                parameters=rule_state.parameters,
+                parameter_builders=self.parameter_builders or [],
+                expectation_configuration_builders=self.expectation_configuration_builders
+                or [],
+                batch_list=batch_list,
+                batch_request=batch_request,
+                runtime_configuration=runtime_configuration,
+            )
 
         return rule_state
 
@@ -295,6 +327,231 @@ class Rule(SerializableDictDot):
         """
         return self.__repr__()
 
+    def _resolve_metrics_for_all_domains(
+        self,
+        domains: List[Domain],
+        variables: Optional[ParameterContainer] = None,
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> None:
+        """
+        Resolves metrics, which "ParameterBuilder" objects are known to need, for all "Domain" objects together (rather
+        than "Domain" by "Domain"), enabling "ExecutionEngine" to bundle them (e.g., to fuse column aggregates into few
+        queries).  Resolved metrics are retained in metric cache of "ExecutionEngine", where "ParameterBuilder" objects
+        find them, when parameters are subsequently built for every "Domain".
+        """
+        # Parameters are not yet computed; hence, metrics depending on them are not planned.
+        parameters: Dict[str, ParameterContainer] = {
+            domain.id: ParameterContainer(parameter_nodes=None) for domain in domains
+        }
+
+        # Metrics, computed by the same "ExecutionEngine", are resolved as one "ValidationGraph".
+        metric_configurations_by_execution_engine: Dict[
+            int, Tuple[Validator, List[MetricConfiguration]]
+        ] = {}
+
+        parameter_builders: List[ParameterBuilder] = self.parameter_builders or []
+        parameter_builder: ParameterBuilder
+        for parameter_builder in parameter_builders:
+            domain: Domain
+            metric_configurations: List[MetricConfiguration] = [
+                metric_configuration
+                for domain in domains
+                for metric_configuration in parameter_builder.get_metric_configurations(
+                    domain=domain,
+                    variables=variables,
+                    parameters=parameters,
+                    batch_list=batch_list,
+                    batch_request=batch_request,
+                )
+            ]
+            if not metric_configurations:
+                continue
+
+            validator: Optional[Validator] = parameter_builder.get_validator(
+                domain=None,
+                variables=variables,
+                parameters=parameters,
+            )
+            if validator is None or validator.execution_engine.metric_cache is None:
+                continue
+
+            execution_engine_id: int = id(validator.execution_engine)
+            if execution_engine_id in metric_configurations_by_execution_engine:
+                metric_configurations_by_execution_engine[execution_engine_id][
+                    1
+                ].extend(metric_configurations)
+            else:
+                metric_configurations_by_execution_engine[execution_engine_id] = (
+                    validator,
+                    metric_configurations,
+                )
+
+        for (
+            validator,
+            metric_configurations,
+        ) in metric_configurations_by_execution_engine.values():
+            validator.metrics_calculator.compute_metrics(
+                metric_configurations=metric_configurations,
+                runtime_configuration=runtime_configuration,
+                min_graph_edges_pbar_enable=0,
+            )
+
+    @staticmethod
+    def _build_parameters_for_domain(
+        domain: Domain,
+        variables: Optional[ParameterContainer],
+        parameters: Dict[str, ParameterContainer],
+        parameter_builders: List[ParameterBuilder],
+        expectation_configuration_builders: List[ExpectationConfigurationBuilder],
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> None:
+        parameter_builder: ParameterBuilder
+        for parameter_builder in parameter_builders:
+            parameter_builder.build_parameters(
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+                parameter_computation_impl=None,
+                batch_list=batch_list,
+                batch_request=batch_request,
+                runtime_configuration=runtime_configuration,
+            )
+
+        expectation_configuration_builder: ExpectationConfigurationBuilder
+        for expectation_configuration_builder in expectation_configuration_builders:
+            expectation_configuration_builder.resolve_validation_dependencies(
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+                batch_list=batch_list,
+                batch_request=batch_request,
+                runtime_configuration=runtime_configuration,
+            )
+
+    def _build_parameters_for_domains_concurrently(
+        self,
+        async_executor: AsyncExecutor,
+        domains: List[Domain],
+        variables: Optional[ParameterContainer],
+        rule_state: RuleState,
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> None:
+        """
+        Builds parameters of every "Domain" on its own thread.  Since "Builder" objects keep per-call state, each thread
+        instantiates its own "Builder" objects from configuration of this "Rule" and its own "ParameterContainer"; these
+        are then merged into "RuleState" in order of "Domain" objects, making outcome identical to that of serial run.
+        """
+        rule_config: dict = self.to_dict()
+        data_context: Optional[AbstractDataContext] = self.domain_builder.data_context
+
+        domain: Domain
+        for domain in domains:
+            rule_state.initialize_parameter_container_for_domain(domain=domain)
+
+        # Threads start with empty "contextvars" context; copying it propagates state, scoped to profiler run.
+        async_results: List[AsyncResult[ParameterContainer]] = [
+            async_executor.submit(
+                contextvars.copy_context().run,
+                self._build_parameters_for_domain_in_isolation,
+                domain=domain,
+                variables=variables,
+                rule_config=rule_config,
+                data_context=data_context,
+                batch_list=batch_list,
+                batch_request=batch_request,
+                runtime_configuration=runtime_configuration,
+            )
+            for domain in domains
+        ]
+
+        pbar_method: Callable = determine_progress_bar_method_by_environment()
+
+        async_result: AsyncResult[ParameterContainer]
+        for domain, async_result in pbar_method(
+            list(zip(domains, async_results)),
+            desc="Profiling Dataset:",
+            position=1,
+            leave=False,
+            bar_format="{desc:25}{percentage:3.0f}%|{bar}{r_bar}",
+        ):
+            rule_state.parameters[domain.id] = async_result.result()
+
+    def _build_parameters_for_domain_in_isolation(
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer],
+        rule_config: dict,
+        data_context: Optional[AbstractDataContext],
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> ParameterContainer:
+        parameters: Dict[str, ParameterContainer] = {
+            domain.id: ParameterContainer(parameter_nodes=None)
+        }
+        parameter_builders: List[ParameterBuilder] = (
+            init_rule_parameter_builders(
+                parameter_builder_configs=rule_config["parameter_builders"],
+                data_context=data_context,
+            )
+            or []
+        )
+        expectation_configuration_builders: List[
+            ExpectationConfigurationBuilder
+        ] = init_rule_expectation_configuration_builders(
+            expectation_configuration_builder_configs=rule_config[
+                "expectation_configuration_builders"
+            ]
+            or [],
+            data_context=data_context,
+        )
+        Rule._copy_batch_specifications(
+            source_builders=self.parameter_builders or [],
+            builders=parameter_builders,
+        )
+        Rule._copy_batch_specifications(
+            source_builders=self.expectation_configuration_builders or [],
+            builders=expectation_configuration_builders,
+        )
+
+        # Pooled "Validator" objects share "ExecutionEngine" across threads; Batch, activated by other threads, must not
+        # become active Batch of this thread's metric computations.
+        with thread_scoped_batch_activation():
+            self._build_parameters_for_domain(
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+                parameter_builders=parameter_builders,
+                expectation_configuration_builders=expectation_configuration_builders,
+                batch_list=batch_list,
+                batch_request=batch_request,
+                runtime_configuration=runtime_configuration,
+            )
+        return parameters[domain.id]
+
+    @staticmethod
+    def _copy_batch_specifications(
+        source_builders: List[Builder], builders: List[Builder]
+    ) -> None:
+        """
+        Configuration of "Builder" excludes "batch_request" and "batch_list", set on it dynamically; these are copied
+        from "Builder" objects of this "Rule", so that "Builder" objects, instantiated from this configuration, use the
+        same Batch data as they would in serial run.
+        """
+        source_builder: Builder
+        builder: Builder
+        for source_builder, builder in zip(source_builders, builders):
+            if source_builder.batch_request is not None:
+                builder.batch_request = source_builder.batch_request
+            elif source_builder.batch_list is not None:
+                builder.batch_list = source_builder.batch_list
+
     def _get_parameter_builders_as_dict(self) -> Dict[str, ParameterBuilder]:
         parameter_builders: List[ParameterBuilder] = self.parameter_builders or []
 
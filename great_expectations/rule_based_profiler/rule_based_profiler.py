@@ -57,6 +57,9 @@ from great_expectations.rule_based_profiler.helpers.configuration_reconciliation
 from great_expectations.rule_based_profiler.helpers.util import (
     convert_variables_to_dict,
 )
+from great_expectations.rule_based_profiler.helpers.validator_pool import (
+    validator_pool_scope,
+)
 from great_expectations.rule_based_profiler.parameter_builder import (
     ParameterBuilder,
     init_rule_parameter_builders,
@@ -316,23 +319,25 @@ class BaseRuleBasedProfiler(ConfigPeer):
 
         rule_state: RuleState
         rule: Rule
-        for rule in pbar_method(
-            effective_rules,
-            desc="Generating Expectations:",
-            disable=disable,
-            position=0,
-            leave=True,
-            bar_format="{desc:25}{percentage:3.0f}%|{bar}{r_bar}",
-        ):
-            rule_state = rule.run(
-                variables=effective_variables,
-                batch_list=batch_list,
-                batch_request=batch_request,
-                runtime_configuration=runtime_configuration,
-                reconciliation_directives=reconciliation_directives,
-                rule_state=RuleState(),
-            )
-            self.rule_states.append(rule_state)
+        # Batches (and Validators built on them) are loaded once per run and shared by all Rules and their Builders.
+        with validator_pool_scope():
+            for rule in pbar_method(
+                effective_rules,
+                desc="Generating Expectations:",
+                disable=disable,
+                position=0,
+                leave=True,
+                bar_format="{desc:25}{percentage:3.0f}%|{bar}{r_bar}",
+            ):
+                rule_state = rule.run(
+                    variables=effective_variables,
+                    batch_list=batch_list,
+                    batch_request=batch_request,
+                    runtime_configuration=runtime_configuration,
+                    reconciliation_directives=reconciliation_directives,
+                    rule_state=RuleState(),
+                )
+                self.rule_states.append(rule_state)
 
         return RuleBasedProfilerResult(
             fully_qualified_parameter_names_by_domain=self.get_fully_qualified_parameter_names_by_domain(),
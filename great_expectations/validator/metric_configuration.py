@@ -3,7 +3,7 @@ from typing import Optional, Tuple
 
 from great_expectations.core._docs_decorators import public_api
 from great_expectations.core.domain import Domain
-from great_expectations.core.id_dict import IDDict
+from great_expectations.core.id_dict import FrozenIDDict, IDDict
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.util import convert_to_json_serializable
 
@@ -33,17 +33,13 @@ class MetricConfiguration:
     ) -> None:
         self._metric_name = metric_name
 
-        if not isinstance(metric_domain_kwargs, IDDict):
-            metric_domain_kwargs = IDDict(metric_domain_kwargs)
-
-        self._metric_domain_kwargs: IDDict = metric_domain_kwargs
-
-        if not isinstance(metric_value_kwargs, IDDict):
-            if metric_value_kwargs is None:
-                metric_value_kwargs = {}
-            metric_value_kwargs = IDDict(metric_value_kwargs)
-
-        self._metric_value_kwargs: IDDict = metric_value_kwargs
+        # Immutable kwargs compute their ids (looked up for every use of "MetricConfiguration.id") only once.
+        self._metric_domain_kwargs: FrozenIDDict = self._freeze_metric_kwargs(
+            metric_kwargs=metric_domain_kwargs
+        )
+        self._metric_value_kwargs: FrozenIDDict = self._freeze_metric_kwargs(
+            metric_kwargs=metric_value_kwargs
+        )
 
         self._metric_dependencies: IDDict = IDDict({})
 
@@ -58,13 +54,25 @@ class MetricConfiguration:
         return self._metric_name
 
     @property
-    def metric_domain_kwargs(self) -> IDDict:
+    def metric_domain_kwargs(self) -> FrozenIDDict:
         return self._metric_domain_kwargs
 
+    @metric_domain_kwargs.setter
+    def metric_domain_kwargs(self, metric_domain_kwargs: dict) -> None:
+        self._metric_domain_kwargs = self._freeze_metric_kwargs(
+            metric_kwargs=metric_domain_kwargs
+        )
+
     @property
-    def metric_value_kwargs(self) -> IDDict:
+    def metric_value_kwargs(self) -> FrozenIDDict:
         return self._metric_value_kwargs
 
+    @metric_value_kwargs.setter
+    def metric_value_kwargs(self, metric_value_kwargs: Optional[dict]) -> None:
+        self._metric_value_kwargs = self._freeze_metric_kwargs(
+            metric_kwargs=metric_value_kwargs
+        )
+
     @property
     def metric_domain_kwargs_id(self) -> str:
         return self.metric_domain_kwargs.to_id()
@@ -157,6 +165,16 @@ class MetricConfiguration:
             self.metric_value_kwargs_id,
         )
 
+    @staticmethod
+    def _freeze_metric_kwargs(metric_kwargs: Optional[dict]) -> FrozenIDDict:
+        if isinstance(metric_kwargs, FrozenIDDict):
+            return metric_kwargs
+
+        if metric_kwargs is None:
+            metric_kwargs = {}
+
+        return FrozenIDDict(metric_kwargs)
+
     @public_api
     def to_json_dict(self) -> dict:
         """Returns a JSON-serializable dict representation of this MetricConfiguration.
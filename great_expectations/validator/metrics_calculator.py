@@ -11,11 +11,16 @@ from great_expectations.validator.metric_configuration import MetricConfiguratio
 from great_expectations.validator.validation_graph import ValidationGraph
 
 if TYPE_CHECKING:
+    from great_expectations.core.id_dict import IDDict
     from great_expectations.execution_engine import ExecutionEngine
+    from great_expectations.execution_engine.metric_cache import MetricCache
 
 logger = logging.getLogger(__name__)
 logging.captureWarnings(True)
 
+# Sentinel, distinguishing absent cache entries from cached "None" metric values.
+_MISSING_METRIC_VALUE = object()
+
 
 class MetricsCalculator:
     def __init__(
@@ -160,6 +165,7 @@ class MetricsCalculator:
         self,
         metric_configurations: List[MetricConfiguration],
         runtime_configuration: Optional[dict] = None,
+        metric_dependencies_cache: Optional[Dict[Tuple[str, str, str], IDDict]] = None,
     ) -> ValidationGraph:
         """
         Obtain domain and value keys for metrics and proceeds to add these metrics to the validation graph
@@ -168,12 +174,15 @@ class MetricsCalculator:
         Args:
             metric_configurations: List of "MetricConfiguration" objects, for which to build combined "ValidationGraph".
             runtime_configuration: Additional run-time settings (see "Validator.DEFAULT_RUNTIME_CONFIGURATION").
+            metric_dependencies_cache: Dependencies of already expanded metrics, shared among graphs built with the
+                same "runtime_configuration" (see "ValidationGraph").
 
         Returns:
             Resulting "ValidationGraph" object.
         """
         graph: ValidationGraph = ValidationGraph(
-            execution_engine=self._execution_engine
+            execution_engine=self._execution_engine,
+            metric_dependencies_cache=metric_dependencies_cache,
         )
 
         metric_configuration: MetricConfiguration
@@ -185,6 +194,43 @@ class MetricsCalculator:
 
         return graph
 
+    def get_cached_metrics(
+        self,
+        metric_configurations: List[MetricConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """
+        Looks up metrics, already resolved and held in metric cache of "ExecutionEngine" (default kwargs are set first).
+
+        Args:
+            metric_configurations: List of desired MetricConfiguration objects.
+
+        Returns:
+            Dictionary with cached metrics, with unique metric ID as key and computed metric as value.
+        """
+        metric_cache: Optional[MetricCache] = self._execution_engine.metric_cache
+        if metric_cache is None:
+            return {}
+
+        graph: ValidationGraph = ValidationGraph(
+            execution_engine=self._execution_engine
+        )
+
+        cached_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        metric_configuration: MetricConfiguration
+        metric_value: MetricValue
+        for metric_configuration in metric_configurations:
+            graph.set_metric_configuration_default_kwargs_if_absent(
+                metric_configuration=metric_configuration
+            )
+            metric_value = metric_cache.get(
+                metric_configuration.id, _MISSING_METRIC_VALUE
+            )
+            if metric_value is not _MISSING_METRIC_VALUE:
+                cached_metrics[metric_configuration.id] = metric_value
+
+        return cached_metrics
+
     def resolve_validation_graph_and_handle_aborted_metrics_info(
         self,
         graph: ValidationGraph,
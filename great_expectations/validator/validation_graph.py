@@ -2,10 +2,15 @@ from __future__ import annotations
 
 import logging
 import traceback
+from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
 from typing import (
     TYPE_CHECKING,
     Callable,
+    ContextManager,
     Dict,
+    Iterable,
     List,
     Optional,
     Set,
@@ -30,6 +35,7 @@ from great_expectations.validator.metric_configuration import (
 )
 
 if TYPE_CHECKING:
+    from great_expectations.execution_engine.metric_cache import MetricCache
     from great_expectations.expectations.metrics.metric_provider import MetricProvider
 
 logger = logging.getLogger(__name__)
@@ -65,24 +71,79 @@ class MetricEdge:
 
 
 class ValidationGraph:
+    """ValidationGraph holds "MetricEdge" objects (metric dependencies) of metrics, which are to be resolved together.
+
+    Args:
+        execution_engine: "ExecutionEngine" object, which computes metrics contained within this "ValidationGraph" object.
+        edges: Initial "MetricEdge" objects.
+        scheduler: "MetricResolutionScheduler" object, which orchestrates resolution of metrics.
+        metric_dependencies_cache: Dependencies of already expanded metrics (keyed by metric ID), which may be shared
+            among graphs, built with the same "runtime_configuration", so that shared subgraphs are only expanded once.
+    """
+
     def __init__(
         self,
         execution_engine: ExecutionEngine,
         edges: Optional[List[MetricEdge]] = None,
+        scheduler: Optional[MetricResolutionScheduler] = None,
+        metric_dependencies_cache: Optional[Dict[Tuple[str, str, str], IDDict]] = None,
     ) -> None:
         self._execution_engine = execution_engine
+        self._scheduler = scheduler
+
+        if metric_dependencies_cache is None:
+            metric_dependencies_cache = {}
+
+        self._metric_dependencies_cache = metric_dependencies_cache
+        self._expanded_metric_ids: Set[Tuple[str, str, str]] = set()
+
+        self._edges: List[MetricEdge] = []
+        self._edge_ids: Set[Tuple[str, str]] = set()
+
+        # Adjacency index: metrics, appearing on the left side of some edge, and IDs of metrics they depend on.
+        self._metric_configurations: Dict[
+            Tuple[str, str, str], MetricConfiguration
+        ] = {}
+        self._dependency_ids: Dict[Tuple[str, str, str], Set[Tuple[str, str, str]]] = {}
 
         if edges:
-            self._edges = edges
-        else:
-            self._edges = []
+            edge: MetricEdge
+            for edge in edges:
+                self._index(edge=edge)
 
-        self._edge_ids = {edge.id for edge in self._edges}
+            self._edges = edges
+            self._edge_ids = {edge.id for edge in self._edges}
 
     def __eq__(self, other) -> bool:
         """Supports comparing two "ValidationGraph" objects."""
         return self.edge_ids == other.edge_ids
 
+    @property
+    def execution_engine(self) -> ExecutionEngine:
+        """Returns "ExecutionEngine" object, which computes metrics contained within this "ValidationGraph" object."""
+        return self._execution_engine
+
+    @property
+    def scheduler(self) -> MetricResolutionScheduler:
+        """Returns "MetricResolutionScheduler" object, which orchestrates resolution of this "ValidationGraph" object.
+
+        Unless a scheduler was supplied explicitly, metrics are resolved concurrently (as soon as their dependencies are
+        available) if "ExecutionEngine" permits more than one concurrent metric resolution; otherwise, level by level.
+        """
+        if self._scheduler is not None:
+            return self._scheduler
+
+        # Only genuine "ExecutionEngine" objects declare their concurrency limits; stand-ins are resolved level by level.
+        if (
+            isinstance(self._execution_engine, ExecutionEngine)
+            and self._execution_engine.max_metric_resolution_concurrency > 1
+        ):
+            return ConcurrentMetricResolutionScheduler(
+                max_workers=self._execution_engine.max_metric_resolution_concurrency
+            )
+
+        return LevelByLevelMetricResolutionScheduler()
+
     @property
     def edges(self) -> List[MetricEdge]:
         """Returns "MetricEdge" objects, contained within this "ValidationGraph" object (as list)."""
@@ -98,6 +159,15 @@ class ValidationGraph:
         if edge.id not in self._edge_ids:
             self._edges.append(edge)
             self._edge_ids.add(edge.id)
+            self._index(edge=edge)
+
+    def _index(self, edge: MetricEdge) -> None:
+        self._metric_configurations.setdefault(edge.left.id, edge.left)
+        dependency_ids: Set[Tuple[str, str, str]] = self._dependency_ids.setdefault(
+            edge.left.id, set()
+        )
+        if edge.right is not None:
+            dependency_ids.add(edge.right.id)
 
     def build_metric_dependency_graph(
         self,
@@ -122,11 +192,29 @@ class ValidationGraph:
             metric_configuration=metric_configuration
         )
 
-        metric_dependencies = metric_impl_klass.get_evaluation_dependencies(
-            metric=metric_configuration,
-            execution_engine=self._execution_engine,
-            runtime_configuration=runtime_configuration,
+        metric_id: Tuple[str, str, str] = metric_configuration.id
+
+        # Subgraphs, shared by several metrics (e.g., "table.columns"), are only expanded once.
+        if metric_id in self._expanded_metric_ids:
+            if self._metric_dependencies_cache.get(metric_id):
+                metric_configuration.metric_dependencies = (
+                    self._metric_dependencies_cache[metric_id]
+                )
+
+            return
+
+        self._expanded_metric_ids.add(metric_id)
+
+        metric_dependencies: Optional[IDDict] = self._metric_dependencies_cache.get(
+            metric_id
         )
+        if metric_dependencies is None:
+            metric_dependencies = self._get_metric_dependencies(
+                metric_configuration=metric_configuration,
+                metric_impl_klass=metric_impl_klass,
+                runtime_configuration=runtime_configuration,
+            )
+            self._metric_dependencies_cache[metric_id] = metric_dependencies
 
         if len(metric_dependencies) == 0:
             self.add(
@@ -138,9 +226,9 @@ class ValidationGraph:
             metric_configuration.metric_dependencies = metric_dependencies
             for metric_dependency in metric_dependencies.values():
                 # TODO: <Alex>In the future, provide a more robust cycle detection mechanism.</Alex>
-                if metric_dependency.id == metric_configuration.id:
+                if metric_dependency.id == metric_id:
                     logger.warning(
-                        f"Metric {str(metric_configuration.id)} has created a circular dependency"
+                        f"Metric {str(metric_id)} has created a circular dependency"
                     )
                     continue
                 self.add(
@@ -154,6 +242,26 @@ class ValidationGraph:
                     runtime_configuration=runtime_configuration,
                 )
 
+    def _get_metric_dependencies(
+        self,
+        metric_configuration: MetricConfiguration,
+        metric_impl_klass: MetricProvider,
+        runtime_configuration: Optional[dict] = None,
+    ) -> IDDict:
+        # Metrics, retrieved from "PersistentMetricCache" of "ExecutionEngine", need none of their dependencies.
+        if isinstance(
+            self._execution_engine, ExecutionEngine
+        ) and self._execution_engine.load_persisted_metric(
+            metric_configuration=metric_configuration
+        ):
+            return IDDict({})
+
+        return metric_impl_klass.get_evaluation_dependencies(
+            metric=metric_configuration,
+            execution_engine=self._execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
     def set_metric_configuration_default_kwargs_if_absent(
         self, metric_configuration: MetricConfiguration
     ) -> Tuple[MetricProvider, Callable]:
@@ -166,15 +274,20 @@ class ValidationGraph:
             metric_name=metric_configuration.metric_name,
             execution_engine=self._execution_engine,
         )
-        self._set_default_metric_kwargs_if_absent(
-            default_kwarg_values=metric_impl_klass.default_kwarg_values,
-            metric_kwargs=metric_configuration.metric_domain_kwargs,
-            keys=metric_impl_klass.domain_keys,
+        # Kwargs of "MetricConfiguration" are immutable; they are replaced with those, which include defaults.
+        metric_configuration.metric_domain_kwargs = (
+            self._get_metric_kwargs_with_defaults(
+                default_kwarg_values=metric_impl_klass.default_kwarg_values,
+                metric_kwargs=metric_configuration.metric_domain_kwargs,
+                keys=metric_impl_klass.domain_keys,
+            )
         )
-        self._set_default_metric_kwargs_if_absent(
-            default_kwarg_values=metric_impl_klass.default_kwarg_values,
-            metric_kwargs=metric_configuration.metric_value_kwargs,
-            keys=metric_impl_klass.value_keys,
+        metric_configuration.metric_value_kwargs = (
+            self._get_metric_kwargs_with_defaults(
+                default_kwarg_values=metric_impl_klass.default_kwarg_values,
+                metric_kwargs=metric_configuration.metric_value_kwargs,
+                keys=metric_impl_klass.value_keys,
+            )
         )
         return metric_impl_klass, metric_provider
 
@@ -206,7 +319,7 @@ class ValidationGraph:
 
         return resolved_metrics, aborted_metrics_info
 
-    def _resolve(  # noqa: C901 - complexity 16
+    def _resolve(
         self,
         metrics: Dict[Tuple[str, str, str], MetricValue],
         runtime_configuration: Optional[dict] = None,
@@ -222,6 +335,237 @@ class ValidationGraph:
         if runtime_configuration is None:
             runtime_configuration = {}
 
+        # Dependencies must survive in "MetricCache" of "ExecutionEngine" until metrics depending on them are resolved.
+        metric_cache: Optional[MetricCache] = (
+            self._execution_engine.metric_cache
+            if isinstance(self._execution_engine, ExecutionEngine)
+            else None
+        )
+        dependency_ids: List[Tuple[str, str, str]] = [
+            edge.right.id for edge in self.edges if edge.right is not None
+        ]
+        if metric_cache is not None:
+            metric_cache.pin(keys=dependency_ids)
+
+        # Records of Domains, shared by metrics of this graph, may be retained by "ExecutionEngine" until it resolves.
+        retained_domain_records: ContextManager[None] = (
+            self._execution_engine.retain_shared_domain_records(
+                metric_configurations=list(self._metric_configurations.values())
+            )
+            if isinstance(self._execution_engine, ExecutionEngine)
+            else nullcontext()
+        )
+
+        try:
+            with retained_domain_records:
+                return self.scheduler.resolve(
+                    graph=self,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                    min_graph_edges_pbar_enable=min_graph_edges_pbar_enable,
+                    show_progress_bars=show_progress_bars,
+                )
+        finally:
+            if metric_cache is not None:
+                metric_cache.unpin(keys=dependency_ids)
+
+    def _parse(
+        self,
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+    ) -> Tuple[Set[MetricConfiguration], Set[MetricConfiguration]]:
+        """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
+        validation graph (a graph structure of metric ids) edges"""
+        metric_readiness = MetricReadinessTracker(graph=self, metrics=metrics)
+        return set(metric_readiness.ready_metrics), set(metric_readiness.needed_metrics)
+
+    @staticmethod
+    def _get_metric_kwargs_with_defaults(
+        default_kwarg_values: dict,
+        metric_kwargs: IDDict,
+        keys: Tuple[str, ...],
+    ) -> IDDict:
+        absent_default_kwargs: dict = {
+            key: default_kwarg_values[key]
+            for key in keys
+            if key not in metric_kwargs
+            and key in default_kwarg_values
+            and default_kwarg_values[key] is not None
+        }
+        if not absent_default_kwargs:
+            return metric_kwargs
+
+        return IDDict({**metric_kwargs, **absent_default_kwargs})
+
+    def __repr__(self):
+        edge: MetricEdge
+        return ", ".join([edge.__repr__() for edge in self._edges])
+
+
+class MetricReadinessTracker:
+    """Tracks metrics of "ValidationGraph", which are ready to be resolved (all of their dependencies are resolved).
+
+    Counts of unresolved dependencies of every metric are computed once; as metrics get resolved, only counts of their
+    dependents are updated (instead of all "MetricEdge" objects of "ValidationGraph" being scanned again).
+
+    Args:
+        graph: "ValidationGraph" object, whose metrics are tracked.
+        metrics: Resolved (already computed) metrics, keyed by metric ID.
+    """
+
+    def __init__(
+        self,
+        graph: ValidationGraph,
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+    ) -> None:
+        # Only metrics appearing on the left side of some edge are computed.
+        self._metric_configurations: Dict[
+            Tuple[str, str, str], MetricConfiguration
+        ] = {}
+        self._unmet_dependency_counts: Dict[Tuple[str, str, str], int] = {}
+        self._dependent_ids: Dict[Tuple[str, str, str], List[Tuple[str, str, str]]] = {}
+        # Dictionary (rather than set) keeps ready metrics in order, in which they became ready.
+        self._ready_ids: Dict[Tuple[str, str, str], None] = {}
+
+        metric_id: Tuple[str, str, str]
+        dependency_ids: Set[Tuple[str, str, str]]
+        for metric_id, dependency_ids in graph._dependency_ids.items():
+            if metric_id in metrics:
+                continue
+
+            self._metric_configurations[metric_id] = graph._metric_configurations[
+                metric_id
+            ]
+            unmet_dependency_count: int = 0
+            dependency_id: Tuple[str, str, str]
+            for dependency_id in dependency_ids:
+                if dependency_id not in metrics:
+                    unmet_dependency_count += 1
+                    self._dependent_ids.setdefault(dependency_id, []).append(metric_id)
+
+            self._unmet_dependency_counts[metric_id] = unmet_dependency_count
+            if unmet_dependency_count == 0:
+                self._ready_ids[metric_id] = None
+
+    @property
+    def ready_metrics(self) -> List[MetricConfiguration]:
+        """Returns unresolved metrics, all of whose dependencies are resolved."""
+        return [self._metric_configurations[metric_id] for metric_id in self._ready_ids]
+
+    @property
+    def needed_metrics(self) -> List[MetricConfiguration]:
+        """Returns unresolved metrics, some of whose dependencies are not yet resolved."""
+        return [
+            self._metric_configurations[metric_id]
+            for metric_id, unmet_dependency_count in self._unmet_dependency_counts.items()
+            if unmet_dependency_count > 0
+        ]
+
+    @property
+    def num_unresolved_metrics(self) -> int:
+        return len(self._unmet_dependency_counts)
+
+    def mark_resolved(
+        self, metric_ids: Iterable[Tuple[str, str, str]]
+    ) -> List[MetricConfiguration]:
+        """Accounts for newly resolved metrics; returns metrics, which became ready to be resolved as result."""
+        newly_ready_metrics: List[MetricConfiguration] = []
+
+        metric_id: Tuple[str, str, str]
+        dependent_id: Tuple[str, str, str]
+        for metric_id in metric_ids:
+            self._ready_ids.pop(metric_id, None)
+            self._unmet_dependency_counts.pop(metric_id, None)
+            for dependent_id in self._dependent_ids.pop(metric_id, []):
+                if dependent_id not in self._unmet_dependency_counts:
+                    continue
+
+                self._unmet_dependency_counts[dependent_id] -= 1
+                if self._unmet_dependency_counts[dependent_id] == 0:
+                    self._ready_ids[dependent_id] = None
+                    newly_ready_metrics.append(
+                        self._metric_configurations[dependent_id]
+                    )
+
+        return newly_ready_metrics
+
+
+class MetricResolutionScheduler(ABC):
+    """MetricResolutionScheduler determines when (and how concurrently) metrics of "ValidationGraph" get resolved.
+
+    Every scheduler hands sets of "MetricConfiguration" objects, whose dependencies have already been computed, to
+    "ExecutionEngine.resolve_metrics()"; it retries metrics, failing with "MetricResolutionError", up to
+    "MAX_METRIC_COMPUTATION_RETRIES" times, and reports those that could not be resolved as aborted.
+    """
+
+    @abstractmethod
+    def resolve(
+        self,
+        graph: ValidationGraph,
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: dict,
+        min_graph_edges_pbar_enable: int = 0,
+        show_progress_bars: bool = True,
+    ) -> Dict[
+        Tuple[str, str, str],
+        Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
+    ]:
+        """
+        Resolves metrics of "graph", adding computed values to "metrics" (in place).
+
+        Args:
+            graph: "ValidationGraph" object, containing "MetricEdge" structures with "MetricConfiguration" objects.
+            metrics: Resolved (already computed) metrics, keyed by metric ID; updated with newly computed metrics.
+            runtime_configuration: Additional run-time settings (see "Validator.DEFAULT_RUNTIME_CONFIGURATION").
+            min_graph_edges_pbar_enable: Minumum number of graph edges to warrant showing progress bars.
+            show_progress_bars: Directive to show or suppress progress bars.
+
+        Returns:
+            Aborted metrics information, with metric ID as key.
+        """
+        pass
+
+    @staticmethod
+    def _register_failed_metrics(
+        err: gx_exceptions.MetricResolutionError,
+        failed_metric_info: Dict[
+            Tuple[str, str, str],
+            Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
+        ],
+    ) -> None:
+        exception_info = ExceptionInfo(
+            exception_traceback=traceback.format_exc(),
+            exception_message=str(err),
+        )
+        for failed_metric in err.failed_metrics:
+            if failed_metric.id in failed_metric_info:
+                failed_metric_info[failed_metric.id]["num_failures"] += 1  # type: ignore[operator]  # Incorrect flagging of 'Unsupported operand types for <= ("int" and "MetricConfiguration") and for >= ("Set[ExceptionInfo]" and "int")' in deep "Union" structure.
+                failed_metric_info[failed_metric.id]["exception_info"].add(exception_info)  # type: ignore[union-attr]  # Incorrect flagging of 'Item "MetricConfiguration" of "Union[MetricConfiguration, Set[ExceptionInfo], int]" has no attribute "add" and Item "int" of "Union[MetricConfiguration, Set[ExceptionInfo], int]" has no attribute "add"' in deep "Union" structure.
+            else:
+                failed_metric_info[failed_metric.id] = {}
+                failed_metric_info[failed_metric.id][
+                    "metric_configuration"
+                ] = failed_metric
+                failed_metric_info[failed_metric.id]["num_failures"] = 1
+                failed_metric_info[failed_metric.id]["exception_info"] = {
+                    exception_info
+                }
+
+
+class LevelByLevelMetricResolutionScheduler(MetricResolutionScheduler):
+    """Resolves all metrics, whose dependencies are available, in one "ExecutionEngine.resolve_metrics()" call per
+    iteration, until the entire "ValidationGraph" is resolved (each iteration waits for its slowest metric)."""
+
+    def resolve(  # noqa: C901 - complexity 16
+        self,
+        graph: ValidationGraph,
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: dict,
+        min_graph_edges_pbar_enable: int = 0,
+        show_progress_bars: bool = True,
+    ) -> Dict[
+        Tuple[str, str, str],
+        Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
+    ]:
         if runtime_configuration.get("catch_exceptions", True):
             catch_exceptions = True
         else:
@@ -236,20 +580,21 @@ class ValidationGraph:
             Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
         ] = {}
 
-        ready_metrics: Set[MetricConfiguration]
-        needed_metrics: Set[MetricConfiguration]
+        metric_readiness = MetricReadinessTracker(graph=graph, metrics=metrics)
 
-        exception_info: ExceptionInfo
+        ready_metrics: List[MetricConfiguration]
+        needed_metrics: List[MetricConfiguration]
 
         progress_bar: Optional[tqdm] = None
 
         done: bool = False
         while not done:
-            ready_metrics, needed_metrics = self._parse(metrics=metrics)
+            ready_metrics = metric_readiness.ready_metrics
+            needed_metrics = metric_readiness.needed_metrics
 
             # Check to see if the user has disabled progress bars
             disable = not show_progress_bars
-            if len(self.edges) < min_graph_edges_pbar_enable:
+            if len(graph.edges) < min_graph_edges_pbar_enable:
                 disable = True
 
             if progress_bar is None:
@@ -272,36 +617,22 @@ class ValidationGraph:
 
             try:
                 # Access "ExecutionEngine.resolve_metrics()" method, to resolve missing "MetricConfiguration" objects.
-                metrics.update(
-                    self._execution_engine.resolve_metrics(
-                        metrics_to_resolve=computable_metrics,
-                        metrics=metrics,
-                        runtime_configuration=runtime_configuration,
-                    )
+                resolved_metrics: Dict[
+                    Tuple[str, str, str], MetricValue
+                ] = graph.execution_engine.resolve_metrics(
+                    metrics_to_resolve=computable_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
                 )
+                metrics.update(resolved_metrics)
+                metric_readiness.mark_resolved(metric_ids=resolved_metrics.keys())
                 progress_bar.update(len(computable_metrics))
                 progress_bar.refresh()
             except gx_exceptions.MetricResolutionError as err:
                 if catch_exceptions:
-                    exception_traceback = traceback.format_exc()
-                    exception_message = str(err)
-                    exception_info = ExceptionInfo(
-                        exception_traceback=exception_traceback,
-                        exception_message=exception_message,
+                    self._register_failed_metrics(
+                        err=err, failed_metric_info=failed_metric_info
                     )
-                    for failed_metric in err.failed_metrics:
-                        if failed_metric.id in failed_metric_info:
-                            failed_metric_info[failed_metric.id]["num_failures"] += 1  # type: ignore[operator]  # Incorrect flagging of 'Unsupported operand types for <= ("int" and "MetricConfiguration") and for >= ("Set[ExceptionInfo]" and "int")' in deep "Union" structure.
-                            failed_metric_info[failed_metric.id]["exception_info"].add(exception_info)  # type: ignore[union-attr]  # Incorrect flagging of 'Item "MetricConfiguration" of "Union[MetricConfiguration, Set[ExceptionInfo], int]" has no attribute "add" and Item "int" of "Union[MetricConfiguration, Set[ExceptionInfo], int]" has no attribute "add"' in deep "Union" structure.
-                        else:
-                            failed_metric_info[failed_metric.id] = {}
-                            failed_metric_info[failed_metric.id][
-                                "metric_configuration"
-                            ] = failed_metric
-                            failed_metric_info[failed_metric.id]["num_failures"] = 1
-                            failed_metric_info[failed_metric.id]["exception_info"] = {
-                                exception_info
-                            }
                 else:
                     raise err
             except Exception as e:
@@ -322,48 +653,148 @@ class ValidationGraph:
 
         return aborted_metrics_info
 
-    def _parse(
+
+class ConcurrentMetricResolutionScheduler(MetricResolutionScheduler):
+    """Topologically orders "ValidationGraph" once and submits metrics to a pool of worker threads as soon as all of
+    their dependencies are resolved, so that total resolution time follows the longest dependency chain.
+
+    Metrics, which become ready upon completion of the same "ExecutionEngine.resolve_metrics()" call, are submitted
+    together, in order to retain bundling opportunities of "ExecutionEngine.resolve_metric_bundle()".
+
+    Args:
+        max_workers: Maximum number of "ExecutionEngine.resolve_metrics()" calls in flight at the same time.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        if max_workers < 1:
+            raise ValueError(
+                f"""Instantiation of "{self.__class__.__name__}" requires positive "max_workers" (received \
+{max_workers})."""
+            )
+
+        self._max_workers = max_workers
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def resolve(  # noqa: C901 - complexity 18
         self,
+        graph: ValidationGraph,
         metrics: Dict[Tuple[str, str, str], MetricValue],
-    ) -> Tuple[Set[MetricConfiguration], Set[MetricConfiguration]]:
-        """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
-        validation graph (a graph structure of metric ids) edges"""
-        unmet_dependency_ids = set()
-        unmet_dependency = set()
-        maybe_ready_ids = set()
-        maybe_ready = set()
-
-        for edge in self.edges:
-            if edge.left.id not in metrics:
-                if edge.right is None or edge.right.id in metrics:
-                    if edge.left.id not in maybe_ready_ids:
-                        maybe_ready_ids.add(edge.left.id)
-                        maybe_ready.add(edge.left)
-                else:
-                    if edge.left.id not in unmet_dependency_ids:
-                        unmet_dependency_ids.add(edge.left.id)
-                        unmet_dependency.add(edge.left)
+        runtime_configuration: dict,
+        min_graph_edges_pbar_enable: int = 0,
+        show_progress_bars: bool = True,
+    ) -> Dict[
+        Tuple[str, str, str],
+        Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
+    ]:
+        catch_exceptions: bool = bool(
+            runtime_configuration.get("catch_exceptions", True)
+        )
 
-        return maybe_ready - unmet_dependency, unmet_dependency
+        failed_metric_info: Dict[
+            Tuple[str, str, str],
+            Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
+        ] = {}
+        aborted_metrics_info: Dict[
+            Tuple[str, str, str],
+            Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
+        ] = {}
 
-    @staticmethod
-    def _set_default_metric_kwargs_if_absent(
-        default_kwarg_values: dict,
-        metric_kwargs: IDDict,
-        keys: Tuple[str, ...],
-    ) -> None:
-        key: str
-        for key in keys:
-            if (
-                key not in metric_kwargs
-                and key in default_kwarg_values
-                and default_kwarg_values[key] is not None
-            ):
-                metric_kwargs[key] = default_kwarg_values[key]
+        metric_readiness = MetricReadinessTracker(graph=graph, metrics=metrics)
 
-    def __repr__(self):
-        edge: MetricEdge
-        return ", ".join([edge.__repr__() for edge in self._edges])
+        progress_bar = tqdm(
+            total=metric_readiness.num_unresolved_metrics,
+            desc="Calculating Metrics",
+            disable=(not show_progress_bars)
+            or len(graph.edges) < min_graph_edges_pbar_enable,
+        )
+
+        futures: Dict[Future, List[MetricConfiguration]] = {}
+        done: bool = False
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+
+            def _submit(metrics_to_resolve: List[MetricConfiguration]) -> None:
+                if done or not metrics_to_resolve:
+                    return
+
+                future: Future = executor.submit(
+                    graph.execution_engine.resolve_metrics,
+                    metrics_to_resolve=metrics_to_resolve,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+                futures[future] = metrics_to_resolve
+
+            _submit(metric_readiness.ready_metrics)
+
+            while futures:
+                completed_futures, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+                future: Future
+                for future in completed_futures:
+                    submitted_metrics: List[MetricConfiguration] = futures.pop(future)
+                    try:
+                        resolved_metrics: Dict[
+                            Tuple[str, str, str], MetricValue
+                        ] = future.result()
+                    except gx_exceptions.MetricResolutionError as err:
+                        if not catch_exceptions:
+                            done = True
+                            raise err
+
+                        self._register_failed_metrics(
+                            err=err, failed_metric_info=failed_metric_info
+                        )
+                        failed_metric_ids: Set[Tuple[str, str, str]] = {
+                            failed_metric.id for failed_metric in err.failed_metrics
+                        }
+                        retried_metrics: List[MetricConfiguration] = []
+                        for metric in submitted_metrics:
+                            if metric.id not in failed_metric_ids:
+                                continue
+
+                            if failed_metric_info[metric.id]["num_failures"] >= MAX_METRIC_COMPUTATION_RETRIES:  # type: ignore[operator]  # Incorrect flagging of 'Unsupported operand types for <= ("int" and "MetricConfiguration") and for >= ("Set[ExceptionInfo]" and "int")' in deep "Union" structure.
+                                aborted_metrics_info[metric.id] = failed_metric_info[
+                                    metric.id
+                                ]
+                            else:
+                                retried_metrics.append(metric)
+
+                        # Keep failing metrics apart from their innocent bundle-mates, which are resubmitted together.
+                        _submit(retried_metrics)
+                        _submit(
+                            [
+                                metric
+                                for metric in submitted_metrics
+                                if metric.id not in failed_metric_ids
+                            ]
+                        )
+                        continue
+                    except Exception as e:
+                        done = True
+                        if not catch_exceptions:
+                            raise e
+
+                        logger.error(
+                            f"""Caught exception {str(e)} while trying to resolve a set of {len(submitted_metrics)} metrics; aborting graph resolution."""
+                        )
+                        continue
+
+                    metrics.update(resolved_metrics)
+                    progress_bar.update(len(resolved_metrics))
+
+                    _submit(
+                        metric_readiness.mark_resolved(
+                            metric_ids=resolved_metrics.keys()
+                        )
+                    )
+
+        progress_bar.close()
+
+        return aborted_metrics_info
 
 
 class ExpectationValidationGraph:
@@ -83,7 +83,7 @@ if TYPE_CHECKING:
         BatchDefinition,
         BatchMarkers,
     )
-    from great_expectations.core.id_dict import BatchSpec
+    from great_expectations.core.id_dict import BatchSpec, IDDict
     from great_expectations.data_context.data_context import AbstractDataContext
     from great_expectations.datasource.fluent.interfaces import Batch as FluentBatch
     from great_expectations.execution_engine import ExecutionEngine
@@ -1087,6 +1087,8 @@ class Validator:
         evaluated_config: ExpectationConfiguration
         metric_configuration: MetricConfiguration
         graph: ValidationGraph
+        # Metrics, shared by several expectations (e.g., "table.columns"), have their dependencies expanded only once.
+        metric_dependencies_cache: Dict[Tuple[str, str, str], IDDict] = {}
         for configuration in expectation_configurations:
             # Validating
             try:
@@ -1114,6 +1116,7 @@ class Validator:
                     graph=self._metrics_calculator.build_metric_dependency_graph(
                         metric_configurations=validation_dependencies.get_metric_configurations(),
                         runtime_configuration=runtime_configuration,
+                        metric_dependencies_cache=metric_dependencies_cache,
                     ),
                 )
                 expectation_validation_graphs.append(expectation_validation_graph)
@@ -117,6 +117,7 @@ def test_cli_init_on_new_project(
         data_docs/
             local_site/
                 index.html
+                render_manifest.json
                 expectations/
                     Titanic/
                         warning.html
@@ -661,6 +662,7 @@ def test_cli_init_on_new_project_with_broken_excel_file_try_again_with_different
         data_docs/
             local_site/
                 index.html
+                render_manifest.json
                 expectations/
                     Titanic/
                         warning.html
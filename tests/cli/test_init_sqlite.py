@@ -145,6 +145,7 @@ great_expectations/
         data_docs/
             local_site/
                 index.html
+                render_manifest.json
                 expectations/
                     warning.html
                 static/
@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 import pytest
 
 from great_expectations.core.util import convert_to_json_serializable
@@ -53,3 +54,46 @@ def test_serialization_numpy_datetime():
     datetime_to_test = "2022-12-08T12:56:23.423"
     data = np.datetime64(datetime_to_test)
     assert convert_to_json_serializable(data) == datetime_to_test
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        pytest.param(
+            np.array([1.5, np.nan, 2.0]), [1.5, None, 2.0], id="float_ndarray"
+        ),
+        pytest.param(np.array([[1, 2], [3, 4]]), [[1, 2], [3, 4]], id="2d_ndarray"),
+        pytest.param(np.array([True, False]), [True, False], id="bool_ndarray"),
+        pytest.param(np.array(["a", "b"]), ["a", "b"], id="str_ndarray"),
+        pytest.param(pd.Index([1.0, np.nan]), [1.0, None], id="float_index"),
+        pytest.param(
+            pd.Series([1.0, np.nan], name="x"),
+            [{"index": 0, "x": 1.0}, {"index": 1, "x": None}],
+            id="float_series",
+        ),
+        pytest.param(
+            pd.Series(pd.to_datetime(["2022-12-08"]), index=pd.Index([3.5], name="i")),
+            [{"i": 3.5, "value": "2022-12-08T00:00:00"}],
+            id="datetime_series",
+        ),
+        pytest.param(
+            {1: (np.float64("nan"), {"a": [float("nan"), "s"]})},
+            {"1": [None, {"a": [None, "s"]}]},
+            id="nested_builtins",
+        ),
+    ],
+)
+def test_serialization_of_builtins_and_numeric_arrays(data, expected):
+    assert convert_to_json_serializable(data) == expected
+
+
+@pytest.mark.unit
+def test_serialization_of_list_subclass():
+    class MyList(list):
+        pass
+
+    assert convert_to_json_serializable(MyList([np.int32(1), {"a": 2}])) == [
+        1,
+        {"a": 2},
+    ]
@@ -747,3 +747,155 @@ def test_replace_expectation_finds_no_matches(ge_cloud_suite, ge_cloud_id, exp4)
         str(err.value)
         == "More than one matching expectation was found. Please be more specific with your search criteria"
     )
+
+
+def _find_expectation_indexes_by_scanning(
+    suite: ExpectationSuite,
+    expectation_configuration: ExpectationConfiguration,
+    match_type: str,
+) -> list:
+    return [
+        idx
+        for idx, expectation in enumerate(suite.expectations)
+        if expectation.isEquivalentTo(
+            other=expectation_configuration, match_type=match_type
+        )
+    ]
+
+
+@pytest.mark.unit
+def test_find_expectation_indexes_agrees_with_scan_after_mutations(
+    exp1, exp2, exp3, exp4
+):
+    suite = ExpectationSuite(
+        expectation_suite_name="indexed",
+        expectations=[exp1, exp2, exp3, exp4],
+    )
+    candidates = [exp1, exp2, exp3, exp4]
+
+    def _assert_index_agrees_with_scan() -> None:
+        for expectation_configuration in candidates:
+            for match_type in ["domain", "success", "runtime"]:
+                assert suite.find_expectation_indexes(
+                    expectation_configuration=expectation_configuration,
+                    match_type=match_type,
+                ) == _find_expectation_indexes_by_scanning(
+                    suite=suite,
+                    expectation_configuration=expectation_configuration,
+                    match_type=match_type,
+                )
+
+    _assert_index_agrees_with_scan()
+
+    new_expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": "c", "value_set": [1.0, 2.0]},
+    )
+    candidates.append(new_expectation_configuration)
+    suite.add_expectation(new_expectation_configuration, send_usage_event=False)
+    _assert_index_agrees_with_scan()
+
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": "c", "value_set": [1, 2]},
+        ),
+        send_usage_event=False,
+    )
+    assert len(suite.expectations) == 5
+    _assert_index_agrees_with_scan()
+
+    suite.patch_expectation(
+        expectation_configuration=new_expectation_configuration,
+        op="replace",
+        path="/value_set",
+        value=[5, 6],
+        match_type="domain",
+    )
+    _assert_index_agrees_with_scan()
+
+    suite.remove_expectation(exp1, match_type="domain")
+    _assert_index_agrees_with_scan()
+
+    suite.expectations.insert(0, deepcopy(exp1))
+    suite.expectations[1:3] = list(reversed(suite.expectations[1:3]))
+    _assert_index_agrees_with_scan()
+
+    suite.expectations = list(suite.expectations)
+    _assert_index_agrees_with_scan()
+
+    for copied_suite in [deepcopy(suite), ExpectationSuite(**suite.to_json_dict())]:
+        assert copied_suite.find_expectation_indexes(
+            expectation_configuration=exp4, match_type="domain"
+        ) == suite.find_expectation_indexes(
+            expectation_configuration=exp4, match_type="domain"
+        )
+
+
+@pytest.mark.unit
+def test_find_expectation_indexes_after_kwargs_are_changed_in_place(exp1, exp2):
+    suite = ExpectationSuite(
+        expectation_suite_name="indexed",
+        expectations=[exp1, exp2],
+    )
+    assert suite.find_expectation_indexes(
+        expectation_configuration=exp1, match_type="domain"
+    ) == [0]
+
+    suite.expectations[0].kwargs["column"] = "c"
+    expectation_configuration = ExpectationConfiguration(
+        expectation_type=exp1.expectation_type,
+        kwargs=deepcopy(suite.expectations[0].kwargs),
+    )
+
+    for match_type in ["domain", "success", "runtime"]:
+        assert suite.find_expectation_indexes(
+            expectation_configuration=expectation_configuration,
+            match_type=match_type,
+        ) == [0]
+        assert suite.find_expectation_indexes(
+            expectation_configuration=expectation_configuration,
+            match_type=match_type,
+        ) == _find_expectation_indexes_by_scanning(
+            suite=suite,
+            expectation_configuration=expectation_configuration,
+            match_type=match_type,
+        )
+
+
+@pytest.mark.unit
+def test_find_expectation_indexes_when_index_has_stale_and_current_matches(
+    exp1, exp2, exp4
+):
+    suite = ExpectationSuite(
+        expectation_suite_name="indexed",
+        expectations=[exp1, exp2, exp4],
+    )
+    assert suite.find_expectation_indexes(
+        expectation_configuration=exp2, match_type="domain"
+    ) == [1, 2]
+
+    # Position 0 now matches, but is indexed under column "a"; position 2 is indexed under column "b", but no longer matches.
+    suite.expectations[0].kwargs["column"] = "b"
+    suite.expectations[2].kwargs["column"] = "c"
+    suite.expectations[1].ge_cloud_id = "my_ge_cloud_id"
+
+    for match_type in ["domain", "success", "runtime"]:
+        for column in ["a", "b", "c"]:
+            expectation_configuration = ExpectationConfiguration(
+                expectation_type=exp1.expectation_type,
+                kwargs={**exp1.kwargs, "column": column},
+            )
+            assert suite.find_expectation_indexes(
+                expectation_configuration=expectation_configuration,
+                match_type=match_type,
+            ) == _find_expectation_indexes_by_scanning(
+                suite=suite,
+                expectation_configuration=expectation_configuration,
+                match_type=match_type,
+            )
+
+    assert suite.find_expectation_indexes(
+        expectation_configuration=exp2, match_type="domain"
+    ) == [0, 1]
+    assert suite.find_expectation_indexes(ge_cloud_id="my_ge_cloud_id") == [1]
@@ -0,0 +1,78 @@
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+from great_expectations.core.id_dict import FrozenIDDict, IDDict
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param({"column": "a", "mostly": 0.95}, id="json_native"),
+        pytest.param(
+            {"column": "a", "nested": {"values": [1, 2.5, None, True]}},
+            id="json_native_nested",
+        ),
+        pytest.param({"column": "a", "value": float("nan")}, id="nan"),
+        pytest.param({"column": "a", "value": np.float64(1.5)}, id="numpy"),
+        pytest.param({"column": "a", "values": {1, 2}}, id="set"),
+    ],
+)
+def test_frozen_id_dict_id_is_identical_to_that_of_id_dict(data: dict):
+    frozen_id_dict = FrozenIDDict(data)
+
+    assert frozen_id_dict.to_id() == IDDict(data).to_id()
+    assert hash(frozen_id_dict) == hash(IDDict(data))
+    assert frozen_id_dict == IDDict(data)
+
+
+@pytest.mark.unit
+def test_frozen_id_dict_caches_id():
+    frozen_id_dict = FrozenIDDict({"column": "a", "mostly": 0.95})
+
+    first_id: str = frozen_id_dict.to_id()
+
+    assert frozen_id_dict.to_id() is first_id
+    assert frozen_id_dict.to_id(id_ignore_keys={"mostly"}) == "column=a"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        pytest.param(lambda d: d.__setitem__("column", "b"), id="setitem"),
+        pytest.param(lambda d: d.__delitem__("column"), id="delitem"),
+        pytest.param(lambda d: d.update({"column": "b"}), id="update"),
+        pytest.param(lambda d: d.setdefault("mostly", 0.5), id="setdefault"),
+        pytest.param(lambda d: d.pop("column"), id="pop"),
+        pytest.param(lambda d: d.popitem(), id="popitem"),
+        pytest.param(lambda d: d.clear(), id="clear"),
+    ],
+)
+def test_frozen_id_dict_is_immutable(mutate):
+    frozen_id_dict = FrozenIDDict({"column": "a"})
+
+    with pytest.raises(TypeError):
+        mutate(frozen_id_dict)
+
+    assert frozen_id_dict == {"column": "a"}
+
+
+@pytest.mark.unit
+def test_frozen_id_dict_copies_are_mutable_and_pickling_round_trips():
+    frozen_id_dict = FrozenIDDict({"column": "a", "nested": {"value": 1}})
+
+    shallow_copy = copy.copy(frozen_id_dict)
+    deep_copy = copy.deepcopy(frozen_id_dict)
+    assert type(shallow_copy) is IDDict
+    assert type(deep_copy) is IDDict
+
+    deep_copy["nested"]["value"] = 2
+    assert frozen_id_dict["nested"]["value"] == 1
+
+    unpickled = pickle.loads(pickle.dumps(frozen_id_dict))
+    assert type(unpickled) is FrozenIDDict
+    assert unpickled.to_id() == frozen_id_dict.to_id()
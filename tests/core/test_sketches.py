@@ -0,0 +1,100 @@
+import json
+
+import numpy as np
+import pytest
+
+from great_expectations.core.sketches import (
+    HyperLogLogSketch,
+    KLLSketch,
+    MisraGriesSketch,
+)
+
+
+def _round_trip(sketch):
+    return type(sketch).from_json_dict(json.loads(json.dumps(sketch.to_json_dict())))
+
+
+@pytest.mark.unit
+def test_kll_sketch_estimates_quantiles_within_relative_error():
+    values = np.random.default_rng(seed=0).exponential(size=100000)
+    sketch = KLLSketch.from_relative_error(relative_error=0.01)
+    for chunk in np.array_split(values, 100):
+        sketch.update(values=chunk)
+
+    assert sketch.count == len(values)
+
+    quantiles = np.linspace(0.0, 1.0, 21)
+    estimates = sketch.quantiles(quantiles=quantiles)
+    ranks = np.searchsorted(np.sort(values), estimates, side="right") / len(values)
+    assert np.max(np.abs(ranks - quantiles)) <= 0.01
+
+    # Sketch retains small fraction of values.
+    assert len(_round_trip(sketch).to_json_dict()["compactors"][0]) < 1000
+    assert _round_trip(sketch).quantiles(quantiles=quantiles) == estimates
+
+
+@pytest.mark.unit
+def test_kll_sketch_merges_sketches_of_disjoint_values():
+    values = np.random.default_rng(seed=1).normal(size=20000)
+    sketch = KLLSketch(k=200)
+    sketch.update(values=values[:5000])
+    other = KLLSketch(k=200)
+    other.update(values=np.append(values[5000:], np.nan))
+
+    sketch.merge(other=_round_trip(other))
+
+    assert sketch.count == len(values)
+    median = sketch.quantiles(quantiles=[0.5])[0]
+    assert abs(np.mean(values <= median) - 0.5) <= 0.01
+
+    assert np.isnan(KLLSketch().quantiles(quantiles=[0.5])[0])
+    with pytest.raises(TypeError):
+        sketch.merge(other=HyperLogLogSketch())
+    with pytest.raises(ValueError):
+        KLLSketch.from_relative_error(relative_error=1.5)
+
+
+@pytest.mark.unit
+def test_hyper_log_log_sketch_estimates_distinct_count_within_relative_error():
+    rng = np.random.default_rng(seed=2)
+    values = rng.integers(0, 20000, size=100000)
+    sketch = HyperLogLogSketch.from_relative_error(relative_error=0.02)
+    sketch.update(values=values[:50000])
+    other = HyperLogLogSketch.from_relative_error(relative_error=0.02)
+    # Equal integers and floats (e.g., of chunks, whose types differ because of nulls) are same values.
+    other.update(values=np.append(values[50000:].astype(np.float64), np.nan))
+
+    sketch.merge(other=_round_trip(other))
+
+    distinct_count = len(np.unique(values))
+    assert abs(sketch.estimate() - distinct_count) <= 0.04 * distinct_count
+
+    small = HyperLogLogSketch()
+    small.update(values=["a", "b", None, "a", "c"])
+    small.update(values=[1, 2.0, 2])
+    assert small.estimate() == 5  # noqa: PLR2004
+    assert HyperLogLogSketch().estimate() == 0
+
+    with pytest.raises(ValueError):
+        sketch.merge(other=HyperLogLogSketch(precision=sketch.precision + 1))
+
+
+@pytest.mark.unit
+def test_misra_gries_sketch_retains_heavy_hitters_with_bounded_error():
+    values = np.random.default_rng(seed=3).zipf(1.5, size=100000)
+    sketch = MisraGriesSketch.from_relative_error(relative_error=0.01)
+    sketch.update(values=values[:30000])
+    other = MisraGriesSketch.from_relative_error(relative_error=0.01)
+    other.update(values=values[30000:])
+
+    sketch.merge(other=_round_trip(other))
+
+    heavy_hitters = sketch.heavy_hitters()
+    assert len(heavy_hitters) <= sketch.capacity
+    assert list(heavy_hitters)[0] == 1
+    assert sketch.maximum_error <= len(values) / (sketch.capacity + 1)
+
+    unique_values, counts = np.unique(values, return_counts=True)
+    for value, count in zip(unique_values.tolist(), counts.tolist()):
+        estimate = heavy_hitters.get(value, 0)
+        assert count - sketch.maximum_error <= estimate <= count
@@ -6,7 +6,7 @@ import pytest
 import tests.test_utils as test_utils
 from great_expectations.data_context.store import DatabaseStoreBackend
 from great_expectations.data_context.util import instantiate_class_from_config
-from great_expectations.exceptions import StoreBackendError
+from great_expectations.exceptions import StoreBackendError, StoreError
 
 pytestmark = pytest.mark.sqlalchemy_version_compatibility
 
@@ -111,6 +111,74 @@ def test_database_store_backend_duplicate_key_violation(caplog, sa, test_backend
     assert "Integrity error" in str(exc.value)
 
 
+@pytest.mark.integration
+def test_database_store_backend_get_many_and_set_many(sa):
+    # Use sqlite so we don't require postgres for this test.
+    store_backend = DatabaseStoreBackend(
+        credentials={"drivername": "sqlite"},
+        table_name="test_database_store_backend_get_many_and_set_many",
+        key_columns=["k1", "k2"],
+    )
+
+    store_backend.set_many(
+        [(("1", "a"), "hello"), (("1", "b"), "world"), (("2", "a"), "!")]
+    )
+    assert store_backend.get_many([("2", "a"), ("1", "a")]) == ["!", "hello"]
+
+    # Existing keys are updated, leaving keys that share a prefix with them unchanged.
+    store_backend.set_many([(("1", "a"), "goodbye"), (("3", "a"), "?")])
+    store_backend.set(("2", "a"), "!!")
+    assert store_backend.get_many([("1", "a"), ("1", "b"), ("2", "a"), ("3", "a")]) == [
+        "goodbye",
+        "world",
+        "!!",
+        "?",
+    ]
+
+    with pytest.raises(StoreError):
+        store_backend.get_many([("1", "a"), ("4", "a")])
+
+
+@pytest.mark.integration
+def test_database_store_backend_set_on_existing_table_without_primary_key(sa):
+    engine = sa.create_engine("sqlite://")
+    with engine.begin() as connection:
+        connection.execute(
+            sa.text("CREATE TABLE ge_metrics (k1 VARCHAR, k2 VARCHAR, value VARCHAR)")
+        )
+
+    store_backend = DatabaseStoreBackend(
+        engine=engine,
+        table_name="ge_metrics",
+        key_columns=["k1", "k2"],
+    )
+
+    store_backend.set(("a", "b"), "1")
+    store_backend.set(("a", "b"), "2")
+    store_backend.set_many([(("a", "b"), "3"), (("a", "c"), "4")])
+    assert store_backend.get_many([("a", "b"), ("a", "c")]) == ["3", "4"]
+    with engine.begin() as connection:
+        assert (
+            connection.execute(sa.text("SELECT COUNT(*) FROM ge_metrics")).scalar() == 2
+        )
+
+
+@pytest.mark.integration
+def test_database_store_backend_get_many_in_chunks(sa):
+    store_backend = DatabaseStoreBackend(
+        credentials={"drivername": "sqlite"},
+        table_name="test_database_store_backend_get_many_in_chunks",
+        key_columns=["k1"],
+    )
+    store_backend.MAX_BOUND_PARAMETERS_PER_STATEMENT = 2
+
+    keys = [(str(idx),) for idx in range(5)]
+    store_backend.set_many([(key, f"value_{key[0]}") for key in keys])
+    assert store_backend.get_many(keys[::-1]) == [
+        f"value_{idx}" for idx in reversed(range(5))
+    ]
+
+
 @pytest.mark.integration
 def test_database_store_backend_url_instantiation(caplog, sa, test_backends):
     if "postgresql" not in test_backends:
@@ -409,6 +409,20 @@ def test_InMemoryStoreBackend():
         my_store.get_url_for_key(my_key)
 
 
+@pytest.mark.unit
+def test_InMemoryStoreBackend_get_many_and_set_many():
+    my_store = InMemoryStoreBackend()
+
+    my_store.set_many([(("A",), "aaa"), (("B",), "bbb")])
+    assert my_store.get_many([("B",), ("A",)]) == ["bbb", "aaa"]
+
+    with pytest.raises(InvalidKeyError):
+        my_store.get_many([("A",), ("C",)])
+
+    with pytest.raises(TypeError):
+        my_store.set_many([(("A",), "aaa"), ("B", "bbb")])
+
+
 @pytest.mark.integration
 def test_tuple_filesystem_store_filepath_prefix_error(tmp_path_factory):
     path = str(
@@ -511,6 +525,35 @@ def test_TupleFilesystemStoreBackend(tmp_path_factory):
     assert url == "http://www.test.com/my_file_CCC"
 
 
+@pytest.mark.integration
+def test_TupleFilesystemStoreBackend_get_many_and_set_many(tmp_path_factory):
+    project_path = str(
+        tmp_path_factory.mktemp(
+            "test_TupleFilesystemStoreBackend_get_many_and_set_many__dir"
+        )
+    )
+
+    my_store = TupleFilesystemStoreBackend(
+        root_directory=project_path,
+        base_directory="dummy_str",
+        filepath_template="{0}/my_file_{1}",
+        suppress_store_backend_id=True,
+    )
+
+    my_store.set_many(
+        [(("run_1", "AAA"), "aaa"), (("run_1", "BBB"), "bbb"), (("run_2", "AAA"), "")]
+    )
+    assert set(my_store.list_keys()) == {
+        ("run_1", "AAA"),
+        ("run_1", "BBB"),
+        ("run_2", "AAA"),
+    }
+    assert my_store.get_many([("run_1", "BBB"), ("run_2", "AAA")]) == ["bbb", ""]
+
+    with pytest.raises(InvalidKeyError):
+        my_store.get_many([("run_1", "AAA"), ("run_3", "AAA")])
+
+
 @pytest.mark.integration
 def test_TupleFilesystemStoreBackend_ignores_jupyter_notebook_checkpoints(
     tmp_path_factory,
@@ -1354,6 +1397,95 @@ def test_TupleS3StoreBackend_list_over_1000_keys():
     assert len(keys) == num_keys_to_add + 1
 
 
+@mock_s3
+@pytest.mark.integration
+def test_TupleS3StoreBackend_list_keys_with_prefix():
+    bucket = "leakybucket"
+    prefix = "my_prefix"
+
+    # create a bucket in Moto's mock AWS environment
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(
+        filepath_template="{0}/{1}/my_file_{2}.json",
+        bucket=bucket,
+        prefix=prefix,
+        suppress_store_backend_id=True,
+    )
+    keys = [
+        ("my_suite", "my_run", "AAA"),
+        ("my_suite", "my_run", "BBB"),
+        ("my_suite", "my_run_2", "AAA"),
+        ("my_other_suite", "my_run", "AAA"),
+    ]
+    for key in keys:
+        my_store.set(key, "aaa")
+
+    assert (
+        my_store._build_s3_object_key_prefix(("my_suite", "my_run"))
+        == "my_prefix/my_suite/my_run/my_file_"
+    )
+    assert my_store._build_s3_object_key_prefix(()) == "my_prefix"
+
+    assert set(my_store.list_keys()) == set(keys)
+    # Keys, whose filepath starts with that of the prefix, but not with the prefix itself, are not listed.
+    assert set(my_store.list_keys(("my_suite", "my_run"))) == {
+        ("my_suite", "my_run", "AAA"),
+        ("my_suite", "my_run", "BBB"),
+    }
+    assert set(my_store.list_keys(("my_suite",))) == {
+        ("my_suite", "my_run", "AAA"),
+        ("my_suite", "my_run", "BBB"),
+        ("my_suite", "my_run_2", "AAA"),
+    }
+    assert my_store.list_keys(("my_missing_suite",)) == []
+
+    assert my_store.has_key(("my_suite", "my_run_2", "AAA"))
+    assert not my_store.has_key(("my_suite", "my_run_2", "BBB"))
+
+
+@pytest.mark.unit
+def test_TupleStoreBackend_convert_key_prefix_to_filepath_prefix(tmp_path_factory):
+    project_path = str(
+        tmp_path_factory.mktemp(
+            "test_TupleStoreBackend_convert_key_prefix_to_filepath_prefix__dir"
+        )
+    )
+
+    my_store = TupleFilesystemStoreBackend(
+        root_directory=project_path,
+        base_directory="dummy_str",
+        filepath_template="{0}/{2}/{1}-{2}.json",
+        filepath_prefix="validations",
+        platform_specific_separator=False,
+        suppress_store_backend_id=True,
+    )
+    assert my_store._convert_key_prefix_to_filepath_prefix(()) == ""
+    assert my_store._convert_key_prefix_to_filepath_prefix(("A",)) == "validations/A/"
+    # Elements following the first missing element in the template are not used.
+    assert (
+        my_store._convert_key_prefix_to_filepath_prefix(("A", "B")) == "validations/A/"
+    )
+    assert (
+        my_store._convert_key_prefix_to_filepath_prefix(("A", "B", "C"))
+        == "validations/A/C/B-C.json"
+    )
+
+    my_store_with_no_filepath_template = TupleFilesystemStoreBackend(
+        root_directory=project_path,
+        base_directory="dummy_str",
+        platform_specific_separator=False,
+        suppress_store_backend_id=True,
+    )
+    assert (
+        my_store_with_no_filepath_template._convert_key_prefix_to_filepath_prefix(
+            ("A", "B")
+        )
+        == "A/B"
+    )
+
+
 @pytest.mark.integration
 def test_InlineStoreBackend(empty_data_context: DataContext) -> None:
     inline_store_backend: InlineStoreBackend = InlineStoreBackend(
@@ -1,4 +1,5 @@
 import datetime
+import json
 from unittest import mock
 
 import boto3
@@ -7,6 +8,8 @@ from freezegun import freeze_time
 from moto import mock_s3
 
 import tests.test_utils as test_utils
+from great_expectations import exceptions as gx_exceptions
+from great_expectations.compatibility.orjson import ORJSON_NOT_IMPORTED
 from great_expectations.core import ExpectationSuiteValidationResult
 from great_expectations.data_context.store import ValidationsStore
 from great_expectations.data_context.types.resource_identifiers import (
@@ -157,6 +160,42 @@ def test_ValidationsStore_with_InMemoryStoreBackend():
     assert test_utils.validate_uuid4(my_store.store_backend_id)
 
 
+@pytest.mark.unit
+def test_ValidationsStore_with_orjson_serializes_same_content():
+    orjson = pytest.importorskip("orjson")  # noqa: F841
+
+    validation_result = ExpectationSuiteValidationResult(
+        success=True,
+        results=[],
+        statistics={"evaluated_expectations": 0, "success_percent": None},
+        meta={"great_expectations_version": "0.0.0", "names": ["a", "b"]},
+    )
+    store_backend = {
+        "module_name": "great_expectations.data_context.store",
+        "class_name": "InMemoryStoreBackend",
+    }
+    json_store = ValidationsStore(store_backend=dict(store_backend))
+    orjson_store = ValidationsStore(store_backend=dict(store_backend), use_orjson=True)
+
+    assert orjson_store.config["use_orjson"] is True
+    assert "use_orjson" not in json_store.config
+    assert json.loads(orjson_store.serialize(validation_result)) == json.loads(
+        json_store.serialize(validation_result)
+    )
+    assert orjson_store.deserialize(
+        orjson_store.serialize(validation_result)
+    ) == json_store.deserialize(json_store.serialize(validation_result))
+
+
+@pytest.mark.unit
+def test_ValidationsStore_with_orjson_requires_orjson():
+    with mock.patch(
+        "great_expectations.data_context.store.validations_store.orjson",
+        ORJSON_NOT_IMPORTED,
+    ), pytest.raises(gx_exceptions.StoreConfigurationError):
+        ValidationsStore(use_orjson=True)
+
+
 @pytest.mark.integration
 @freeze_time("09/26/2019 13:42:41")
 @pytest.mark.filterwarnings(
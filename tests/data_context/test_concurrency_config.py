@@ -2,7 +2,9 @@ from great_expectations.data_context.types.base import (
     ConcurrencyConfig,
     DataContextConfig,
     InMemoryStoreBackendDefaults,
+    concurrencyConfigSchema,
 )
+from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.util import get_context
 
 
@@ -29,3 +31,73 @@ def test_data_context_concurrency_property():
         )
     )
     assert data_context.concurrency.enabled
+
+
+def test_max_metric_resolution_concurrency_round_trip():
+    assert concurrencyConfigSchema.dump(ConcurrencyConfig(enabled=True)) == {
+        "enabled": True
+    }
+
+    concurrency_config = ConcurrencyConfig(
+        **concurrencyConfigSchema.load(
+            {"enabled": True, "max_metric_resolution_concurrency": 3}
+        )
+    )
+    assert concurrency_config.max_metric_resolution_concurrency == 3
+    assert concurrencyConfigSchema.dump(concurrency_config) == {
+        "enabled": True,
+        "max_metric_resolution_concurrency": 3,
+    }
+
+
+def test_data_context_concurrency_reaches_datasource_execution_engines():
+    data_context = get_context(
+        project_config=DataContextConfig(
+            concurrency=ConcurrencyConfig(
+                enabled=True, max_metric_resolution_concurrency=3
+            ),
+            store_backend_defaults=InMemoryStoreBackendDefaults(),
+        )
+    )
+    datasource = data_context.add_datasource(
+        name="my_pandas_datasource",
+        class_name="Datasource",
+        execution_engine={"class_name": "PandasExecutionEngine"},
+        data_connectors={
+            "my_runtime_data_connector": {
+                "class_name": "RuntimeDataConnector",
+                "batch_identifiers": ["id"],
+            }
+        },
+    )
+    assert datasource.execution_engine.concurrency.enabled
+    assert datasource.execution_engine.max_metric_resolution_concurrency == 3
+    assert datasource.execution_engine.config["concurrency"] == {
+        "enabled": True,
+        "max_metric_resolution_concurrency": 3,
+    }
+
+    fluent_datasource = data_context.sources.add_pandas(name="my_fluent_datasource")
+    assert (
+        fluent_datasource.get_execution_engine().max_metric_resolution_concurrency == 3
+    )
+
+
+def test_execution_engine_concurrency_from_config():
+    execution_engine = instantiate_class_from_config(
+        config={
+            "class_name": "PandasExecutionEngine",
+            "concurrency": {"enabled": True, "max_metric_resolution_concurrency": 2},
+        },
+        runtime_environment={},
+        config_defaults={"module_name": "great_expectations.execution_engine"},
+    )
+    assert execution_engine.max_metric_resolution_concurrency == 2
+
+    execution_engine = instantiate_class_from_config(
+        config={"class_name": "PandasExecutionEngine"},
+        runtime_environment={},
+        config_defaults={"module_name": "great_expectations.execution_engine"},
+    )
+    assert execution_engine.max_metric_resolution_concurrency == 1
+    assert "concurrency" not in execution_engine.config
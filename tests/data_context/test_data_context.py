@@ -566,6 +566,7 @@ project_path/
 data_docs/
     local_site/
         index.html
+        render_manifest.json
         expectations/
             random/
                 subdir_reader/
@@ -455,6 +455,78 @@ def test_list_datasources() -> None:
     assert len(context.list_datasources()) == 2
 
 
+@pytest.mark.unit
+def test_datasources_are_instantiated_on_first_access() -> None:
+    project_config = DataContextConfig(
+        store_backend_defaults=InMemoryStoreBackendDefaults()
+    )
+    project_config.datasources = {
+        datasource_name: {
+            "class_name": "Datasource",
+            "data_connectors": {},
+            "execution_engine": {
+                "class_name": "PandasExecutionEngine",
+                "module_name": "great_expectations.execution_engine",
+            },
+            "module_name": "great_expectations.datasource",
+        }
+        for datasource_name in ["my_datasource_name", "my_other_datasource_name"]
+    }
+
+    with mock.patch(
+        "great_expectations.data_context.data_context.abstract_data_context.AbstractDataContext._instantiate_datasource_from_config",
+        autospec=True,
+        side_effect=EphemeralDataContext._instantiate_datasource_from_config,
+    ) as mock_instantiate:
+        context = gx.get_context(project_config=project_config)
+        context.sources.add_pandas("my_fluent_datasource_name")
+        assert mock_instantiate.call_count == 0
+        assert list(context.fluent_datasources) == ["my_fluent_datasource_name"]
+        assert mock_instantiate.call_count == 0
+
+        datasource = context.get_datasource("my_datasource_name")
+        assert isinstance(datasource, Datasource)
+        assert context.get_datasource("my_datasource_name") is datasource
+        assert mock_instantiate.call_count == 1
+
+        assert set(context.datasources) == {
+            "my_datasource_name",
+            "my_other_datasource_name",
+            "my_fluent_datasource_name",
+        }
+        assert mock_instantiate.call_count == 2
+
+
+@pytest.mark.unit
+def test_delete_datasource_does_not_instantiate_pending_datasource() -> None:
+    project_config = DataContextConfig(
+        store_backend_defaults=InMemoryStoreBackendDefaults()
+    )
+    project_config.datasources = {
+        "my_unreachable_datasource_name": {
+            "class_name": "Datasource",
+            "data_connectors": {},
+            "execution_engine": {
+                "class_name": "SqlAlchemyExecutionEngine",
+                "module_name": "great_expectations.execution_engine",
+                "connection_string": "postgresql://unreachable:5432/db",
+            },
+            "module_name": "great_expectations.datasource",
+        }
+    }
+
+    with mock.patch(
+        "great_expectations.data_context.data_context.abstract_data_context.AbstractDataContext._instantiate_datasource_from_config",
+        autospec=True,
+        side_effect=AssertionError("not instantiated"),
+    ):
+        context = gx.get_context(project_config=project_config)
+        context.delete_datasource("my_unreachable_datasource_name")
+
+    assert "my_unreachable_datasource_name" not in context.datasources
+    assert "my_unreachable_datasource_name" not in context.config.datasources
+
+
 @pytest.mark.integration
 def test_get_available_data_assets_names(test_df_pandas, empty_data_context) -> None:
 
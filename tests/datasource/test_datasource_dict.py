@@ -0,0 +1,114 @@
+import concurrent.futures
+import copy
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.datasource.datasource_dict import LazyDatasourceDict
+
+
+@pytest.mark.unit
+def test_lazy_datasource_dict_instantiates_pending_datasource_on_access_by_name():
+    datasource = mock.Mock()
+    instantiate_fn = mock.Mock(return_value=datasource)
+
+    datasources = LazyDatasourceDict()
+    datasources.add_pending(name="my_datasource", instantiate_fn=instantiate_fn)
+    datasources.add_pending(
+        name="my_other_datasource",
+        instantiate_fn=mock.Mock(side_effect=AssertionError("not accessed")),
+    )
+
+    assert datasources.instantiated == {}
+    assert "my_datasource" in datasources
+    assert datasources["my_datasource"] is datasource
+    assert datasources.get("my_datasource") is datasource
+    assert datasources.get("my_missing_datasource") is None
+    assert instantiate_fn.call_count == 1
+    assert datasources.instantiated == {"my_datasource": datasource}
+
+    datasources["my_other_datasource"] = datasource
+    del datasources["my_datasource"]
+    assert dict(datasources) == {"my_other_datasource": datasource}
+
+
+@pytest.mark.unit
+def test_lazy_datasource_dict_drops_datasource_failing_to_instantiate():
+    datasource = mock.Mock()
+
+    datasources = LazyDatasourceDict()
+    datasources.add_pending(
+        name="my_datasource", instantiate_fn=mock.Mock(return_value=datasource)
+    )
+    datasources.add_pending(
+        name="my_unreachable_datasource",
+        instantiate_fn=mock.Mock(
+            side_effect=gx_exceptions.DatasourceInitializationError(
+                datasource_name="my_unreachable_datasource", message="unreachable"
+            )
+        ),
+    )
+
+    assert len(datasources) == 1
+    assert "my_unreachable_datasource" not in datasources
+    with pytest.raises(KeyError):
+        _ = datasources["my_unreachable_datasource"]
+
+    assert list(datasources.items()) == [("my_datasource", datasource)]
+
+
+@pytest.mark.unit
+def test_lazy_datasource_dict_removes_pending_datasource_without_instantiating_it():
+    datasources = LazyDatasourceDict()
+    for name in ["my_datasource", "my_other_datasource"]:
+        datasources.add_pending(
+            name=name,
+            instantiate_fn=mock.Mock(side_effect=AssertionError("not accessed")),
+        )
+
+    assert datasources.pop("my_datasource", None) is None
+    del datasources["my_other_datasource"]
+    assert datasources.pop("my_missing_datasource", None) is None
+    with pytest.raises(KeyError):
+        datasources.pop("my_missing_datasource")
+
+    assert len(datasources) == 0
+
+
+@pytest.mark.unit
+def test_lazy_datasource_dict_instantiates_pending_datasource_once_across_threads():
+    datasource = mock.Mock()
+    all_threads_started = threading.Barrier(8)
+
+    def _instantiate():
+        time.sleep(0.05)
+        return datasource
+
+    instantiate_fn = mock.Mock(side_effect=_instantiate)
+    datasources = LazyDatasourceDict()
+    datasources.add_pending(name="my_datasource", instantiate_fn=instantiate_fn)
+
+    def _get_datasource(_):
+        all_threads_started.wait()
+        return datasources["my_datasource"]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(_get_datasource, range(8)))
+
+    assert all(result is datasource for result in results)
+    assert instantiate_fn.call_count == 1
+
+
+@pytest.mark.unit
+def test_lazy_datasource_dict_deepcopy_keeps_pending_datasources():
+    datasources = LazyDatasourceDict()
+    datasources.add_pending(name="my_datasource", instantiate_fn=lambda: "datasource")
+
+    datasources_copy = copy.deepcopy(datasources)
+
+    assert datasources_copy.is_pending("my_datasource")
+    assert datasources_copy["my_datasource"] == "datasource"
+    assert datasources.is_pending("my_datasource")
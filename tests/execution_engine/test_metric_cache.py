@@ -0,0 +1,175 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine.metric_cache import (
+    ConditionValueCache,
+    MetricCache,
+    estimate_size_bytes,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validation_graph import ValidationGraph
+
+METRIC_ID_1 = ("metric_1", "column=a", tuple())
+METRIC_ID_2 = ("metric_2", "column=a", tuple())
+METRIC_ID_3 = ("metric_3", "column=a", tuple())
+
+
+@pytest.mark.unit
+def test_estimate_size_bytes():
+    array = np.zeros(1000, dtype=np.int64)
+    assert estimate_size_bytes(value=array) == 8000
+
+    series = pd.Series(array)
+    assert estimate_size_bytes(value=series) == series.memory_usage(index=True)
+
+    df = pd.DataFrame({"a": array, "b": array})
+    assert estimate_size_bytes(value=df) == df.memory_usage(index=True).sum()
+
+    # Partial metric values are tuples, holding (among others) Pandas objects.
+    assert estimate_size_bytes(value=(series, {}, {})) > estimate_size_bytes(
+        value=series
+    )
+
+
+@pytest.mark.unit
+def test_metric_cache_evicts_least_recently_used_entries_above_budget():
+    cache = MetricCache(max_bytes=20000)
+
+    cache[METRIC_ID_1] = np.zeros(1000, dtype=np.int64)
+    cache[METRIC_ID_2] = np.zeros(1000, dtype=np.int64)
+    assert cache.size_bytes == 16000
+
+    assert cache.get(METRIC_ID_1) is not None
+    cache[METRIC_ID_3] = np.zeros(1000, dtype=np.int64)
+
+    assert METRIC_ID_1 in cache
+    assert METRIC_ID_2 not in cache
+    assert METRIC_ID_3 in cache
+    assert cache.get(METRIC_ID_2) is None
+
+    assert cache.statistics == {
+        "entries": 2,
+        "size_bytes": 16000,
+        "max_bytes": 20000,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 1,
+    }
+
+
+@pytest.mark.unit
+def test_metric_cache_does_not_evict_pinned_entries():
+    cache = MetricCache(max_bytes=10000)
+
+    cache.pin(keys=[METRIC_ID_1])
+    cache[METRIC_ID_1] = np.zeros(1000, dtype=np.int64)
+    cache[METRIC_ID_2] = np.zeros(1000, dtype=np.int64)
+
+    assert METRIC_ID_1 in cache
+    assert METRIC_ID_2 not in cache
+
+    # Pinned entries may exceed budget, until they are unpinned (as many times as they were pinned).
+    cache.pin(keys=[METRIC_ID_1, METRIC_ID_3])
+    cache[METRIC_ID_3] = np.zeros(1000, dtype=np.int64)
+    assert cache.size_bytes == 16000
+
+    cache.unpin(keys=[METRIC_ID_3])
+    assert METRIC_ID_3 not in cache
+
+    cache.unpin(keys=[METRIC_ID_1])
+    cache[METRIC_ID_2] = np.zeros(1000, dtype=np.int64)
+    assert METRIC_ID_1 in cache
+    assert METRIC_ID_2 not in cache
+
+    cache.unpin(keys=[METRIC_ID_1])
+    cache[METRIC_ID_2] = np.zeros(1000, dtype=np.int64)
+    assert METRIC_ID_1 not in cache
+    assert METRIC_ID_2 in cache
+    assert cache.evictions == 4
+
+
+@pytest.mark.unit
+def test_metric_cache_pop_releases_size():
+    cache = MetricCache()
+
+    cache[METRIC_ID_1] = np.zeros(1000, dtype=np.int64)
+    assert cache.size_bytes == 8000
+
+    assert cache.pop(METRIC_ID_1).shape == (1000,)
+    assert cache.pop(METRIC_ID_1, "missing") == "missing"
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+
+@pytest.mark.unit
+def test_metric_cache_is_unbounded_by_default():
+    cache = MetricCache()
+
+    cache.update({METRIC_ID_1: 1, METRIC_ID_2: np.zeros(10**6)})
+
+    assert len(cache) == 2
+    assert cache.evictions == 0
+
+    with pytest.raises(ValueError):
+        MetricCache(max_bytes=-1)
+
+
+@pytest.mark.unit
+def test_execution_engine_metric_cache_is_bounded_and_released_after_graph_resolution():
+    engine = PandasExecutionEngine(metric_cache_max_bytes=0)
+    engine.load_batch_data(
+        batch_id="my_id", batch_data=pd.DataFrame({"a": [1, 2, 3, None]})
+    )
+
+    metric_configuration = MetricConfiguration(
+        metric_name="column_values.null.unexpected_count",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    graph = ValidationGraph(execution_engine=engine)
+    graph.build_metric_dependency_graph(metric_configuration=metric_configuration)
+    resolved_metrics, aborted_metrics_info = graph.resolve(show_progress_bars=False)
+
+    assert aborted_metrics_info == {}
+    assert resolved_metrics[metric_configuration.id] == 3
+
+    # Once graph is resolved, nothing is pinned, and budget of zero bytes leaves cache empty.
+    assert engine.metric_cache.size_bytes == 0
+    assert engine.metric_cache.evictions >= len(resolved_metrics)
+
+    assert PandasExecutionEngine(caching=False).metric_cache is None
+
+
+@pytest.mark.unit
+def test_condition_value_cache_evicts_least_recently_used_values_above_max_entries():
+    cache = ConditionValueCache(max_entries=3)
+
+    cache.set_many(
+        condition_id="is_json", values=["a", "{}", 1], results=[False, True, False]
+    )
+    # Values are distinguished by type, as well as by condition.
+    assert cache.get_many(condition_id="is_json", values=["{}", "1", 1, "a"]) == (
+        [True, None, False, False],
+        [True, False, True, True],
+    )
+    assert cache.get_many(condition_id="is_date", values=["a"]) == ([None], [False])
+
+    # "{}" is least recently used value.
+    cache.set_many(condition_id="is_json", values=["[]"], results=[True])
+    assert len(cache) == 3
+    assert cache.get_many(condition_id="is_json", values=["{}", "[]"]) == (
+        [None, True],
+        [False, True],
+    )
+
+    assert cache.statistics == {
+        "entries": 3,
+        "max_entries": 3,
+        "hits": 4,
+        "misses": 3,
+    }
+
+    with pytest.raises(ValueError):
+        ConditionValueCache(max_entries=0)
@@ -0,0 +1,110 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine.pandas_aggregate_states import (
+    AggregateState,
+    MaxAggregateState,
+    MeanAggregateState,
+    MinAggregateState,
+    StandardDeviationAggregateState,
+    SumAggregateState,
+)
+
+COLUMN = pd.Series([3.5, None, -1.0, 7.25, 2.0, None, 10.0, 4.0])
+
+
+def _aggregate_over_chunks(
+    state_type, aggregate_fn, column: pd.Series, chunk_size: int
+) -> AggregateState:
+    state: AggregateState = state_type(aggregate_fn=aggregate_fn)
+    for start in range(0, len(column), chunk_size):
+        state.update(column=column.iloc[start : start + chunk_size])
+
+    return state
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "state_type,aggregate_fn",
+    [
+        (MinAggregateState, lambda column: column.min()),
+        (MaxAggregateState, lambda column: column.max()),
+        (SumAggregateState, lambda column: column.sum()),
+        (MeanAggregateState, lambda column: column.mean()),
+        (StandardDeviationAggregateState, lambda column: column.std()),
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 100])
+def test_aggregate_states_over_chunks_match_aggregates_of_entire_column(
+    state_type, aggregate_fn, chunk_size
+):
+    state: AggregateState = _aggregate_over_chunks(
+        state_type=state_type,
+        aggregate_fn=aggregate_fn,
+        column=COLUMN,
+        chunk_size=chunk_size,
+    )
+    assert state.result() == pytest.approx(aggregate_fn(column=COLUMN))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "state_type,aggregate_fn",
+    [
+        (MaxAggregateState, lambda column: column.max()),
+        (StandardDeviationAggregateState, lambda column: column.std()),
+    ],
+)
+def test_merged_aggregate_states_match_aggregates_of_entire_column(
+    state_type, aggregate_fn
+):
+    state: AggregateState = _aggregate_over_chunks(
+        state_type=state_type,
+        aggregate_fn=aggregate_fn,
+        column=COLUMN.iloc[:5],
+        chunk_size=2,
+    )
+    state.merge(
+        other=_aggregate_over_chunks(
+            state_type=state_type,
+            aggregate_fn=aggregate_fn,
+            column=COLUMN.iloc[5:],
+            chunk_size=2,
+        )
+    )
+    assert state.result() == pytest.approx(aggregate_fn(column=COLUMN))
+
+
+@pytest.mark.unit
+def test_aggregate_states_without_values():
+    state: AggregateState = MaxAggregateState(aggregate_fn=lambda column: column.max())
+    state.update(column=pd.Series([None, None], dtype=float))
+    assert math.isnan(state.result())
+
+    state = MeanAggregateState(aggregate_fn=lambda column: column.mean())
+    state.update(column=pd.Series([], dtype=float))
+    assert math.isnan(state.result())
+
+    state = StandardDeviationAggregateState(aggregate_fn=lambda column: column.std())
+    state.update(column=pd.Series([1.0]))
+    assert math.isnan(state.result())
+
+
+@pytest.mark.unit
+def test_moments_aggregate_state_is_numerically_stable():
+    column = pd.Series(1.0e9 + np.arange(10) % 2)
+    state: AggregateState = _aggregate_over_chunks(
+        state_type=StandardDeviationAggregateState,
+        aggregate_fn=lambda column: column.std(),
+        column=column,
+        chunk_size=3,
+    )
+    assert state.result() == pytest.approx(column.std())
+
+    with pytest.raises(TypeError):
+        MeanAggregateState(aggregate_fn=lambda column: column.mean()).update(
+            column=pd.Series(["a", "b"])
+        )
@@ -7,16 +7,27 @@ import pytest
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility import aws, azure, google
-from great_expectations.core.batch_spec import RuntimeDataBatchSpec, S3BatchSpec
+from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.batch import Batch
+from great_expectations.core.batch_spec import (
+    PathBatchSpec,
+    RuntimeDataBatchSpec,
+    S3BatchSpec,
+)
 
 # noinspection PyBroadException
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.execution_engine.pandas_batch_data import (
+    PandasChunkedBatchData,
+)
 from great_expectations.execution_engine.pandas_execution_engine import (
     PandasExecutionEngine,
 )
 from great_expectations.util import is_library_loadable
 from great_expectations.validator.computed_metric import MetricValue
 from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validation_graph import ValidationGraph
+from great_expectations.validator.validator import Validator
 from tests.expectations.test_util import get_table_columns_metric
 
 
@@ -233,6 +244,73 @@ def test_get_domain_records_with_multicolumn_domain():
     ), "Data does not match after getting full access compute domain"
 
 
+@pytest.mark.unit
+def test_get_domain_records_memoizes_filtered_records_per_batch():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame({"a": [1, 2, 3, 4, None], "b": [2, 3, 4, 5, 6]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    with mock.patch.object(
+        pd.DataFrame, "query", autospec=True, side_effect=pd.DataFrame.query
+    ) as mock_query:
+        data = engine.get_domain_records(
+            domain_kwargs={
+                "column": "a",
+                "row_condition": "b>2",
+                "condition_parser": "pandas",
+            }
+        )
+        # Same filtering Domain kwargs (for another column and explicit Batch ID) reuse filtered records.
+        assert (
+            engine.get_domain_records(
+                domain_kwargs={
+                    "column": "b",
+                    "batch_id": "1234",
+                    "row_condition": "b>2",
+                    "condition_parser": "pandas",
+                }
+            )
+            is data
+        )
+        assert mock_query.call_count == 1
+
+        # Unfiltered Domain is Batch itself.
+        assert engine.get_domain_records(domain_kwargs={"column": "a"}) is df
+
+        # Reloading Batch discards records filtered from its previous data.
+        engine.load_batch_data(batch_data=df.head(2), batch_id="1234")
+        data = engine.get_domain_records(
+            domain_kwargs={
+                "column": "a",
+                "row_condition": "b>2",
+                "condition_parser": "pandas",
+            }
+        )
+        assert mock_query.call_count == 2
+
+    assert data.equals(pd.DataFrame({"a": [2.0], "b": [3]}, index=[1]))
+
+    # Filtered records count against (and are evicted within) budget of metric cache.
+    assert engine.metric_cache.size_bytes > 0
+    engine = PandasExecutionEngine(metric_cache_max_bytes=1)
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    domain_kwargs: dict = {"row_condition": "b>2", "condition_parser": "pandas"}
+    assert engine.get_domain_records(domain_kwargs=domain_kwargs).equals(df.tail(4))
+    assert len(engine.metric_cache) == 0
+    assert engine.metric_cache.size_bytes == 0
+
+    engine = PandasExecutionEngine(caching=False)
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    domain_kwargs = {
+        "column_A": "a",
+        "column_B": "b",
+        "ignore_row_if": "either_value_is_missing",
+    }
+    assert engine.get_domain_records(
+        domain_kwargs=domain_kwargs
+    ) is not engine.get_domain_records(domain_kwargs=domain_kwargs)
+
+
 def test_get_compute_domain_with_no_domain_kwargs():
     engine = PandasExecutionEngine()
     df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
@@ -659,3 +737,311 @@ def test_get_batch_with_gcs_misconfigured(gcs_batch_spec):
     # Raises error if batch_spec causes ExecutionEngine error
     with pytest.raises(gx_exceptions.ExecutionEngineError):
         execution_engine_no_gcs.get_batch_data(batch_spec=gcs_batch_spec)
+
+
+@pytest.mark.unit
+def test_resolve_metric_bundle_obtains_records_once_per_compute_domain():
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": [4, 5, None, 7]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    desired_metrics = []
+    for metric_name in ("column.max", "column.min", "column.mean"):
+        for column_name in ("a", "b"):
+            desired_metric = MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs={"column": column_name},
+                metric_value_kwargs=None,
+            )
+            desired_metric.metric_dependencies = {
+                "table.columns": table_columns_metric,
+            }
+            desired_metrics.append(desired_metric)
+
+    with mock.patch.object(
+        PandasExecutionEngine,
+        "get_domain_records",
+        wraps=engine.get_domain_records,
+    ) as mock_get_domain_records:
+        results = engine.resolve_metrics(
+            metrics_to_resolve=desired_metrics, metrics=metrics
+        )
+
+    assert mock_get_domain_records.call_count == 1
+    assert [results[desired_metric.id] for desired_metric in desired_metrics] == [
+        3.0,
+        7.0,
+        1.0,
+        4.0,
+        2.0,
+        5.333333333333333,
+    ]
+
+
+@pytest.mark.unit
+def test_resolve_metric_bundle_reports_only_failed_column_aggregates():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    desired_metrics = []
+    for column_name in ("a", "b"):
+        desired_metric = MetricConfiguration(
+            metric_name="column.mean",
+            metric_domain_kwargs={"column": column_name},
+            metric_value_kwargs=None,
+        )
+        desired_metric.metric_dependencies = {
+            "table.columns": table_columns_metric,
+        }
+        desired_metrics.append(desired_metric)
+
+    with pytest.raises(gx_exceptions.MetricResolutionError) as e:
+        engine.resolve_metrics(metrics_to_resolve=desired_metrics, metrics=metrics)
+
+    assert [failed_metric.id for failed_metric in e.value.failed_metrics] == [
+        desired_metrics[1].id
+    ]
+
+
+@pytest.mark.unit
+def test_batch_data_read_in_chunks_resolves_aggregates_without_reading_all_records(
+    tmp_path,
+):
+    df = pd.DataFrame(
+        {"a": [1.5, 2.0, None, 4.0, 8.0, -3.0, 2.5], "b": [1, 2, 3, 4, 5, 6, 7]}
+    )
+    path = str(tmp_path / "data.csv")
+    df.to_csv(path, index=False)
+
+    engine = PandasExecutionEngine()
+    batch_data, _ = engine.get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(
+            path=path, reader_method="read_csv", reader_options={"chunksize": 3}
+        )
+    )
+    assert isinstance(batch_data, PandasChunkedBatchData)
+    engine.load_batch_data(batch_id="my_id", batch_data=batch_data)
+
+    metric_configurations = [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=None,
+        )
+        for metric_name, metric_domain_kwargs in [
+            ("table.row_count", {}),
+            ("table.row_count", {"row_condition": "b>2", "condition_parser": "pandas"}),
+            ("column.max", {"column": "a"}),
+            ("column.mean", {"column": "a"}),
+            ("column.standard_deviation", {"column": "a"}),
+            (
+                "column.min",
+                {"column": "a", "row_condition": "b>2", "condition_parser": "pandas"},
+            ),
+        ]
+    ]
+    graph = ValidationGraph(execution_engine=engine)
+    for metric_configuration in metric_configurations:
+        graph.build_metric_dependency_graph(metric_configuration=metric_configuration)
+
+    resolved_metrics, aborted_metrics_info = graph.resolve(show_progress_bars=False)
+
+    assert aborted_metrics_info == {}
+    assert not batch_data.is_materialized
+    assert [
+        resolved_metrics[metric_configuration.id]
+        for metric_configuration in metric_configurations
+    ] == [
+        7,
+        5,
+        8.0,
+        pytest.approx(df["a"].mean()),
+        pytest.approx(df["a"].std()),
+        -3.0,
+    ]
+
+    # Metrics, which do not support chunked computation, fail, unless reading all records (once) is allowed.
+    with pytest.raises(gx_exceptions.ExecutionEngineError):
+        _ = batch_data.dataframe
+
+    assert not batch_data.is_materialized
+
+    engine = PandasExecutionEngine(materialize_chunked_batch_data=True)
+    assert engine.config["materialize_chunked_batch_data"]
+    batch_data, _ = engine.get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(
+            path=path, reader_method="read_csv", reader_options={"chunksize": 3}
+        )
+    )
+    assert batch_data.dataframe.equals(df)
+    assert batch_data.is_materialized
+
+
+@pytest.mark.unit
+def test_batch_data_read_in_chunks_fails_column_map_expectation_unless_materialization_is_allowed(
+    tmp_path,
+):
+    df = pd.DataFrame({"a": [1.5, 2.0, None, 4.0, 8.0, -3.0, 2.5]})
+    path = str(tmp_path / "data.csv")
+    df.to_csv(path, index=False)
+
+    expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_not_be_null",
+        kwargs={"column": "a"},
+    )
+
+    materialize_chunked_batch_data: bool
+    for materialize_chunked_batch_data in [False, True]:
+        engine = PandasExecutionEngine(
+            materialize_chunked_batch_data=materialize_chunked_batch_data
+        )
+        batch_data, batch_markers = engine.get_batch_data_and_markers(
+            batch_spec=PathBatchSpec(
+                path=path, reader_method="read_csv", reader_options={"chunksize": 3}
+            )
+        )
+        validator = Validator(
+            execution_engine=engine,
+            batches=[Batch(data=batch_data, batch_markers=batch_markers)],
+        )
+        result = validator.graph_validate(configurations=[expectation_configuration])[0]
+
+        if materialize_chunked_batch_data:
+            assert not result.success
+            assert result.result["unexpected_count"] == 1
+        else:
+            assert result.exception_info["raised_exception"]
+            assert "chunksize" in result.exception_info["exception_message"]
+
+
+@pytest.mark.unit
+def test_batch_data_read_in_chunks_resolves_approximate_metrics_from_merged_sketches(
+    tmp_path,
+):
+    df = pd.DataFrame(
+        {"a": [float(value) for value in range(100)], "b": [1, 2, 2, None] * 25}
+    )
+    path = str(tmp_path / "data.csv")
+    df.to_csv(path, index=False)
+
+    engine = PandasExecutionEngine()
+    batch_data, _ = engine.get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(
+            path=path, reader_method="read_csv", reader_options={"chunksize": 30}
+        )
+    )
+    engine.load_batch_data(batch_id="my_id", batch_data=batch_data)
+
+    metric_configurations = [
+        MetricConfiguration(
+            metric_name="column.quantile_values",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs={
+                "quantiles": [0.0, 0.5, 1.0],
+                "allow_relative_error": 0.01,
+            },
+        ),
+        MetricConfiguration(
+            metric_name="column.distinct_values.count.approximate",
+            metric_domain_kwargs={"column": "b"},
+            metric_value_kwargs={"allow_relative_error": 0.05},
+        ),
+        MetricConfiguration(
+            metric_name="column.most_common_value",
+            metric_domain_kwargs={"column": "b"},
+            metric_value_kwargs={"allow_relative_error": 0.1},
+        ),
+    ]
+    graph = ValidationGraph(execution_engine=engine)
+    for metric_configuration in metric_configurations:
+        graph.build_metric_dependency_graph(metric_configuration=metric_configuration)
+
+    resolved_metrics, aborted_metrics_info = graph.resolve(show_progress_bars=False)
+
+    assert aborted_metrics_info == {}
+    assert not batch_data.is_materialized
+    # Sketches of so few values are exact.
+    assert [
+        resolved_metrics[metric_configuration.id]
+        for metric_configuration in metric_configurations
+    ] == [[0.0, 49.0, 99.0], 2, [2.0]]
+
+
+@pytest.mark.unit
+def test_batch_data_read_in_chunks_does_not_support_splitting_and_sampling(tmp_path):
+    path = str(tmp_path / "data.csv")
+    pd.DataFrame({"a": [1, 2, 3]}).to_csv(path, index=False)
+
+    with pytest.raises(gx_exceptions.ExecutionEngineError):
+        PandasExecutionEngine().get_batch_data_and_markers(
+            batch_spec=PathBatchSpec(
+                path=path,
+                reader_method="read_csv",
+                reader_options={"chunksize": 2},
+                sampling_method="sample_using_random",
+            )
+        )
+
+
+@pytest.mark.unit
+def test_exact_quantile_values_and_most_common_value_are_bundled_column_aggregates():
+    df = pd.DataFrame({"a": [1.0, 2.0, 2.0, None, 4.0]})
+    engine = PandasExecutionEngine()
+    engine.load_batch_data(batch_id="my_id", batch_data=df)
+
+    metric_configurations = [
+        MetricConfiguration(
+            metric_name="column.quantile_values",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs={
+                "quantiles": [0.0, 0.5, 1.0],
+                "allow_relative_error": "lower",
+            },
+        ),
+        MetricConfiguration(
+            metric_name="column.most_common_value",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=None,
+        ),
+    ]
+    graph = ValidationGraph(execution_engine=engine)
+    for metric_configuration in metric_configurations:
+        graph.build_metric_dependency_graph(metric_configuration=metric_configuration)
+
+    with mock.patch.object(
+        PandasExecutionEngine,
+        "resolve_metric_bundle",
+        autospec=True,
+        side_effect=PandasExecutionEngine.resolve_metric_bundle,
+    ) as mock_resolve_metric_bundle:
+        resolved_metrics, aborted_metrics_info = graph.resolve(show_progress_bars=False)
+
+    assert aborted_metrics_info == {}
+    assert [
+        resolved_metrics[metric_configuration.id]
+        for metric_configuration in metric_configurations
+    ] == [[1.0, 2.0, 4.0], [2.0]]
+    bundled_metric_ids = {
+        bundled_metric_configuration.metric_configuration.id
+        for call in mock_resolve_metric_bundle.call_args_list
+        for bundled_metric_configuration in call.kwargs["metric_fn_bundle"]
+    }
+    assert all(
+        metric_configuration.id in bundled_metric_ids
+        for metric_configuration in metric_configurations
+    )
@@ -0,0 +1,236 @@
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine.persistent_metric_cache import (
+    FilesystemPersistentMetricCache,
+    PersistentMetricCache,
+    SqlitePersistentMetricCache,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validation_graph import ValidationGraph
+
+METRIC_ID_1 = ("column.max", "column=a", tuple())
+METRIC_ID_2 = ("column.min", "column=a", tuple())
+METRIC_ID_3 = ("column.mean", "column=a", tuple())
+
+
+@pytest.fixture(params=["sqlite", "filesystem"])
+def persistent_metric_cache_factory(request, tmp_path):
+    def _build(**kwargs) -> PersistentMetricCache:
+        if request.param == "sqlite":
+            return SqlitePersistentMetricCache(
+                database_path=str(tmp_path / "metrics.db"), **kwargs
+            )
+
+        return FilesystemPersistentMetricCache(
+            base_directory=str(tmp_path / "metrics"), **kwargs
+        )
+
+    return _build
+
+
+@pytest.mark.unit
+def test_persistent_metric_cache_round_trip_is_keyed_by_batch_fingerprint(
+    persistent_metric_cache_factory,
+):
+    cache: PersistentMetricCache = persistent_metric_cache_factory()
+
+    assert cache.get(metric_id=METRIC_ID_1, batch_fingerprint="abc") == (False, None)
+    assert cache.set(metric_id=METRIC_ID_1, batch_fingerprint="abc", value=[1, 2.5])
+    assert cache.get(metric_id=METRIC_ID_1, batch_fingerprint="abc") == (
+        True,
+        [1, 2.5],
+    )
+    assert cache.get(metric_id=METRIC_ID_1, batch_fingerprint="def") == (False, None)
+    assert len(cache) == 1
+
+    # Entries survive instances of cache.
+    assert persistent_metric_cache_factory().get(
+        metric_id=METRIC_ID_1, batch_fingerprint="abc"
+    ) == (True, [1, 2.5])
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_persistent_metric_cache_evicts_least_recently_used_entries(
+    persistent_metric_cache_factory,
+):
+    cache: PersistentMetricCache = persistent_metric_cache_factory(max_entries=2)
+
+    with mock.patch(
+        "great_expectations.execution_engine.persistent_metric_cache.time.time"
+    ) as mock_time:
+        mock_time.return_value = 1000.0
+        cache.set(metric_id=METRIC_ID_1, batch_fingerprint="abc", value=1)
+        mock_time.return_value = 1001.0
+        cache.set(metric_id=METRIC_ID_2, batch_fingerprint="abc", value=2)
+        mock_time.return_value = 1002.0
+        assert cache.get(metric_id=METRIC_ID_1, batch_fingerprint="abc") == (True, 1)
+        mock_time.return_value = 1003.0
+        cache.set(metric_id=METRIC_ID_3, batch_fingerprint="abc", value=3)
+
+    assert len(cache) == 2
+    assert cache.get(metric_id=METRIC_ID_1, batch_fingerprint="abc") == (True, 1)
+    assert cache.get(metric_id=METRIC_ID_2, batch_fingerprint="abc") == (False, None)
+    assert cache.get(metric_id=METRIC_ID_3, batch_fingerprint="abc") == (True, 3)
+
+
+@pytest.mark.unit
+def test_persistent_metric_cache_expires_entries_after_ttl(
+    persistent_metric_cache_factory,
+):
+    cache: PersistentMetricCache = persistent_metric_cache_factory(ttl_seconds=60)
+
+    with mock.patch(
+        "great_expectations.execution_engine.persistent_metric_cache.time.time"
+    ) as mock_time:
+        mock_time.return_value = 1000.0
+        cache.set(metric_id=METRIC_ID_1, batch_fingerprint="abc", value=1)
+        mock_time.return_value = 1030.0
+        assert cache.get(metric_id=METRIC_ID_1, batch_fingerprint="abc") == (True, 1)
+        mock_time.return_value = 1061.0
+        assert cache.get(metric_id=METRIC_ID_1, batch_fingerprint="abc") == (
+            False,
+            None,
+        )
+
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_persistent_metric_cache_does_not_evict_unless_bounded(
+    persistent_metric_cache_factory,
+):
+    cache: PersistentMetricCache = persistent_metric_cache_factory()
+
+    with mock.patch.object(cache, "_evict") as mock_evict:
+        cache.set(metric_id=METRIC_ID_1, batch_fingerprint="abc", value=1)
+        cache.set(metric_id=METRIC_ID_2, batch_fingerprint="abc", value=2)
+
+    mock_evict.assert_not_called()
+
+
+@pytest.mark.unit
+def test_filesystem_persistent_metric_cache_amortizes_eviction(tmp_path):
+    cache = FilesystemPersistentMetricCache(
+        base_directory=str(tmp_path / "metrics"), max_entries=20
+    )
+
+    with mock.patch.object(cache, "_evict", wraps=cache._evict) as mock_evict:
+        for value in range(22):
+            cache.set(
+                metric_id=("column.max", f"column={value}", tuple()),
+                batch_fingerprint="abc",
+                value=value,
+            )
+
+    # Directory is scanned after every "max_entries / 10" entries stored.
+    assert mock_evict.call_count == 11
+    assert len(cache) == 20
+
+
+@pytest.mark.unit
+def test_sqlite_persistent_metric_cache_reuses_connection(tmp_path):
+    cache = SqlitePersistentMetricCache(
+        database_path=str(tmp_path / "metrics.db"), max_entries=2
+    )
+
+    with mock.patch(
+        "great_expectations.execution_engine.persistent_metric_cache.sqlite3.connect"
+    ) as mock_connect:
+        cache.set(metric_id=METRIC_ID_1, batch_fingerprint="abc", value=1)
+        assert cache.get(metric_id=METRIC_ID_1, batch_fingerprint="abc") == (True, 1)
+        assert len(cache) == 1
+
+    mock_connect.assert_not_called()
+
+    cache.close()
+    assert cache.get(metric_id=METRIC_ID_1, batch_fingerprint="abc") == (True, 1)
+    cache.close()
+
+
+@pytest.mark.unit
+def test_persistent_metric_cache_does_not_store_unserializable_values(
+    persistent_metric_cache_factory,
+):
+    cache: PersistentMetricCache = persistent_metric_cache_factory()
+
+    assert not cache.set(
+        metric_id=METRIC_ID_1, batch_fingerprint="abc", value=lambda x: x
+    )
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_persistent_metric_cache_invalid_configuration_raises_error(tmp_path):
+    with pytest.raises(ValueError):
+        SqlitePersistentMetricCache(
+            database_path=str(tmp_path / "metrics.db"), max_entries=0
+        )
+
+    with pytest.raises(ValueError):
+        SqlitePersistentMetricCache(
+            database_path=str(tmp_path / "metrics.db"), ttl_seconds=0
+        )
+
+
+@pytest.mark.unit
+def test_unchanged_batch_metrics_are_not_recomputed_across_execution_engines(
+    tmp_path,
+):
+    persistent_metric_cache_config: dict = {
+        "class_name": "SqlitePersistentMetricCache",
+        "database_path": str(tmp_path / "metrics.db"),
+    }
+
+    def _resolve_column_max(df: pd.DataFrame) -> tuple:
+        engine = PandasExecutionEngine(
+            persistent_metric_cache=persistent_metric_cache_config
+        )
+        engine.load_batch_data(batch_id="my_id", batch_data=df)
+
+        metric_configuration = MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=None,
+        )
+        graph = ValidationGraph(execution_engine=engine)
+        graph.build_metric_dependency_graph(metric_configuration=metric_configuration)
+
+        with mock.patch.object(
+            PandasExecutionEngine,
+            "resolve_metric_bundle",
+            wraps=engine.resolve_metric_bundle,
+        ) as mock_resolve_metric_bundle:
+            resolved_metrics, aborted_metrics_info = graph.resolve(
+                show_progress_bars=False
+            )
+
+        assert aborted_metrics_info == {}
+        return (
+            resolved_metrics[metric_configuration.id],
+            len(graph.edges),
+            mock_resolve_metric_bundle.call_count,
+        )
+
+    df = pd.DataFrame({"a": [1, 2, 3]})
+
+    column_max, num_edges, num_computations = _resolve_column_max(df=df)
+    assert column_max == 3
+    assert num_edges > 1
+    assert num_computations > 0
+
+    # Same data: dependencies are pruned from graph, and nothing is computed.
+    assert _resolve_column_max(df=df.copy()) == (3, 1, 0)
+
+    # Changed data: metric is computed again.
+    column_max, num_edges, num_computations = _resolve_column_max(
+        df=pd.DataFrame({"a": [1, 2, 4]})
+    )
+    assert column_max == 4
+    assert num_computations > 0
@@ -1160,6 +1160,145 @@ def test_resolve_metric_bundle_with_compute_domain_kwargs_json_serialization(
         assert False, str(e)
 
 
+@pytest.mark.parametrize("fuse_metric_bundle_queries", [True, False])
+def test_resolve_metric_bundle_fuses_domains_sharing_batch(
+    caplog, spark_session, fuse_metric_bundle_queries
+):
+    engine: SparkDFExecutionEngine = build_spark_engine(
+        spark=spark_session,
+        df=pd.DataFrame(
+            {"a": [1, 2, 1, 2, 3, 3], "b": [4, 5, 4, 5, 4, 6]},
+        ),
+        batch_id="1234",
+    )
+    engine._fuse_metric_bundle_queries = fuse_metric_bundle_queries
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    # The last row condition retains no rows, so its metrics are computed separately.
+    row_conditions = [None, "b > 4", "b = 5", "b > 100"]
+    aggregate_fn_metrics = []
+    desired_metrics = []
+    for metric_name in ["column.max", "column.min"]:
+        for row_condition in row_conditions:
+            metric_domain_kwargs = {"column": "a"}
+            if row_condition:
+                metric_domain_kwargs.update(
+                    {"row_condition": row_condition, "condition_parser": "spark"}
+                )
+
+            aggregate_fn_metric = MetricConfiguration(
+                metric_name=f"{metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+                metric_domain_kwargs=metric_domain_kwargs,
+                metric_value_kwargs=None,
+            )
+            aggregate_fn_metric.metric_dependencies = {
+                "table.columns": table_columns_metric,
+            }
+            aggregate_fn_metrics.append(aggregate_fn_metric)
+
+            desired_metric = MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs=metric_domain_kwargs,
+                metric_value_kwargs=None,
+            )
+            desired_metric.metric_dependencies = {
+                "metric_partial_fn": aggregate_fn_metric,
+                "table.columns": table_columns_metric,
+            }
+            desired_metrics.append(desired_metric)
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=aggregate_fn_metrics, metrics=metrics
+    )
+    metrics.update(results)
+
+    caplog.clear()
+    caplog.set_level(logging.DEBUG, logger="great_expectations")
+    results = engine.resolve_metrics(
+        metrics_to_resolve=desired_metrics, metrics=metrics
+    )
+
+    assert [results[metric.id] for metric in desired_metrics] == [
+        3,
+        3,
+        2,
+        None,
+        1,
+        2,
+        2,
+        None,
+    ]
+    assert (
+        any(
+            record.message.startswith(
+                "SparkDFExecutionEngine computed 8 metrics on 4 Domains"
+            )
+            for record in caplog.records
+        )
+        is fuse_metric_bundle_queries
+    )
+
+
+def test_retain_shared_domain_records_persists_row_condition_domains_while_resolving(
+    spark_session,
+):
+    engine: SparkDFExecutionEngine = build_spark_engine(
+        spark=spark_session,
+        df=pd.DataFrame(
+            {"a": [1, 2, 1, 2, 3, 3], "b": [4, 5, 4, 5, 4, 6]},
+        ),
+        batch_id="1234",
+    )
+    shared_domain_kwargs = {
+        "batch_id": "1234",
+        "row_condition": "b > 4",
+        "condition_parser": "spark",
+    }
+    unshared_domain_kwargs = {
+        "batch_id": "1234",
+        "row_condition": "b = 6",
+        "condition_parser": "spark",
+    }
+    metric_configurations = [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": "a", **shared_domain_kwargs},
+            metric_value_kwargs=None,
+        )
+        for metric_name in ["column.max", "column.min"]
+    ] + [
+        MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"column": "a", **unshared_domain_kwargs},
+            metric_value_kwargs=None,
+        )
+    ]
+
+    with engine.retain_shared_domain_records(
+        metric_configurations=metric_configurations
+    ):
+        shared_df = engine.get_domain_records(domain_kwargs=shared_domain_kwargs)
+        assert shared_df.is_cached
+        assert (
+            engine.get_domain_records(domain_kwargs=shared_domain_kwargs) is shared_df
+        )
+        assert shared_df.count() == 3
+
+        unshared_df = engine.get_domain_records(domain_kwargs=unshared_domain_kwargs)
+        assert not unshared_df.is_cached
+
+    assert not shared_df.is_cached
+    assert engine._persisted_domain_records == {}
+    assert not engine.get_domain_records(domain_kwargs=shared_domain_kwargs).is_cached
+
+
 # Making sure dataframe property is functional
 def test_dataframe_property_given_loaded_batch(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
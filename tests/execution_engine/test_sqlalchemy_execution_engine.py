@@ -1,6 +1,7 @@
 import logging
 import os
 from typing import Dict, Tuple, cast
+from unittest import mock
 
 import pandas as pd
 import pytest
@@ -19,7 +20,11 @@ from great_expectations.core.metric_function_types import (
     MetricPartialFunctionTypeSuffixes,
     SummarizationMetricNameSuffixes,
 )
+from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.data_context.util import file_relative_path
+from great_expectations.execution_engine.execution_engine import (
+    MetricComputationConfiguration,
+)
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
@@ -926,6 +931,260 @@ def test_resolve_metric_bundle_with_compute_domain_kwargs_json_serialization(sa)
         assert False, str(e)
 
 
+@pytest.mark.parametrize("concurrency_enabled", [True, False])
+def test_resolve_metric_bundle_executes_per_domain_queries_concurrently_if_enabled(
+    sa, tmp_path, concurrency_enabled
+):
+    df = pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 5, 4, 5, 4, 6]})
+
+    # File-backed database, so that every pooled connection sees the same table.
+    sqlalchemy_engine = sa.create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    add_dataframe_to_db(df=df, name="test", con=sqlalchemy_engine, index=False)
+
+    engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine,
+        concurrency=ConcurrencyConfig(enabled=concurrency_enabled),
+    )
+    engine.load_batch_data(
+        batch_id="1234",
+        batch_data=SqlAlchemyBatchData(execution_engine=engine, table_name="test"),
+    )
+    # SQLite pins all work to one connection; emulate pooled backend (e.g., BigQuery, PostgreSQL).
+    engine.engine = sqlalchemy_engine
+    engine._engine_backup = None
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    row_conditions = [None, 'col("b")>4', 'col("b")==5']
+    aggregate_fn_metrics = []
+    for row_condition in row_conditions:
+        metric_domain_kwargs = {"column": "a", "batch_id": "1234"}
+        if row_condition:
+            metric_domain_kwargs.update(
+                {
+                    "row_condition": row_condition,
+                    "condition_parser": "great_expectations__experimental__",
+                }
+            )
+
+        aggregate_fn_metric = MetricConfiguration(
+            metric_name=f"column.max.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+            metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=None,
+        )
+        aggregate_fn_metric.metric_dependencies = {
+            "table.columns": table_columns_metric,
+        }
+        aggregate_fn_metrics.append(aggregate_fn_metric)
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=aggregate_fn_metrics, metrics=metrics
+    )
+    metrics.update(results)
+
+    desired_metrics = []
+    for aggregate_fn_metric in aggregate_fn_metrics:
+        desired_metric = MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs=aggregate_fn_metric.metric_domain_kwargs,
+            metric_value_kwargs=None,
+        )
+        desired_metric.metric_dependencies = {
+            "metric_partial_fn": aggregate_fn_metric,
+            "table.columns": table_columns_metric,
+        }
+        desired_metrics.append(desired_metric)
+
+    with mock.patch.object(
+        SqlAlchemyExecutionEngine,
+        "_execute_metric_bundle_query",
+        wraps=SqlAlchemyExecutionEngine._execute_metric_bundle_query,
+    ) as mock_execute_metric_bundle_query:
+        results = engine.resolve_metrics(
+            metrics_to_resolve=desired_metrics, metrics=metrics
+        )
+
+    assert [results[metric.id] for metric in desired_metrics] == [3, 3, 2]
+    assert mock_execute_metric_bundle_query.call_count == len(row_conditions)
+
+    connectables = [
+        call.kwargs["connectable"]
+        for call in mock_execute_metric_bundle_query.call_args_list
+    ]
+    if concurrency_enabled:
+        # Every Domain query checks out its own connection from pool of underlying Engine.
+        assert all(connectable is sqlalchemy_engine for connectable in connectables)
+    else:
+        assert all(
+            isinstance(connectable, sqlalchemy.engine.Connection)
+            for connectable in connectables
+        )
+
+
+def test_max_metric_resolution_concurrency(sa, tmp_path):
+    df = pd.DataFrame({"a": [1, 2, 1, 2, 3, 3]})
+
+    sqlalchemy_engine = sa.create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    add_dataframe_to_db(df=df, name="test", con=sqlalchemy_engine, index=False)
+
+    engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine,
+        concurrency=ConcurrencyConfig(
+            enabled=True, max_metric_resolution_concurrency=4
+        ),
+    )
+    # SQLite pins all work to one connection.
+    assert engine.max_metric_resolution_concurrency == 1
+
+    # Emulate pooled backend (e.g., BigQuery, PostgreSQL).
+    engine.engine = sqlalchemy_engine
+    engine._engine_backup = None
+    engine.load_batch_data(
+        batch_id="1234",
+        batch_data=SqlAlchemyBatchData(execution_engine=engine, table_name="test"),
+    )
+    assert engine.max_metric_resolution_concurrency == 4
+
+    # Temporary tables are only visible to the database session that created them.
+    engine.load_batch_data(
+        batch_id="5678",
+        batch_data=SqlAlchemyBatchData(
+            execution_engine=engine,
+            query="SELECT * FROM test",
+            create_temp_table=True,
+        ),
+    )
+    assert engine.max_metric_resolution_concurrency == 1
+
+
+@pytest.mark.parametrize(
+    "fuse_metric_bundle_queries,expected_query_count", [(True, 1), (False, 3)]
+)
+def test_resolve_metric_bundle_fuses_queries_of_domains_sharing_base_selectable(
+    sa, fuse_metric_bundle_queries, expected_query_count
+):
+    df = pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 5, 4, 5, 4, 6]})
+
+    engine = build_sa_engine(df, sa)
+    engine._fuse_metric_bundle_queries = fuse_metric_bundle_queries
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    row_conditions = [None, 'col("b")>4', 'col("b")==5']
+    aggregate_fn_metrics = []
+    desired_metrics = []
+    for metric_name in ["column.max", "column.min"]:
+        for row_condition in row_conditions:
+            metric_domain_kwargs = {"column": "a"}
+            if row_condition:
+                metric_domain_kwargs.update(
+                    {
+                        "row_condition": row_condition,
+                        "condition_parser": "great_expectations__experimental__",
+                    }
+                )
+
+            aggregate_fn_metric = MetricConfiguration(
+                metric_name=f"{metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+                metric_domain_kwargs=metric_domain_kwargs,
+                metric_value_kwargs=None,
+            )
+            aggregate_fn_metric.metric_dependencies = {
+                "table.columns": table_columns_metric,
+            }
+            aggregate_fn_metrics.append(aggregate_fn_metric)
+
+            desired_metric = MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs=metric_domain_kwargs,
+                metric_value_kwargs=None,
+            )
+            desired_metric.metric_dependencies = {
+                "metric_partial_fn": aggregate_fn_metric,
+                "table.columns": table_columns_metric,
+            }
+            desired_metrics.append(desired_metric)
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=aggregate_fn_metrics, metrics=metrics
+    )
+    metrics.update(results)
+
+    with mock.patch.object(
+        SqlAlchemyExecutionEngine,
+        "_execute_metric_bundle_query",
+        wraps=SqlAlchemyExecutionEngine._execute_metric_bundle_query,
+    ) as mock_execute_metric_bundle_query:
+        results = engine.resolve_metrics(
+            metrics_to_resolve=desired_metrics, metrics=metrics
+        )
+
+    assert mock_execute_metric_bundle_query.call_count == expected_query_count
+    assert [results[metric.id] for metric in desired_metrics] == [3, 3, 2, 1, 2, 2]
+
+
+def test_resolve_metric_bundle_does_not_fuse_non_aggregate_metric_functions(sa):
+    df = pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 5, 4, 5, 4, 6]})
+
+    engine = build_sa_engine(df, sa)
+    engine._fuse_metric_bundle_queries = True
+
+    row_conditions = [None, 'col("b")>4']
+    metric_fn_bundle = []
+    for row_condition in row_conditions:
+        compute_domain_kwargs = {}
+        if row_condition:
+            compute_domain_kwargs.update(
+                {
+                    "row_condition": row_condition,
+                    "condition_parser": "great_expectations__experimental__",
+                }
+            )
+
+        metric_fn_bundle.append(
+            MetricComputationConfiguration(
+                metric_configuration=MetricConfiguration(
+                    metric_name="my_metric",
+                    metric_domain_kwargs=compute_domain_kwargs,
+                    metric_value_kwargs=None,
+                ),
+                metric_fn=sa.func.min(sa.column("a"))
+                + sa.select(sa.func.count())
+                .select_from(sa.table("test"))
+                .scalar_subquery(),
+                metric_provider_kwargs={},
+                compute_domain_kwargs=compute_domain_kwargs,
+                accessor_domain_kwargs={},
+            )
+        )
+
+    with mock.patch.object(
+        SqlAlchemyExecutionEngine,
+        "_execute_metric_bundle_query",
+        wraps=SqlAlchemyExecutionEngine._execute_metric_bundle_query,
+    ) as mock_execute_metric_bundle_query:
+        results = engine.resolve_metric_bundle(metric_fn_bundle=metric_fn_bundle)
+
+    # Subqueries cannot be restricted to rows of their Domain, so every Domain retains its own query.
+    assert mock_execute_metric_bundle_query.call_count == len(row_conditions)
+    assert [
+        results[metric_computation_configuration.metric_configuration.id]
+        for metric_computation_configuration in metric_fn_bundle
+    ] == [7, 8]
+
+
 def test_get_batch_data_and_markers_using_query(sqlite_view_engine, test_df):
     my_execution_engine: SqlAlchemyExecutionEngine = SqlAlchemyExecutionEngine(
         engine=sqlite_view_engine
@@ -2089,6 +2089,119 @@ def test_map_column_values_increasing_spark(spark_session):
     ]
 
 
+@pytest.mark.unit
+def test_map_json_parseable_pd_reuses_condition_values_across_columns():
+    df = pd.DataFrame(
+        {
+            "a": ['{"x": 1}', "not json", '{"x": 1}', None],
+            "b": ["not json", '{"x": 1}', "[]", "[]"],
+        }
+    )
+    batch = Batch(data=df)
+    engine = PandasExecutionEngine(
+        batch_data_dict={batch.id: batch.data},
+        condition_value_cache_max_entries=100,
+    )
+    assert engine.config["condition_value_cache_max_entries"] == 100
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    condition_metrics = []
+    for column_name in ("a", "b"):
+        condition_metric = MetricConfiguration(
+            metric_name=f"column_values.json_parseable.{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
+            metric_domain_kwargs={"column": column_name},
+            metric_value_kwargs=None,
+        )
+        condition_metric.metric_dependencies = {
+            "table.columns": table_columns_metric,
+        }
+        results = engine.resolve_metrics(
+            metrics_to_resolve=(condition_metric,),
+            metrics=metrics,
+        )
+        metrics.update(results)
+        condition_metrics.append(condition_metric)
+
+    # Unexpected condition is True for values, which are not JSON parseable.
+    assert list(metrics[condition_metrics[0].id][0]) == [False, True, False]
+    assert list(metrics[condition_metrics[1].id][0]) == [True, False, False, False]
+    # Of the distinct values of column "b", only "[]" was not seen in column "a".
+    assert engine.condition_value_cache.statistics == {
+        "entries": 3,
+        "max_entries": 100,
+        "hits": 2,
+        "misses": 3,
+    }
+
+
+def test_map_match_json_schema_spark(spark_session):
+    engine: SparkDFExecutionEngine = build_spark_engine(
+        spark=spark_session,
+        df=pd.DataFrame(
+            {
+                "a": ['{"x": 1}', '{"x": "one"}', "[1]", '{"x": 2}', None],
+            }
+        ),
+        batch_id="my_id",
+    )
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    condition_metric = MetricConfiguration(
+        metric_name=f"column_values.match_json_schema.{MetricPartialFunctionTypeSuffixes.CONDITION.value}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "json_schema": {
+                "type": "object",
+                "properties": {"x": {"type": "integer"}},
+            },
+        },
+    )
+    condition_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(condition_metric,),
+        metrics=metrics,
+    )
+    metrics.update(results)
+
+    unexpected_rows_metric = MetricConfiguration(
+        metric_name=f"column_values.match_json_schema.{SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "result_format": {"result_format": "SUMMARY", "partial_unexpected_count": 5}
+        },
+    )
+    unexpected_rows_metric.metric_dependencies = {
+        "unexpected_condition": condition_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(unexpected_rows_metric,), metrics=metrics
+    )
+    metrics.update(results)
+
+    # Null values are not unexpected; JSON array fails validation against object schema.
+    assert metrics[unexpected_rows_metric.id] == [
+        ('{"x": "one"}',),
+        ("[1]",),
+    ]
+
+
 @pytest.mark.filterwarnings(
     "ignore:pandas.Int64Index is deprecated*:FutureWarning:tests.expectations.metrics"
 )
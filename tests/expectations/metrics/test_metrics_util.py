@@ -11,7 +11,9 @@ from great_expectations.compatibility.sqlalchemy import (
 )
 from great_expectations.compatibility import sqlalchemy
 from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+from great_expectations.execution_engine.metric_cache import ConditionValueCache
 from great_expectations.expectations.metrics.util import (
+    evaluate_on_distinct_values,
     get_unexpected_indices_for_multiple_pandas_named_indices,
     get_unexpected_indices_for_single_pandas_named_index,
     sql_statement_with_post_compile_to_string,
@@ -273,3 +275,46 @@ def test_get_unexpected_indices_for_multiple_pandas_named_indices_named_unexpect
         "Error: The list of domain columns is currently empty. Please check your "
         "configuration."
     )
+
+
+@pytest.mark.unit
+def test_evaluate_on_distinct_values():
+    evaluated_values: List[list] = []
+
+    def is_upper(column: pd.Series) -> pd.Series:
+        evaluated_values.append(column.tolist())
+        return column.map(lambda value: isinstance(value, str) and value.isupper())
+
+    column = pd.Series(["A", "b", "A", None, "b", "C"], index=[5, 4, 3, 2, 1, 0])
+
+    result = evaluate_on_distinct_values(column=column, fn=is_upper)
+
+    assert evaluated_values == [["A", "b", "C", None]]
+    pd.testing.assert_series_equal(
+        result, pd.Series([True, False, True, False, False, True], index=column.index)
+    )
+
+    # Only values not seen before are evaluated, when results are cached.
+    cache = ConditionValueCache(max_entries=10)
+    evaluated_values.clear()
+    evaluate_on_distinct_values(
+        column=column, fn=is_upper, condition_value_cache=cache, condition_id="is_upper"
+    )
+    result = evaluate_on_distinct_values(
+        column=pd.Series(["C", "d", "A"]),
+        fn=is_upper,
+        condition_value_cache=cache,
+        condition_id="is_upper",
+    )
+
+    assert evaluated_values == [["A", "b", "C", None], ["d"]]
+    assert result.tolist() == [True, False, True]
+
+    # Unhashable values are passed through as they are.
+    evaluated_values.clear()
+    column = pd.Series([{"a": 1}, {"a": 1}])
+    assert evaluate_on_distinct_values(column=column, fn=is_upper).tolist() == [
+        False,
+        False,
+    ]
+    assert evaluated_values == [[{"a": 1}, {"a": 1}]]
@@ -1,6 +1,9 @@
+import multiprocessing
 import os
+import re
 import shutil
 from typing import Dict
+from unittest import mock
 
 import pytest
 from freezegun import freeze_time
@@ -16,7 +19,10 @@ from great_expectations.data_context.util import (
     file_relative_path,
     instantiate_class_from_config,
 )
-from great_expectations.render.renderer.site_builder import SiteBuilder
+from great_expectations.render.renderer.site_builder import (
+    DefaultSiteSectionBuilder,
+    SiteBuilder,
+)
 from great_expectations.util import get_context
 
 
@@ -207,7 +213,7 @@ def test_configuration_driven_site_builder(
     site_builder = SiteBuilder(
         data_context=context,
         runtime_environment={"root_directory": context.root_directory},
-        **local_site_config
+        **local_site_config,
     )
     res = site_builder.build()
 
@@ -331,7 +337,7 @@ def test_configuration_driven_site_builder(
     team_site_builder = SiteBuilder(
         data_context=context,
         runtime_environment={"root_directory": context.root_directory},
-        **team_site_config
+        **team_site_config,
     )
     team_site_builder.clean_site()
     obs = [
@@ -355,7 +361,7 @@ def test_configuration_driven_site_builder(
     site_builder = SiteBuilder(
         data_context=context,
         runtime_environment={"root_directory": context.root_directory},
-        **local_site_config
+        **local_site_config,
     )
     res = site_builder.build()
 
@@ -439,7 +445,7 @@ def test_configuration_driven_site_builder_skip_and_clean_missing(
     site_builder = SiteBuilder(
         data_context=context,
         runtime_environment={"root_directory": context.root_directory},
-        **local_site_config
+        **local_site_config,
     )
     site_builder.build()
 
@@ -500,6 +506,122 @@ def test_configuration_driven_site_builder_skip_and_clean_missing(
     assert validations_set == validation_html_pages
 
 
+@pytest.mark.slow  # 3.57s
+def test_configuration_driven_site_builder_renders_only_new_or_changed_resources(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+
+    local_site_config = context._project_config.data_docs_sites["local_site"]
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config,
+    )
+    _, first_index_links_dict = site_builder.build()
+
+    expectations_renderer = site_builder.site_section_builders[
+        "expectations"
+    ].renderer_class
+    profiling_renderer = site_builder.site_section_builders["profiling"].renderer_class
+    with mock.patch.object(
+        expectations_renderer, "render", wraps=expectations_renderer.render
+    ) as expectations_render_spy, mock.patch.object(
+        profiling_renderer, "render", wraps=profiling_renderer.render
+    ) as profiling_render_spy:
+        # nothing has changed since the previous build
+        _, index_links_dict = site_builder.build()
+        assert expectations_render_spy.call_count == 0
+        assert profiling_render_spy.call_count == 0
+        assert index_links_dict == first_index_links_dict
+
+        # only the changed suite is rendered again
+        expectation_suite_name = "titanic.subdir_reader.Titanic.BasicDatasetProfiler"
+        suite = context.get_expectation_suite(expectation_suite_name)
+        suite.meta["notes"] = "changed"
+        context.save_expectation_suite(suite)
+        site_builder.build()
+        assert expectations_render_spy.call_count == 1
+        assert (
+            expectations_render_spy.call_args[0][0].expectation_suite_name
+            == expectation_suite_name
+        )
+        assert profiling_render_spy.call_count == 0
+
+        # removed pages are rendered again
+        validation_result_key = context.stores["validations_store"].list_keys()[0]
+        site_builder.target_store.store_backends[ValidationResultIdentifier].remove_key(
+            validation_result_key.to_tuple()
+        )
+        site_builder.build()
+        assert expectations_render_spy.call_count == 1
+        assert profiling_render_spy.call_count == 1
+
+        # cleaning the site forgets everything rendered into it
+        site_builder.clean_site()
+        _, index_links_dict = site_builder.build()
+        assert expectations_render_spy.call_count == 1 + len(
+            context.stores["expectations_store"].list_keys()
+        )
+        assert index_links_dict == first_index_links_dict
+
+
+@freeze_time("09/24/2019 23:18:36")
+@pytest.mark.slow  # 5.63s
+def test_configuration_driven_site_builder_renders_identical_site_concurrently(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+    context.profile_datasource("random")
+
+    site_directories: Dict[int, str] = {}
+    for max_rendering_workers in (None, 3):
+        site_directory = os.path.join(  # noqa: PTH118
+            context.root_directory,
+            "uncommitted",
+            "data_docs",
+            f"site_rendered_by_{max_rendering_workers}",
+        )
+        site_builder = SiteBuilder(
+            data_context=context,
+            store_backend={
+                "class_name": "TupleFilesystemStoreBackend",
+                "base_directory": site_directory,
+            },
+            max_rendering_workers=max_rendering_workers,
+        )
+        site_builder.build()
+        site_directories[max_rendering_workers] = site_directory
+
+    site_files: Dict[int, Dict[str, bytes]] = {}
+    for max_rendering_workers, site_directory in site_directories.items():
+        site_files[max_rendering_workers] = {}
+        for directory, _, filenames in os.walk(site_directory):
+            for filename in filenames:
+                filepath = os.path.join(directory, filename)  # noqa: PTH118
+                with open(filepath, "rb") as f:
+                    # element ids of collapsible content blocks are random
+                    site_files[max_rendering_workers][
+                        os.path.relpath(filepath, site_directory)
+                    ] = re.sub(
+                        rb"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
+                        b"<uuid>",
+                        f.read(),
+                    )
+
+    assert len(site_files[None]) > 1 + len(
+        context.stores["expectations_store"].list_keys()
+    ) + len(context.stores["validations_store"].list_keys())
+    assert sorted(site_files[3]) == sorted(site_files[None])
+    assert [
+        filepath
+        for filepath, content in site_files[None].items()
+        if site_files[3][filepath] != content
+    ] == []
+
+
 @pytest.mark.rendered_output
 @pytest.mark.filterwarnings(
     "ignore:name is deprecated as a batch_parameter*:DeprecationWarning:great_expectations.data_context.data_context"
@@ -575,7 +697,7 @@ def test_configuration_driven_site_builder_without_how_to_buttons(
     site_builder = SiteBuilder(
         data_context=context,
         runtime_environment={"root_directory": context.root_directory},
-        **local_site_config
+        **local_site_config,
     )
     res = site_builder.build()
 
@@ -727,3 +849,42 @@ def test_site_builder_usage_statistics_disabled(
             page_contents = f.read()
             assert expected_logo_url in page_contents
             assert data_context_id not in page_contents
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="pages are rendered in threads where processes cannot be forked",
+)
+@pytest.mark.integration
+def test_configuration_driven_site_builder_forks_all_rendering_processes_before_writing_pages(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    context.profile_datasource("titanic")
+
+    site_builder = SiteBuilder(
+        data_context=context,
+        store_backend={
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": os.path.join(  # noqa: PTH118
+                context.root_directory, "uncommitted", "data_docs", "site"
+            ),
+        },
+        max_rendering_workers=3,
+    )
+
+    write_page = DefaultSiteSectionBuilder._write_page
+    rendering_process_counts = []
+
+    def _write_page(self, resource_key, viewable_content):
+        rendering_process_counts.append(len(multiprocessing.active_children()))
+        return write_page(self, resource_key, viewable_content)
+
+    with mock.patch.object(
+        DefaultSiteSectionBuilder, "_write_page", autospec=True, side_effect=_write_page
+    ):
+        site_builder.build()
+
+    # Page writer threads never run while rendering processes are still being forked.
+    assert len(rendering_process_counts) > 2
+    assert rendering_process_counts[0] == 3
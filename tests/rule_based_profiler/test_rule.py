@@ -1,11 +1,32 @@
-from typing import Any
+import concurrent.futures
+import contextvars
+import threading
+from typing import Any, Dict, List, Optional
+from unittest import mock
 
 import pytest
 
 import great_expectations.exceptions as gx_exceptions
+from great_expectations.core.batch_manager import thread_scoped_batch_activation
+from great_expectations.core.domain import Domain
+from great_expectations.data_context import DataContext
+from great_expectations.data_context.types.base import ConcurrencyConfig
+from great_expectations.rule_based_profiler.domain_builder import ColumnDomainBuilder
+from great_expectations.rule_based_profiler.helpers.util import get_validator
+from great_expectations.rule_based_profiler.helpers.validator_pool import (
+    validator_pool_scope,
+)
+from great_expectations.rule_based_profiler.parameter_builder import (
+    MetricMultiBatchParameterBuilder,
+)
 from great_expectations.rule_based_profiler.parameter_container import (
+    DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME,
     get_parameter_value_by_fully_qualified_parameter_name,
 )
+from great_expectations.rule_based_profiler.rule import Rule
+from great_expectations.rule_based_profiler.rule.rule_state import RuleState
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.metrics_calculator import MetricsCalculator
 
 
 # noinspection PyPep8Naming
@@ -351,3 +372,250 @@ def test_get_parameter_value_by_fully_qualified_parameter_name_valid_parameter_n
             )
             == details
         )
+
+
+@pytest.mark.integration
+@pytest.mark.slow  # 2.59s
+def test_rule_run_plans_metrics_across_domains(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+):
+    data_context: DataContext = (
+        bobby_columnar_table_multi_batch_deterministic_data_context
+    )
+
+    batch_request: dict = {
+        "datasource_name": "taxi_pandas",
+        "data_connector_name": "monthly",
+        "data_asset_name": "my_reports",
+    }
+
+    def _run_rule(runtime_configuration: Optional[dict]) -> Dict[str, Any]:
+        rule = Rule(
+            name="my_rule",
+            domain_builder=ColumnDomainBuilder(
+                include_column_names=["fare_amount", "tip_amount", "total_amount"],
+                data_context=data_context,
+            ),
+            parameter_builders=[
+                MetricMultiBatchParameterBuilder(
+                    name="my_column_max",
+                    metric_name="column.max",
+                    metric_domain_kwargs=DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME,
+                    reduce_scalar_metric=True,
+                    data_context=data_context,
+                ),
+            ],
+        )
+        rule_state: RuleState = rule.run(
+            batch_request=batch_request,
+            runtime_configuration=runtime_configuration,
+        )
+
+        domain: Domain
+        return {
+            domain.domain_kwargs[
+                "column"
+            ]: get_parameter_value_by_fully_qualified_parameter_name(
+                fully_qualified_parameter_name="$parameter.my_column_max.value",
+                domain=domain,
+                parameters=rule_state.parameters,
+            )
+            for domain in rule_state.domains
+        }
+
+    with mock.patch.object(
+        MetricsCalculator,
+        "resolve_validation_graph_and_handle_aborted_metrics_info",
+        autospec=True,
+        side_effect=MetricsCalculator.resolve_validation_graph_and_handle_aborted_metrics_info,
+    ) as mock_resolve:
+        column_max_values: Dict[str, Any] = _run_rule(runtime_configuration=None)
+        num_resolutions_by_domain: int = mock_resolve.call_count
+
+        mock_resolve.reset_mock()
+
+        assert (
+            _run_rule(runtime_configuration={"plan_metrics_across_domains": True})
+            == column_max_values
+        )
+        num_resolutions_planned: int = mock_resolve.call_count
+
+    # "DomainBuilder" resolves its metrics in both runs; "ParameterBuilder" metrics of all three "Domain" objects are
+    # resolved together (rather than one "Domain" at a time) when planned.
+    assert num_resolutions_by_domain - num_resolutions_planned == 3 - 1
+
+
+@pytest.mark.integration
+@pytest.mark.slow  # 2.12s
+def test_rule_run_profiles_domains_concurrently_if_concurrency_is_enabled(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+):
+    data_context: DataContext = (
+        bobby_columnar_table_multi_batch_deterministic_data_context
+    )
+
+    batch_request: dict = {
+        "datasource_name": "taxi_pandas",
+        "data_connector_name": "monthly",
+        "data_asset_name": "my_reports",
+    }
+
+    def _run_rule() -> RuleState:
+        metric_name: str
+        rule = Rule(
+            name="my_rule",
+            domain_builder=ColumnDomainBuilder(
+                include_column_names=["fare_amount", "tip_amount", "total_amount"],
+                data_context=data_context,
+            ),
+            parameter_builders=[
+                MetricMultiBatchParameterBuilder(
+                    name=f"my_{metric_name.replace('.', '_')}",
+                    metric_name=metric_name,
+                    metric_domain_kwargs=DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME,
+                    reduce_scalar_metric=True,
+                    data_context=data_context,
+                )
+                for metric_name in ["column.min", "column.max"]
+            ],
+        )
+        return rule.run(batch_request=batch_request)
+
+    serial_rule_state: RuleState = _run_rule()
+
+    with mock.patch.object(
+        type(data_context),
+        "concurrency",
+        new_callable=mock.PropertyMock,
+        return_value=ConcurrencyConfig(enabled=True),
+    ), mock.patch.object(
+        Rule,
+        "_build_parameters_for_domain_in_isolation",
+        autospec=True,
+        side_effect=Rule._build_parameters_for_domain_in_isolation,
+    ) as mock_build_parameters_for_domain_in_isolation:
+        concurrent_rule_state: RuleState = _run_rule()
+
+    assert mock_build_parameters_for_domain_in_isolation.call_count == 3
+
+    # Parameters are merged in order of "Domain" objects, irrespective of order, in which threads complete.
+    assert list(concurrent_rule_state.parameters.keys()) == list(
+        serial_rule_state.parameters.keys()
+    )
+    domain: Domain
+    for domain in concurrent_rule_state.domains:
+        assert (
+            concurrent_rule_state.parameters[domain.id].to_json_dict()
+            == serial_rule_state.parameters[domain.id].to_json_dict()
+        )
+
+
+@pytest.mark.integration
+def test_pooled_validators_keep_active_batch_of_their_thread(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+):
+    data_context: DataContext = (
+        bobby_columnar_table_multi_batch_deterministic_data_context
+    )
+
+    batch_list: list = data_context.get_batch_list(
+        datasource_name="taxi_pandas",
+        data_connector_name="monthly",
+        data_asset_name="my_reports",
+    )
+    row_count_metric = MetricConfiguration(
+        metric_name="table.row_count",
+        metric_domain_kwargs={},
+        metric_value_kwargs=None,
+    )
+    all_validators_obtained = threading.Barrier(len(batch_list))
+
+    def _get_row_count(batch) -> int:
+        with thread_scoped_batch_activation():
+            # Every thread makes its own Batch active on the shared "ExecutionEngine" before any of them computes.
+            validator = get_validator(
+                purpose="test", data_context=data_context, batch_list=[batch]
+            )
+            all_validators_obtained.wait()
+            return validator.get_metric(metric=row_count_metric)
+
+    with validator_pool_scope():
+        expected_row_counts: List[int] = [
+            get_validator(
+                purpose="test", data_context=data_context, batch_list=[batch]
+            ).get_metric(metric=row_count_metric)
+            for batch in batch_list
+        ]
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(batch_list)
+        ) as executor:
+            row_counts: List[int] = list(
+                executor.map(
+                    lambda batch: contextvars.copy_context().run(_get_row_count, batch),
+                    batch_list,
+                )
+            )
+
+    assert len(set(expected_row_counts)) > 1
+    assert row_counts == expected_row_counts
+
+
+@pytest.mark.integration
+@pytest.mark.slow  # 2.30s
+def test_rule_run_profiles_domains_concurrently_with_parameter_builders_using_different_batch_requests(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+):
+    data_context: DataContext = (
+        bobby_columnar_table_multi_batch_deterministic_data_context
+    )
+
+    batch_request: dict = {
+        "datasource_name": "taxi_pandas",
+        "data_connector_name": "monthly",
+        "data_asset_name": "my_reports",
+    }
+
+    def _run_rule() -> RuleState:
+        parameter_builders: List[MetricMultiBatchParameterBuilder] = []
+        index: int
+        for index in [0, 1, -1]:
+            parameter_builder = MetricMultiBatchParameterBuilder(
+                name=f"my_table_row_count_{index}",
+                metric_name="table.row_count",
+                metric_domain_kwargs={},
+                single_batch_mode=True,
+                data_context=data_context,
+            )
+            # Each "ParameterBuilder" computes its metric on a different Batch of the same "ExecutionEngine".
+            parameter_builder.batch_request = {
+                **batch_request,
+                "data_connector_query": {"index": index},
+            }
+            parameter_builders.append(parameter_builder)
+
+        rule = Rule(
+            name="my_rule",
+            domain_builder=ColumnDomainBuilder(
+                include_column_names=["fare_amount", "tip_amount", "total_amount"],
+                data_context=data_context,
+            ),
+            parameter_builders=parameter_builders,
+        )
+        return rule.run(batch_request=batch_request)
+
+    serial_rule_state: RuleState = _run_rule()
+
+    with mock.patch.object(
+        type(data_context),
+        "concurrency",
+        new_callable=mock.PropertyMock,
+        return_value=ConcurrencyConfig(enabled=True),
+    ):
+        concurrent_rule_state: RuleState = _run_rule()
+
+    domain: Domain
+    for domain in concurrent_rule_state.domains:
+        assert (
+            concurrent_rule_state.parameters[domain.id].to_json_dict()
+            == serial_rule_state.parameters[domain.id].to_json_dict()
+        )
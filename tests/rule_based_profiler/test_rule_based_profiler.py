@@ -26,7 +26,10 @@ from great_expectations.rule_based_profiler.config import (
     ParameterBuilderConfig,
     RuleBasedProfilerConfig,
 )
-from great_expectations.rule_based_profiler.domain_builder import TableDomainBuilder
+from great_expectations.rule_based_profiler.domain_builder import (
+    ColumnDomainBuilder,
+    TableDomainBuilder,
+)
 from great_expectations.rule_based_profiler.expectation_configuration_builder import (
     DefaultExpectationConfigurationBuilder,
 )
@@ -38,6 +41,7 @@ from great_expectations.rule_based_profiler.parameter_builder import (
     MetricMultiBatchParameterBuilder,
 )
 from great_expectations.rule_based_profiler.parameter_container import (
+    DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME,
     ParameterContainer,
 )
 from great_expectations.rule_based_profiler.rule import Rule
@@ -1491,3 +1495,57 @@ def test_add_rule_bad_rule(
         # noinspection PyTypeChecker
         profiler.add_rule(rule=not_a_rule)
     assert "'dict' object has no attribute 'name'" in str(e.value)
+
+
+@pytest.mark.integration
+@pytest.mark.slow  # 1.93s
+def test_run_profiler_loads_each_batch_once_per_run(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+):
+    data_context = bobby_columnar_table_multi_batch_deterministic_data_context
+
+    batch_request: dict = {
+        "datasource_name": "taxi_pandas",
+        "data_connector_name": "monthly",
+        "data_asset_name": "my_reports",
+    }
+
+    profiler: RuleBasedProfiler = RuleBasedProfiler(
+        name="my_rbp",
+        config_version=1.0,
+        data_context=data_context,
+    )
+    metric_name: str
+    profiler.add_rule(
+        rule=Rule(
+            name="my_rule",
+            domain_builder=ColumnDomainBuilder(
+                include_column_names=["fare_amount", "tip_amount"],
+                data_context=data_context,
+            ),
+            parameter_builders=[
+                MetricMultiBatchParameterBuilder(
+                    name=f"my_{metric_name.replace('.', '_')}",
+                    metric_name=metric_name,
+                    metric_domain_kwargs=DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME,
+                    data_context=data_context,
+                )
+                for metric_name in ["column.min", "column.max"]
+            ],
+        )
+    )
+
+    with mock.patch.object(
+        data_context, "get_batch_list", wraps=data_context.get_batch_list
+    ) as mock_get_batch_list:
+        profiler.run(batch_request=batch_request)
+
+    # One "Validator" per "Builder" and "Domain" is requested, but the BatchRequest is executed only once per run.
+    assert mock_get_batch_list.call_count == 1
+
+    with mock.patch.object(
+        data_context, "get_batch_list", wraps=data_context.get_batch_list
+    ) as mock_get_batch_list:
+        profiler.run(batch_request=batch_request)
+
+    assert mock_get_batch_list.call_count == 1
@@ -1,20 +1,26 @@
 import sys
-from typing import Dict, Iterable, Optional, Set, Tuple, Union, cast
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union, cast
 from unittest import mock
 
 import pytest
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
-from great_expectations.execution_engine import ExecutionEngine
+from great_expectations.data_context.types.base import ConcurrencyConfig
+from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
 from great_expectations.expectations.core import ExpectColumnValueZScoresToBeLessThan
 from great_expectations.validator.computed_metric import MetricValue
 from great_expectations.validator.exception_info import ExceptionInfo
 from great_expectations.validator.metric_configuration import MetricConfiguration
 from great_expectations.validator.validation_graph import (
     MAX_METRIC_COMPUTATION_RETRIES,
+    ConcurrentMetricResolutionScheduler,
     ExpectationValidationGraph,
+    LevelByLevelMetricResolutionScheduler,
     MetricEdge,
+    MetricReadinessTracker,
     ValidationGraph,
 )
 from great_expectations.validator.validator import ValidationDependencies
@@ -317,6 +323,98 @@ def test_populate_dependencies_with_incorrect_metric_name():
     )
 
 
+@pytest.mark.unit
+def test_populate_dependencies_expands_shared_subgraphs_once():
+    class PandasExecutionEngineStub:
+        pass
+
+    PandasExecutionEngineStub.__name__ = "PandasExecutionEngine"
+    execution_engine = cast(ExecutionEngine, PandasExecutionEngineStub())
+
+    def _build_graphs(
+        metric_dependencies_cache: Optional[dict],
+    ) -> List[ValidationGraph]:
+        graphs: List[ValidationGraph] = []
+        column: str
+        for column in ("a", "a", "b"):
+            graph = ValidationGraph(
+                execution_engine=execution_engine,
+                metric_dependencies_cache=metric_dependencies_cache,
+            )
+            graph.build_metric_dependency_graph(
+                metric_configuration=MetricConfiguration(
+                    metric_name="column_values.nonnull.unexpected_count",
+                    metric_domain_kwargs={"column": column},
+                )
+            )
+            graphs.append(graph)
+
+        return graphs
+
+    uncached_graphs: List[ValidationGraph] = _build_graphs(
+        metric_dependencies_cache=None
+    )
+
+    with mock.patch.object(
+        ValidationGraph,
+        "_get_metric_dependencies",
+        autospec=True,
+        side_effect=ValidationGraph._get_metric_dependencies,
+    ) as mock_get_metric_dependencies:
+        cached_graphs: List[ValidationGraph] = _build_graphs(
+            metric_dependencies_cache={}
+        )
+
+    assert [graph.edge_ids for graph in cached_graphs] == [
+        graph.edge_ids for graph in uncached_graphs
+    ]
+
+    # Every metric is expanded once, no matter how many graphs contain it.
+    expanded_metric_ids: Set[Tuple[str, str, str]] = {
+        edge.left.id for graph in cached_graphs for edge in graph.edges
+    }
+    assert mock_get_metric_dependencies.call_count == len(expanded_metric_ids)
+
+    # Metrics of graphs, built from cached expansions, still carry their dependencies.
+    edge: MetricEdge
+    for edge in cached_graphs[1].edges:
+        if edge.right is not None:
+            assert edge.right.id in {
+                dependency.id for dependency in edge.left.metric_dependencies.values()
+            }
+
+
+@pytest.mark.unit
+def test_metric_readiness_tracker_matches_parse_as_metrics_get_resolved(
+    expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
+):
+    graph: ValidationGraph = (
+        expect_column_value_z_scores_to_be_less_than_expectation_validation_graph
+    )
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+    metric_readiness = MetricReadinessTracker(graph=graph, metrics=metrics)
+
+    ready_metrics: Set[MetricConfiguration]
+    needed_metrics: Set[MetricConfiguration]
+    ready_metrics, needed_metrics = graph._parse(metrics=metrics)
+    while ready_metrics:
+        assert {metric.id for metric in metric_readiness.ready_metrics} == {
+            metric.id for metric in ready_metrics
+        }
+        assert {metric.id for metric in metric_readiness.needed_metrics} == {
+            metric.id for metric in needed_metrics
+        }
+
+        # Resolve one metric at a time, so that readiness is updated incrementally.
+        metric: MetricConfiguration = metric_readiness.ready_metrics[0]
+        metrics[metric.id] = "my_value"
+        metric_readiness.mark_resolved(metric_ids=[metric.id])
+        ready_metrics, needed_metrics = graph._parse(metrics=metrics)
+
+    assert metric_readiness.num_unresolved_metrics == 0
+    assert not needed_metrics
+
+
 @pytest.mark.unit
 def test_resolve_validation_graph_with_bad_config_catch_exceptions_true():
     failed_metric_configuration = MetricConfiguration(
@@ -469,6 +567,249 @@ def test_progress_bar_config(
         assert mock_tqdm.call_args[1]["disable"] is are_progress_bars_disabled
 
 
+@pytest.mark.unit
+def test_default_scheduler_is_level_by_level_unless_execution_engine_enables_concurrency():
+    assert isinstance(
+        ValidationGraph(execution_engine=PandasExecutionEngine()).scheduler,
+        LevelByLevelMetricResolutionScheduler,
+    )
+
+    with mock.patch(
+        "great_expectations.execution_engine.execution_engine.os.cpu_count",
+        return_value=4,
+    ):
+        scheduler = ValidationGraph(
+            execution_engine=PandasExecutionEngine(
+                concurrency=ConcurrencyConfig(enabled=True)
+            )
+        ).scheduler
+    assert isinstance(scheduler, ConcurrentMetricResolutionScheduler)
+    assert scheduler.max_workers == 4
+
+    scheduler = ConcurrentMetricResolutionScheduler(max_workers=2)
+    assert (
+        ValidationGraph(
+            execution_engine=PandasExecutionEngine(), scheduler=scheduler
+        ).scheduler
+        is scheduler
+    )
+
+
+@pytest.mark.unit
+def test_concurrent_scheduler_submits_metrics_only_after_their_dependencies(
+    expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
+):
+    lock = threading.Lock()
+    resolution_calls: List[List[MetricConfiguration]] = []
+
+    class PandasExecutionEngineFake:
+        # noinspection PyUnusedLocal
+        @staticmethod
+        def resolve_metrics(
+            metrics_to_resolve: Iterable[MetricConfiguration],
+            metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+            runtime_configuration: Optional[dict] = None,
+        ) -> Dict[Tuple[str, str, str], MetricValue]:
+            metric_configuration: MetricConfiguration
+            for metric_configuration in metrics_to_resolve:
+                for dependency in metric_configuration.metric_dependencies.values():
+                    assert dependency.id in metrics
+
+            with lock:
+                resolution_calls.append(list(metrics_to_resolve))
+
+            return {
+                metric_configuration.id: "my_value"
+                for metric_configuration in metrics_to_resolve
+            }
+
+    graph = ValidationGraph(
+        execution_engine=cast(ExecutionEngine, PandasExecutionEngineFake()),
+        edges=expect_column_value_z_scores_to_be_less_than_expectation_validation_graph.edges,
+        scheduler=ConcurrentMetricResolutionScheduler(max_workers=4),
+    )
+
+    resolved_metrics, aborted_metrics_info = graph.resolve(show_progress_bars=False)
+
+    edge: MetricEdge
+    all_metric_ids: Set[Tuple[str, str, str]] = {edge.left.id for edge in graph.edges}
+    assert set(resolved_metrics.keys()) == all_metric_ids
+    assert aborted_metrics_info == {}
+
+    # Every metric is computed exactly once.
+    resolved_metric_ids: List[Tuple[str, str, str]] = [
+        metric_configuration.id
+        for resolution_call in resolution_calls
+        for metric_configuration in resolution_call
+    ]
+    assert sorted(resolved_metric_ids) == sorted(all_metric_ids)
+
+
+@pytest.mark.unit
+def test_concurrent_scheduler_aborts_metric_after_max_retries():
+    failed_metric_configuration = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={
+            "column": "not_in_table",
+        },
+        metric_value_kwargs={
+            "parse_strings_as_datetimes": False,
+        },
+    )
+
+    class PandasExecutionEngineFake:
+        # noinspection PyUnusedLocal
+        @staticmethod
+        def resolve_metrics(
+            metrics_to_resolve: Iterable[MetricConfiguration],
+            metrics: Optional[Dict[Tuple[str, str, str], MetricConfiguration]] = None,
+            runtime_configuration: Optional[dict] = None,
+        ) -> Dict[Tuple[str, str, str], MetricValue]:
+            metric_configuration: MetricConfiguration
+            if failed_metric_configuration.id in [
+                metric_configuration.id for metric_configuration in metrics_to_resolve
+            ]:
+                raise gx_exceptions.MetricResolutionError(
+                    message='Error: The column "not_in_table" in BatchData does not exist.',
+                    failed_metrics=[failed_metric_configuration],
+                )
+
+            return {
+                metric_configuration.id: "my_value"
+                for metric_configuration in metrics_to_resolve
+            }
+
+    PandasExecutionEngineFake.__name__ = "PandasExecutionEngine"
+    execution_engine = cast(ExecutionEngine, PandasExecutionEngineFake())
+
+    graph = ValidationGraph(
+        execution_engine=execution_engine,
+        scheduler=ConcurrentMetricResolutionScheduler(max_workers=2),
+    )
+
+    runtime_configuration = {
+        "catch_exceptions": True,
+        "result_format": {"result_format": "BASIC"},
+    }
+
+    graph.build_metric_dependency_graph(
+        metric_configuration=failed_metric_configuration,
+        runtime_configuration=runtime_configuration,
+    )
+
+    resolved_metrics, aborted_metrics_info = graph.resolve(
+        runtime_configuration=runtime_configuration,
+        show_progress_bars=False,
+    )
+
+    assert failed_metric_configuration.id not in resolved_metrics
+    assert len(aborted_metrics_info) == 1
+
+    aborted_metric_info_item = list(aborted_metrics_info.values())[0]
+    assert aborted_metric_info_item["num_failures"] == MAX_METRIC_COMPUTATION_RETRIES
+
+    runtime_configuration["catch_exceptions"] = False
+    with pytest.raises(gx_exceptions.MetricResolutionError):
+        graph.resolve(
+            runtime_configuration=runtime_configuration,
+            show_progress_bars=False,
+        )
+
+
+@pytest.mark.unit
+def test_concurrent_scheduler_matches_level_by_level_scheduler_on_pandas():
+    import pandas as pd
+
+    df = pd.DataFrame({"a": [1, 2, 3, 4, None], "b": [2, 3, 4, None, 6]})
+
+    metric_configurations: List[MetricConfiguration] = [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=None,
+        )
+        for metric_name in ["column.max", "column.mean", "column.standard_deviation"]
+        for column in ["a", "b"]
+    ]
+
+    results: List[Dict[Tuple[str, str, str], MetricValue]] = []
+    scheduler: Optional[ConcurrentMetricResolutionScheduler]
+    for scheduler in [None, ConcurrentMetricResolutionScheduler(max_workers=4)]:
+        engine = PandasExecutionEngine()
+        engine.load_batch_data(batch_id="my_id", batch_data=df)
+        graph = ValidationGraph(execution_engine=engine, scheduler=scheduler)
+        for metric_configuration in metric_configurations:
+            graph.build_metric_dependency_graph(
+                metric_configuration=metric_configuration
+            )
+
+        resolved_metrics, aborted_metrics_info = graph.resolve(show_progress_bars=False)
+        assert aborted_metrics_info == {}
+        results.append(
+            {
+                metric_configuration.id: resolved_metrics[metric_configuration.id]
+                for metric_configuration in metric_configurations
+            }
+        )
+
+    assert results[0] == results[1]
+
+
+@pytest.mark.unit
+def test_resolve_retains_shared_domain_records_of_execution_engine_while_resolving():
+    import pandas as pd
+
+    engine = PandasExecutionEngine()
+    engine.load_batch_data(
+        batch_id="my_id", batch_data=pd.DataFrame({"a": [1, 2, 3, 4, None]})
+    )
+    graph = ValidationGraph(execution_engine=engine)
+    metric_configuration = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    graph.build_metric_dependency_graph(metric_configuration=metric_configuration)
+
+    retained_metric_ids: List[Set[Tuple[str, str, str]]] = []
+    resolving_inside_context: List[bool] = []
+    inside_context = False
+
+    @contextmanager
+    def _retain_shared_domain_records(metric_configurations):
+        nonlocal inside_context
+        retained_metric_ids.append(
+            {configuration.id for configuration in metric_configurations}
+        )
+        inside_context = True
+        try:
+            yield
+        finally:
+            inside_context = False
+
+    resolve_metrics = engine.resolve_metrics
+
+    def _resolve_metrics(*args, **kwargs):
+        resolving_inside_context.append(inside_context)
+        return resolve_metrics(*args, **kwargs)
+
+    with mock.patch.object(
+        engine,
+        "retain_shared_domain_records",
+        side_effect=_retain_shared_domain_records,
+    ), mock.patch.object(engine, "resolve_metrics", side_effect=_resolve_metrics):
+        resolved_metrics, aborted_metrics_info = graph.resolve(show_progress_bars=False)
+
+    assert aborted_metrics_info == {}
+    assert resolved_metrics[metric_configuration.id] == 4
+    assert retained_metric_ids == [
+        {configuration.id for configuration in graph._metric_configurations.values()}
+    ]
+    assert metric_configuration.id in retained_metric_ids[0]
+    assert resolving_inside_context and all(resolving_inside_context)
+    assert not inside_context
+
+
 if __name__ == "__main__":
     argv: list = sys.argv[1:]
 